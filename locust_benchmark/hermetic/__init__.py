@@ -0,0 +1,22 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Hermetic online serving benchmark.
+
+Runs `get_feature_vector(s)` through `VectorServer`, `OnlineStoreRestClientEngine`
+and `OnlineStoreSqlClient` against a local RonDB REST server stand-in and a local
+MySQL-protocol backend seeded with synthetic feature groups, so no Hopsworks
+cluster is needed. See `python -m hermetic --help`.
+"""
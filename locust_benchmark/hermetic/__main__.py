@@ -0,0 +1,343 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Run the hermetic online serving benchmark.
+
+Run it from the `locust_benchmark` directory as::
+
+    python -m hermetic --concurrency 1,8 --batch-size 10,100
+
+Every combination of client, lookup mode, concurrency and batch size is run for
+`--duration` seconds after a warm-up, and reported as p50/p99 latency and QPS of
+two stages: `total`, measured around `get_feature_vector(s)`, and `backend`, the
+time the local servers spend answering. `--save-baseline` stores the results and
+`--check` exits with status 1 if a result regressed beyond `--tolerance`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import logging
+import random
+import sys
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from unittest import mock
+
+from hopsworks_common import client as hopsworks_client
+from hsfs import engine
+from hsfs.core import explicit_provenance
+from hsfs.storage_connector import JdbcConnector
+
+from hermetic.fake_mysql import FakeMySQLServer
+from hermetic.fake_rdrs import FakeRdrsServer
+from hermetic.stats import (
+    LatencyRecorder,
+    StageSummary,
+    load_baselines,
+    save_baselines,
+)
+from hermetic.synthetic import DATABASE, PRIMARY_KEY, SyntheticFeatureStore
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from hsfs.feature_view import FeatureView
+
+
+DEFAULT_BASELINES = Path(__file__).parent / "baselines.json"
+API_KEY = "hermetic-benchmark"
+
+
+class _LocalClient:
+    """Hopsworks client of a project that is never contacted."""
+
+    _connected = True
+    _project_id = 119
+    _project_name = "bench"
+
+    def _is_external(self) -> bool:
+        return False
+
+    def _get_ca_chain_path(self) -> None:
+        return None
+
+    def _send_request(self, method: str, path_params: list[Any], *args, **kwargs):
+        raise RuntimeError(
+            f"The hermetic benchmark does not serve {method} /{'/'.join(map(str, path_params))}"
+        )
+
+    def _close(self) -> None:
+        pass
+
+
+@contextlib.contextmanager
+def _local_hopsworks(
+    store: SyntheticFeatureStore, rdrs: FakeRdrsServer, mysql: FakeMySQLServer
+) -> Iterator[None]:
+    """Answer the metadata requests of `init_serving` from `store`."""
+    feature_groups = store.feature_groups()
+    links = explicit_provenance.Links()
+    links._accessible = feature_groups
+    online_connector = JdbcConnector(
+        id=1,
+        name="bench_online",
+        featurestore_id=store.tables[0].feature_group_id,
+        connection_string=f"jdbc:mysql://{mysql.host}:{mysql.port}/{DATABASE}",
+        arguments=[
+            {"name": "user", "value": "bench"},
+            {"name": "password", "value": "bench"},
+        ],
+    )
+
+    patches = [
+        mock.patch.object(hopsworks_client, "_client", _LocalClient()),
+        mock.patch(
+            "hsfs.feature_view.FeatureView.get_parent_feature_groups",
+            return_value=links,
+        ),
+        mock.patch(
+            "hsfs.core.feature_view_api.FeatureViewApi._get_serving_prepared_statement",
+            side_effect=lambda name, version, batch, *args, **kwargs: (
+                store.prepared_statements(batch)
+            ),
+        ),
+        mock.patch(
+            "hsfs.core.storage_connector_api.StorageConnectorApi._get_online_connector",
+            return_value=online_connector,
+        ),
+        mock.patch(
+            "hopsworks_common.client.online_store_rest_client.OnlineStoreRestClientSingleton._get_default_dynamic_parameters_config",
+            return_value={"host": rdrs.host, "port": rdrs.port, "ca_certs": None},
+        ),
+    ]
+    with contextlib.ExitStack() as stack:
+        for patch in patches:
+            stack.enter_context(patch)
+        engine._init("python")
+        yield
+
+
+def _init_serving(store: SyntheticFeatureStore, rdrs: FakeRdrsServer, pool_size: int):
+    view = store.feature_view()
+    view.init_serving(
+        1,
+        external=False,
+        init_rest_client=True,
+        init_sql_client=True,
+        default_client="rest",
+        config_rest_client={
+            "api_key": API_KEY,
+            "host": rdrs.host,
+            "port": rdrs.port,
+            "use_ssl": False,
+            "verify_certs": False,
+        },
+        options={"minsize": pool_size, "maxsize": pool_size} if pool_size else None,
+    )
+    return view
+
+
+def _lookup(
+    view: FeatureView, client: str, batch_size: int, rows: int, rng: random.Random
+) -> None:
+    force = {"force_rest_client": client == "rest", "force_sql_client": client == "sql"}
+    if batch_size:
+        view.get_feature_vectors(
+            [{PRIMARY_KEY: rng.randrange(rows)} for _ in range(batch_size)], **force
+        )
+    else:
+        view.get_feature_vector({PRIMARY_KEY: rng.randrange(rows)}, **force)
+
+
+def _run(
+    view: FeatureView,
+    client: str,
+    batch_size: int,
+    concurrency: int,
+    rows: int,
+    warmup: float,
+    duration: float,
+    total: LatencyRecorder,
+    backend: LatencyRecorder,
+) -> tuple[StageSummary | None, StageSummary | None]:
+    stop = threading.Event()
+    measuring = threading.Event()
+    errors: list[BaseException] = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        while not stop.is_set():
+            start = time.perf_counter()
+            try:
+                _lookup(view, client, batch_size, rows, rng)
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+                return
+            if measuring.is_set():
+                total.record(time.perf_counter() - start)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for seed in range(concurrency):
+            pool.submit(worker, seed)
+        time.sleep(warmup)
+        total.reset()
+        backend.reset()
+        measuring.set()
+        start = time.perf_counter()
+        stop.wait(duration)
+        stop.set()
+        elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return total.summary(elapsed), backend.summary(elapsed)
+
+
+def _csv(cast):
+    return lambda value: [cast(item) for item in value.split(",") if item]
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m hermetic",
+        description="Hermetic benchmark of the online feature vector retrieval.",
+    )
+    parser.add_argument("--client", type=_csv(str), default=["rest", "sql"])
+    parser.add_argument("--mode", type=_csv(str), default=["single", "batch"])
+    parser.add_argument("--concurrency", type=_csv(int), default=[1, 8])
+    parser.add_argument(
+        "--batch-size",
+        type=_csv(int),
+        default=[100],
+        help="Entries per get_feature_vectors call of the batch mode.",
+    )
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--warmup", type=float, default=1.0)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--feature-groups", type=int, default=2)
+    parser.add_argument("--schema-repetitions", type=int, default=1)
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=0,
+        help="Size of the aiomysql connection pool, by default one per feature group.",
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINES)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Relative regression of a metric tolerated by --check.",
+    )
+    args = parser.parse_args(argv)
+    for client in args.client:
+        if client not in ("rest", "sql"):
+            parser.error(f"Unknown client {client!r}, use rest or sql.")
+    for mode in args.mode:
+        if mode not in ("single", "batch"):
+            parser.error(f"Unknown mode {mode!r}, use single or batch.")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    # the local RonDB REST server does not use TLS
+    logging.getLogger("hopsworks_common.client.online_store_rest_client").setLevel(
+        logging.ERROR
+    )
+    warnings.filterwarnings("ignore")
+
+    store = SyntheticFeatureStore(
+        feature_groups=args.feature_groups,
+        rows=args.rows,
+        schema_repetitions=args.schema_repetitions,
+    )
+    total, backend = LatencyRecorder(), LatencyRecorder()
+    rdrs = FakeRdrsServer(store, backend).start()
+    mysql = FakeMySQLServer(store, backend).start()
+    baselines = load_baselines(args.baseline)
+    results: dict[str, StageSummary] = {}
+    regressions: list[str] = []
+
+    print(
+        f"{'scenario':<34} {'stage':<8} {'requests':>9} {'p50 ms':>9} {'p99 ms':>9} {'qps':>10}"
+    )
+    try:
+        with _local_hopsworks(store, rdrs, mysql):
+            view = _init_serving(store, rdrs, args.pool_size)
+            for client in args.client:
+                for mode in args.mode:
+                    batch_sizes = args.batch_size if mode == "batch" else [0]
+                    for batch_size in batch_sizes:
+                        for concurrency in args.concurrency:
+                            scenario = f"{client}/{mode}/c{concurrency}" + (
+                                f"/b{batch_size}" if batch_size else ""
+                            )
+                            summaries = _run(
+                                view,
+                                client,
+                                batch_size,
+                                concurrency,
+                                args.rows,
+                                args.warmup,
+                                args.duration,
+                                total,
+                                backend,
+                            )
+                            for stage, summary in zip(
+                                ("total", "backend"), summaries, strict=True
+                            ):
+                                if summary is None:
+                                    continue
+                                key = f"{scenario}/{stage}"
+                                results[key] = summary
+                                print(
+                                    f"{scenario:<34} {stage:<8} {summary.requests:>9} "
+                                    f"{summary.p50_ms:>9.3f} {summary.p99_ms:>9.3f} "
+                                    f"{summary.qps:>10.1f}"
+                                )
+                                if key in baselines:
+                                    regressions.extend(
+                                        f"{key}: {regression}"
+                                        for regression in summary.regressions(
+                                            baselines[key], args.tolerance
+                                        )
+                                    )
+    finally:
+        rdrs.stop()
+        mysql.stop()
+
+    if args.save_baseline:
+        save_baselines(args.baseline, {**baselines, **results})
+        print(f"Saved {len(results)} baselines to {args.baseline}")
+    if regressions:
+        print("Regressions against the baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
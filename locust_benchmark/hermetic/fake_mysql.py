@@ -0,0 +1,371 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Local MySQL-protocol backend answering serving prepared statements.
+
+Implements the subset of the MySQL client/server protocol that aiomysql and
+PyMySQL use for online feature lookups: the `mysql_native_password` handshake
+(any credentials are accepted), `COM_QUERY` with text result sets, `COM_PING`,
+`COM_INIT_DB` and `COM_QUIT`. Queries must have the shape of the serving prepared
+statements, `SELECT ... FROM db.table AS alias WHERE alias.pk = v` or
+`... WHERE alias.pk IN (v, ...)`, and are answered from a `SyntheticFeatureStore`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import os
+import re
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from hermetic.stats import LatencyRecorder
+    from hermetic.synthetic import SyntheticFeatureStore
+
+
+_CLIENT_LONG_PASSWORD = 0x1
+_CLIENT_FOUND_ROWS = 0x2
+_CLIENT_LONG_FLAG = 0x4
+_CLIENT_CONNECT_WITH_DB = 0x8
+_CLIENT_PROTOCOL_41 = 0x200
+_CLIENT_TRANSACTIONS = 0x2000
+_CLIENT_SECURE_CONNECTION = 0x8000
+_CLIENT_MULTI_RESULTS = 0x20000
+_CLIENT_PLUGIN_AUTH = 0x80000
+_CAPABILITIES = (
+    _CLIENT_LONG_PASSWORD
+    | _CLIENT_FOUND_ROWS
+    | _CLIENT_LONG_FLAG
+    | _CLIENT_CONNECT_WITH_DB
+    | _CLIENT_PROTOCOL_41
+    | _CLIENT_TRANSACTIONS
+    | _CLIENT_SECURE_CONNECTION
+    | _CLIENT_MULTI_RESULTS
+    | _CLIENT_PLUGIN_AUTH
+)
+_SERVER_STATUS_AUTOCOMMIT = 0x2
+_UTF8MB4 = 45
+_BINARY = 63
+
+_COM_QUIT = 0x01
+_COM_INIT_DB = 0x02
+_COM_QUERY = 0x03
+_COM_PING = 0x0E
+
+_MAX_PAYLOAD = 0xFFFFFF
+
+# column type, charset and flags of the text protocol column definitions
+_COLUMN_TYPES = {
+    "bigint": (0x08, _BINARY, 0x80),
+    "double": (0x05, _BINARY, 0x80),
+    "string": (0xFD, _UTF8MB4, 0),
+    "timestamp": (0x0C, _BINARY, 0x80),
+}
+
+_QUERY = re.compile(
+    r"^\s*SELECT\s+(?P<columns>.+?)\s+FROM\s+`(?P<database>[^`]+)`\.`(?P<table>[^`]+)`"
+    r"(?:\s+AS\s+`[^`]+`)?\s+WHERE\s+(?P<where>.+?)\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_COLUMN = re.compile(r"`[^`]+`\.`(?P<name>[^`]+)`(?:\s+AS\s+`(?P<label>[^`]+)`)?")
+_KEY_COLUMN = re.compile(r"`[^`]+`\.`([^`]+)`")
+_LITERAL = re.compile(
+    r"'(?P<string>(?:[^'\\]|\\.)*)'|(?P<number>-?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|(?P<null>NULL)",
+    re.IGNORECASE,
+)
+
+
+def _lenenc_int(value: int) -> bytes:
+    if value < 251:
+        return bytes([value])
+    if value < 1 << 16:
+        return b"\xfc" + struct.pack("<H", value)
+    if value < 1 << 24:
+        return b"\xfd" + struct.pack("<I", value)[:3]
+    return b"\xfe" + struct.pack("<Q", value)
+
+
+def _lenenc_str(value: bytes) -> bytes:
+    return _lenenc_int(len(value)) + value
+
+
+def _text_value(value: Any) -> bytes:
+    if value is None:
+        return b"\xfb"
+    if isinstance(value, datetime.datetime):
+        value = value.strftime("%Y-%m-%d %H:%M:%S")
+    elif isinstance(value, float):
+        value = repr(value)
+    return _lenenc_str(str(value).encode())
+
+
+def _literals(sql: str) -> list[Any]:
+    values = []
+    for match in _LITERAL.finditer(sql):
+        if match.group("string") is not None:
+            values.append(re.sub(r"\\(.)", r"\1", match.group("string")))
+        elif match.group("number") is not None:
+            number = match.group("number")
+            values.append(
+                int(number) if re.fullmatch(r"-?\d+", number) else float(number)
+            )
+        else:
+            values.append(None)
+    return values
+
+
+class _QueryError(Exception):
+    pass
+
+
+class _Connection:
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        server: FakeMySQLServer,
+        connection_id: int,
+    ):
+        self._reader = reader
+        self._writer = writer
+        self._server = server
+        self._connection_id = connection_id
+        self._sequence = 0
+
+    async def serve(self) -> None:
+        try:
+            self._send(self._greeting())
+            await self._read()  # handshake response, every user is accepted
+            self._send(self._ok())
+            await self._writer.drain()
+            while True:
+                payload = await self._read()
+                command = payload[0]
+                if command == _COM_QUIT:
+                    break
+                start = time.perf_counter()
+                if command == _COM_QUERY:
+                    self._query(payload[1:].decode())
+                elif command in (_COM_PING, _COM_INIT_DB):
+                    self._send(self._ok())
+                else:
+                    self._send(self._error(1047, f"Unknown command {command}"))
+                await self._writer.drain()
+                if command == _COM_QUERY:
+                    self._server.recorder.record(time.perf_counter() - start)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writer.close()
+
+    async def _read(self) -> bytes:
+        payload = b""
+        while True:
+            header = await self._reader.readexactly(4)
+            length = int.from_bytes(header[:3], "little")
+            self._sequence = (header[3] + 1) % 256
+            payload += await self._reader.readexactly(length)
+            if length < _MAX_PAYLOAD:
+                return payload
+
+    def _send(self, payload: bytes) -> None:
+        while True:
+            chunk, payload = payload[:_MAX_PAYLOAD], payload[_MAX_PAYLOAD:]
+            self._writer.write(
+                len(chunk).to_bytes(3, "little") + bytes([self._sequence]) + chunk
+            )
+            self._sequence = (self._sequence + 1) % 256
+            if len(chunk) < _MAX_PAYLOAD:
+                return
+
+    def _greeting(self) -> bytes:
+        salt = os.urandom(20).replace(b"\0", b"\1")
+        return b"".join(
+            (
+                b"\x0a",
+                b"8.0.36-hermetic\0",
+                struct.pack("<I", self._connection_id),
+                salt[:8],
+                b"\0",
+                struct.pack("<H", _CAPABILITIES & 0xFFFF),
+                bytes([_UTF8MB4]),
+                struct.pack("<H", _SERVER_STATUS_AUTOCOMMIT),
+                struct.pack("<H", _CAPABILITIES >> 16),
+                bytes([len(salt) + 1]),
+                b"\0" * 10,
+                salt[8:],
+                b"\0",
+                b"mysql_native_password\0",
+            )
+        )
+
+    @staticmethod
+    def _ok() -> bytes:
+        return b"\x00\x00\x00" + struct.pack("<HH", _SERVER_STATUS_AUTOCOMMIT, 0)
+
+    @staticmethod
+    def _eof() -> bytes:
+        return b"\xfe" + struct.pack("<HH", 0, _SERVER_STATUS_AUTOCOMMIT)
+
+    @staticmethod
+    def _error(code: int, message: str) -> bytes:
+        return b"\xff" + struct.pack("<H", code) + b"#HY000" + message.encode()
+
+    def _query(self, sql: str) -> None:
+        match = _QUERY.match(sql)
+        if match is None:
+            if re.match(r"\s*SELECT\b", sql, re.IGNORECASE):
+                self._send(self._error(1064, f"Unsupported query: {sql[:200]}"))
+            else:
+                # SET statements and the like
+                self._send(self._ok())
+            return
+        try:
+            columns, types, rows = self._select(match)
+        except _QueryError as e:
+            self._send(self._error(1146, str(e)))
+            return
+
+        self._send(_lenenc_int(len(columns)))
+        for (name, label), type in zip(columns, types, strict=True):
+            column_type, charset, flags = _COLUMN_TYPES[type]
+            self._send(
+                b"".join(
+                    (
+                        _lenenc_str(b"def"),
+                        _lenenc_str(match.group("database").encode()),
+                        _lenenc_str(match.group("table").encode()),
+                        _lenenc_str(match.group("table").encode()),
+                        _lenenc_str(label.encode()),
+                        _lenenc_str(name.encode()),
+                        b"\x0c",
+                        struct.pack("<HIBHB", charset, 255, column_type, flags, 0),
+                        b"\0\0",
+                    )
+                )
+            )
+        self._send(self._eof())
+        for row in rows:
+            self._send(b"".join(_text_value(value) for value in row))
+        self._send(self._eof())
+
+    def _select(
+        self, match: re.Match
+    ) -> tuple[list[tuple[str, str]], list[str], list[tuple]]:
+        table = self._server.store.table(match.group("table"))
+        if table is None:
+            raise _QueryError(f"Table '{match.group('table')}' doesn't exist")
+        columns = [
+            (column.group("name"), column.group("label") or column.group("name"))
+            for column in _COLUMN.finditer(match.group("columns"))
+        ]
+        try:
+            positions = [table.columns.index(name) for name, _ in columns]
+        except ValueError as e:
+            raise _QueryError(f"Unknown column in '{table.name}': {e}") from e
+
+        where = match.group("where")
+        operator = re.search(r"\bIN\b|=", where, re.IGNORECASE)
+        if operator is None:
+            raise _QueryError(f"Unsupported filter: {where}")
+        keys = _KEY_COLUMN.findall(where[: operator.start()])
+        values = _literals(where[operator.end() :])
+        lookups = [
+            tuple(values[i : i + len(keys)]) for i in range(0, len(values), len(keys))
+        ]
+        if keys != table.columns[: len(keys)]:
+            raise _QueryError(f"Lookups must filter on the primary key of {table.name}")
+
+        rows = []
+        for lookup in lookups:
+            row = table.lookup(lookup[0] if len(lookup) == 1 else lookup)
+            if row is not None:
+                rows.append(tuple(row[position] for position in positions))
+        return columns, [table.types[position] for position in positions], rows
+
+
+class FakeMySQLServer:
+    """MySQL-protocol server answering online feature lookups from memory.
+
+    Parameters:
+        store: Feature groups to serve, one table per feature group.
+        recorder: Receives the time spent handling each query.
+        host: Interface to listen on.
+        port: Port to listen on, `0` picks a free one.
+    """
+
+    def __init__(
+        self,
+        store: SyntheticFeatureStore,
+        recorder: LatencyRecorder,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.store = store
+        self.recorder = recorder
+        self._host = host
+        self._port = port
+        self._connections = 0
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._loop = asyncio.new_event_loop()
+        self._server: asyncio.Server | None = None
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="fake-mysql", daemon=True
+        )
+
+    @property
+    def host(self) -> str:
+        return self._host
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    def start(self) -> FakeMySQLServer:
+        self._thread.start()
+        self._server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._accept, self._host, self._port), self._loop
+        ).result()
+        self._port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def stop(self) -> None:
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _shutdown(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        # closing the transports ends the pending reads of the open connections
+        for writer in list(self._writers):
+            writer.close()
+        while self._writers:
+            await asyncio.sleep(0.01)
+
+    async def _accept(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._connections += 1
+        self._writers.add(writer)
+        try:
+            await _Connection(reader, writer, self, self._connections).serve()
+        finally:
+            self._writers.discard(writer)
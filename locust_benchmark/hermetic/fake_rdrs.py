@@ -0,0 +1,169 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Local stand-in of the RonDB REST server feature store API.
+
+Serves `GET /{version}/ping`, `POST /{version}/feature_store` and
+`POST /{version}/batch_feature_store` from a `SyntheticFeatureStore`, with the
+response shape documented in `OnlineStoreRestClientApi`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+from hermetic.synthetic import PRIMARY_KEY
+
+
+if TYPE_CHECKING:
+    from hermetic.stats import LatencyRecorder
+    from hermetic.synthetic import SyntheticFeatureStore
+
+
+API_KEY_HEADER = "X-API-KEY"
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    return value
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, avoid waiting for delayed ACKs
+    disable_nagle_algorithm = True
+    server: _Server
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        if self.path.rstrip("/").endswith("/ping"):
+            self._reply(HTTPStatus.OK, {})
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, {"message": f"No route {self.path}"})
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        start = time.perf_counter()
+        if not self.headers.get(API_KEY_HEADER):
+            self._reply(HTTPStatus.UNAUTHORIZED, {"message": "Missing API key"})
+            return
+        payload = json.loads(body)
+        endpoint = self.path.rstrip("/").rsplit("/", 1)[-1]
+        if endpoint == "feature_store":
+            response = self._single(payload)
+        elif endpoint == "batch_feature_store":
+            response = self._batch(payload)
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, {"message": f"No route {self.path}"})
+            return
+        self._reply(HTTPStatus.OK, response)
+        self.server.recorder.record(time.perf_counter() - start)
+
+    def _lookup(self, entry: dict[str, Any]) -> tuple[str, list, list]:
+        values, detailed_status = self.server.store.feature_vector(entry[PRIMARY_KEY])
+        complete = all(status["httpStatus"] == 200 for status in detailed_status)
+        return (
+            "COMPLETE" if complete else "MISSING",
+            [_encode(value) for value in values],
+            detailed_status,
+        )
+
+    def _single(self, payload: dict[str, Any]) -> dict[str, Any]:
+        status, features, detailed_status = self._lookup(payload["entries"])
+        response = {"status": status, "features": features, "metadata": None}
+        if payload.get("options", {}).get("includeDetailedStatus"):
+            response["detailedStatus"] = detailed_status
+        return response
+
+    def _batch(self, payload: dict[str, Any]) -> dict[str, Any]:
+        results = [self._lookup(entry) for entry in payload["entries"]]
+        response = {
+            "status": [status for status, _, _ in results],
+            "features": [features for _, features, _ in results],
+            "metadata": None,
+        }
+        if payload.get("options", {}).get("includeDetailedStatus"):
+            response["detailedStatus"] = [status for _, _, status in results]
+        return response
+
+    def _reply(self, status: HTTPStatus, body: dict[str, Any]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        store: SyntheticFeatureStore,
+        recorder: LatencyRecorder,
+    ):
+        super().__init__(address, _Handler)
+        self.store = store
+        self.recorder = recorder
+
+
+class FakeRdrsServer:
+    """RonDB REST server answering feature vector lookups from memory.
+
+    Parameters:
+        store: Feature groups to serve.
+        recorder: Receives the time spent handling each lookup request.
+        host: Interface to listen on.
+        port: Port to listen on, `0` picks a free one.
+    """
+
+    def __init__(
+        self,
+        store: SyntheticFeatureStore,
+        recorder: LatencyRecorder,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self._server = _Server((host, port), store, recorder)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="fake-rdrs", daemon=True
+        )
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def start(self) -> FakeRdrsServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,101 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Latency recording and baseline comparison of the hermetic benchmark."""
+
+from __future__ import annotations
+
+import json
+import math
+import threading
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass(frozen=True)
+class StageSummary:
+    """Latency percentiles and throughput of one benchmark stage."""
+
+    requests: int
+    p50_ms: float
+    p99_ms: float
+    qps: float
+
+    def regressions(self, baseline: StageSummary, tolerance: float) -> list[str]:
+        """Return a description of each metric worse than `baseline` by more than `tolerance`."""
+        found = []
+        for metric in ("p50_ms", "p99_ms"):
+            current, reference = getattr(self, metric), getattr(baseline, metric)
+            if current > reference * (1 + tolerance):
+                found.append(f"{metric} {current:.3f} > {reference:.3f}")
+        if self.qps < baseline.qps * (1 - tolerance):
+            found.append(f"qps {self.qps:.1f} < {baseline.qps:.1f}")
+        return found
+
+
+class LatencyRecorder:
+    """Thread-safe collector of request durations in seconds."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._durations: list[float] = []
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._durations.append(seconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._durations = []
+
+    def summary(self, elapsed: float) -> StageSummary | None:
+        """Summarize the recorded durations over a run of `elapsed` seconds."""
+        with self._lock:
+            durations = sorted(self._durations)
+        if not durations:
+            return None
+        return StageSummary(
+            requests=len(durations),
+            p50_ms=round(_percentile(durations, 0.50) * 1000, 3),
+            p99_ms=round(_percentile(durations, 0.99) * 1000, 3),
+            qps=round(len(durations) / elapsed, 1),
+        )
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def load_baselines(path: Path) -> dict[str, StageSummary]:
+    if not path.exists():
+        return {}
+    return {
+        key: StageSummary(**value)
+        for key, value in json.loads(path.read_text()).items()
+    }
+
+
+def save_baselines(path: Path, summaries: dict[str, StageSummary]) -> None:
+    path.write_text(
+        json.dumps(
+            {key: asdict(summary) for key, summary in sorted(summaries.items())},
+            indent=2,
+        )
+        + "\n"
+    )
@@ -0,0 +1,240 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Synthetic feature groups and the feature view metadata joining them.
+
+The online tables are held in memory and shared by the RonDB REST server and the
+MySQL stand-ins. The same object builds the `FeatureView`, serving keys and
+serving prepared statements that Hopsworks would otherwise return, shaped like
+the ones of a feature view created with `fg_0.select_all().join(fg_1.select_except(["id"]))`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+import string
+from dataclasses import dataclass, field
+from typing import Any
+
+from hsfs.constructor.prepared_statement_parameter import PreparedStatementParameter
+from hsfs.constructor.serving_prepared_statement import ServingPreparedStatement
+from hsfs.feature import Feature
+from hsfs.feature_group import FeatureGroup
+from hsfs.feature_view import FeatureView
+from hsfs.serving_key import ServingKey
+from hsfs.training_dataset_feature import TrainingDatasetFeature
+
+
+FEATURE_STORE_ID = 67
+FEATURE_STORE_NAME = "bench_featurestore"
+DATABASE = "bench"
+PRIMARY_KEY = "id"
+
+# One schema repetition adds one feature of each of these types per feature group.
+_KINDS = ("bigint", "double", "string", "timestamp")
+_EPOCH = datetime.datetime(2026, 1, 1)
+
+
+@dataclass
+class OnlineTable:
+    """In-memory online table of one synthetic feature group."""
+
+    feature_group_id: int
+    name: str
+    columns: list[str]
+    types: list[str]
+    rows: dict[Any, tuple] = field(default_factory=dict)
+
+    def lookup(self, key: Any) -> tuple | None:
+        return self.rows.get(key)
+
+
+def _value(kind: str, rng: random.Random) -> Any:
+    if kind == "bigint":
+        return rng.randrange(100_000)
+    if kind == "double":
+        return rng.random()
+    if kind == "string":
+        return "".join(rng.choices(string.ascii_lowercase, k=8))
+    return _EPOCH + datetime.timedelta(seconds=rng.randrange(86_400 * 365))
+
+
+class SyntheticFeatureStore:
+    """Feature groups keyed on `id`, joined into one feature view.
+
+    Parameters:
+        feature_groups: Number of joined feature groups.
+        rows: Number of primary key values per feature group.
+        schema_repetitions: Features of each type per feature group, as in the
+            locust benchmark configuration.
+        seed: Seed of the generated values.
+    """
+
+    def __init__(
+        self,
+        feature_groups: int = 2,
+        rows: int = 10_000,
+        schema_repetitions: int = 1,
+        seed: int = 0,
+    ):
+        rng = random.Random(seed)
+        self.rows = rows
+        self.tables: list[OnlineTable] = []
+        for i in range(feature_groups):
+            kinds = [kind for _ in range(schema_repetitions) for kind in _KINDS]
+            columns = [PRIMARY_KEY] + [
+                f"fg{i}_{kind}_{j // len(_KINDS)}" for j, kind in enumerate(kinds)
+            ]
+            table = OnlineTable(
+                feature_group_id=1000 + i,
+                name=f"bench_fg_{i}_1",
+                columns=columns,
+                types=["bigint", *kinds],
+            )
+            for key in range(rows):
+                table.rows[key] = (key, *(_value(kind, rng) for kind in kinds))
+            self.tables.append(table)
+        self._tables_by_name = {table.name: table for table in self.tables}
+
+    def table(self, name: str) -> OnlineTable | None:
+        return self._tables_by_name.get(name)
+
+    def feature_vector(self, key: Any) -> tuple[list[Any], list[dict[str, Any]]]:
+        """Return the feature view row of `key` with the per feature group status.
+
+        Parameters:
+            key: Primary key value.
+
+        Returns:
+            The ordered feature values, `None` for feature groups without the key,
+            and one RonDB REST server detailed status entry per feature group.
+        """
+        values = []
+        detailed_status = []
+        for index, table in enumerate(self.tables):
+            row = table.lookup(key)
+            found = row is not None
+            detailed_status.append(
+                {
+                    "operationId": str(index),
+                    "featureGroupId": table.feature_group_id,
+                    "httpStatus": 200 if found else 404,
+                }
+            )
+            start = 0 if index == 0 else 1
+            if found:
+                values.extend(row[start:])
+            else:
+                values.extend([key] if index == 0 else [])
+                values.extend([None] * (len(table.columns) - 1))
+        return values, detailed_status
+
+    def feature_groups(self) -> list[FeatureGroup]:
+        return [
+            FeatureGroup(
+                name=table.name[: -len("_1")],
+                version=1,
+                featurestore_id=FEATURE_STORE_ID,
+                id=table.feature_group_id,
+                primary_key=[PRIMARY_KEY],
+                online_enabled=True,
+                featurestore_name=FEATURE_STORE_NAME,
+                features=[
+                    Feature(name, type=type, primary=name == PRIMARY_KEY)
+                    for name, type in zip(table.columns, table.types, strict=True)
+                ],
+            )
+            for table in self.tables
+        ]
+
+    def feature_view(self) -> FeatureView:
+        """Build the feature view joining all feature groups on `id`."""
+        feature_groups = self.feature_groups()
+        query = feature_groups[0].select_all()
+        for feature_group in feature_groups[1:]:
+            query = query.join(
+                feature_group.select_except([PRIMARY_KEY]), on=[PRIMARY_KEY]
+            )
+
+        features = []
+        for index, (table, feature_group) in enumerate(
+            zip(self.tables, feature_groups, strict=True)
+        ):
+            for name, type in zip(table.columns, table.types, strict=True):
+                if index > 0 and name == PRIMARY_KEY:
+                    continue
+                features.append(
+                    TrainingDatasetFeature(
+                        name=name,
+                        type=type,
+                        index=len(features),
+                        featuregroup=feature_group,
+                        feature_group_feature_name=name,
+                    )
+                )
+
+        view = FeatureView(
+            name="bench_fv",
+            query=query,
+            featurestore_id=FEATURE_STORE_ID,
+            version=1,
+            featurestore_name=FEATURE_STORE_NAME,
+            serving_keys=[
+                ServingKey(
+                    feature_name=PRIMARY_KEY,
+                    join_index=index,
+                    feature_group=feature_group,
+                    required=index == 0,
+                    join_on=None if index == 0 else PRIMARY_KEY,
+                )
+                for index, feature_group in enumerate(feature_groups)
+            ],
+        )
+        view.schema = features
+        return view
+
+    def prepared_statements(self, batch: bool) -> list[ServingPreparedStatement]:
+        """Build the serving prepared statements Hopsworks returns for the view.
+
+        Parameters:
+            batch: Whether to build the statements of batch lookups, which filter
+                with `IN ?` instead of `= ?`.
+
+        Returns:
+            One prepared statement per feature group.
+        """
+        statements = []
+        for index, table in enumerate(self.tables):
+            alias = f"fg{index}"
+            select = ", ".join(
+                f"`{alias}`.`{name}` AS `{name}`" for name in table.columns
+            )
+            operator = "IN" if batch else "="
+            statements.append(
+                ServingPreparedStatement(
+                    feature_group_id=table.feature_group_id,
+                    prepared_statement_index=index,
+                    prepared_statement_parameters=[
+                        PreparedStatementParameter(name=PRIMARY_KEY, index=1)
+                    ],
+                    query_online=(
+                        f"SELECT {select}\nFROM `{DATABASE}`.`{table.name}` AS `{alias}`"
+                        f"\nWHERE `{alias}`.`{PRIMARY_KEY}` {operator} ?"
+                    ),
+                    prefix=None,
+                )
+            )
+        return statements
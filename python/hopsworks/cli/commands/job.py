@@ -489,6 +489,71 @@ def job_stop(ctx: click.Context, name: str) -> None:
     output.success("✓ Stopped execution %s of %s", getattr(latest, "id", "?"), name)
 
 
+@job_group.command("wait")
+@click.argument("names", nargs=-1, required=True)
+@click.option(
+    "--timeout",
+    type=float,
+    default=None,
+    help="Maximum waiting time in seconds; unbounded by default.",
+)
+@click.pass_context
+def job_wait(ctx: click.Context, names: tuple[str, ...], timeout: float | None) -> None:
+    """Wait for the most recent executions of one or more jobs to finish.
+
+    The executions are polled together, so waiting for many jobs costs
+    about as many requests as waiting for one. Each execution is reported
+    as soon as it finishes; the command fails if any of them failed or did
+    not finish within ``--timeout``.
+
+    Args:
+        ctx: Click context.
+        names: Job names.
+        timeout: Maximum waiting time in seconds.
+    """
+    from hopsworks_common import execution_waiter  # noqa: PLC0415
+
+    latest = []
+    for name in names:
+        executions = _executions(_get_job(ctx, name))
+        if not executions:
+            raise click.ClickException(f"No executions for job '{name}'.")
+        latest.append(executions[0])
+
+    finished, failed = [], []
+    try:
+        for execution in execution_waiter.as_completed(latest, timeout=timeout):
+            finished.append(execution)
+            if execution.success:
+                output.success(
+                    "✓ %s execution #%s %s",
+                    execution.job_name,
+                    execution.id,
+                    execution.state,
+                )
+            else:
+                failed.append(execution)
+                output.error(
+                    "✗ %s execution #%s %s (%s)",
+                    execution.job_name,
+                    execution.id,
+                    execution.state,
+                    execution.final_status,
+                )
+    except TimeoutError:
+        unfinished = len(latest) - len(finished)
+        raise click.ClickException(
+            f"{unfinished} execution(s) did not finish within {timeout} seconds."
+        ) from None
+    except Exception as exc:  # noqa: BLE001
+        raise click.ClickException(f"Wait failed: {exc}") from exc
+    finally:
+        if output.JSON_MODE:
+            output.print_json([_execution_to_dict(e) for e in finished])
+    if failed:
+        raise click.ClickException(f"{len(failed)} execution(s) failed.")
+
+
 @job_group.command("logs")
 @click.argument("name")
 @click.option(
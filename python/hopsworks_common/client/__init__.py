@@ -19,7 +19,7 @@ from __future__ import annotations
 from typing import Literal
 
 from hopsworks_apigen import also_available_as
-from hopsworks_common.client import external, hopsworks, istio
+from hopsworks_common.client import external, hopsworks, istio, response_cache
 from hopsworks_common.constants import HOSTS
 
 
@@ -55,6 +55,7 @@ def _init(
                 api_key_file,
                 api_key_value,
             )
+        _client._response_cache = response_cache._from_environ()
     elif _client._is_external() and not _client._project_name:
         _client._provide_project(project)
 
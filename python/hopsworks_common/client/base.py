@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import json
 import logging
 import os
 import struct
@@ -34,7 +35,7 @@ from cryptography.hazmat.primitives.serialization import (
     load_der_private_key,
 )
 from hopsworks_apigen import also_available_as
-from hopsworks_common.client import auth, exceptions
+from hopsworks_common.client import auth, exceptions, response_cache
 from hopsworks_common.decorators import _connected
 
 
@@ -58,6 +59,9 @@ class Client:
     DEFAULT_DATABRICKS_ROOT_VIRTUALENV_ENV = "DEFAULT_DATABRICKS_ROOT_VIRTUALENV_ENV"
     HOPSWORKS_PUBLIC_HOST = "HOPSWORKS_PUBLIC_HOST"
 
+    # opt-in cache of metadata GET responses, see `response_cache`
+    _response_cache: response_cache.ResponseCache | None = None
+
     def _get_verify(self, verify: bool, trust_store_path: str | None) -> str | bool:
         """Get verification method for sending HTTP requests to Hopsworks.
 
@@ -133,6 +137,7 @@ class Client:
         """Send REST request to Hopsworks.
 
         Uses the client it is executed from. Path parameters are url encoded automatically.
+        If the metadata response cache is enabled, `GET` requests of feature store metadata may be answered from it, see `hopsworks_common.client.response_cache`.
 
         Parameters:
             method: 'GET', 'PUT' or 'POST'
@@ -158,6 +163,18 @@ class Client:
             f_url.path.segments = path_params
         url = str(f_url)
 
+        cache = self._response_cache if with_base_path_params else None
+        cache_key = cache_ttl = cached = None
+        if cache is not None and method == "GET" and not stream:
+            cache_ttl = cache._ttl(path_params)
+            if cache_ttl is not None:
+                cache_key = cache._key(path_params, url, query_params, headers)
+                cached = cache._get(cache_key)
+                if cached is not None and cached.expires > time.monotonic():
+                    return json.loads(cached.content)
+                if cached is not None and cached.etag is not None:
+                    headers = {**(headers or {}), "If-None-Match": cached.etag}
+
         request = requests.Request(
             method,
             url=url,
@@ -170,14 +187,32 @@ class Client:
 
         _logger.debug(f"url:{url} hostname_verification:{self._verify}")
 
-        prepped = self._session.prepare_request(request)
-        response = self._session.send(prepped, verify=self._verify, stream=stream)
+        try:
+            prepped = self._session.prepare_request(request)
+            response = self._session.send(prepped, verify=self._verify, stream=stream)
 
-        if response.status_code == 401 and self.REST_ENDPOINT in os.environ:
-            # refresh token and retry request - only on hopsworks
-            response = self._retry_token_expired(
-                request, stream, self.TOKEN_EXPIRED_RETRY_INTERVAL, 1
-            )
+            if response.status_code == 401 and self.REST_ENDPOINT in os.environ:
+                # refresh token and retry request - only on hopsworks
+                response = self._retry_token_expired(
+                    request, stream, self.TOKEN_EXPIRED_RETRY_INTERVAL, 1
+                )
+        finally:
+            if cache is not None and method != "GET":
+                # drop the cached metadata the request may have changed, even if
+                # it failed, as the server may have applied it nonetheless
+                cache.invalidate(path_params)
+
+        if cache_key is not None:
+            if response.status_code == 304 and cached is not None:
+                cache._revalidated(cache_key, cached, cache_ttl)
+                return json.loads(cached.content)
+            if response.status_code == 200 and len(response.content) > 0:
+                cache._put(
+                    cache_key,
+                    response.content,
+                    response.headers.get("ETag"),
+                    cache_ttl,
+                )
 
         if response.status_code // 100 != 2:
             raise exceptions.RestAPIError(url, response)
@@ -115,6 +115,7 @@ class VectorDatabaseException(Exception):
     # reason
     REQUESTED_K_TOO_LARGE = "REQUESTED_K_TOO_LARGE"
     REQUESTED_NUM_RESULT_TOO_LARGE = "REQUESTED_NUM_RESULT_TOO_LARGE"
+    POINT_IN_TIME_UNAVAILABLE = "POINT_IN_TIME_UNAVAILABLE"
     OTHERS = "OTHERS"
 
     # info
@@ -34,10 +34,6 @@ if TYPE_CHECKING:
     from urllib.parse import ParseResult
 
 
-with contextlib.suppress(ImportError):
-    from pyspark.sql import SparkSession
-
-
 _logger = logging.getLogger(__name__)
 
 
@@ -124,6 +120,8 @@ class Client(base.Client):
             # are needed when the application starts (before user code is run)
             # So in this case, we can't materialize the certificates on the fly.
             _logger.debug("Running in Spark environment, initializing Spark session")
+            from pyspark.sql import SparkSession
+
             _spark_session = SparkSession.builder.enableHiveSupport().getOrCreate()
 
             self._validate_spark_configuration(_spark_session)
@@ -148,6 +146,7 @@ class Client(base.Client):
             # The session created here is reused by the engine, so this is
             # the only place where these configs take effect.
             from hopsworks_common.spark_connect_utils import _is_spark_connect_env
+            from pyspark.sql import SparkSession
 
             builder = SparkSession.builder
             if _is_spark_connect_env():
@@ -189,6 +188,8 @@ class Client(base.Client):
                 "Running in Spark environment with no metastore and hopsfs, initializing Spark session"
             )
             self._download_certs()
+            from pyspark.sql import SparkSession
+
             _spark_session = (
                 SparkSession.builder.config(
                     "spark.sql.extensions", "io.delta.sql.DeltaSparkSessionExtension"
@@ -17,12 +17,17 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from typing import TYPE_CHECKING
 
 from hopsworks_apigen import also_available_as
 from hopsworks_common.client import base
-from hopsworks_common.client.istio.grpc.inference_client import (
-    GRPCInferenceServerClient,
-)
+
+
+if TYPE_CHECKING:
+    from hopsworks_common.client.istio.grpc.inference_client import (
+        AsyncGRPCInferenceServerClient,
+        GRPCInferenceServerClient,
+    )
 
 
 @also_available_as("hsml.client.istio.base.Client")
@@ -74,8 +79,27 @@ class Client(base.Client):
         self._connected = False
 
     def _create_grpc_channel(self, path_prefix: str) -> GRPCInferenceServerClient:
+        # grpc and the protobuf codecs are only needed for gRPC inference
+        from hopsworks_common.client.istio.grpc.inference_client import (
+            GRPCInferenceServerClient,
+        )
+
         return GRPCInferenceServerClient(
             url=self._host + ":" + str(self._port),
             path_prefix=path_prefix,
             serving_api_key=self._auth._token,
         )
+
+    def _create_async_grpc_client(
+        self, path_prefix: str, num_channels: int = 1
+    ) -> AsyncGRPCInferenceServerClient:
+        from hopsworks_common.client.istio.grpc.inference_client import (
+            AsyncGRPCInferenceServerClient,
+        )
+
+        return AsyncGRPCInferenceServerClient(
+            url=self._host + ":" + str(self._port),
+            path_prefix=path_prefix,
+            serving_api_key=self._auth._token,
+            num_channels=num_channels,
+        )
@@ -13,12 +13,37 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING
+
 import grpc
 from hopsworks_apigen import also_available_as
-from hopsworks_common.client.istio.grpc.proto.grpc_predict_v2_pb2_grpc import (
-    GRPCInferenceServiceStub,
+from hopsworks_common.client.istio.grpc.proto import (
+    grpc_predict_v2_pb2,
+    grpc_predict_v2_pb2_grpc,
 )
-from hopsworks_common.client.istio.utils.infer_type import InferRequest, InferResponse
+from hopsworks_common.client.istio.utils.infer_type import (
+    InferenceServerException,
+    InferRequest,
+    InferResponse,
+)
+
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable
+
+
+_CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+]
+_MODEL_INFER = "/inference.GRPCInferenceService/ModelInfer"
+_MODEL_STREAM_INFER = "/inference.GRPCInferenceService/ModelStreamInfer"
 
 
 @also_available_as("hsml.client.istio.grpc.inference_client._PathPrefixInterceptor")
@@ -66,13 +91,8 @@ class GRPCInferenceServerClient:
         serving_api_key,
         path_prefix=None,
     ):
-        channel_opt = [
-            ("grpc.max_send_message_length", -1),
-            ("grpc.max_receive_message_length", -1),
-        ]
-
         # Authentication is done via API Key in the Authorization header
-        self._channel = grpc.insecure_channel(url, options=channel_opt)
+        self._channel = grpc.insecure_channel(url, options=_CHANNEL_OPTIONS)
 
         # Apply path prefix interceptor for path-based routing
         if path_prefix:
@@ -80,7 +100,9 @@ class GRPCInferenceServerClient:
                 self._channel, _PathPrefixInterceptor(path_prefix)
             )
 
-        self._client_stub = GRPCInferenceServiceStub(self._channel)
+        self._client_stub = grpc_predict_v2_pb2_grpc.GRPCInferenceServiceStub(
+            self._channel
+        )
         self._serving_api_key = serving_api_key
 
     def __enter__(self):
@@ -115,3 +137,209 @@ class GRPCInferenceServerClient:
 
         # convert back the ModelInferResponse message to InferResponse
         return InferResponse.from_grpc(model_infer_response)
+
+
+@also_available_as(
+    "hsml.client.istio.grpc.inference_client.AsyncGRPCInferenceServerClient"
+)
+class AsyncGRPCInferenceServerClient:
+    """Asyncio client of the KServe v2 gRPC inference protocol.
+
+    The client keeps a pool of `num_channels` HTTP/2 channels and spreads the calls over them round-robin, so that many inferences can be in flight at once.
+    gRPC asyncio channels are bound to the event loop they are created in, so the pool is created lazily for each running event loop.
+    A client can therefore be shared by threads running their own event loop, each of them reusing its own connections.
+
+    ```python
+    async with AsyncGRPCInferenceServerClient(url, api_key) as client:
+        responses = await asyncio.gather(*(client.infer(r) for r in requests))
+        async for response in client.stream_infer(requests):
+            print(response.id, response.outputs)
+    ```
+
+    Parameters:
+        url: The `host:port` of the inference server.
+        serving_api_key: The API key used to authenticate the requests.
+        path_prefix: The prefix of the method paths, used for path-based routing.
+        num_channels: The number of channels in the pool of each event loop.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        serving_api_key: str,
+        path_prefix: str | None = None,
+        num_channels: int = 1,
+    ):
+        if num_channels < 1:
+            raise ValueError("num_channels must be at least 1.")
+        self._url = url
+        self._serving_api_key = serving_api_key
+        self._path_prefix = path_prefix or ""
+        self._num_channels = num_channels
+        self._lock = threading.Lock()
+        self._pools: dict[asyncio.AbstractEventLoop, _AsyncChannelPool] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        await self.close()
+
+    def _get_pool(self) -> _AsyncChannelPool:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                # drop the pools of the event loops which are gone
+                for closed in [lp for lp in self._pools if lp.is_closed()]:
+                    del self._pools[closed]
+                pool = self._pools[loop] = _AsyncChannelPool(
+                    self._url, self._path_prefix, self._num_channels
+                )
+            return pool
+
+    def _metadata(self, headers: dict | None) -> tuple:
+        headers = {} if headers is None else dict(headers)
+        headers["authorization"] = "ApiKey " + self._serving_api_key
+        return tuple(headers.items())
+
+    async def close(self):
+        """Close the channels of the running event loop.
+
+        Calls made afterwards from the event loop open new channels.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.pop(loop, None)
+        if pool is not None:
+            await pool.close()
+
+    async def infer(
+        self,
+        infer_request: InferRequest,
+        headers: dict | None = None,
+        client_timeout: float | None = None,
+    ) -> InferResponse:
+        """Send an inference request.
+
+        Parameters:
+            infer_request: The inference request.
+            headers: Additional headers of the request.
+            client_timeout: The maximum time in seconds to wait for the response.
+
+        Returns:
+            The inference response.
+
+        Raises:
+            grpc.aio.AioRpcError: If the call fails.
+        """
+        model_infer_response = (
+            await self._get_pool()
+            .next()
+            .model_infer(
+                infer_request.to_grpc(),
+                metadata=self._metadata(headers),
+                timeout=client_timeout,
+            )
+        )
+        return InferResponse.from_grpc(model_infer_response)
+
+    async def stream_infer(
+        self,
+        infer_requests: Iterable[InferRequest] | AsyncIterable[InferRequest],
+        headers: dict | None = None,
+        client_timeout: float | None = None,
+    ) -> AsyncIterator[InferResponse]:
+        """Send inference requests over a single bidirectional `ModelStreamInfer` stream.
+
+        Requests are sent as they are produced by `infer_requests`, without waiting for the responses of the previous ones.
+        Responses are yielded as the server completes them, which may differ from the order of the requests.
+        Requests without an id get their position in `infer_requests` as id, so that responses can be matched by their `id`.
+
+        Parameters:
+            infer_requests: The inference requests, either an iterable or an async iterable.
+            headers: Additional headers of the stream.
+            client_timeout: The maximum time in seconds the whole stream may take.
+
+        Yields:
+            The inference responses, in the order they complete.
+
+        Raises:
+            hopsworks_common.client.istio.utils.infer_type.InferenceServerException: If the server fails to process a request.
+            grpc.aio.AioRpcError: If the stream fails.
+        """
+        call = (
+            self._get_pool()
+            .next()
+            .model_stream_infer(
+                _to_grpc_requests(infer_requests),
+                metadata=self._metadata(headers),
+                timeout=client_timeout,
+            )
+        )
+        try:
+            async for response in call:
+                if response.error_message:
+                    raise InferenceServerException(msg=response.error_message)
+                yield InferResponse.from_grpc(response.infer_response)
+        finally:
+            # stop sending the remaining requests if the caller stops consuming
+            call.cancel()
+
+
+class _AsyncChannelPool:
+    """Channels of an event loop, with the inference methods bound to each of them."""
+
+    def __init__(self, url: str, path_prefix: str, num_channels: int):
+        self._channels = [_AsyncChannel(url, path_prefix) for _ in range(num_channels)]
+        self._cycle = itertools.cycle(self._channels)
+
+    def next(self) -> _AsyncChannel:
+        return next(self._cycle)
+
+    async def close(self):
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+
+
+class _AsyncChannel:
+    def __init__(self, url: str, path_prefix: str):
+        # channels with the same target share their connection through the global
+        # subchannel pool, use a local one so that each channel of the pool opens
+        # its own connection
+        self._channel = grpc.aio.insecure_channel(
+            url,
+            options=[*_CHANNEL_OPTIONS, ("grpc.use_local_subchannel_pool", 1)],
+        )
+        # the path prefix is prepended to the methods directly, as interceptors
+        # would add a hop to every message of a stream
+        self.model_infer = self._channel.unary_unary(
+            path_prefix + _MODEL_INFER,
+            request_serializer=grpc_predict_v2_pb2.ModelInferRequest.SerializeToString,
+            response_deserializer=grpc_predict_v2_pb2.ModelInferResponse.FromString,
+        )
+        self.model_stream_infer = self._channel.stream_stream(
+            path_prefix + _MODEL_STREAM_INFER,
+            request_serializer=grpc_predict_v2_pb2.ModelInferRequest.SerializeToString,
+            response_deserializer=grpc_predict_v2_pb2.ModelStreamInferResponse.FromString,
+        )
+
+    async def close(self):
+        await self._channel.close()
+
+
+async def _to_grpc_requests(
+    infer_requests: Iterable[InferRequest] | AsyncIterable[InferRequest],
+) -> AsyncIterator[grpc_predict_v2_pb2.ModelInferRequest]:
+    if not isinstance(infer_requests, AsyncIterable):
+        infer_requests = _aiter(infer_requests)
+    index = 0
+    async for infer_request in infer_requests:
+        if infer_request.id is None:
+            infer_request.id = str(index)
+        index += 1
+        yield infer_request.to_grpc()
+
+
+async def _aiter(iterable: Iterable) -> AsyncIterator:
+    for item in iterable:
+        yield item
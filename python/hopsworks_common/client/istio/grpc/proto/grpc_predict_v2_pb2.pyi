@@ -321,6 +321,18 @@ class ModelReadyResponse(_message.Message):
     ready: bool
     def __init__(self, ready: bool = ...) -> None: ...
 
+class ModelStreamInferResponse(_message.Message):
+    __slots__ = ["error_message", "infer_response"]
+    ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    INFER_RESPONSE_FIELD_NUMBER: _ClassVar[int]
+    error_message: str
+    infer_response: ModelInferResponse
+    def __init__(
+        self,
+        error_message: str | None = ...,
+        infer_response: ModelInferResponse | _Mapping | None = ...,
+    ) -> None: ...
+
 class RepositoryModelLoadRequest(_message.Message):
     __slots__ = ["model_name"]
     MODEL_NAME_FIELD_NUMBER: _ClassVar[int]
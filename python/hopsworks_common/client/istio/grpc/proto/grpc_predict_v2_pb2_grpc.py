@@ -17,20 +17,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-import hopsworks_common.client.istio.grpc.inference_client as inference_client
+import grpc
 import hopsworks_common.client.istio.grpc.proto.grpc_predict_v2_pb2 as grpc__predict__v2__pb2
 
 
-if TYPE_CHECKING:
-    import grpc._channel
-
-
 class GRPCInferenceServiceStub:
     """Inference Server GRPC endpoints."""
 
-    def __init__(self, channel: grpc._channel.Channel):
+    def __init__(self, channel: grpc.Channel):
         """Constructor.
 
         Parameters:
@@ -66,6 +60,11 @@ class GRPCInferenceServiceStub:
             request_serializer=grpc__predict__v2__pb2.ModelInferRequest.SerializeToString,
             response_deserializer=grpc__predict__v2__pb2.ModelInferResponse.FromString,
         )
+        self.ModelStreamInfer = channel.stream_stream(
+            "/inference.GRPCInferenceService/ModelStreamInfer",
+            request_serializer=grpc__predict__v2__pb2.ModelInferRequest.SerializeToString,
+            response_deserializer=grpc__predict__v2__pb2.ModelStreamInferResponse.FromString,
+        )
         self.RepositoryModelLoad = channel.unary_unary(
             "/inference.GRPCInferenceService/RepositoryModelLoad",
             request_serializer=grpc__predict__v2__pb2.RepositoryModelLoadRequest.SerializeToString,
@@ -88,7 +87,7 @@ class GRPCInferenceServiceServicer:
             request: The request message.
             context: The gRPC context.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
@@ -99,7 +98,7 @@ class GRPCInferenceServiceServicer:
             request: The request message.
             context: The gRPC context.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
@@ -110,7 +109,7 @@ class GRPCInferenceServiceServicer:
             request: The request message.
             context: The gRPC context.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
@@ -124,7 +123,7 @@ class GRPCInferenceServiceServicer:
         Errors are indicated by the google.rpc.Status returned for the request.
         The OK code indicates success and other codes indicate failure.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
@@ -138,7 +137,7 @@ class GRPCInferenceServiceServicer:
         Errors are indicated by the google.rpc.Status returned for the request.
         The OK code indicates success and other codes indicate failure.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
@@ -152,7 +151,21 @@ class GRPCInferenceServiceServicer:
         Errors are indicated by the google.rpc.Status returned for the request.
         The OK code indicates success and other codes indicate failure.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ModelStreamInfer(self, request_iterator, context):
+        """The ModelStreamInfer API performs inference on a stream of requests using the specified model.
+
+        Parameters:
+            request_iterator: The iterator of request messages.
+            context: The gRPC context.
+
+        A response is sent for each request as soon as it is ready.
+        Errors of a single request are indicated by the error_message of its response.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
@@ -163,7 +176,7 @@ class GRPCInferenceServiceServicer:
             request: The request message.
             context: The gRPC context.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
@@ -174,55 +187,60 @@ class GRPCInferenceServiceServicer:
             request: The request message.
             context: The gRPC context.
         """
-        context.set_code(inference_client.StatusCode.UNIMPLEMENTED)
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
 
 def add_GRPCInferenceServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
-        "ServerLive": inference_client.unary_unary_rpc_method_handler(
+        "ServerLive": grpc.unary_unary_rpc_method_handler(
             servicer.ServerLive,
             request_deserializer=grpc__predict__v2__pb2.ServerLiveRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.ServerLiveResponse.SerializeToString,
         ),
-        "ServerReady": inference_client.unary_unary_rpc_method_handler(
+        "ServerReady": grpc.unary_unary_rpc_method_handler(
             servicer.ServerReady,
             request_deserializer=grpc__predict__v2__pb2.ServerReadyRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.ServerReadyResponse.SerializeToString,
         ),
-        "ModelReady": inference_client.unary_unary_rpc_method_handler(
+        "ModelReady": grpc.unary_unary_rpc_method_handler(
             servicer.ModelReady,
             request_deserializer=grpc__predict__v2__pb2.ModelReadyRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.ModelReadyResponse.SerializeToString,
         ),
-        "ServerMetadata": inference_client.unary_unary_rpc_method_handler(
+        "ServerMetadata": grpc.unary_unary_rpc_method_handler(
             servicer.ServerMetadata,
             request_deserializer=grpc__predict__v2__pb2.ServerMetadataRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.ServerMetadataResponse.SerializeToString,
         ),
-        "ModelMetadata": inference_client.unary_unary_rpc_method_handler(
+        "ModelMetadata": grpc.unary_unary_rpc_method_handler(
             servicer.ModelMetadata,
             request_deserializer=grpc__predict__v2__pb2.ModelMetadataRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.ModelMetadataResponse.SerializeToString,
         ),
-        "ModelInfer": inference_client.unary_unary_rpc_method_handler(
+        "ModelInfer": grpc.unary_unary_rpc_method_handler(
             servicer.ModelInfer,
             request_deserializer=grpc__predict__v2__pb2.ModelInferRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.ModelInferResponse.SerializeToString,
         ),
-        "RepositoryModelLoad": inference_client.unary_unary_rpc_method_handler(
+        "ModelStreamInfer": grpc.stream_stream_rpc_method_handler(
+            servicer.ModelStreamInfer,
+            request_deserializer=grpc__predict__v2__pb2.ModelInferRequest.FromString,
+            response_serializer=grpc__predict__v2__pb2.ModelStreamInferResponse.SerializeToString,
+        ),
+        "RepositoryModelLoad": grpc.unary_unary_rpc_method_handler(
             servicer.RepositoryModelLoad,
             request_deserializer=grpc__predict__v2__pb2.RepositoryModelLoadRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.RepositoryModelLoadResponse.SerializeToString,
         ),
-        "RepositoryModelUnload": inference_client.unary_unary_rpc_method_handler(
+        "RepositoryModelUnload": grpc.unary_unary_rpc_method_handler(
             servicer.RepositoryModelUnload,
             request_deserializer=grpc__predict__v2__pb2.RepositoryModelUnloadRequest.FromString,
             response_serializer=grpc__predict__v2__pb2.RepositoryModelUnloadResponse.SerializeToString,
         ),
     }
-    generic_handler = inference_client.method_handlers_generic_handler(
+    generic_handler = grpc.method_handlers_generic_handler(
         "inference.GRPCInferenceService", rpc_method_handlers
     )
     server.add_generic_rpc_handlers((generic_handler,))
@@ -245,7 +263,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/ServerLive",
@@ -274,7 +292,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/ServerReady",
@@ -303,7 +321,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/ModelReady",
@@ -332,7 +350,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/ServerMetadata",
@@ -361,7 +379,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/ModelMetadata",
@@ -390,7 +408,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/ModelInfer",
@@ -406,6 +424,35 @@ class GRPCInferenceService:
             metadata,
         )
 
+    @staticmethod
+    def ModelStreamInfer(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            "/inference.GRPCInferenceService/ModelStreamInfer",
+            grpc__predict__v2__pb2.ModelInferRequest.SerializeToString,
+            grpc__predict__v2__pb2.ModelStreamInferResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
     @staticmethod
     def RepositoryModelLoad(
         request,
@@ -419,7 +466,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/RepositoryModelLoad",
@@ -448,7 +495,7 @@ class GRPCInferenceService:
         timeout=None,
         metadata=None,
     ):
-        return inference_client.experimental.unary_unary(
+        return grpc.experimental.unary_unary(
             request,
             target,
             "/inference.GRPCInferenceService/RepositoryModelUnload",
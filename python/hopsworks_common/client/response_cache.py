@@ -0,0 +1,214 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""In-memory cache of feature store metadata responses of the REST client.
+
+Successful `GET` responses of feature groups, feature views, storage
+connectors, training datasets and transformation functions are kept for a time
+to live depending on the resource type, so repeated lookups, for example when a
+job or a serving process initializes its feature views, do not reach the
+server. Once an entry expires, it is revalidated with its `ETag` through
+`If-None-Match`, and its body is reused if the server answers
+`304 Not Modified`. Any other request to a resource type, such as the `POST`
+inserting into a feature group, drops the entries of that type in the feature
+store. The total size of the cached bodies is bounded with least-recently-used
+eviction.
+
+The cache is opt-in through the `HOPSWORKS_METADATA_CACHE` environment
+variable, read when the client is initialized, either `true` for the defaults
+or a JSON object with the optional keys `"max_bytes"` and `"ttls"`, the latter
+mapping resource types to their time to live in seconds, where `0` disables
+caching of the type.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from urllib.parse import urlencode
+
+
+_logger = logging.getLogger(__name__)
+
+ENV_VAR = "HOPSWORKS_METADATA_CACHE"
+DEFAULT_MAX_BYTES = 64 * 1024**2
+# time to live in seconds of the responses of each resource type
+DEFAULT_TTLS = {
+    "featuregroups": 60.0,
+    "featureview": 60.0,
+    "storageconnectors": 30.0,
+    "trainingdatasets": 60.0,
+    "transformationfunctions": 300.0,
+}
+# sub-resources of an item whose responses are metadata as well, other
+# sub-resources such as statistics or commits are never cached
+_CACHEABLE_SUFFIXES = {"preparedstatement", "trainingdatasets"}
+
+
+class _Entry:
+    __slots__ = ("content", "etag", "expires")
+
+    def __init__(self, content: bytes, etag: str | None, expires: float):
+        self.content = content
+        self.etag = etag
+        self.expires = expires
+
+
+class ResponseCache:
+    """Size-bounded cache of metadata responses, keyed by URL, query and headers.
+
+    Parameters:
+        max_bytes: Maximum total size of the cached response bodies.
+        ttls: Time to live in seconds of each resource type, overriding `DEFAULT_TTLS`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: dict[str, float] | None = None,
+    ):
+        self._max_bytes = max_bytes
+        self._ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _resource(path_params: list) -> tuple[tuple[str, ...], list[str]] | None:
+        """Split a path into its resource collection and the segments after it.
+
+        Returns:
+            The path up to the resource type, such as `("project", "1", "featurestores", "2", "featuregroups")`, and the segments after it, or `None` if the path is not under a feature store.
+        """
+        segments = [str(p) for p in path_params]
+        if (
+            len(segments) < 5
+            or segments[0] != "project"
+            or segments[2] != "featurestores"
+        ):
+            return None
+        return tuple(segments[:5]), segments[5:]
+
+    def _ttl(self, path_params: list) -> float | None:
+        """Return the time to live of the `GET` responses of a path, or `None` if they are not cached."""
+        resource = self._resource(path_params)
+        if resource is None:
+            return None
+        collection, rest = resource
+        ttl = self._ttls.get(collection[-1])
+        if not ttl:
+            return None
+        # the collection, an item, a version of it and their metadata suffixes
+        if rest:
+            rest = _skip_version(rest[1:])
+        if rest:
+            if rest[0] not in _CACHEABLE_SUFFIXES:
+                return None
+            rest = _skip_version(rest[1:])
+        return None if rest else ttl
+
+    def _key(
+        self,
+        path_params: list,
+        url: str,
+        query_params: dict | None,
+        headers: dict | None,
+    ) -> tuple:
+        query = urlencode(sorted((query_params or {}).items()), doseq=True)
+        headers = tuple(sorted((headers or {}).items()))
+        return self._resource(path_params)[0], url, query, headers
+
+    def _get(self, key: tuple) -> _Entry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key: tuple, content: bytes, etag: str | None, ttl: float) -> None:
+        if len(content) > self._max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = _Entry(content, etag, time.monotonic() + ttl)
+            self._size += len(content)
+            while self._size > self._max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+
+    def _revalidated(self, key: tuple, entry: _Entry, ttl: float) -> None:
+        """Extend the lifetime of an entry the server reported as not modified."""
+        with self._lock:
+            if self._entries.get(key) is entry:
+                entry.expires = time.monotonic() + ttl
+
+    def invalidate(self, path_params: list | None = None) -> None:
+        """Drop cached responses.
+
+        Parameters:
+            path_params: A path whose resource type in its feature store is dropped, or `None` to drop all responses.
+        """
+        if path_params is None:
+            collection = None
+        else:
+            resource = self._resource(path_params)
+            if resource is None:
+                return
+            collection = resource[0]
+        with self._lock:
+            for key in list(self._entries):
+                if collection is None or key[0] == collection:
+                    self._size -= len(self._entries.pop(key).content)
+
+
+def _skip_version(segments: list[str]) -> list[str]:
+    if len(segments) >= 2 and segments[0] == "version":
+        return segments[2:]
+    return segments
+
+
+def _from_environ() -> ResponseCache | None:
+    """Create the cache configured by the `HOPSWORKS_METADATA_CACHE` environment variable.
+
+    Returns:
+        The cache, or `None` if the variable is unset or disables the cache.
+    """
+    value = os.environ.get(ENV_VAR, "").strip()
+    if value.lower() in ("", "0", "false"):
+        return None
+    config: dict[str, Any] = {}
+    if value.lower() not in ("1", "true"):
+        try:
+            config = json.loads(value)
+        except ValueError:
+            config = None
+        if not isinstance(config, dict):
+            _logger.warning(
+                "Ignoring invalid %s value %r, expected true or a JSON object.",
+                ENV_VAR,
+                value,
+            )
+            return None
+    return ResponseCache(
+        max_bytes=int(config.get("max_bytes", DEFAULT_MAX_BYTES)),
+        ttls=config.get("ttls"),
+    )
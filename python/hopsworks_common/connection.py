@@ -35,7 +35,6 @@ from hopsworks_common.core import (
     services_api,
     variable_api,
 )
-from hopsworks_common.core.opensearch import OpenSearchClientSingleton
 from hopsworks_common.decorators import _connected, _not_connected
 from requests.exceptions import ConnectionError
 from typing_extensions import Self
@@ -470,6 +469,7 @@ class Connection:
         if not self._connected:
             return  # the connection is already closed
 
+        from hopsworks_common.core.opensearch import OpenSearchClientSingleton
         from hsfs import engine
 
         if OpenSearchClientSingleton._instance:
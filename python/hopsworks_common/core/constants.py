@@ -14,6 +14,7 @@
 #   limitations under the License.
 #
 
+import importlib.metadata
 import importlib.util
 
 
@@ -47,13 +48,19 @@ if HAS_GREAT_EXPECTATIONS:
     # GE 1.x's _docs_decorators logs an INFO line for every closure it scans
     # during module init (DataSourceManager._register_* / _bind_asset_factory_*),
     # producing hundreds of useless lines on every SDK import. Suppress before
-    # the great_expectations import so module-init chatter never fires.
+    # the first great_expectations import so module-init chatter never fires.
     import logging
 
     logging.getLogger("great_expectations._docs_decorators").setLevel(logging.WARNING)
-    import great_expectations as _ge
-
-    GE_MAJOR = int(_ge.__version__.split(".")[0])
+    # Importing great_expectations takes seconds, read the version from the
+    # package metadata so that only data validation pays for the import.
+    try:
+        _ge_version = importlib.metadata.version("great_expectations")
+    except importlib.metadata.PackageNotFoundError:
+        import great_expectations as _ge
+
+        _ge_version = _ge.__version__
+    GE_MAJOR = int(_ge_version.split(".")[0])
 great_expectations_not_installed_message = (
     "Great Expectations package not found. "
     "If you want to use data validation with Hopsworks you can install the corresponding extras via "
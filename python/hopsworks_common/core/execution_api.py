@@ -102,11 +102,13 @@ class ExecutionApi:
             _client._send_request("GET", path_params, headers=headers), job
         )
 
-    def _get_all(self, job):
+    def _get_all(self, job, limit: int | None = None):
         _client = client._get_instance()
         path_params = ["project", _client._project_id, "jobs", job.name, "executions"]
 
         query_params = {"sort_by": "submissiontime:desc"}
+        if limit is not None:
+            query_params["limit"] = limit
 
         headers = {"content-type": "application/json"}
         return execution.Execution.from_response_json(
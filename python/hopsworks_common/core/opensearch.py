@@ -195,6 +195,43 @@ class ProjectOpenSearchClient:
             body=body, index=index, params=OpensearchRequestOption.get_options(options)
         )
 
+    @retry(
+        wait_exponential_multiplier=1000,
+        stop_max_attempt_number=5,
+        retry_on_exception=_is_timeout,
+    )
+    @_handle_opensearch_exception
+    def _msearch(self, body, index=None, options=None):
+        """Run several searches in a single request.
+
+        Parameters:
+            body: Alternating header and query dictionaries, as expected by the OpenSearch `_msearch` API.
+            index: Default index for the searches whose header does not name one.
+            options: The options used for the request to the vector database.
+
+        Returns:
+            The `_msearch` response, with one entry per search in `"responses"`.
+
+        Raises:
+            hopsworks.client.exceptions.VectorDatabaseException: If any of the searches failed.
+        """
+        result = self._get_opensearch_client().msearch(
+            body=body, index=index, params=OpensearchRequestOption.get_options(options)
+        )
+        for response in result["responses"]:
+            error = response.get("error")
+            if not error:
+                continue
+            caused_by = error.get("caused_by") if isinstance(error, dict) else None
+            if caused_by and caused_by.get("type") == "illegal_argument_exception":
+                raise self._create_vector_database_exception(caused_by["reason"])
+            raise VectorDatabaseException(
+                VectorDatabaseException.OTHERS,
+                f"Error in Opensearch request: {error}",
+                response,
+            )
+        return result
+
     @retry(
         wait_exponential_multiplier=1000,
         stop_max_attempt_number=5,
@@ -207,6 +244,40 @@ class ProjectOpenSearchClient:
         )
         return result["count"]
 
+    @retry(
+        wait_exponential_multiplier=1000,
+        stop_max_attempt_number=5,
+        retry_on_exception=_is_timeout,
+    )
+    @_handle_opensearch_exception
+    def _create_pit(self, index, keep_alive, options=None):
+        """Create a point in time on an index, requires OpenSearch 2.4 or newer.
+
+        Parameters:
+            index: Name of the index.
+            keep_alive: How long the point in time is kept alive between requests, e.g. `"5m"`.
+            options: The options used for the request to the vector database.
+
+        Returns:
+            The id of the point in time.
+        """
+        params = {
+            **OpensearchRequestOption.get_options(options),
+            "keep_alive": keep_alive,
+        }
+        return self._get_opensearch_client().create_point_in_time(
+            index=index, params=params
+        )["pit_id"]
+
+    @_handle_opensearch_exception
+    def _delete_pit(self, pit_id):
+        """Delete a point in time created with `_create_pit`.
+
+        Parameters:
+            pit_id: The id of the point in time.
+        """
+        self._get_opensearch_client().delete_point_in_time(body={"pit_id": [pit_id]})
+
     def _refresh_opensearch_connection(self):
         """Refresh the OpenSearch connection for the client."""
         if self.is_cluster_client:
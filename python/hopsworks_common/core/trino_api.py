@@ -43,7 +43,6 @@ if HAS_TRINO:
         DEFAULT_SCHEMA,
     )
     from trino.dbapi import connect as _trino_connect
-    from trino.sqlalchemy import URL
     from trino.transaction import IsolationLevel
 
     AUTOCOMMIT = IsolationLevel.AUTOCOMMIT
@@ -342,6 +341,7 @@ class TrinoApi:
             ```
         """
         from sqlalchemy import create_engine
+        from trino.sqlalchemy import URL
 
         host = self.get_host()
         port = self.get_port()
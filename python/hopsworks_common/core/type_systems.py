@@ -39,6 +39,8 @@ if TYPE_CHECKING:
 
 if HAS_PYARROW:
     import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.json as pa_json
 
     # Decimal types are currently not supported
     _INT_TYPES = [pa.uint8(), pa.uint16(), pa.int8(), pa.int16(), pa.int32()]
@@ -319,8 +321,135 @@ def _convert_pandas_object_type_to_offline_type(arrow_type: str) -> str:
     raise ValueError(f"dtype 'O' (arrow_type '{str(arrow_type)}') not supported")
 
 
+# String representations of booleans produced by `str(bool)` and read back from Hopsworks
+_BOOLEAN_LITERALS = {"True": True, "False": False}
+
+
+def _parse_json_strings(strings: pa.Array, arrow_type: pa.DataType) -> pa.Array:
+    """Parse an array of JSON documents into an array of `arrow_type`.
+
+    The documents are wrapped into one newline-delimited JSON buffer, which the Arrow JSON reader parses in parallel.
+    Null and empty strings are parsed as null.
+
+    Parameters:
+        strings: Array of JSON documents.
+        arrow_type: Type of the documents.
+
+    Returns:
+        The parsed array.
+
+    Raises:
+        pyarrow.ArrowInvalid: If a document is not valid JSON of type `arrow_type`, e.g. a Python literal such as `{'k': True}`.
+    """
+    large_string = pa.large_string()
+    strings = strings.cast(large_string)
+    strings = pc.if_else(
+        pc.equal(strings, ""), pa.scalar(None, type=large_string), strings
+    )
+    lines = pc.binary_join_element_wise(
+        pa.scalar('{"v":', type=large_string),
+        pc.fill_null(strings, pa.scalar("null", type=large_string)),
+        pa.scalar("}\n", type=large_string),
+        pa.scalar("", type=large_string),
+    )
+    # the lines are laid out back to back in the data buffer of the array
+    offsets = np.frombuffer(lines.buffers()[1], dtype=np.int64)[
+        lines.offset : lines.offset + len(lines) + 1
+    ]
+    longest_line = pc.max(pc.binary_length(lines)).as_py() or 0
+    table = pa_json.read_json(
+        pa.BufferReader(lines.buffers()[2][int(offsets[0]) : int(offsets[-1])]),
+        read_options=pa_json.ReadOptions(block_size=max(1 << 20, 2 * longest_line)),
+        parse_options=pa_json.ParseOptions(
+            explicit_schema=pa.schema([("v", arrow_type)]),
+            unexpected_field_behavior="error",
+        ),
+    )
+    if table.num_rows != len(strings):
+        raise pa.ArrowInvalid("Documents span several lines.")
+    return table.column("v").combine_chunks()
+
+
+def _cast_to_decimal(values: pa.Array, offline_type: str) -> pa.Array:
+    """Cast strings or integers to the decimal type, raising instead of losing digits."""
+    decimal_type = _convert_offline_type_to_pyarrow_type(offline_type)
+    if pa.types.is_integer(values.type):
+        values = pc.cast(values, pa.decimal128(38, decimal_type.scale))
+    return pc.cast(values, decimal_type)
+
+
 def _cast_pandas_column_to_offline_type(
     feature_column: pd.Series, offline_type: str
+) -> pd.Series:
+    """Cast a pandas column to the offline type with Arrow compute kernels.
+
+    Columns the kernels cannot cast without changing the values, such as Python literals, fall back to casting element by element.
+    Decimals are always cast element by element, since the column holds `decimal.Decimal` objects either way.
+
+    Parameters:
+        feature_column: The column to cast.
+        offline_type: The offline type of the feature.
+
+    Returns:
+        The cast column.
+    """
+    offline_type = offline_type.lower()
+    try:
+        cast_column = _cast_pandas_column_vectorized(feature_column, offline_type)
+    except (
+        pa.ArrowInvalid,
+        pa.ArrowNotImplementedError,
+        pa.ArrowTypeError,
+        FeatureStoreException,
+    ):
+        cast_column = None
+    if cast_column is not None:
+        return cast_column
+    return _cast_pandas_column_elementwise(feature_column, offline_type)
+
+
+def _cast_pandas_column_vectorized(
+    feature_column: pd.Series, offline_type: str
+) -> pd.Series | None:
+    if offline_type.startswith(("array<", "struct<")):
+        if pd.api.types.infer_dtype(feature_column, skipna=True) != "string":
+            return None
+        parsed = _parse_json_strings(
+            pa.array(feature_column, type=pa.large_string(), from_pandas=True),
+            _convert_offline_type_to_pyarrow_type(offline_type),
+        )
+        return pd.Series(
+            parsed.to_pylist(),
+            index=feature_column.index,
+            name=feature_column.name,
+            dtype=object,
+        )
+    if offline_type == "boolean":
+        if feature_column.dtype == np.bool_:
+            return feature_column
+        if pd.api.types.infer_dtype(feature_column, skipna=True) != "string":
+            return None
+        present = feature_column.notna() & (feature_column != "")
+        parsed = feature_column.map(_BOOLEAN_LITERALS)
+        if parsed[present].isna().any():
+            return None
+        return parsed.astype(object).where(present, None)
+    if offline_type == "string":
+        if pd.api.types.is_integer_dtype(
+            feature_column.dtype
+        ) and not pd.api.types.is_extension_array_dtype(feature_column.dtype):
+            return feature_column.astype(str).astype(object)
+        if (
+            feature_column.dtype == object
+            and pd.api.types.infer_dtype(feature_column, skipna=False) == "string"
+        ):
+            return feature_column
+        return None
+    return None
+
+
+def _cast_pandas_column_elementwise(
+    feature_column: pd.Series, offline_type: str
 ) -> pd.Series:
     offline_type = offline_type.lower()
     if offline_type == "timestamp":
@@ -355,6 +484,76 @@ def _cast_pandas_column_to_offline_type(
 @_uses_polars
 def _cast_polars_column_to_offline_type(
     feature_column: pl.Series, offline_type: str
+) -> pl.Series:
+    """Cast a polars column to the offline type with native polars expressions and Arrow compute kernels.
+
+    Columns that cannot be cast this way without changing the values, such as Python literals, fall back to casting element by element.
+
+    Parameters:
+        feature_column: The column to cast.
+        offline_type: The offline type of the feature.
+
+    Returns:
+        The cast column.
+    """
+    offline_type = offline_type.lower()
+    try:
+        cast_column = _cast_polars_column_vectorized(feature_column, offline_type)
+    except (
+        pl.exceptions.PolarsError,
+        pa.ArrowInvalid,
+        pa.ArrowNotImplementedError,
+        pa.ArrowTypeError,
+        FeatureStoreException,
+    ):
+        cast_column = None
+    if cast_column is not None:
+        return cast_column
+    return _cast_polars_column_elementwise(feature_column, offline_type)
+
+
+def _cast_polars_column_vectorized(
+    feature_column: pl.Series, offline_type: str
+) -> pl.Series | None:
+    if offline_type.startswith(("array<", "struct<")):
+        if isinstance(feature_column.dtype, (pl.List, pl.Array, pl.Struct)):
+            return feature_column
+        if feature_column.dtype != pl.String:
+            return None
+        dtype = pl.from_arrow(
+            pa.array([], type=_convert_offline_type_to_pyarrow_type(offline_type))
+        ).dtype
+        return (
+            feature_column.to_frame()
+            .select(pl.when(pl.first() != "").then(pl.first()).str.json_decode(dtype))
+            .to_series()
+        )
+    if offline_type == "boolean":
+        if feature_column.dtype == pl.Boolean:
+            return feature_column
+        if feature_column.dtype != pl.String:
+            return None
+        return feature_column.replace_strict(
+            {**_BOOLEAN_LITERALS, "": None}, return_dtype=pl.Boolean
+        )
+    if offline_type == "string":
+        if feature_column.dtype == pl.String:
+            return feature_column
+        if feature_column.dtype.is_integer():
+            return feature_column.cast(pl.String)
+        return None
+    if offline_type.startswith("decimal"):
+        if feature_column.dtype != pl.String and not feature_column.dtype.is_integer():
+            return None
+        return pl.Series(
+            feature_column.name,
+            _cast_to_decimal(feature_column.to_arrow(), offline_type),
+        )
+    return None
+
+
+def _cast_polars_column_elementwise(
+    feature_column: pl.Series, offline_type: str
 ) -> pl.Series:
     offline_type = offline_type.lower()
     if offline_type == "timestamp":
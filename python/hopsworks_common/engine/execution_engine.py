@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import logging
 import os
 import time
@@ -156,7 +157,7 @@ class ExecutionEngine:
                 **Note**: the actual waiting time may be bigger by approximately 3 seconds.
 
         Returns:
-            The final execution or `None` if the timeout is exceeded.
+            The final execution, or the execution as it was last polled if the timeout is exceeded.
 
         Raises:
             hopsworks.client.exceptions.RestAPIError: If the backend encounters an error when handling the request.
@@ -173,24 +174,35 @@ class ExecutionEngine:
             job.job_type.lower() == "spark" or job.job_type.lower() == "pyspark"
         )
 
-        updated_execution = self._execution_api._get(job, execution.id)
+        from hopsworks_common import execution_waiter
+
+        # the shared waiter polls less often the longer the execution runs, and
+        # batches the requests with the executions awaited by other threads
+        waiter = execution_waiter._get_default_waiter()
+        future = waiter.add(execution)
         execution_state = None
-        while updated_execution.success is None:
-            if timeout and timeout <= passed() + MAX_LAG:
-                self._log.info("The waiting timeout was exceeded.")
-                return updated_execution
-            time.sleep(MAX_LAG)
-            updated_execution = self._execution_api._get(job, execution.id)
-            if execution_state != updated_execution.state:
-                if is_yarn_job:
-                    self._log.info(
-                        f"Waiting for execution to finish. Current state: {updated_execution.state}. Final status: {updated_execution.final_status}"
-                    )
-                else:
-                    self._log.info(
-                        f"Waiting for execution to finish. Current state: {updated_execution.state}"
-                    )
-            execution_state = updated_execution.state
+        try:
+            while True:
+                done, _ = concurrent.futures.wait([future], timeout=MAX_LAG)
+                updated_execution = future.result() if done else future.item
+                if execution_state != updated_execution.state:
+                    if is_yarn_job:
+                        self._log.info(
+                            f"Waiting for execution to finish. Current state: {updated_execution.state}. Final status: {updated_execution.final_status}"
+                        )
+                    else:
+                        self._log.info(
+                            f"Waiting for execution to finish. Current state: {updated_execution.state}"
+                        )
+                execution_state = updated_execution.state
+                if done:
+                    break
+                if timeout and timeout <= passed() + MAX_LAG:
+                    self._log.info("The waiting timeout was exceeded.")
+                    return updated_execution
+        finally:
+            if not future.done():
+                waiter._discard([future])
 
         # wait for log files to be aggregated, max 6 minutes
         await_time = 6 * 60.0
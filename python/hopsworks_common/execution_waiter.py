@@ -0,0 +1,341 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Wait for many job executions and online ingestions at once.
+
+A single polling thread tracks every execution and ingestion added to an
+[`ExecutionWaiter`][hopsworks_common.execution_waiter.ExecutionWaiter].
+Each round it polls only the items that are due, requesting the executions of
+the same job together, and polls an item less often the longer it has been
+running.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from hopsworks_apigen import public
+from hopsworks_common import execution as execution_mod
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+_logger = logging.getLogger(__name__)
+
+
+class _ItemFuture(concurrent.futures.Future):
+    """Future of a tracked item, holding the item as it was last polled."""
+
+    def __init__(self, item: Any):
+        super().__init__()
+        self.item = item
+
+
+class _Tracked:
+    __slots__ = ("key", "origin", "future", "started", "next_poll", "state", "refs")
+
+    def __init__(self, key: tuple, item: Any, now: float):
+        self.key = key
+        # the item as added, whose job and API the polls go through
+        self.origin = item
+        self.future = _ItemFuture(item)
+        self.started = now
+        self.next_poll = now
+        self.state = getattr(item, "state", None)
+        self.refs = 0
+
+
+def _key(item: Any) -> tuple:
+    if isinstance(item, execution_mod.Execution):
+        return ("execution", item.job_name, item.id)
+    return ("other", id(item))
+
+
+@public(
+    "hopsworks.execution_waiter.ExecutionWaiter",
+    "hsfs.core.execution_waiter.ExecutionWaiter",
+)
+class ExecutionWaiter:
+    """Track many job executions and online ingestions with a single polling thread.
+
+    An item is polled `min_interval` seconds after it is added, and then every `backoff` times the time it has been tracked, capped at `max_interval` seconds.
+    A job running for an hour is therefore polled every `max_interval` seconds, while a short job is noticed within seconds of finishing.
+    Due executions of the same job are requested together, and the requests of a round are sent concurrently.
+
+    Usually you do not need to create a waiter, as [`wait_all`][hopsworks_common.execution_waiter.wait_all] and [`as_completed`][hopsworks_common.execution_waiter.as_completed] share one.
+
+    ```python
+    waiter = ExecutionWaiter()
+    futures = [waiter.add(job.run(await_termination=False)) for job in jobs]
+    for future in concurrent.futures.as_completed(futures):
+        execution = future.result()
+        print(execution.job_name, execution.success)
+    ```
+
+    Parameters:
+        min_interval: Minimum time in seconds between two polls of an item.
+        max_interval: Maximum time in seconds between two polls of an item.
+        backoff: Fraction of the time an item has been tracked to wait before polling it again.
+        max_workers: Maximum number of status requests sent concurrently.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 0.1,
+        max_workers: int = 8,
+    ):
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._backoff = backoff
+        self._max_workers = max_workers
+        self._condition = threading.Condition()
+        self._tracked: dict[tuple, _Tracked] = {}
+        self._thread: threading.Thread | None = None
+
+    @public
+    def add(self, item: Any) -> concurrent.futures.Future:
+        """Start tracking a job execution or an online ingestion.
+
+        Adding an item which is already tracked returns the future of the first call.
+
+        Parameters:
+            item: A job [`Execution`][hopsworks.execution.Execution] or an [`OnlineIngestion`][hsfs.core.online_ingestion.OnlineIngestion].
+
+        Returns:
+            A future resolved with the updated item once the execution reaches a final state or the ingestion processed all its entries.
+            Failed executions resolve the future as well, check their [`success`][hopsworks.execution.Execution.success].
+            The future holds the exception if polling the item fails.
+        """
+        key = _key(item)
+        with self._condition:
+            tracked = self._tracked.get(key)
+            if tracked is None:
+                tracked = self._tracked[key] = _Tracked(key, item, time.monotonic())
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="execution-waiter", daemon=True
+                    )
+                    self._thread.start()
+                self._condition.notify()
+            tracked.refs += 1
+            return tracked.future
+
+    def _discard(self, futures: Iterable[_ItemFuture]) -> None:
+        """Give up on `futures`, cancelling those no other caller waits for."""
+        futures = set(futures)
+        with self._condition:
+            for tracked in list(self._tracked.values()):
+                if tracked.future not in futures:
+                    continue
+                tracked.refs -= 1
+                if tracked.refs <= 0:
+                    del self._tracked[tracked.key]
+                    tracked.future.cancel()
+
+    def _interval(self, tracked: _Tracked, now: float) -> float:
+        return min(
+            self._max_interval,
+            max(self._min_interval, self._backoff * (now - tracked.started)),
+        )
+
+    def _run(self) -> None:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="execution-waiter"
+        ) as pool:
+            while True:
+                with self._condition:
+                    if not self._tracked:
+                        self._thread = None
+                        return
+                    now = time.monotonic()
+                    next_poll = min(t.next_poll for t in self._tracked.values())
+                    if next_poll > now:
+                        self._condition.wait(next_poll - now)
+                        continue
+                    batches = self._batches(now)
+                list(pool.map(self._poll, batches))
+
+    def _batches(self, now: float) -> list[list[_Tracked]]:
+        """Group the due items into the batches of a polling round."""
+        by_job: dict[str, list[_Tracked]] = {}
+        batches = []
+        for tracked in self._tracked.values():
+            if tracked.key[0] == "execution":
+                by_job.setdefault(tracked.key[1], []).append(tracked)
+            elif tracked.next_poll <= now:
+                batches.append([tracked])
+        for job_executions in by_job.values():
+            # the executions of a job share a request, so poll them all once any is due
+            if any(t.next_poll <= now for t in job_executions):
+                batches.append(job_executions)
+        return batches
+
+    def _poll(self, batch: list[_Tracked]) -> None:
+        try:
+            updated = self._fetch(batch)
+            finished = [
+                item.success is not None
+                if tracked.key[0] == "execution"
+                else item._is_complete()
+                for tracked, item in zip(batch, updated, strict=True)
+            ]
+        except Exception as e:
+            with self._condition:
+                failed = [t for t in batch if self._untrack(t)]
+            for tracked in failed:
+                tracked.future.set_exception(e)
+            return
+
+        now = time.monotonic()
+        completed = []
+        with self._condition:
+            for tracked, item, done in zip(batch, updated, finished, strict=True):
+                tracked.future.item = item
+                if tracked.key[0] == "execution" and item.state != tracked.state:
+                    _logger.debug(
+                        "Execution %s of job %s is %s.",
+                        item.id,
+                        tracked.key[1],
+                        item.state,
+                    )
+                    tracked.state = item.state
+                if not done:
+                    tracked.next_poll = now + self._interval(tracked, now)
+                elif self._untrack(tracked):
+                    completed.append(tracked)
+        for tracked in completed:
+            tracked.future.set_result(tracked.future.item)
+
+    def _untrack(self, tracked: _Tracked) -> bool:
+        """Stop tracking an item, unless it was discarded meanwhile."""
+        if self._tracked.get(tracked.key) is not tracked:
+            return False
+        del self._tracked[tracked.key]
+        return True
+
+    def _fetch(self, batch: list[_Tracked]) -> list[Any]:
+        """Request the current state of a single ingestion or of executions of one job."""
+        items = [tracked.future.item for tracked in batch]
+        if batch[0].key[0] != "execution":
+            items[0].refresh()
+            return items
+        job, api = batch[0].origin._job, batch[0].origin._execution_api
+        if len(items) == 1:
+            return [api._get(job, items[0].id)]
+        # the tracked executions are the latest ones of the job, fetch a page big
+        # enough to hold them and request the ones it misses individually
+        latest = api._get_all(job, limit=2 * len(items))
+        by_id = {execution.id: execution for execution in latest or []}
+        return [by_id.get(item.id) or api._get(job, item.id) for item in items]
+
+
+_default_waiter: ExecutionWaiter | None = None
+_default_waiter_lock = threading.Lock()
+
+
+def _get_default_waiter() -> ExecutionWaiter:
+    global _default_waiter
+    with _default_waiter_lock:
+        if _default_waiter is None:
+            _default_waiter = ExecutionWaiter()
+        return _default_waiter
+
+
+def _add_all(
+    items: Iterable[Any], waiter: ExecutionWaiter | None
+) -> tuple[ExecutionWaiter, list[_ItemFuture]]:
+    waiter = waiter or _get_default_waiter()
+    return waiter, [waiter.add(item) for item in items]
+
+
+@public("hopsworks.execution_waiter.wait_all", "hsfs.core.execution_waiter.wait_all")
+def wait_all(
+    items: Iterable[Any],
+    timeout: float | None = None,
+    waiter: ExecutionWaiter | None = None,
+) -> list[Any]:
+    """Wait until all job executions and online ingestions finish.
+
+    ```python
+    executions = [job.run(await_termination=False) for job in jobs]
+    for execution in wait_all(executions, timeout=3600):
+        print(execution.job_name, execution.state, execution.success)
+    ```
+
+    Parameters:
+        items: Job executions and online ingestions to wait for.
+        timeout: Maximum waiting time in seconds, if `None` the waiting time is unbounded.
+        waiter: The waiter tracking the items, by default one shared by all callers.
+
+    Returns:
+        The updated items in the order of `items`.
+        Failed executions are returned as well, check their `success`.
+        If the timeout is exceeded, the unfinished items are returned in the state they were last polled in.
+
+    Raises:
+        hopsworks.client.exceptions.RestAPIError: If the backend encounters an error when handling a request.
+    """
+    waiter, futures = _add_all(items, waiter)
+    try:
+        concurrent.futures.wait(futures, timeout=timeout)
+        return [future.result() if future.done() else future.item for future in futures]
+    finally:
+        waiter._discard(future for future in futures if not future.done())
+
+
+@public(
+    "hopsworks.execution_waiter.as_completed",
+    "hsfs.core.execution_waiter.as_completed",
+)
+def as_completed(
+    items: Iterable[Any],
+    timeout: float | None = None,
+    waiter: ExecutionWaiter | None = None,
+) -> Iterator[Any]:
+    """Yield job executions and online ingestions as they finish.
+
+    ```python
+    executions = [job.run(await_termination=False) for job in jobs]
+    for execution in as_completed(executions):
+        if not execution.success:
+            print(f"{execution.job_name} failed, see {execution.get_url()}")
+    ```
+
+    Parameters:
+        items: Job executions and online ingestions to wait for.
+        timeout: Maximum waiting time in seconds, if `None` the waiting time is unbounded.
+        waiter: The waiter tracking the items, by default one shared by all callers.
+
+    Yields:
+        The updated items in the order they finish, failed executions included.
+
+    Raises:
+        TimeoutError: If the timeout is exceeded before all items finished.
+        hopsworks.client.exceptions.RestAPIError: If the backend encounters an error when handling a request.
+    """
+    waiter, futures = _add_all(items, waiter)
+    try:
+        for future in concurrent.futures.as_completed(futures, timeout=timeout):
+            yield future.result()
+    finally:
+        waiter._discard(future for future in futures if not future.done())
@@ -46,16 +46,13 @@ from hopsworks_common.git_file_status import GitFileStatus
 from six import string_types
 
 
-if HAS_PANDAS:
-    import pandas as pd
-
-
 FEATURE_STORE_NAME_SUFFIX = "_featurestore"
 
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    import pandas as pd
     from hsfs import feature_group
 
 
@@ -91,7 +88,8 @@ class NumpyEncoder(json.JSONEncoder):
                 return np.vectorize(encode_binary)(obj), True
             return obj.tolist(), True
 
-        if isinstance(obj, datetime) or (HAS_PANDAS and isinstance(obj, pd.Timestamp)):
+        # pandas Timestamp is a subclass of datetime
+        if isinstance(obj, datetime):
             return obj.isoformat(), True
         if isinstance(obj, (bytes, bytearray)):
             return encode_binary(obj), True
@@ -663,6 +661,9 @@ def _handle_tensor_input(input_tensor):
 
 @also_available_as("hsml.util._handle_dataframe_input")
 def _handle_dataframe_input(input_ex):
+    if HAS_PANDAS:
+        import pandas as pd
+
     if HAS_PANDAS and isinstance(input_ex, pd.DataFrame):
         if not input_ex.empty:
             return input_ex.iloc[0].tolist()
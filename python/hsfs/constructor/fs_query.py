@@ -116,6 +116,18 @@ class FsQuery:
     ) -> list[hudi_feature_group_alias.HudiFeatureGroupAlias]:
         return self._hudi_cached_feature_groups
 
+    @property
+    def delta_cached_feature_groups(
+        self,
+    ) -> list[hudi_feature_group_alias.HudiFeatureGroupAlias]:
+        return self._delta_cached_feature_groups
+
+    @property
+    def iceberg_cached_feature_groups(
+        self,
+    ) -> list[hudi_feature_group_alias.HudiFeatureGroupAlias]:
+        return self._iceberg_cached_feature_groups
+
     @property
     def hqs_payload(self) -> str | None:
         return self._hqs_payload
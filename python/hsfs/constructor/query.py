@@ -300,6 +300,16 @@ class Query:
                 Only for python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`
+                For online reads of feature groups without an embedding index:
+                * key `"batch_size"` to return an iterator of dataframes of at most `batch_size` rows instead of a
+                  single dataframe, read through a server-side cursor so only one batch is held in memory at a time.
+                  For example: `{"batch_size": 10000}`
+                For online reads of a feature group with an embedding index:
+                * key `"vector_db_scan"` to configure the scan of the embedding index, a dictionary with the keys
+                  `"batch_size"` and `"slices"`. For example: `{"vector_db_scan": {"batch_size": 5000, "slices": 4}}`
                 `None` is converted to `{}`.
             start_time:
                 Filter data to only include records where the event_time column of the
@@ -344,10 +354,29 @@ class Query:
                 self._left_feature_group,
                 dataframe_type=dataframe_type,
                 filter=self._filter,
+                read_options=read_options,
             )
         self.check_and_warn_ambiguous_features()
         if not read_options:
             read_options = {}
+
+        schema = None
+        if (
+            read_options
+            and "pandas_types" in read_options
+            and read_options["pandas_types"]
+        ):
+            schema = self.features
+            if len(self.joins) > 0 or None in [f.type for f in schema]:
+                raise ValueError(
+                    "Pandas types casting only supported for feature_group.read()/query.select_all()"
+                )
+
+        if not online and self._is_python_time_travel_read(read_options):
+            return engine._get_instance()._read_time_travel(
+                self, dataframe_type, schema
+            )
+
         # When the left FG has partitioned_by set, add grain-column
         # predicates equivalent to any event_time range filter — the grain
         # columns are real partition columns, so every engine prunes on them.
@@ -364,18 +393,6 @@ class Query:
         finally:
             self._filter = original_filter
 
-        schema = None
-        if (
-            read_options
-            and "pandas_types" in read_options
-            and read_options["pandas_types"]
-        ):
-            schema = self.features
-            if len(self.joins) > 0 or None in [f.type for f in schema]:
-                raise ValueError(
-                    "Pandas types casting only supported for feature_group.read()/query.select_all()"
-                )
-
         return engine._get_instance()._sql(
             sql_query,
             self._feature_store_name,
@@ -385,6 +402,27 @@ class Query:
             schema,
         )
 
+    def _is_python_time_travel_read(self, read_options: dict[str, Any]) -> bool:
+        """Whether the Python engine reads the time travel window of this query directly from the table.
+
+        This is the case for time travel queries on a single Delta or Iceberg feature group without filters,
+        unless the Hopsworks Query Service can read them.
+        """
+        return (
+            self._python_engine
+            and isinstance(self._left_feature_group, fg_mod.FeatureGroup)
+            and self._left_feature_group.time_travel_format in ["DELTA", "ICEBERG"]
+            and (
+                bool(self._left_feature_group_start_time)
+                or self._left_feature_group_end_time is not None
+            )
+            and not self._joins
+            and self._filter is None
+            and not engine._get_instance()._is_flyingduck_query_supported(
+                self, read_options
+            )
+        )
+
     def _read_with_time_filter(
         self,
         online: bool,
@@ -524,7 +562,9 @@ class Query:
         """Perform time travel on the given Query.
 
         Warning: Pyspark/Spark Only
-            Apache HUDI exclusively supports Time Travel and Incremental Query via Spark Context
+            Apache HUDI exclusively supports Time Travel and Incremental Query via Spark Context.
+            With the Python engine, queries on a single `DELTA` or `ICEBERG` feature group without filters are read directly from the table,
+            from the Delta change data feed or the Iceberg snapshots appended in the time window.
 
         This method returns a new Query object at the specified point in time. Optionally, commits before a
         specified point in time can be excluded from the query. The Query can then either be read into a Dataframe
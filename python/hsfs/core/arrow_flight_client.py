@@ -492,6 +492,8 @@ class ArrowFlightClient:
 
         reader = self._connection.do_get(info.endpoints[0].ticket, options)
         _logger.debug("Dataset fetched. Converting to dataframe %s.", dataframe_type)
+        if dataframe_type.lower() == "pyarrow":
+            return reader.read_all()
         if dataframe_type.lower() == "polars":
             if not HAS_POLARS:
                 raise ModuleNotFoundError(polars_not_installed_message)
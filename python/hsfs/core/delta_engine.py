@@ -108,6 +108,9 @@ class DeltaEngine:
     DELTA_DOT_PREFIX = "delta."
     DELTA_GLUE_CATALOG_IMPL = "org.apache.spark.sql.delta.catalog.DeltaCatalog"
     APPEND = "append"
+    # write option bounding the number of rows merged at once by delta-rs, unset
+    # the upsert is a single merge so that it commits atomically
+    MERGE_CHUNK_ROWS = "merge_chunk_rows"
 
     def __init__(
         self,
@@ -285,23 +288,10 @@ class DeltaEngine:
             end_ts = delta_fg_alias.left_feature_group_end_timestamp
             commits = self._get_delta_commits(location) if location else None
             if commits:
-                # Highest version committed at or before end_ts.
-                # commitInfo timestamps are not guaranteed monotonic in version
-                # (concurrent writers / commit retries), so stop at the first
-                # commit past end_ts rather than letting a later out-of-order
-                # commit select too high a version.
-                # When end_ts predates every commit the earliest version is
-                # pinned; if the window genuinely ended before the first commit
-                # this reads post-window data instead of returning empty
-                # (indistinguishable here from clock skew, and mirrors the
-                # Iceberg earliest-snapshot fallback).
-                version = commits[0][0]
-                for commit_version, commit_ts in commits:
-                    if commit_ts > end_ts:
-                        break
-                    version = commit_version
                 delta_options = {
-                    self.DELTA_QUERY_TIME_TRAVEL_AS_OF_VERSION: version,
+                    self.DELTA_QUERY_TIME_TRAVEL_AS_OF_VERSION: self._get_delta_version_at(
+                        commits, end_ts
+                    ),
                 }
             else:
                 _delta_commit_end_time = util._get_delta_datestr_from_timestamp(end_ts)
@@ -425,6 +415,105 @@ class DeltaEngine:
         commits = self._get_delta_commits(location)
         return commits[0] if commits else None
 
+    @staticmethod
+    def _get_delta_version_at(commits: list[tuple[int, int]], timestamp: int) -> int:
+        """Get the highest version committed at or before `timestamp`.
+
+        commitInfo timestamps are not guaranteed monotonic in version
+        (concurrent writers / commit retries), so the search stops at the first
+        commit past `timestamp` rather than letting a later out-of-order commit
+        select too high a version.
+        When `timestamp` predates every commit the earliest version is pinned;
+        if the window genuinely ended before the first commit this reads
+        post-window data instead of returning empty (indistinguishable here
+        from clock skew, and mirrors the Iceberg earliest-snapshot fallback).
+        """
+        version = commits[0][0]
+        for commit_version, commit_ts in commits:
+            if commit_ts > timestamp:
+                break
+            version = commit_version
+        return version
+
+    def _read_delta_rs_dataset(
+        self,
+        start_timestamp: int | None,
+        end_timestamp: int | None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """Read the feature group as of a point in time, or its changes in a time window, with delta-rs.
+
+        Without `start_timestamp`, the table is read at the version committed at or before `end_timestamp`.
+        Otherwise the change data feed of the versions committed after `start_timestamp`, up to `end_timestamp`, is read,
+        keeping the inserted rows and the new values of the updated ones, like the Spark engine does.
+
+        Parameters:
+            start_timestamp: Start of the window in milliseconds since the epoch, `None` to read a snapshot.
+            end_timestamp: End of the window in milliseconds since the epoch, `None` for the latest version.
+            columns: The columns to read, all of them if `None`.
+
+        Returns:
+            The rows of the snapshot or the changed rows.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from deltalake import DeltaTable
+
+        table = DeltaTable(
+            self._get_delta_rs_location(),
+            storage_options=self._get_delta_rs_storage_options(),
+        )
+        # delta-rs reads the commit timestamps from the log itself, so its
+        # history() is on the same clock as the recorded commit times
+        commits = sorted(
+            (
+                int(commit["version"]),
+                int(util._convert_event_time_to_timestamp(commit["timestamp"])),
+            )
+            for commit in table.history()
+        )
+        if not start_timestamp:
+            if end_timestamp is not None:
+                table.load_as_version(
+                    self._get_delta_version_at(commits, end_timestamp)
+                )
+            return table.to_pyarrow_table(columns=columns)
+
+        starting_version = next(
+            (version for version, ts in commits if ts > start_timestamp), None
+        )
+        ending_version = (
+            self._get_delta_version_at(commits, end_timestamp)
+            if end_timestamp is not None
+            else commits[-1][0]
+        )
+        schema = pa.schema(table.schema().to_arrow())
+        if columns:
+            schema = pa.schema([schema.field(name) for name in columns])
+        if starting_version is None or ending_version < starting_version:
+            return schema.empty_table()
+
+        _logger.debug(
+            f"Reading the change data feed of feature group {self._feature_group.name} "
+            f"v{self._feature_group.version} from version {starting_version} to {ending_version}"
+        )
+        changes = pa.table(
+            table.load_cdf(
+                starting_version=starting_version,
+                ending_version=ending_version,
+                columns=columns + ["_change_type"] if columns else None,
+            )
+        )
+        # upserts record the old values of the updated rows and the deleted rows
+        # as well, which the other engines do not return; the change data feed
+        # has string_view columns, which are cast before filtering
+        change_types = changes["_change_type"].cast(pa.string())
+        return (
+            changes.select(schema.names)
+            .cast(schema)
+            .filter(pc.is_in(change_types, pa.array(["insert", "update_postimage"])))
+        )
+
     def _delete_record(self, delete_df):
         partition_transforms._require_writable(self._feature_group)
         storage_options = None
@@ -853,6 +942,119 @@ class DeltaEngine:
             _logger.debug(f"Partition overlap check failed, falling back to merge: {e}")
             return False
 
+    @staticmethod
+    def _get_key_ranges(
+        dataset, columns: list[str]
+    ) -> dict[str, tuple[int | str, int | str]]:
+        """Return {col: (min, max)} for each integer or string column of the dataset.
+
+        Only Arrow tables are inspected, columns of other types, missing from the
+        dataset or holding only nulls are left out. Returns no ranges on any
+        error, as the ranges only narrow down the files a merge reads.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+
+            if not isinstance(dataset, pa.Table) or dataset.num_rows == 0:
+                return {}
+            key_ranges = {}
+            for col in columns:
+                if col not in dataset.column_names:
+                    continue
+                column = dataset.column(col)
+                if not (
+                    pa.types.is_integer(column.type)
+                    or pa.types.is_string(column.type)
+                    or pa.types.is_large_string(column.type)
+                ):
+                    continue
+                min_max = pc.min_max(column)
+                low, high = min_max["min"].as_py(), min_max["max"].as_py()
+                if low is not None:
+                    key_ranges[col] = (low, high)
+            return key_ranges
+        except Exception as e:
+            _logger.debug(f"Computing key ranges failed, merging without them: {e}")
+            return {}
+
+    def _can_append_by_key_stats(self, fg_source_table, dataset) -> bool:
+        """Return True if no file of the table can hold one of the incoming keys.
+
+        Compares the range of each integer primary key column of the dataset
+        with the min/max statistics the Delta log keeps for every file. A row
+        can only match if all its key columns fall within a file's ranges, so
+        when every file misses the range of at least one key column, each row
+        is a new insert and appending is equivalent to merging. This covers
+        tables which are not partitioned, or whose partitions overlap with the
+        incoming data, written with increasing keys.
+
+        String keys are skipped as Delta truncates string statistics. Falls
+        back to False (i.e. use merge) on missing statistics or any error.
+        """
+        try:
+            import pyarrow as pa
+
+            key_ranges = {
+                col: key_range
+                for col, key_range in self._get_key_ranges(
+                    dataset, self._feature_group.primary_key
+                ).items()
+                if isinstance(key_range[0], int)
+            }
+            if not key_ranges:
+                return False
+            actions = pa.record_batch(
+                fg_source_table.get_add_actions(flatten=True)
+            ).to_pydict()
+            for i in range(len(actions["path"])):
+                if all(
+                    actions[f"min.{col}"][i] is None
+                    or actions[f"max.{col}"][i] is None
+                    or (
+                        actions[f"min.{col}"][i] <= high
+                        and actions[f"max.{col}"][i] >= low
+                    )
+                    for col, (low, high) in key_ranges.items()
+                ):
+                    _logger.debug(
+                        f"Key statistics check: file {actions['path'][i]} may hold incoming keys {key_ranges}"
+                    )
+                    return False
+            _logger.debug(
+                f"Key statistics check: none of {len(actions['path'])} files holds incoming keys {key_ranges}, use_append=True"
+            )
+            return True
+        except Exception as e:
+            _logger.debug(f"Key statistics check failed, falling back to merge: {e}")
+            return False
+
+    @staticmethod
+    def _iter_merge_chunks(dataset, merge_keys: list[str], chunk_rows: int):
+        """Split a large Arrow table into chunks of at most `chunk_rows` rows.
+
+        The rows are sorted by the merge keys first, so that each chunk covers a
+        narrow key range and its merge only reads the files overlapping it. Only
+        the sort indices are computed upfront and each chunk is taken when the
+        previous one was merged, which bounds the memory a merge join needs.
+        """
+        import pyarrow as pa
+
+        if (
+            not isinstance(dataset, pa.Table)
+            or chunk_rows <= 0
+            or dataset.num_rows <= chunk_rows
+        ):
+            yield dataset
+            return
+        import pyarrow.compute as pc
+
+        indices = pc.sort_indices(
+            dataset, sort_keys=[(col, "ascending") for col in merge_keys]
+        )
+        for offset in range(0, dataset.num_rows, chunk_rows):
+            yield dataset.take(indices.slice(offset, chunk_rows))
+
     def _write_delta_rs_dataset(
         self,
         dataset: pa.Table | pl.DataFrame | pd.DataFrame,
@@ -956,6 +1158,15 @@ class DeltaEngine:
                     partition_by=self._feature_group.partition_key,
                     storage_options=storage_options or None,
                 )
+            elif self._can_append_by_key_stats(fg_source_table, dataset):
+                # none of the files can hold a row with an incoming key
+                deltars_write(
+                    location,
+                    dataset,
+                    mode="append",
+                    partition_by=self._feature_group.partition_key,
+                    storage_options=storage_options or None,
+                )
             else:
                 source_alias = (
                     f"{self._feature_group.name}_{self._feature_group.version}_source"
@@ -974,20 +1185,49 @@ class DeltaEngine:
                     if self._feature_group.partition_key
                     else None
                 )
-                merge_query_str = self._generate_merge_query(
-                    source_alias, updates_alias, partition_values
-                )
-                (
-                    fg_source_table.merge(
-                        source=dataset,
-                        predicate=merge_query_str,
-                        source_alias=updates_alias,
-                        target_alias=source_alias,
+                chunk_rows = int((write_options or {}).get(self.MERGE_CHUNK_ROWS) or 0)
+                num_chunks = 0
+                totals = {}
+                for chunk in self._iter_merge_chunks(
+                    dataset, self._get_merge_keys(), chunk_rows
+                ):
+                    num_chunks += 1
+                    merge_query_str = self._generate_merge_query(
+                        source_alias,
+                        updates_alias,
+                        partition_values,
+                        key_ranges=self._get_key_ranges(
+                            chunk, self._feature_group.primary_key
+                        ),
                     )
-                    .when_matched_update_all()
-                    .when_not_matched_insert_all()
-                    .execute()
-                )
+                    metrics = (
+                        fg_source_table.merge(
+                            source=chunk,
+                            predicate=merge_query_str,
+                            source_alias=updates_alias,
+                            target_alias=source_alias,
+                        )
+                        .when_matched_update_all()
+                        .when_not_matched_insert_all()
+                        .execute()
+                    )
+                    if isinstance(metrics, dict):
+                        for key, value in metrics.items():
+                            if isinstance(value, int):
+                                totals[key] = totals.get(key, 0) + value
+                if num_chunks > 1:
+                    _logger.debug(
+                        f"Merged {num_chunks} chunks of at most {chunk_rows} rows into {location}: {totals}"
+                    )
+                    # the commit metadata only describes the merge of the last chunk
+                    commit = self._get_last_commit_metadata(
+                        self._spark_session, location, storage_options=storage_options
+                    )
+                    if commit is not None:
+                        commit.rows_inserted = totals.get("num_target_rows_inserted", 0)
+                        commit.rows_updated = totals.get("num_target_rows_updated", 0)
+                        commit.rows_deleted = totals.get("num_target_rows_deleted", 0)
+                    return commit
         _logger.debug(
             f"Executed delta-rs write. Retrieving commit metadata for Delta table at {location}"
         )
@@ -1326,22 +1566,13 @@ class DeltaEngine:
         source_alias,
         updates_alias,
         partition_values: dict[str, list[str]] | None = None,
+        key_ranges: dict[str, tuple[int | str, int | str]] | None = None,
     ):
         _logger.debug(
             f"Generating merge query for feature group {self._feature_group.name} v{self._feature_group.version} from source alias {source_alias} and updates alias {updates_alias}"
         )
         merge_query_list = []
-        primary_key = self._feature_group.primary_key.copy()
-
-        # add event time to primary key for upserts
-        if self._feature_group.event_time is not None:
-            primary_key.append(self._feature_group.event_time)
-
-        # add partition key for upserts
-        if self._feature_group.partition_key:
-            primary_key = primary_key + self._feature_group.partition_key
-
-        for pk in primary_key:
+        for pk in self._get_merge_keys():
             merge_query_list.append(f"{source_alias}.{pk} == {updates_alias}.{pk}")
         merge_query_str = " AND ".join(merge_query_list)
 
@@ -1353,9 +1584,39 @@ class DeltaEngine:
                 vals_sql = ", ".join(f"'{v}'" for v in vals)
                 merge_query_str += f" AND {source_alias}.{col} IN ({vals_sql})"
 
+        # Append literal key range filters, which DataFusion checks against the
+        # min/max statistics of each Parquet file to skip files holding none of
+        # the incoming keys, also when the table is not partitioned.
+        if key_ranges:
+            for col, (low, high) in key_ranges.items():
+                merge_query_str += (
+                    f" AND {source_alias}.{col} >= {self._to_sql_literal(low)}"
+                    f" AND {source_alias}.{col} <= {self._to_sql_literal(high)}"
+                )
+
         _logger.debug(f"Merge query: {merge_query_str}")
         return merge_query_str
 
+    def _get_merge_keys(self) -> list[str]:
+        """Return the columns identifying a row in an upsert."""
+        merge_keys = self._feature_group.primary_key.copy()
+
+        # add event time to primary key for upserts
+        if self._feature_group.event_time is not None:
+            merge_keys.append(self._feature_group.event_time)
+
+        # add partition key for upserts
+        if self._feature_group.partition_key:
+            merge_keys = merge_keys + self._feature_group.partition_key
+        return merge_keys
+
+    @staticmethod
+    def _to_sql_literal(value: int | str) -> str:
+        if isinstance(value, str):
+            escaped = value.replace("'", "''")
+            return f"'{escaped}'"
+        return str(value)
+
     @staticmethod
     def _get_last_commit_metadata(
         spark_context, base_path, storage_options: dict | None = None
@@ -15,11 +15,15 @@
 #
 from __future__ import annotations
 
+import base64
+import binascii
 import json
 import logging
+import struct
 from typing import TYPE_CHECKING
 
 import numpy as np
+from hsfs.core.kll_sketch import KllDoublesSketch
 
 
 if TYPE_CHECKING:
@@ -37,6 +41,10 @@ _WINDOW_DETECTION = 1
 # with this absolute fallback when the value is zero.
 _DEGENERATE_RANGE_MARGIN = 0.01
 
+_KLL_FORMAT = "datasketches-native-v1"
+# Quantile fractions 0.01 .. 0.99 of the merged percentiles vector.
+_PERCENTILE_FRACTIONS = [i / 100 for i in range(1, 100)]
+
 
 class DistributionEngine:
     """Resolves bin edges and builds probability distributions from feature statistics.
@@ -174,7 +182,7 @@ class DistributionEngine:
             kll_entry = ext.get("kll")
             if (
                 isinstance(kll_entry, dict)
-                and kll_entry.get("kllFormat") == "datasketches-native-v1"
+                and kll_entry.get("kllFormat") == _KLL_FORMAT
             ):
                 native_count += 1
 
@@ -195,12 +203,13 @@ class DistributionEngine:
             fds.extended_statistics["kll"]["bytes"] for fds in reference_fds_list
         ]
 
-        # Invoke the JVM KllMerger via the Spark Py4J bridge.
-        merged_json = self._call_kll_merger(base64_sketches, histogram_bins)
-        if merged_json is None:
-            return None
-
-        parsed = json.loads(merged_json)
+        parsed = self._merge_kll_sketches(base64_sketches, histogram_bins)
+        if parsed is None:
+            # Invoke the JVM KllMerger via the Spark Py4J bridge.
+            merged_json = self._call_kll_merger(base64_sketches, histogram_bins)
+            if merged_json is None:
+                return None
+            parsed = json.loads(merged_json)
 
         # Empty merge (no rows in any batch).
         if not parsed.get("percentiles"):
@@ -370,6 +379,78 @@ class DistributionEngine:
     # Distribution building helpers
     # ------------------------------------------------------------------
 
+    def _merge_kll_sketches(
+        self,
+        base64_sketches: list[str],
+        histogram_bins: int,
+    ) -> dict | None:
+        """Merge native KLL sketches in Python, mirroring the JVM KllMerger output.
+
+        Returns the same dict the JSON of `KllMerger.merge` parses to, or None if
+        a sketch cannot be decoded, in which case the JVM merger is tried.
+        """
+        merged = None
+        try:
+            for b64 in base64_sketches:
+                if not b64:
+                    continue
+                sketch = KllDoublesSketch.from_bytes(base64.b64decode(b64))
+                if merged is None:
+                    merged = sketch
+                else:
+                    merged.merge(sketch)
+        except (ValueError, binascii.Error, struct.error) as exc:
+            logger.debug("Could not merge KLL sketches in Python: %s", exc)
+            return None
+
+        if merged is None or merged.is_empty:
+            return {"percentiles": [], "histogram": [], "n": 0}
+
+        return {
+            "percentiles": merged.get_quantiles(_PERCENTILE_FRACTIONS).tolist(),
+            "histogram": self._build_histogram_from_cdf(merged, histogram_bins),
+            "kll": base64.b64encode(merged.to_bytes()).decode("ascii"),
+            "kllFormat": _KLL_FORMAT,
+            "n": merged.n,
+            "min": merged.min_item,
+            "max": merged.max_item,
+        }
+
+    def _build_histogram_from_cdf(
+        self, sketch: KllDoublesSketch, histogram_bins: int
+    ) -> list[dict]:
+        """Approximate an equi-width Deequ-shaped histogram from the sketch CDF."""
+        n = sketch.n
+        low, high = sketch.min_item, sketch.max_item
+        if histogram_bins <= 0 or n <= 0:
+            return []
+        if high <= low:
+            # Constant feature: a single bin with a margin holds all the weight.
+            margin = (
+                abs(low) * _DEGENERATE_RANGE_MARGIN
+                if low != 0
+                else (_DEGENERATE_RANGE_MARGIN)
+            )
+            return [self._histogram_bucket(low - margin, high + margin, n, n)]
+        split_points = low + np.arange(histogram_bins + 1) * (
+            (high - low) / histogram_bins
+        )
+        cdf = sketch.get_cdf(split_points)
+        # Math.round of the JVM merger, half up rather than half to even
+        counts = np.floor(np.maximum(np.diff(cdf[:-1]), 0.0) * n + 0.5).astype(int)
+        return [
+            self._histogram_bucket(split_points[i], split_points[i + 1], count, n)
+            for i, count in enumerate(counts.tolist())
+        ]
+
+    @staticmethod
+    def _histogram_bucket(low: float, high: float, count: int, n: int) -> dict:
+        return {
+            "value": f"{low:.2f} to {high:.2f}",
+            "count": count,
+            "ratio": count / n if n > 0 else 0.0,
+        }
+
     def _call_kll_merger(
         self,
         base64_sketches: list[str],
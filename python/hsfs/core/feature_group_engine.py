@@ -14,11 +14,15 @@
 #
 from __future__ import annotations
 
+import collections
+import os
 import warnings
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from hopsworks_common.client import exceptions
-from hopsworks_common.core.constants import HAS_PYICEBERG
+from hopsworks_common.core.constants import HAS_PYARROW, HAS_PYICEBERG
 from hopsworks_common.core.sink_job_configuration import (
     FeatureColumnMapping,
     SinkJobConfiguration,
@@ -31,6 +35,7 @@ from hsfs.core import (
     hudi_engine,
     iceberg_engine,
     job_api,
+    kafka_engine,
     partition_transforms,
     transformation_execution_dag,
     transformation_function_engine,
@@ -41,6 +46,9 @@ from hsfs.core.schema_validation import DataFrameValidator
 from hsfs.storage_connector import StorageConnector
 
 
+if HAS_PYARROW:
+    import pyarrow as pa
+
 if TYPE_CHECKING:
     import pandas as pd
     import polars as pl
@@ -242,6 +250,71 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         transformation_context: dict[str, Any] = None,
         transform: bool = True,
         n_processes: int | None = None,
+    ):
+        feature_dataframe, dataframe_features = self._prepare_insert_dataframe(
+            feature_group,
+            feature_dataframe,
+            validation_options,
+            transformation_context,
+            transform,
+            n_processes,
+        )
+
+        if not feature_group._id:
+            # only save metadata if feature group does not exist
+            self._save_feature_group_metadata(
+                feature_group,
+                dataframe_features,
+                write_options,
+            )
+        else:
+            # else, just verify that feature group schema matches user-provided dataframe
+            self._verify_schema_compatibility(
+                self._columns_for_user_schema(feature_group), dataframe_features
+            )
+
+        # ge validation on python and non stream feature groups on spark
+        ge_report = feature_group._great_expectation_engine._validate(
+            feature_group=feature_group,
+            dataframe=feature_dataframe,
+            validation_options=validation_options or {},
+            ingestion_result="INGESTED",
+            ge_type=False,
+        )
+        self._check_validation_report(feature_group, ge_report)
+
+        offline_write_options = write_options
+        online_write_options = write_options
+
+        if not feature_group.online_enabled and storage == "online":
+            raise exceptions.FeatureStoreException(
+                "Online storage is not enabled for this feature group."
+            )
+
+        if overwrite:
+            self._feature_group_api._delete_content(feature_group)
+
+        return (
+            engine._get_instance()._save_dataframe(
+                feature_group,
+                feature_dataframe,
+                "bulk_insert" if overwrite else operation,
+                feature_group.online_enabled,
+                storage,
+                offline_write_options,
+                online_write_options,
+            ),
+            ge_report,
+        )
+
+    def _prepare_insert_dataframe(
+        self,
+        feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup,
+        feature_dataframe,
+        validation_options: dict | None,
+        transformation_context: dict[str, Any] | None,
+        transform: bool,
+        n_processes: int | None,
     ):
         dataframe_features = engine._get_instance()._parse_schema_feature_group(
             feature_dataframe,
@@ -290,28 +363,12 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                 feature_group, feature_dataframe, dataframe_features
             )
 
-        if not feature_group._id:
-            # only save metadata if feature group does not exist
-            self._save_feature_group_metadata(
-                feature_group,
-                dataframe_features,
-                write_options,
-            )
-        else:
-            # else, just verify that feature group schema matches user-provided dataframe
-            self._verify_schema_compatibility(
-                self._columns_for_user_schema(feature_group), dataframe_features
-            )
-
-        # ge validation on python and non stream feature groups on spark
-        ge_report = feature_group._great_expectation_engine._validate(
-            feature_group=feature_group,
-            dataframe=feature_dataframe,
-            validation_options=validation_options or {},
-            ingestion_result="INGESTED",
-            ge_type=False,
-        )
+        return feature_dataframe, dataframe_features
 
+    @staticmethod
+    def _check_validation_report(
+        feature_group: fg.FeatureGroup | fg.ExternalFeatureGroup, ge_report
+    ) -> None:
         if ge_report is not None and ge_report.ingestion_result == "REJECTED":
             feature_group_url = util._get_feature_group_url(
                 feature_store_id=feature_group.feature_store_id,
@@ -323,29 +380,208 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
                 f"You can check a summary or download your report at {feature_group_url}."
             )
 
-        offline_write_options = write_options
-        online_write_options = write_options
+    @staticmethod
+    def _is_batch_source(features) -> bool:
+        """Whether `features` is a stream of chunks rather than a single dataframe."""
+        return isinstance(features, (str, os.PathLike, Iterator)) or (
+            HAS_PYARROW and isinstance(features, pa.RecordBatchReader)
+        )
 
-        if not feature_group.online_enabled and storage == "online":
+    @staticmethod
+    def _read_batch_source(source, batch_size: int) -> Iterator:
+        """Iterate over the chunks of a batch source.
+
+        A path is read as a local Parquet dataset, or as an Arrow IPC dataset if it ends in `.arrow`, `.feather` or `.ipc`, in record batches of at most `batch_size` rows.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            import pyarrow.dataset as pa_dataset
+
+            path = os.fspath(source)
+            file_format = (
+                "ipc"
+                if path.lower().endswith((".arrow", ".feather", ".ipc"))
+                else "parquet"
+            )
+            return pa_dataset.dataset(path, format=file_format).to_batches(
+                batch_size=batch_size
+            )
+        return iter(source)
+
+    @staticmethod
+    def _convert_insert_chunk(chunk):
+        if HAS_PYARROW and isinstance(chunk, (pa.RecordBatch, pa.Table)):
+            chunk = chunk.to_pandas()
+        return engine._get_instance()._convert_to_default_dataframe(chunk)
+
+    def _prepare_insert_chunk(
+        self,
+        feature_group: fg.FeatureGroup,
+        chunk,
+        validation_options: dict,
+        transformation_context: dict[str, Any] | None,
+        transform: bool,
+        n_processes: int | None,
+    ):
+        feature_dataframe, dataframe_features = self._prepare_insert_dataframe(
+            feature_group,
+            self._convert_insert_chunk(chunk),
+            validation_options,
+            transformation_context,
+            transform,
+            n_processes,
+        )
+        self._verify_schema_compatibility(
+            self._columns_for_user_schema(feature_group), dataframe_features
+        )
+        return feature_dataframe
+
+    def _insert_batches(
+        self,
+        feature_group: fg.FeatureGroup,
+        batches,
+        overwrite: bool,
+        operation: str,
+        storage: str | None,
+        write_options: dict[str, Any],
+        validation_options: dict[str, Any],
+        transformation_context: dict[str, Any] | None = None,
+        transform: bool = True,
+        n_processes: int | None = None,
+        max_workers: int = 2,
+    ):
+        """Insert a stream of chunks while holding only a bounded number of them in memory.
+
+        The first chunk goes through `_insert`, which resolves and saves the schema, deletes the content on overwrite and fetches the expectation suite.
+        The remaining chunks are converted, transformed and schema validated on `max_workers` threads while the previous chunks are validated and written in order on the calling thread.
+        A stream feature group shares one Kafka producer across the chunks and runs its materialization job once at the end.
+
+        Parameters:
+            feature_group: The feature group to insert into.
+            batches: Iterator over dataframes or Arrow record batches or tables.
+            overwrite: Drop all data in the feature group before inserting the first chunk.
+            operation: Write operation for the chunks.
+            storage: `"offline"`, `"online"` or `None` to write to both.
+            write_options: Write options of the insert.
+            validation_options: Validation options of the insert.
+            transformation_context: Context passed to the transformation functions.
+            transform: Whether to apply on-demand transformations to each chunk.
+            n_processes: Number of worker processes for the transformation functions of each chunk.
+            max_workers: Number of chunks prepared ahead of the write.
+
+        Returns:
+            The materialization job, if one was started, and the validation report of the last chunk.
+
+        Raises:
+            hopsworks.client.exceptions.FeatureStoreException: If the source is empty.
+            hopsworks.client.exceptions.DataValidationException: If a chunk is rejected by data validation.
+        """
+        batches = iter(batches)
+        first_chunk = next(batches, None)
+        if first_chunk is None:
             raise exceptions.FeatureStoreException(
-                "Online storage is not enabled for this feature group."
+                "The data to insert into the feature group is empty."
             )
 
-        if overwrite:
-            self._feature_group_api._delete_content(feature_group)
+        python_engine = engine._get_instance()
+        materialize = (
+            not isinstance(feature_group, fg.ExternalFeatureGroup)
+            and feature_group.stream
+            and storage != kafka_engine._STORAGE_ONLINE
+        )
+        initial_check_point = ""
+        if materialize and feature_group._id:
+            # the materialization job reads from where the first chunk starts
+            initial_check_point = kafka_engine._kafka_get_offsets(
+                topic_name=feature_group._online_topic_name,
+                feature_store_id=feature_group.feature_store_id,
+                offline_write_options=write_options,
+                high=True,
+            )
+        chunk_write_options = {**write_options, "start_offline_materialization": False}
+        chunk_validation_options = {
+            **validation_options,
+            "fetch_expectation_suite": False,
+        }
 
-        return (
-            engine._get_instance()._save_dataframe(
+        multi_part_insert = feature_group._multi_part_insert
+        feature_group._multi_part_insert = True
+        try:
+            _, ge_report = self._insert(
                 feature_group,
-                feature_dataframe,
-                "bulk_insert" if overwrite else operation,
-                feature_group.online_enabled,
-                storage,
-                offline_write_options,
-                online_write_options,
-            ),
-            ge_report,
-        )
+                feature_dataframe=self._convert_insert_chunk(first_chunk),
+                overwrite=overwrite,
+                operation=operation,
+                storage=storage,
+                write_options=chunk_write_options,
+                validation_options=validation_options,
+                transformation_context=transformation_context,
+                transform=transform,
+                n_processes=n_processes,
+            )
+            del first_chunk
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = collections.deque()
+
+                def submit_next() -> bool:
+                    chunk = next(batches, None)
+                    if chunk is None:
+                        return False
+                    pending.append(
+                        executor.submit(
+                            self._prepare_insert_chunk,
+                            feature_group,
+                            chunk,
+                            chunk_validation_options,
+                            transformation_context,
+                            transform,
+                            n_processes,
+                        )
+                    )
+                    return True
+
+                while len(pending) < max_workers and submit_next():
+                    pass
+                try:
+                    while pending:
+                        feature_dataframe = pending.popleft().result()
+                        submit_next()
+                        ge_report = feature_group._great_expectation_engine._validate(
+                            feature_group=feature_group,
+                            dataframe=feature_dataframe,
+                            validation_options=chunk_validation_options,
+                            ingestion_result="INGESTED",
+                            ge_type=False,
+                        )
+                        self._check_validation_report(feature_group, ge_report)
+                        python_engine._save_dataframe(
+                            feature_group,
+                            feature_dataframe,
+                            operation,
+                            feature_group.online_enabled,
+                            storage,
+                            chunk_write_options,
+                            chunk_write_options,
+                        )
+                        del feature_dataframe
+                finally:
+                    for future in pending:
+                        future.cancel()
+        finally:
+            if not multi_part_insert:
+                feature_group.finalize_multi_part_insert()
+
+        job = None
+        if (
+            materialize
+            and feature_group.materialization_job is not None
+            and python_engine._start_offline_materialization(write_options)
+        ):
+            python_engine._start_materialization_job(
+                feature_group, write_options, initial_check_point
+            )
+            job = feature_group.materialization_job
+        return job, ge_report
 
     def _commit_details(self, feature_group, wallclock_time, limit):
         if (
@@ -376,7 +612,7 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
 
     @staticmethod
     def _get_spark_session_and_context():
-        if isinstance(engine._get_instance(), engine.spark.Engine):
+        if engine._is_spark_engine(engine._get_instance()):
             return (
                 engine._get_instance()._spark_session,
                 engine._get_instance()._spark_context,
@@ -389,7 +625,7 @@ class FeatureGroupEngine(feature_group_base_engine.FeatureGroupBaseEngine):
         # applies a RonDB delete by primary key. The offline delete is handled
         # separately by `_commit_delete`.
         online_engine = engine._get_instance()
-        if isinstance(online_engine, engine.spark.Engine):
+        if engine._is_spark_engine(online_engine):
             online_engine._delete_online_dataframe(
                 feature_group, delete_df, write_options
             )
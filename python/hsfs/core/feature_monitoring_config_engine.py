@@ -15,13 +15,14 @@
 #
 from __future__ import annotations
 
+import dataclasses
 import logging
 import re
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 from hopsworks_common import util
-from hopsworks_common.client.exceptions import FeatureStoreException, RestAPIError
+from hopsworks_common.client.exceptions import FeatureStoreException
 from hsfs.core import feature_monitoring_config as fmc
 from hsfs.core import feature_monitoring_config_api, monitoring_window_config_engine
 from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
@@ -96,6 +97,20 @@ if TYPE_CHECKING:
     from hsfs.core.statistics_comparison_config import StatisticsComparisonConfig
 
 
+@dataclasses.dataclass
+class _MonitoringRun:
+    """A monitoring config run waiting for the statistics of its windows.
+
+    A `None` detection window is empty because the offline data is not materialized yet,
+    a `None` reference window means the config has no reference window.
+    """
+
+    config: fmc.FeatureMonitoringConfig
+    detection_window: monitoring_window_config_engine.WindowStatisticsRequest | None
+    reference_window: monitoring_window_config_engine.WindowStatisticsRequest | None
+    detection_window_commit_time: int | None = None
+
+
 class FeatureMonitoringConfigEngine:
     """Logic and helper methods to deal with configs from a feature monitoring job.
 
@@ -519,6 +534,113 @@ class FeatureMonitoringConfigEngine:
         Returns:
             A list of result object describing the outcome of the monitoring.
         """
+        result = self._run_feature_monitoring_configs(
+            entity=entity,
+            config_names=[config_name],
+            end_commit_time=end_commit_time,
+        )[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def _run_feature_monitoring_configs(
+        self,
+        entity: feature_group.FeatureGroup | feature_view.FeatureView,
+        config_names: list[str],
+        end_commit_time: int | None = None,
+    ) -> list[FeatureMonitoringResult | Exception]:
+        """Run several monitoring configs of an entity in one monitoring cycle.
+
+        The detection and reference windows of all configs are computed together by
+        `MonitoringWindowConfigEngine._run_windows_monitoring`, so a window shared by
+        several configs is read and profiled once for all their features, and distinct
+        windows are computed concurrently.
+        A config which fails does not fail the others.
+
+        Parameters:
+            entity: Featuregroup or Featureview object containing the features to monitor.
+            config_names: names of the monitoring configs.
+            end_commit_time: optional commit timestamp in milliseconds that triggered this
+                job, see `_run_feature_monitoring`.
+
+        Returns:
+            The result of each config, or the exception it failed with, in the order of `config_names`.
+        """
+        runs = []
+        for config_name in config_names:
+            try:
+                runs.append(
+                    self._prepare_feature_monitoring_run(
+                        entity=entity,
+                        config_name=config_name,
+                        end_commit_time=end_commit_time,
+                    )
+                )
+            except Exception as e:
+                runs.append(e)
+        requests = [
+            window
+            for run in runs
+            if isinstance(run, _MonitoringRun)
+            for window in (run.detection_window, run.reference_window)
+            if window is not None
+        ]
+        statistics = iter(
+            self._monitoring_window_config_engine._run_windows_monitoring(
+                entity=entity, requests=requests, return_exceptions=True
+            )
+        )
+
+        results = []
+        for run in runs:
+            if not isinstance(run, _MonitoringRun):
+                # the config failed, or the statistics of the previous run were reused
+                results.append(run)
+                continue
+            if run.detection_window is not None:
+                detection_statistics = next(statistics)
+            else:
+                # Offline data not materialized yet — skip the read and emit empty stats.
+                detection_statistics = [
+                    FeatureDescriptiveStatistics(feature_name=f, count=0)
+                    for f in run.config.get_feature_names()
+                ]
+            reference_statistics = (
+                next(statistics) if run.reference_window is not None else None
+            )
+            try:
+                for window_statistics in (detection_statistics, reference_statistics):
+                    if isinstance(window_statistics, Exception):
+                        raise window_statistics
+                results.append(
+                    self._result_engine._run_and_save_statistics_comparison(
+                        fm_config=run.config,
+                        detection_statistics=detection_statistics,
+                        reference_statistics=reference_statistics,
+                        detection_window_commit_time=run.detection_window_commit_time,
+                    )
+                )
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _prepare_feature_monitoring_run(
+        self,
+        entity: feature_group.FeatureGroup | feature_view.FeatureView,
+        config_name: str,
+        end_commit_time: int | None = None,
+    ) -> _MonitoringRun | FeatureMonitoringResult:
+        """Resolve the windows a monitoring config needs the statistics of.
+
+        Parameters:
+            entity: Featuregroup or Featureview object containing the feature to monitor.
+            config_name: name of the monitoring config.
+            end_commit_time: optional commit timestamp in milliseconds that triggered this
+                job, see `_run_feature_monitoring`.
+
+        Returns:
+            The windows to compute, or the saved result if the statistics of the previous run are reused.
+        """
         config = self._feature_monitoring_config_api._get_by_name(config_name)
 
         assert config is not None, "Feature monitoring config not found."
@@ -655,43 +777,17 @@ class FeatureMonitoringConfigEngine:
                 # New commit (or first run): pin detection window end to the commit time.
                 end_commit_time = latest_commit_time
 
-        # TODO: [FSTORE-1206] Parallelize both single_window_monitoring calls and wait
-        if detection_window_unmaterialized:
-            # Offline data not materialized yet — skip the read and emit empty stats.
-            detection_statistics = [
-                FeatureDescriptiveStatistics(feature_name=f, count=0)
-                for f in feature_names
-            ]
-        else:
-            try:
-                detection_statistics = (
-                    self._monitoring_window_config_engine._run_single_window_monitoring(
-                        entity=entity,
-                        monitoring_window_config=config.detection_window_config,
-                        feature_names=feature_names,
-                        profile_flags=profile_flags,
-                        end_commit_time_override=end_commit_time,
-                        model_filter=model_filter,
-                    )
-                )
-            except RestAPIError as e:
-                if (
-                    e.error_code
-                    == RestAPIError.FeatureStoreErrorCode.STATISTICS_NOT_FOUND
-                ):
-                    logger.warning(
-                        "Detection window statistics not found for config '%s'. "
-                        "Treating detection window as empty.",
-                        config_name,
-                    )
-                    detection_statistics = [
-                        FeatureDescriptiveStatistics(feature_name=f, count=0)
-                        for f in feature_names
-                    ]
-                else:
-                    raise
+        detection_window = None
+        if not detection_window_unmaterialized:
+            detection_window = monitoring_window_config_engine.WindowStatisticsRequest(
+                monitoring_window_config=config.detection_window_config,
+                feature_names=feature_names,
+                profile_flags=profile_flags,
+                end_commit_time_override=end_commit_time,
+                model_filter=model_filter,
+            )
 
-        reference_statistics = None
+        reference_window = None
         if config.reference_window_config is not None:
             # Apply the model filter to the reference window only when it reads from the
             # same entity (logging FG) as the detection window — i.e. time-based windows.
@@ -717,38 +813,18 @@ class FeatureMonitoringConfigEngine:
                 and detection_window_commit_time is not None
                 else None
             )
-            try:
-                reference_statistics = (
-                    self._monitoring_window_config_engine._run_single_window_monitoring(
-                        entity=entity,
-                        monitoring_window_config=config.reference_window_config,
-                        feature_names=feature_names,
-                        profile_flags=profile_flags,
-                        end_commit_time_override=ref_commit_time_override,
-                        model_filter=ref_model_filter,
-                    )
-                )
-            except RestAPIError as e:
-                if (
-                    e.error_code
-                    == RestAPIError.FeatureStoreErrorCode.STATISTICS_NOT_FOUND
-                ):
-                    logger.warning(
-                        "Reference window statistics not found for config '%s'. "
-                        "Treating reference window as empty.",
-                        config_name,
-                    )
-                    reference_statistics = [
-                        FeatureDescriptiveStatistics(feature_name=f, count=0)
-                        for f in feature_names
-                    ]
-                else:
-                    raise
+            reference_window = monitoring_window_config_engine.WindowStatisticsRequest(
+                monitoring_window_config=config.reference_window_config,
+                feature_names=feature_names,
+                profile_flags=profile_flags,
+                end_commit_time_override=ref_commit_time_override,
+                model_filter=ref_model_filter,
+            )
 
-        return self._result_engine._run_and_save_statistics_comparison(
-            fm_config=config,
-            detection_statistics=detection_statistics,
-            reference_statistics=reference_statistics,
+        return _MonitoringRun(
+            config=config,
+            detection_window=detection_window,
+            reference_window=reference_window,
             detection_window_commit_time=detection_window_commit_time,
         )
 
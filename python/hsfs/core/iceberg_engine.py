@@ -1298,30 +1298,7 @@ class IcebergEngine:
                 for f in table.sortOrder().fields()
             ]
         else:
-            glue = self._glue_catalog()
-            if glue is not None:
-                from pyiceberg.catalog import load_catalog
-
-                catalog = load_catalog(
-                    glue.catalog_name, **glue._pyiceberg_catalog_properties()
-                )
-                table = catalog.load_table(glue.identifier)
-            else:
-                self._setup_pyiceberg()
-                catalog = self._make_pyiceberg_catalog()
-                _, table = self._load_pyiceberg_table(
-                    catalog, self._get_pyiceberg_location()
-                )
-            if table is None:
-                raise FeatureStoreException(
-                    f"Feature group {self._feature_group.name} has no "
-                    "readable path-based Iceberg metadata "
-                    "(version-hint.text). Either no data was written yet, or "
-                    "the table is owned by a user-provided catalog (the "
-                    "iceberg.catalog write option), whose current-metadata "
-                    "pointer lives in that catalog; inspect the layout "
-                    "through the catalog instead."
-                )
+            table = self._load_pyiceberg_current_table("inspect the layout")
             schema = table.schema()
 
             def spec_fields(spec):
@@ -1737,6 +1714,134 @@ class IcebergEngine:
         table = catalog.register_table(self._pyiceberg_identifier(), metadata_location)
         return version, table
 
+    def _load_pyiceberg_current_table(self, operation: str):
+        """Load the current state of the table with PyIceberg, for reading.
+
+        Glue-backed feature groups load through the Glue Data Catalog, the
+        others from the path-based metadata at the table location.
+        *operation* completes the error raised when there is no such metadata.
+        """
+        glue = self._glue_catalog()
+        if glue is not None:
+            from pyiceberg.catalog import load_catalog
+
+            catalog = load_catalog(
+                glue.catalog_name, **glue._pyiceberg_catalog_properties()
+            )
+            return catalog.load_table(glue.identifier)
+        self._setup_pyiceberg()
+        catalog = self._make_pyiceberg_catalog()
+        _, table = self._load_pyiceberg_table(catalog, self._get_pyiceberg_location())
+        if table is None:
+            raise FeatureStoreException(
+                f"Feature group {self._feature_group.name} has no "
+                "readable path-based Iceberg metadata "
+                "(version-hint.text). Either no data was written yet, or "
+                "the table is owned by a user-provided catalog (the "
+                "iceberg.catalog write option), whose current-metadata "
+                f"pointer lives in that catalog; {operation} "
+                "through the catalog instead."
+            )
+        return table
+
+    @_uses_pyiceberg
+    def _read_pyiceberg_dataset(
+        self,
+        start_timestamp: int | None,
+        end_timestamp: int | None,
+        columns: list[str] | None = None,
+    ) -> pa.Table:
+        """Read the feature group as of a point in time, or its appends in a time window, with PyIceberg.
+
+        Without `start_timestamp`, the table is read at the snapshot committed at or before `end_timestamp`.
+        Otherwise only the data files added by the append snapshots committed after `start_timestamp`,
+        up to `end_timestamp`, are read, like the incremental scan of the Spark engine.
+        Upserts append the new values of the updated rows, so these are returned as well.
+        The snapshots are resolved like
+        [`_setup_iceberg_read_opts`][hsfs.core.iceberg_engine.IcebergEngine._setup_iceberg_read_opts] does.
+
+        Parameters:
+            start_timestamp: Start of the window in milliseconds since the epoch, `None` to read a snapshot.
+            end_timestamp: End of the window in milliseconds since the epoch, `None` for the current snapshot.
+            columns: The columns to read, all of them if `None`.
+
+        Returns:
+            The rows of the snapshot or the appended rows.
+        """
+        from pyiceberg.expressions import AlwaysTrue
+        from pyiceberg.io.pyarrow import ArrowScan
+        from pyiceberg.manifest import ManifestContent, ManifestEntryStatus
+        from pyiceberg.table import FileScanTask
+        from pyiceberg.table.snapshots import Operation, ancestors_between
+
+        table = self._load_pyiceberg_current_table("read it")
+        snapshots = sorted(
+            table.snapshots(), key=lambda snapshot: snapshot.timestamp_ms
+        )
+        snapshot_log = [
+            {"snapshot_id": snapshot.snapshot_id, "committed_at": snapshot.timestamp_ms}
+            for snapshot in snapshots
+        ]
+        selected_fields = tuple(columns) if columns else ("*",)
+
+        end_snapshot_id = None
+        if end_timestamp is not None and snapshots:
+            end_snapshot_id = self._latest_snapshot_id_at(snapshot_log, end_timestamp)
+            if end_snapshot_id is None:
+                end_snapshot_id = snapshots[0].snapshot_id
+        start_snapshot_id = (
+            self._latest_snapshot_id_at(snapshot_log, start_timestamp)
+            if start_timestamp
+            else None
+        )
+        if start_snapshot_id is None:
+            # a snapshot read, or a window starting before the first snapshot,
+            # whose content is the table state at the end of the window
+            return table.scan(
+                selected_fields=selected_fields, snapshot_id=end_snapshot_id
+            ).to_arrow()
+
+        end_snapshot = (
+            table.snapshot_by_id(end_snapshot_id)
+            if end_snapshot_id is not None
+            else table.current_snapshot()
+        )
+        start_snapshot = table.snapshot_by_id(start_snapshot_id)
+        window = list(ancestors_between(start_snapshot, end_snapshot, table.metadata))
+        if start_snapshot not in window:
+            # the window ends before it starts
+            window = []
+        tasks = []
+        for snapshot in window:
+            if (
+                snapshot.snapshot_id == start_snapshot_id
+                or snapshot.summary is None
+                or snapshot.summary.operation != Operation.APPEND
+            ):
+                continue
+            for manifest in snapshot.manifests(table.io):
+                if (
+                    manifest.content != ManifestContent.DATA
+                    or manifest.added_snapshot_id != snapshot.snapshot_id
+                ):
+                    continue
+                tasks.extend(
+                    FileScanTask(entry.data_file)
+                    for entry in manifest.fetch_manifest_entry(table.io)
+                    if entry.status == ManifestEntryStatus.ADDED
+                    and entry.snapshot_id == snapshot.snapshot_id
+                )
+        _logger.debug(
+            f"Reading {len(tasks)} data files appended to feature group "
+            f"{self._feature_group.name} v{self._feature_group.version} after snapshot {start_snapshot_id}"
+        )
+        projected_schema = (
+            table.schema().select(*columns) if columns else table.schema()
+        )
+        return ArrowScan(
+            table.metadata, table.io, projected_schema, AlwaysTrue()
+        ).to_table(tasks)
+
     def _create_pyiceberg_table(self, catalog, location: str, arrow_schema):
         if self._feature_group.sort_order:
             raise FeatureStoreException(
@@ -17,6 +17,9 @@ from __future__ import annotations
 
 import contextlib
 import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from io import BytesIO
 from typing import TYPE_CHECKING, Any, Literal
@@ -29,8 +32,13 @@ from hopsworks_common.core.constants import (
     HAS_FAST_AVRO,
     HAS_NUMPY,
     HAS_PANDAS,
+    HAS_POLARS,
+    HAS_PYARROW,
     avro_not_installed_message,
+    polars_not_installed_message,
+    pyarrow_not_installed_message,
 )
+from hopsworks_common.core.type_systems import _convert_offline_type_to_pyarrow_type
 from hopsworks_common.decorators import _uses_confluent_kafka
 from hsfs.core import online_ingestion, online_ingestion_api, storage_connector_api
 from tqdm import tqdm
@@ -42,8 +50,16 @@ if HAS_NUMPY:
 if HAS_PANDAS:
     import pandas as pd
 
+if HAS_POLARS:
+    import polars as pl
+
+if HAS_PYARROW:
+    import pyarrow as pa
+
 if HAS_CONFLUENT_KAFKA:
     from confluent_kafka import (
+        OFFSET_BEGINNING,
+        OFFSET_END,
         Consumer,
         KafkaError,
         KafkaException,
@@ -52,7 +68,7 @@ if HAS_CONFLUENT_KAFKA:
     )
 
 if HAS_FAST_AVRO:
-    from fastavro import schemaless_writer
+    from fastavro import schemaless_reader, schemaless_writer
     from fastavro.schema import parse_schema
 elif HAS_AVRO:
     import avro.io
@@ -60,7 +76,7 @@ elif HAS_AVRO:
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
     from hsfs.feature_group import ExternalFeatureGroup, FeatureGroup
 
@@ -85,6 +101,11 @@ _STORAGE_ONLINE = "online"
 _STORAGE_OFFLINE = "offline"
 # endregion
 
+# Metadata columns appended to the batches read from the online topic.
+KAFKA_PARTITION_COLUMN = "kafka_partition"
+KAFKA_OFFSET_COLUMN = "kafka_offset"
+KAFKA_TIMESTAMP_COLUMN = "kafka_timestamp"
+
 
 @_uses_confluent_kafka
 def _init_kafka_consumer(
@@ -318,6 +339,283 @@ def _get_encoder_func(writer_schema: str) -> callable:
     return lambda record, outf: writer.write(record, avro.io.BinaryEncoder(outf))
 
 
+def _get_decoder_func(writer_schema: str) -> Callable[[bytes], Any]:
+    if HAS_FAST_AVRO:
+        parsed_schema = parse_schema(json.loads(writer_schema))
+        return lambda payload: schemaless_reader(BytesIO(payload), parsed_schema, None)
+
+    if not HAS_AVRO:
+        raise ModuleNotFoundError(avro_not_installed_message)
+
+    reader = avro.io.DatumReader(avro.schema.parse(writer_schema))
+    return lambda payload: reader.read(avro.io.BinaryDecoder(BytesIO(payload)))
+
+
+def _get_reader_function(
+    feature_group: FeatureGroup | ExternalFeatureGroup,
+) -> tuple[dict[str, Callable[[bytes], Any]], Callable[[bytes], Any]]:
+    # counterpart of _get_writer_function, complex features are nested avro payloads
+    feature_readers = {
+        feature: _get_decoder_func(feature_group._get_feature_avro_schema(feature))
+        for feature in feature_group.get_complex_features()
+    }
+    reader = _get_decoder_func(feature_group._get_encoded_avro_schema())
+    return feature_readers, reader
+
+
+def _get_arrow_types(
+    feature_group: FeatureGroup | ExternalFeatureGroup,
+) -> dict[str, pa.DataType | None]:
+    arrow_types = {}
+    for feature in feature_group.columns:
+        try:
+            arrow_types[feature.name] = _convert_offline_type_to_pyarrow_type(
+                feature.type
+            )
+        except FeatureStoreException:
+            # let arrow infer types which have no arrow counterpart
+            arrow_types[feature.name] = None
+    return arrow_types
+
+
+def _decode_messages(
+    messages: list[Any],
+    feature_readers: dict[str, Callable[[bytes], Any]],
+    reader: Callable[[bytes], Any],
+    arrow_types: dict[str, pa.DataType | None],
+) -> pa.Table:
+    """Decode a batch of online topic messages into a single Arrow table.
+
+    Values are collected column by column and converted to Arrow once per batch, instead of building a DataFrame row by row.
+    """
+    columns = {name: [] for name in arrow_types}
+    partitions, offsets, timestamps = [], [], []
+    for message in messages:
+        row = reader(message.value())
+        for name, feature_reader in feature_readers.items():
+            if row.get(name) is not None:
+                row[name] = feature_reader(row[name])
+        for name, values in columns.items():
+            values.append(row.get(name))
+        partitions.append(message.partition())
+        offsets.append(message.offset())
+        timestamps.append(message.timestamp()[1])
+
+    arrays = [
+        pa.array(values, type=arrow_types[name]) for name, values in columns.items()
+    ]
+    arrays += [
+        pa.array(partitions, type=pa.int32()),
+        pa.array(offsets, type=pa.int64()),
+        pa.array(timestamps, type=pa.timestamp("ms", tz="UTC")),
+    ]
+    return pa.Table.from_arrays(
+        arrays,
+        names=list(columns)
+        + [KAFKA_PARTITION_COLUMN, KAFKA_OFFSET_COLUMN, KAFKA_TIMESTAMP_COLUMN],
+    )
+
+
+def _consume_partitions(
+    feature_group: FeatureGroup | ExternalFeatureGroup,
+    assignment: list[TopicPartition],
+    end_offsets: dict[int, int] | None,
+    batch_size: int,
+    timeout: float,
+    consumer_options: dict[str, Any],
+    stop: threading.Event | None = None,
+) -> Iterator[pa.Table]:
+    feature_group_id = str(feature_group.id).encode("utf8")
+    feature_readers, reader = _get_reader_function(feature_group)
+    arrow_types = _get_arrow_types(feature_group)
+    remaining = {tp.partition for tp in assignment}
+
+    consumer = _init_kafka_consumer(feature_group.feature_store_id, consumer_options)
+    try:
+        consumer.assign(assignment)
+        while end_offsets is None or remaining:
+            # checked on every poll, an idle partition yields nothing to stop on
+            if stop is not None and stop.is_set():
+                return
+            records = []
+            for message in consumer.consume(num_messages=batch_size, timeout=timeout):
+                error = message.error()
+                if error is not None:
+                    if error.code() == KafkaError._PARTITION_EOF:
+                        remaining.discard(message.partition())
+                        continue
+                    raise KafkaException(error)
+                if end_offsets is not None:
+                    end_offset = end_offsets[message.partition()]
+                    if message.offset() + 1 >= end_offset:
+                        remaining.discard(message.partition())
+                    if message.offset() >= end_offset:
+                        continue
+                # the online topic can be shared by the feature groups of a project
+                if dict(message.headers() or []).get("featureGroupId") != (
+                    feature_group_id
+                ):
+                    continue
+                records.append(message)
+            if records:
+                yield _decode_messages(records, feature_readers, reader, arrow_types)
+    finally:
+        consumer.close()
+
+
+def _consume_in_parallel(
+    consumers: list[Iterator[pa.Table]],
+    stop: threading.Event,
+) -> Iterator[pa.Table]:
+    # at most two batches per consumer are buffered to keep memory bounded
+    batches = queue.Queue(maxsize=2 * len(consumers))
+    done = object()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def drain(consumer):
+        try:
+            for batch in consumer:
+                if stop.is_set():
+                    return
+                put(batch)
+        except Exception as e:
+            put(e)
+        finally:
+            consumer.close()
+            put(done)
+
+    with ThreadPoolExecutor(max_workers=len(consumers)) as executor:
+        for consumer in consumers:
+            executor.submit(drain, consumer)
+        try:
+            remaining = len(consumers)
+            while remaining:
+                item = batches.get()
+                if item is done:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            stop.set()
+
+
+@_uses_confluent_kafka
+def _consume_batches(
+    feature_group: FeatureGroup | ExternalFeatureGroup,
+    partitions: list[int] | None = None,
+    start_offsets: Literal["earliest", "latest"] | dict[int, int] = "earliest",
+    stop_at_end: bool = True,
+    batch_size: int = 10000,
+    timeout: float = 1.0,
+    max_workers: int | None = None,
+    dataframe_type: Literal["pyarrow", "pandas", "polars"] = "pyarrow",
+    options: dict[str, Any] | None = None,
+) -> Iterator[pa.Table | pd.DataFrame | pl.DataFrame]:
+    """Read the online topic of a feature group as batches of decoded rows.
+
+    Parameters:
+        feature_group: The feature group whose online topic is read.
+        partitions: Partitions to read, defaults to all partitions of the topic.
+        start_offsets: `"earliest"`, `"latest"` or a dictionary of start offsets by partition.
+        stop_at_end: Stop at the end of the partitions as of the start of the read, otherwise keep waiting for new messages.
+        batch_size: Maximum number of messages consumed and decoded per batch.
+        timeout: Maximum time in seconds to wait for a batch of messages.
+        max_workers: Number of consumers reading disjoint sets of partitions in parallel, defaults to one per partition, at most 8.
+        dataframe_type: Type of the returned batches.
+        options: Options with the key `"kafka_producer_config"` to override the consumer configuration.
+
+    Returns:
+        An iterator of batches with a column per feature and the columns `kafka_partition`, `kafka_offset` and `kafka_timestamp`.
+
+    Raises:
+        hopsworks.client.exceptions.FeatureStoreException: If the topic does not exist.
+    """
+    if not HAS_PYARROW:
+        raise ModuleNotFoundError(pyarrow_not_installed_message)
+    if dataframe_type == "polars" and not HAS_POLARS:
+        raise ModuleNotFoundError(polars_not_installed_message)
+    options = options or {}
+    topic_name = feature_group._online_topic_name
+    consumer_options = {
+        **options,
+        "kafka_producer_config": {
+            # reading the topic must not move the offsets of the consumer group
+            "enable.auto.commit": False,
+            **options.get("kafka_producer_config", {}),
+            "enable.partition.eof": True,
+        },
+    }
+
+    consumer = _init_kafka_consumer(feature_group.feature_store_id, consumer_options)
+    try:
+        topic = consumer.list_topics(
+            topic_name, timeout=options.get("kafka_timeout", 6)
+        ).topics.get(topic_name)
+        if topic is None or topic.error is not None:
+            raise FeatureStoreException(f"Topic '{topic_name}' does not exist.")
+        if partitions is None:
+            partitions = sorted(topic.partitions)
+        end_offsets = None
+        if stop_at_end:
+            end_offsets = {
+                partition: consumer.get_watermark_offsets(
+                    TopicPartition(topic_name, partition)
+                )[1]
+                for partition in partitions
+            }
+    finally:
+        consumer.close()
+    if not partitions:
+        return
+
+    if isinstance(start_offsets, dict):
+        assignment = [
+            TopicPartition(topic_name, p, start_offsets.get(p, OFFSET_BEGINNING))
+            for p in partitions
+        ]
+    else:
+        offset = OFFSET_END if start_offsets == "latest" else OFFSET_BEGINNING
+        assignment = [TopicPartition(topic_name, p, offset) for p in partitions]
+
+    max_workers = min(max_workers or 8, len(assignment))
+    stop = threading.Event()
+    consumers = [
+        _consume_partitions(
+            feature_group,
+            assignment[i::max_workers],
+            end_offsets,
+            batch_size,
+            timeout,
+            consumer_options,
+            stop,
+        )
+        for i in range(max_workers)
+    ]
+    batches = (
+        consumers[0] if max_workers == 1 else _consume_in_parallel(consumers, stop)
+    )
+    try:
+        for table in batches:
+            if dataframe_type == "pandas":
+                yield table.to_pandas()
+            elif dataframe_type == "polars":
+                yield pl.from_arrow(table)
+            else:
+                yield table
+    finally:
+        # closes the consumers also when the caller stops iterating early
+        batches.close()
+
+
 def _encode_row(complex_feature_writers, writer, row):
     # transform special data types
     # here we might need to handle also timestamps and other complex types
@@ -0,0 +1,365 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""NumPy implementation of the datasketches KLL doubles sketch.
+
+Reads, merges and writes the compact serialization of
+`org.apache.datasketches.kll.KllDoublesSketch.toByteArray()` (datasketches-java
+6.x), which is what the per-batch profiler stores as the `datasketches-native-v1`
+KLL sidecar. This lets the Python engine merge stored sketches without a JVM.
+
+A sketch with `numLevels` levels holds, at level `h`, items of weight `2^h`. The
+compact layout is a 20-byte preamble, the first `numLevels` entries of the levels
+array, the min and max items, and the retained items, all little endian.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+_KLL_FAMILY = 15
+_SERIAL_VERSION_EMPTY_FULL = 1
+_SERIAL_VERSION_SINGLE = 2
+_PREAMBLE_INTS_EMPTY_SINGLE = 2
+_PREAMBLE_INTS_FULL = 5
+
+_EMPTY_FLAG = 1
+_LEVEL_ZERO_SORTED_FLAG = 2
+_SINGLE_ITEM_FLAG = 4
+
+_DEFAULT_M = 8
+
+# preInts, serVer, family, flags, K, M, <unused>
+_SHORT_PREAMBLE = struct.Struct("<BBBBHBx")
+# ... followed by N, minK, numLevels, <unused>
+_FULL_PREAMBLE = struct.Struct("<BBBBHBxqHBx")
+_DOUBLE = struct.Struct("<d")
+_MIN_MAX = struct.Struct("<dd")
+
+# Below this N, natural ranks are rounded before taking the ceiling, as the Java
+# sorted view does, so that e.g. 0.29 * 100 selects rank 29 and not 30.
+_TAIL_ROUNDING_FACTOR = 10_000_000
+
+
+def _level_capacity(k: int, m: int, num_levels: int, level: int) -> int:
+    """Capacity of `level`, `max(m, round(k * (2/3)^depth))` in integer arithmetic."""
+    depth = num_levels - level - 1
+    return max(m, ((2 * k << depth) // 3**depth + 1) >> 1)
+
+
+def _total_capacity(k: int, m: int, num_levels: int) -> int:
+    return sum(_level_capacity(k, m, num_levels, h) for h in range(num_levels))
+
+
+class KllDoublesSketch:
+    """Mergeable KLL quantiles sketch over doubles.
+
+    Parameters:
+        k: Accuracy parameter of the sketch.
+        m: Minimum level width.
+        min_k: Smallest `k` of any sketch merged into this one.
+    """
+
+    def __init__(self, k: int, m: int = _DEFAULT_M, min_k: int | None = None):
+        self._k = k
+        self._m = m
+        self._min_k = k if min_k is None else min_k
+        self._n = 0
+        self._min_item = math.nan
+        self._max_item = math.nan
+        # _levels[h] holds the items of weight 2^h; levels above 0 stay sorted
+        self._levels: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._level_zero_sorted = False
+        self._rng = np.random.default_rng()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> KllDoublesSketch:
+        """Deserialize a compact sketch as written by datasketches-java.
+
+        Parameters:
+            data: Serialized sketch.
+
+        Returns:
+            The deserialized sketch.
+
+        Raises:
+            ValueError: If `data` is not a compact KLL doubles sketch.
+        """
+        if len(data) < _SHORT_PREAMBLE.size:
+            raise ValueError(f"KLL sketch too short: {len(data)} bytes.")
+        pre_ints, ser_ver, family, flags, k, m = _SHORT_PREAMBLE.unpack_from(data)
+        if family != _KLL_FAMILY:
+            raise ValueError(f"Not a KLL sketch, family id is {family}.")
+
+        if flags & _EMPTY_FLAG:
+            return cls(k, m)
+
+        sketch = cls(k, m)
+        if ser_ver == _SERIAL_VERSION_SINGLE or flags & _SINGLE_ITEM_FLAG:
+            (item,) = _DOUBLE.unpack_from(data, _SHORT_PREAMBLE.size)
+            sketch._n = 1
+            sketch._min_item = sketch._max_item = item
+            sketch._levels = [np.array([item])]
+            sketch._level_zero_sorted = True
+            return sketch
+
+        if ser_ver != _SERIAL_VERSION_EMPTY_FULL or pre_ints != _PREAMBLE_INTS_FULL:
+            raise ValueError(
+                f"Unsupported KLL serialization: serial version {ser_ver}, "
+                f"{pre_ints} preamble ints."
+            )
+        *_, n, min_k, num_levels = _FULL_PREAMBLE.unpack_from(data)
+        offset = _FULL_PREAMBLE.size
+        level_offsets = np.frombuffer(
+            data, dtype="<i4", count=num_levels, offset=offset
+        )
+        offset += 4 * num_levels
+        min_item, max_item = _MIN_MAX.unpack_from(data, offset)
+        offset += _MIN_MAX.size
+        if (len(data) - offset) % 8:
+            raise ValueError("KLL sketch items are not a whole number of doubles.")
+        items = np.frombuffer(data, dtype="<f8", offset=offset).astype(np.float64)
+
+        capacity = int(level_offsets[0]) + len(items)
+        if capacity != _total_capacity(k, m, num_levels):
+            raise ValueError(
+                f"KLL sketch with k={k} and {num_levels} levels has "
+                f"{capacity} item slots."
+            )
+        bounds = np.append(level_offsets, capacity) - level_offsets[0]
+        if np.any(np.diff(bounds) < 0):
+            raise ValueError("KLL sketch levels are not increasing.")
+        levels = [items[bounds[h] : bounds[h + 1]] for h in range(num_levels)]
+        if sum(len(level) << h for h, level in enumerate(levels)) != n:
+            raise ValueError(f"KLL sketch item weights do not add up to N={n}.")
+
+        sketch._n = n
+        sketch._min_k = min_k
+        sketch._min_item = min_item
+        sketch._max_item = max_item
+        sketch._levels = levels
+        sketch._level_zero_sorted = bool(flags & _LEVEL_ZERO_SORTED_FLAG)
+        return sketch
+
+    def to_bytes(self) -> bytes:
+        """Serialize the sketch in the compact datasketches format.
+
+        Returns:
+            The serialized sketch, readable by `KllDoublesSketch.heapify` in Java.
+        """
+        if self.is_empty:
+            return _SHORT_PREAMBLE.pack(
+                _PREAMBLE_INTS_EMPTY_SINGLE,
+                _SERIAL_VERSION_EMPTY_FULL,
+                _KLL_FAMILY,
+                _EMPTY_FLAG | _LEVEL_ZERO_SORTED_FLAG,
+                self._k,
+                self._m,
+            )
+        if self._n == 1:
+            return _SHORT_PREAMBLE.pack(
+                _PREAMBLE_INTS_EMPTY_SINGLE,
+                _SERIAL_VERSION_SINGLE,
+                _KLL_FAMILY,
+                _SINGLE_ITEM_FLAG | _LEVEL_ZERO_SORTED_FLAG,
+                self._k,
+                self._m,
+            ) + _DOUBLE.pack(self._min_item)
+
+        num_levels = len(self._levels)
+        sizes = np.array([len(level) for level in self._levels])
+        first = _total_capacity(self._k, self._m, num_levels) - int(sizes.sum())
+        level_offsets = first + np.concatenate(([0], np.cumsum(sizes[:-1])))
+        flags = _LEVEL_ZERO_SORTED_FLAG if self._level_zero_sorted else 0
+        return b"".join(
+            (
+                _FULL_PREAMBLE.pack(
+                    _PREAMBLE_INTS_FULL,
+                    _SERIAL_VERSION_EMPTY_FULL,
+                    _KLL_FAMILY,
+                    flags,
+                    self._k,
+                    self._m,
+                    self._n,
+                    self._min_k,
+                    num_levels,
+                ),
+                level_offsets.astype("<i4").tobytes(),
+                _MIN_MAX.pack(self._min_item, self._max_item),
+                np.concatenate(self._levels).astype("<f8").tobytes(),
+            )
+        )
+
+    @property
+    def k(self) -> int:
+        """Accuracy parameter of the sketch."""
+        return self._k
+
+    @property
+    def n(self) -> int:
+        """Number of items the sketch has seen."""
+        return self._n
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the sketch has seen no items."""
+        return self._n == 0
+
+    @property
+    def min_item(self) -> float:
+        """Smallest item seen, NaN if the sketch is empty."""
+        return self._min_item
+
+    @property
+    def max_item(self) -> float:
+        """Largest item seen, NaN if the sketch is empty."""
+        return self._max_item
+
+    @property
+    def num_retained(self) -> int:
+        """Number of items retained by the sketch."""
+        return sum(len(level) for level in self._levels)
+
+    def update(self, items: Sequence[float] | np.ndarray) -> None:
+        """Add items to the sketch, NaNs are ignored as in datasketches.
+
+        Parameters:
+            items: Items to add.
+        """
+        items = np.asarray(items, dtype=np.float64).ravel()
+        items = items[~np.isnan(items)]
+        if not len(items):
+            return
+        self._add_extremes(float(items.min()), float(items.max()))
+        self._n += len(items)
+        self._levels[0] = np.concatenate((self._levels[0], items))
+        self._level_zero_sorted = False
+        self._compress()
+
+    def merge(self, other: KllDoublesSketch) -> None:
+        """Merge another sketch into this one.
+
+        Parameters:
+            other: Sketch to merge, left unchanged.
+        """
+        if other.is_empty:
+            return
+        self._add_extremes(other._min_item, other._max_item)
+        self._n += other._n
+        self._min_k = min(self._min_k, other._min_k)
+        for h, items in enumerate(other._levels):
+            if h == len(self._levels):
+                self._levels.append(items.copy())
+            elif h == 0:
+                self._levels[0] = np.concatenate((self._levels[0], items))
+            else:
+                self._levels[h] = np.sort(np.concatenate((self._levels[h], items)))
+        self._level_zero_sorted = False
+        self._compress()
+
+    def get_quantiles(self, ranks: Sequence[float]) -> np.ndarray:
+        """Return the items at the given normalized ranks, inclusive search.
+
+        Parameters:
+            ranks: Normalized ranks in `[0, 1]`.
+
+        Returns:
+            The approximate quantile of each rank.
+
+        Raises:
+            ValueError: If the sketch is empty.
+        """
+        if self.is_empty:
+            raise ValueError("Cannot compute quantiles of an empty KLL sketch.")
+        items, cumulative_weights = self._sorted_view()
+        natural_ranks = np.asarray(ranks, dtype=np.float64) * self._n
+        if self._n <= _TAIL_ROUNDING_FACTOR:
+            natural_ranks = (
+                np.round(natural_ranks * _TAIL_ROUNDING_FACTOR) / _TAIL_ROUNDING_FACTOR
+            )
+        indices = np.searchsorted(cumulative_weights, np.ceil(natural_ranks))
+        return items[np.minimum(indices, len(items) - 1)]
+
+    def get_cdf(self, split_points: Sequence[float]) -> np.ndarray:
+        """Return the normalized rank of each split point, inclusive search.
+
+        Parameters:
+            split_points: Strictly increasing split points.
+
+        Returns:
+            `len(split_points) + 1` cumulative fractions, the last one being 1.
+
+        Raises:
+            ValueError: If the sketch is empty.
+        """
+        if self.is_empty:
+            raise ValueError("Cannot compute the CDF of an empty KLL sketch.")
+        items, cumulative_weights = self._sorted_view()
+        counts = np.searchsorted(items, split_points, side="right")
+        weights = np.concatenate(([0], cumulative_weights))[counts]
+        return np.append(weights / self._n, 1.0)
+
+    def _add_extremes(self, min_item: float, max_item: float) -> None:
+        if self.is_empty:
+            self._min_item, self._max_item = min_item, max_item
+        else:
+            self._min_item = min(self._min_item, min_item)
+            self._max_item = max(self._max_item, max_item)
+
+    def _sorted_view(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(len(level), 1 << h, dtype=np.int64)
+                for h, level in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], np.cumsum(weights[order])
+
+    def _compress(self) -> None:
+        # Compact the lowest level that reached its capacity until the sketch
+        # fits, like KllHelper.generalCompress: an odd item stays behind and a
+        # random half of the rest moves one level up with double weight.
+        while True:
+            num_levels = len(self._levels)
+            if self.num_retained <= _total_capacity(self._k, self._m, num_levels):
+                return
+            for h in range(num_levels):
+                if len(self._levels[h]) >= _level_capacity(
+                    self._k, self._m, num_levels, h
+                ):
+                    break
+            items = self._levels[h] if h else np.sort(self._levels[h])
+            odd = len(items) % 2
+            promoted = items[odd + int(self._rng.integers(2)) :: 2]
+            self._levels[h] = items[:odd]
+            if h == 0:
+                self._level_zero_sorted = True
+            if h + 1 == num_levels:
+                self._levels.append(promoted)
+            else:
+                self._levels[h + 1] = np.sort(
+                    np.concatenate((self._levels[h + 1], promoted))
+                )
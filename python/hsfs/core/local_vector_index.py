@@ -0,0 +1,456 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""In-memory nearest neighbor search over the offline data of embedding feature groups.
+
+The index answers the same queries as `find_neighbors` without going through the vector database, which makes it suitable for offline evaluation of retrieval models over many queries.
+Scores are reported like the vector database reports them, lower is closer:
+the squared euclidean distance for `l2_norm`, one minus the cosine similarity for `cosine`, and the transformed inner product of the OpenSearch `innerproduct` space for `dot_product`.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from hopsworks_apigen import public
+from hopsworks_common.client.exceptions import FeatureStoreException
+from hsfs.embedding import SimilarityFunctionType
+
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from hsfs import feature_group as fg_mod
+
+
+_logger = logging.getLogger(__name__)
+
+# Upper bound on the number of query-corpus scores held in memory at once.
+_MAX_SCORE_ELEMENTS = 2**25
+# Number of training points per centroid when fitting k-means.
+_KMEANS_POINTS_PER_CENTROID = 256
+# Product quantization fits 256 centroids per subspace, so it trains on fewer points.
+_PQ_POINTS_PER_CENTROID = 64
+_KMEANS_ITERATIONS = 10
+
+
+@public
+class LocalVectorIndex:
+    """Nearest neighbor index over the embeddings of a feature group held in local memory.
+
+    Use [`FeatureGroup.build_local_index`][hsfs.feature_group.FeatureGroup.build_local_index] to create an index from the offline data of a feature group.
+
+    Three index types are supported:
+
+    * `"flat"`: exact brute-force search.
+    * `"ivf"`: the embeddings are partitioned with k-means into `nlist` lists and only the `nprobe` lists closest to a query are searched exactly.
+    * `"ivf_pq"`: like `"ivf"`, but the embeddings are compressed with product quantization into `pq_m` one-byte codes and scores are approximated from the codes.
+    """
+
+    FLAT = "flat"
+    IVF = "ivf"
+    IVF_PQ = "ivf_pq"
+
+    def __init__(
+        self,
+        embeddings: np.ndarray,
+        rows: pd.DataFrame,
+        similarity_function_type: str = SimilarityFunctionType.L2,
+        index_type: str = FLAT,
+        nlist: int | None = None,
+        nprobe: int = 8,
+        pq_m: int | None = None,
+        seed: int = 0,
+    ):
+        self._similarity_function_type = similarity_function_type.lower()
+        if self._similarity_function_type not in (
+            SimilarityFunctionType.L2,
+            SimilarityFunctionType.COSINE,
+            SimilarityFunctionType.DOT_PRODUCT,
+        ):
+            raise ValueError(
+                f"Unsupported similarity function type '{similarity_function_type}'."
+            )
+        index_type = index_type.lower()
+        if index_type not in (self.FLAT, self.IVF, self.IVF_PQ):
+            raise ValueError(
+                f"Unsupported index type '{index_type}', use one of "
+                f"'{self.FLAT}', '{self.IVF}' or '{self.IVF_PQ}'."
+            )
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2:
+            raise ValueError("Embeddings must be a two-dimensional array.")
+        if len(rows) != len(embeddings):
+            raise ValueError("Number of rows and embeddings do not match.")
+
+        self._index_type = index_type
+        self._rows = rows.reset_index(drop=True)
+        self._nprobe = nprobe
+        self._rng = np.random.default_rng(seed)
+        self._vectors = self._normalize(embeddings)
+        self._dimension = embeddings.shape[1]
+        self._norms = (
+            np.einsum("ij,ij->i", self._vectors, self._vectors)
+            if self._similarity_function_type == SimilarityFunctionType.L2
+            else None
+        )
+
+        self._centroids = None
+        self._codes = None
+        if index_type != self.FLAT and len(self._vectors):
+            self._build_ivf(nlist)
+        if index_type == self.IVF_PQ and len(self._vectors):
+            self._build_pq(pq_m)
+
+    @classmethod
+    def _from_feature_group(
+        cls,
+        feature_group: fg_mod.FeatureGroup,
+        col: str | None = None,
+        data: pd.DataFrame | None = None,
+        read_options: dict | None = None,
+        **kwargs,
+    ) -> LocalVectorIndex:
+        if not feature_group.embedding_index:
+            raise FeatureStoreException("Feature group does not have embedding.")
+        if col:
+            embedding_feature = feature_group.embedding_index.get_embedding(col)
+            if embedding_feature is None:
+                raise FeatureStoreException(f"Feature '{col}' is not an embedding.")
+        else:
+            embedding_features = list(feature_group.embedding_index.get_embeddings())
+            if len(embedding_features) > 1:
+                raise FeatureStoreException(
+                    "More than 1 embedding feature. Please specify the `col`."
+                )
+            embedding_feature = embedding_features[0]
+
+        if data is None:
+            data = feature_group.read(
+                dataframe_type="pandas", read_options=read_options
+            )
+        embeddings = cls._stack_embeddings(data[embedding_feature.name])
+        if embedding_feature.dimension and embeddings.shape[1] not in (
+            0,
+            embedding_feature.dimension,
+        ):
+            raise FeatureStoreException(
+                f"Embedding '{embedding_feature.name}' has dimension {embeddings.shape[1]},"
+                f" expected {embedding_feature.dimension}."
+            )
+        return cls(
+            embeddings,
+            data[[f.name for f in feature_group.columns if f.name in data.columns]],
+            similarity_function_type=embedding_feature.similarity_function_type
+            or SimilarityFunctionType.L2,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _stack_embeddings(column: pd.Series) -> np.ndarray:
+        if column.isna().any():
+            raise FeatureStoreException(
+                f"Embedding '{column.name}' contains missing values."
+            )
+        if len(column) == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack(column.to_numpy()).astype(np.float32, copy=False)
+
+    def _normalize(self, vectors: np.ndarray) -> np.ndarray:
+        if self._similarity_function_type != SimilarityFunctionType.COSINE:
+            return vectors
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    @public
+    def find_neighbors(
+        self, embedding: list[int | float], k: int = 10
+    ) -> list[tuple[float, list[Any]]]:
+        """Find the nearest neighbors of an embedding.
+
+        Parameters:
+            embedding: The target embedding for which neighbors are to be found.
+            k: The number of nearest neighbors to retrieve.
+
+        Returns:
+            A list of tuples representing the nearest neighbors, in the format of `FeatureGroup.find_neighbors`.
+            Each tuple contains: `(The similarity score, A list of feature values)`.
+        """
+        return self.find_neighbors_batch([embedding], k=k)[0]
+
+    @public
+    def find_neighbors_batch(
+        self, embeddings: list[list[int | float]] | np.ndarray, k: int = 10
+    ) -> list[list[tuple[float, list[Any]]]]:
+        """Find the nearest neighbors of many embeddings at once.
+
+        Parameters:
+            embeddings: The target embeddings, one per query.
+            k: The number of nearest neighbors to retrieve per query.
+
+        Returns:
+            One list of neighbors per query, in the format of `FeatureGroup.find_neighbors`.
+        """
+        scores, indices = self.search(embeddings, k=k)
+        rows = self._rows
+        results = []
+        for query_scores, query_indices in zip(scores, indices, strict=True):
+            found = query_indices >= 0
+            values = rows.iloc[query_indices[found]].to_numpy(dtype=object).tolist()
+            results.append(
+                [
+                    (float(score), [self._to_python(v) for v in row])
+                    for score, row in zip(query_scores[found], values, strict=True)
+                ]
+            )
+        return results
+
+    @public
+    def search(
+        self, embeddings: list[list[int | float]] | np.ndarray, k: int = 10
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the nearest neighbors of many embeddings and return them as arrays.
+
+        This skips building the rows of the neighbors, which makes it the fastest way to compute metrics like recall@k over many queries.
+
+        Parameters:
+            embeddings: The target embeddings, one per query.
+            k: The number of nearest neighbors to retrieve per query.
+
+        Returns:
+            A tuple `(scores, indices)` of arrays of shape `(number of queries, k)`, ordered from the closest neighbor.
+            `indices` are row positions in the indexed data and are `-1`, with a score of `inf`, where fewer than `k` neighbors were found.
+        """
+        queries = self._normalize(np.atleast_2d(np.asarray(embeddings, np.float32)))
+        n_queries = len(queries)
+        scores = np.full((n_queries, k), np.inf, dtype=np.float32)
+        indices = np.full((n_queries, k), -1, dtype=np.int64)
+        if n_queries == 0 or k <= 0 or len(self) == 0:
+            return scores, indices
+        if queries.shape[1] != self._dimension:
+            raise ValueError(
+                f"Query dimension {queries.shape[1]} does not match the index "
+                f"dimension {self._dimension}."
+            )
+
+        if self._index_type == self.FLAT:
+            batch_size = max(1, _MAX_SCORE_ELEMENTS // len(self._vectors))
+            for start in range(0, n_queries, batch_size):
+                batch = slice(start, start + batch_size)
+                similarity = self._similarity(
+                    queries[batch], self._vectors, self._norms
+                )
+                self._top_k(similarity, None, k, scores[batch], indices[batch])
+        else:
+            probed = self._top_lists(queries)
+            for i, lists in enumerate(probed):
+                candidates = np.concatenate(
+                    [
+                        self._list_order[
+                            self._list_offsets[j] : self._list_offsets[j + 1]
+                        ]
+                        for j in lists
+                    ]
+                )
+                if self._codes is not None:
+                    similarity = self._pq_similarity(queries[i], candidates)
+                else:
+                    similarity = self._similarity(
+                        queries[i : i + 1],
+                        self._vectors[candidates],
+                        None if self._norms is None else self._norms[candidates],
+                    )
+                self._top_k(
+                    similarity.reshape(1, -1),
+                    candidates,
+                    k,
+                    scores[i : i + 1],
+                    indices[i : i + 1],
+                )
+        return scores, indices
+
+    def _similarity(
+        self, queries: np.ndarray, vectors: np.ndarray, norms: np.ndarray | None
+    ) -> np.ndarray:
+        # higher is closer for all similarity functions
+        products = queries @ vectors.T
+        if self._similarity_function_type == SimilarityFunctionType.L2:
+            query_norms = np.einsum("ij,ij->i", queries, queries)[:, None]
+            return -np.maximum(query_norms - 2 * products + norms[None, :], 0)
+        return products
+
+    def _to_score(self, similarity: np.ndarray) -> np.ndarray:
+        # https://opensearch.org/docs/latest/search-plugins/knn/approximate-knn/#spaces
+        if self._similarity_function_type == SimilarityFunctionType.L2:
+            return -similarity
+        if self._similarity_function_type == SimilarityFunctionType.COSINE:
+            return 1 - similarity
+        with np.errstate(divide="ignore"):
+            return np.where(similarity >= 0, 1 / (1 + similarity) - 1, -similarity)
+
+    def _top_k(
+        self,
+        similarity: np.ndarray,
+        candidates: np.ndarray | None,
+        k: int,
+        scores_out: np.ndarray,
+        indices_out: np.ndarray,
+    ) -> None:
+        n = similarity.shape[1]
+        kk = min(k, n)
+        if kk == 0:
+            return
+        if kk < n:
+            top = np.argpartition(-similarity, kk - 1, axis=1)[:, :kk]
+        else:
+            top = np.broadcast_to(np.arange(n), (len(similarity), n))
+        top_similarity = np.take_along_axis(similarity, top, axis=1)
+        order = np.argsort(-top_similarity, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        scores_out[:, :kk] = self._to_score(
+            np.take_along_axis(top_similarity, order, 1)
+        )
+        indices_out[:, :kk] = top if candidates is None else candidates[top]
+
+    def _build_ivf(self, nlist: int | None) -> None:
+        n = len(self._vectors)
+        nlist = min(nlist or max(1, int(np.sqrt(n))), n)
+        self._centroids = self._kmeans(self._vectors, nlist)
+        assignments = self._assign(self._vectors, self._centroids)
+        self._list_order = np.argsort(assignments, kind="stable")
+        self._list_offsets = np.concatenate(
+            [[0], np.cumsum(np.bincount(assignments, minlength=nlist))]
+        )
+        _logger.debug("Built IVF index with %d lists over %d vectors", nlist, n)
+
+    def _top_lists(self, queries: np.ndarray) -> np.ndarray:
+        nprobe = min(self._nprobe, len(self._centroids))
+        if self._similarity_function_type == SimilarityFunctionType.L2:
+            norms = np.einsum("ij,ij->i", self._centroids, self._centroids)
+            similarity = self._similarity(queries, self._centroids, norms)
+        else:
+            similarity = queries @ self._centroids.T
+        return np.argpartition(-similarity, nprobe - 1, axis=1)[:, :nprobe]
+
+    def _build_pq(self, pq_m: int | None) -> None:
+        dimension = self._dimension
+        pq_m = pq_m or next(m for m in (16, 8, 4, 2, 1) if dimension % m == 0)
+        if dimension % pq_m:
+            raise ValueError(
+                f"Embedding dimension {dimension} is not divisible by pq_m={pq_m}."
+            )
+        n_codes = min(256, len(self._vectors))
+        subvectors = [
+            np.ascontiguousarray(subvector)
+            for subvector in np.split(self._vectors, pq_m, axis=1)
+        ]
+        self._codebooks = np.stack(
+            [
+                self._kmeans(subvectors[m], n_codes, _PQ_POINTS_PER_CENTROID)
+                for m in range(pq_m)
+            ]
+        )
+        self._codes = np.stack(
+            [
+                self._assign(subvectors[m], self._codebooks[m]).astype(np.uint8)
+                for m in range(pq_m)
+            ],
+            axis=1,
+        )
+        # the codes replace the vectors for scoring
+        self._vectors = self._vectors[:0]
+        self._norms = None
+        _logger.debug("Built PQ codes with %d subquantizers", pq_m)
+
+    def _pq_similarity(self, query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        pq_m = self._codebooks.shape[0]
+        query = query.reshape(pq_m, 1, -1)
+        if self._similarity_function_type == SimilarityFunctionType.L2:
+            tables = -np.sum((self._codebooks - query) ** 2, axis=2)
+        else:
+            tables = np.einsum("mkd,mld->mk", self._codebooks, query)
+        codes = self._codes[candidates]
+        return tables[np.arange(pq_m), codes].sum(axis=1)
+
+    def _kmeans(
+        self,
+        vectors: np.ndarray,
+        k: int,
+        points_per_centroid: int = _KMEANS_POINTS_PER_CENTROID,
+    ) -> np.ndarray:
+        n = len(vectors)
+        sample_size = min(n, k * points_per_centroid)
+        sample = vectors[self._rng.choice(n, sample_size, replace=False)]
+        centroids = sample[self._rng.choice(sample_size, k, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            assignments = self._assign(sample, centroids)
+            counts = np.bincount(assignments, minlength=k)
+            nonempty = counts > 0
+            # sum the points per cluster in one pass over the sorted assignments
+            offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])[nonempty]
+            sums = np.add.reduceat(sample[np.argsort(assignments)], offsets, axis=0)
+            centroids[nonempty] = sums / counts[nonempty, None]
+        return centroids
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        centroid_norms = np.einsum("ij,ij->i", centroids, centroids)
+        batch_size = max(1, _MAX_SCORE_ELEMENTS // len(centroids))
+        assignments = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), batch_size):
+            distances = vectors[start : start + batch_size] @ centroids.T
+            distances *= -2
+            distances += centroid_norms
+            assignments[start : start + batch_size] = np.argmin(distances, axis=1)
+        return assignments
+
+    @staticmethod
+    def _to_python(value: Any) -> Any:
+        # embeddings are returned as lists like by the vector database
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        return value
+
+    @public
+    @property
+    def index_type(self) -> str:
+        """Type of the index, one of `"flat"`, `"ivf"` or `"ivf_pq"`."""
+        return self._index_type
+
+    @public
+    @property
+    def similarity_function_type(self) -> str:
+        """Similarity function used to rank the neighbors."""
+        return self._similarity_function_type
+
+    @public
+    @property
+    def nprobe(self) -> int:
+        """Number of inverted lists searched per query for `"ivf"` and `"ivf_pq"` indexes."""
+        return self._nprobe
+
+    @nprobe.setter
+    def nprobe(self, nprobe: int) -> None:
+        self._nprobe = nprobe
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __repr__(self) -> str:
+        return (
+            f"LocalVectorIndex({self._index_type!r}, "
+            f"{self._similarity_function_type!r}, size={len(self)})"
+        )
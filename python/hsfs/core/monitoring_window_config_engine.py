@@ -15,31 +15,61 @@
 #
 from __future__ import annotations
 
+import concurrent.futures
+import dataclasses
 import logging
 import re
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, TypeVar
+from typing import TypeVar
 
 from hopsworks_common.client.exceptions import RestAPIError
 from hsfs import feature_group, feature_view, util
 from hsfs.core import monitoring_window_config as mwc
 from hsfs.core import statistics_engine
+from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
 from hsfs.feature import Feature
 from hsfs.training_dataset_split import TrainingDatasetSplit
 
 
-if TYPE_CHECKING:
-    from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
-
-
 logger = logging.getLogger(__name__)
 
 # Maximum number of commits to enumerate when building a rolling reference via merge.
 _MAX_COMMITS_FOR_MERGE = 100
 
 
+@dataclasses.dataclass
+class WindowStatisticsRequest:
+    """Statistics of some features of an entity in a monitoring window.
+
+    Requests with the same window, profile flags, end commit time and model filter
+    are computed together by `MonitoringWindowConfigEngine._run_windows_monitoring`.
+    """
+
+    monitoring_window_config: mwc.MonitoringWindowConfig
+    feature_names: list[str]
+    profile_flags: dict | None = None
+    end_commit_time_override: int | None = None
+    model_filter: tuple[str, int] | None = None
+
+    def _window_key(self) -> tuple:
+        window = self.monitoring_window_config
+        # WindowConfigType is not hashable, its string is the value
+        return (
+            str(window.window_config_type),
+            window.time_offset,
+            window.window_length,
+            window.training_dataset_version,
+            window.row_percentage,
+            tuple(sorted((self.profile_flags or {}).items())),
+            self.end_commit_time_override,
+            self.model_filter,
+        )
+
+
 class MonitoringWindowConfigEngine:
     _MAX_TIME_RANGE_LENGTH = 12
+    # Maximum number of distinct monitoring windows read and profiled concurrently.
+    MAX_CONCURRENT_WINDOWS = 4
 
     def __init__(self, **kwargs):
         # No need to initialize anything
@@ -287,6 +317,94 @@ class MonitoringWindowConfigEngine:
             self._round_and_convert_event_time(event_time=end_time),
         )
 
+    def _run_windows_monitoring(
+        self,
+        entity: feature_group.FeatureGroup | feature_view.FeatureView,
+        requests: list[WindowStatisticsRequest],
+        return_exceptions: bool = False,
+    ) -> list[list[FeatureDescriptiveStatistics] | Exception]:
+        """Compute the statistics of several monitoring windows of an entity.
+
+        Requests for the same window, for example the detection windows of configs
+        monitoring different features with the same schedule, are merged, so each
+        window is read and profiled once for the union of their features. Distinct
+        windows are computed concurrently, up to `MAX_CONCURRENT_WINDOWS` at a time.
+
+        Parameters:
+            entity: The entity to monitor.
+            requests: Windows and features to compute the statistics of.
+            return_exceptions: Whether the requests of a window which failed get the exception instead of the failure being raised, so the other windows are still returned.
+
+        Returns:
+            The descriptive statistics of the features of each request, in the order of the requests.
+            With `return_exceptions`, a request of a failed window gets the exception instead.
+        """
+        windows: dict[tuple, tuple[WindowStatisticsRequest, dict[str, None]]] = {}
+        for request in requests:
+            feature_names = windows.setdefault(request._window_key(), (request, {}))[1]
+            feature_names.update(dict.fromkeys(request.feature_names))
+
+        def run(window: tuple[WindowStatisticsRequest, dict[str, None]]):
+            request, feature_names = window
+            try:
+                return self._run_window_statistics(entity, request, list(feature_names))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        if len(windows) <= 1:
+            window_statistics = [run(window) for window in windows.values()]
+        else:
+            # All windows are of the same entity, so the statistics engine each
+            # thread initializes in _run_single_window_monitoring is equivalent.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(windows), self.MAX_CONCURRENT_WINDOWS)
+            ) as pool:
+                window_statistics = list(pool.map(run, windows.values()))
+        statistics_by_window = dict(zip(windows, window_statistics, strict=True))
+
+        results = []
+        for request in requests:
+            statistics = statistics_by_window[request._window_key()]
+            if isinstance(statistics, Exception):
+                results.append(statistics)
+                continue
+            feature_names = set(request.feature_names)
+            results.append(
+                [fds for fds in statistics if fds.feature_name in feature_names]
+            )
+        return results
+
+    def _run_window_statistics(
+        self,
+        entity: feature_group.FeatureGroup | feature_view.FeatureView,
+        request: WindowStatisticsRequest,
+        feature_names: list[str],
+    ) -> list[FeatureDescriptiveStatistics]:
+        """Compute the statistics of a window, treating missing registered statistics as an empty window."""
+        try:
+            return self._run_single_window_monitoring(
+                entity=entity,
+                monitoring_window_config=request.monitoring_window_config,
+                feature_names=feature_names,
+                profile_flags=request.profile_flags,
+                end_commit_time_override=request.end_commit_time_override,
+                model_filter=request.model_filter,
+            )
+        except RestAPIError as e:
+            if e.error_code != RestAPIError.FeatureStoreErrorCode.STATISTICS_NOT_FOUND:
+                raise
+            logger.warning(
+                "Statistics of the %s monitoring window not found. "
+                "Treating the window as empty.",
+                request.monitoring_window_config.window_config_type,
+            )
+            return [
+                FeatureDescriptiveStatistics(feature_name=f, count=0)
+                for f in feature_names
+            ]
+
     def _run_single_window_monitoring(
         self,
         entity: feature_group.FeatureGroup | feature_view.FeatureView,
@@ -665,7 +783,7 @@ class MonitoringWindowConfigEngine:
 
         For each feature, fetches the stored per-batch statistics rows within
         [start_time, end_time], extracts native KLL sidecars, and merges them
-        via the JVM KllMerger into a synthetic reference FDS.
+        into a synthetic reference FDS, in Python or via the JVM KllMerger.
 
         Parameters:
             entity: Feature group whose per-batch statistics are merged.
@@ -0,0 +1,266 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Local on-disk cache for offline query results of the Python engine.
+
+Results read through the Hopsworks Query Service are stored as Arrow IPC files
+and served back memory-mapped on a hit. An entry is keyed by the query payload
+and by the latest commit of every feature group the query reads, so a new
+commit on any of them produces a different key and the stale entry of the same
+query is dropped on the next write. The total size of the cache directory is
+bounded with least-recently-used eviction.
+
+The cache is opt-in per read through the `"local_cache"` read option, either
+`True` for the defaults or a dictionary with the keys `"path"` and
+`"max_size_bytes"`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+from typing import TYPE_CHECKING, Any
+
+import pyarrow as pa
+from hsfs.core import feature_group_api
+
+
+if TYPE_CHECKING:
+    from hsfs.constructor.fs_query import FsQuery
+
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "hopsworks", "offline_query_cache"
+)
+DEFAULT_MAX_SIZE_BYTES = 20 * 1024**3
+CACHE_FILE_SUFFIX = ".arrow"
+
+_cache_instances: dict[tuple[str, int], OfflineQueryCache] = {}
+_cache_instances_lock = threading.Lock()
+
+
+def _get_instance(
+    local_cache: bool | dict[str, Any] | None,
+) -> OfflineQueryCache | None:
+    """Return the cache configured by the `"local_cache"` read option.
+
+    Parameters:
+        local_cache: `True` to use the default location and size, a dictionary with the optional keys `"path"` and `"max_size_bytes"`, or a falsy value to disable caching.
+
+    Returns:
+        The cache instance, or `None` if caching is disabled.
+    """
+    if not local_cache:
+        return None
+    config = local_cache if isinstance(local_cache, dict) else {}
+    cache_dir = os.path.abspath(
+        os.path.expanduser(config.get("path", DEFAULT_CACHE_DIR))
+    )
+    max_size_bytes = int(config.get("max_size_bytes", DEFAULT_MAX_SIZE_BYTES))
+    with _cache_instances_lock:
+        key = (cache_dir, max_size_bytes)
+        if key not in _cache_instances:
+            _cache_instances[key] = OfflineQueryCache(cache_dir, max_size_bytes)
+        return _cache_instances[key]
+
+
+class OfflineQueryCache:
+    """Size-bounded LRU cache of Arrow tables on the local file system."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self._max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._feature_group_api = feature_group_api.FeatureGroupApi()
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    def _cache_key(self, fs_query: FsQuery) -> tuple[str, str] | None:
+        """Compute the cache key of a query.
+
+        The key consists of a hash of the query payload, identifying the entry, and a hash of the commit state of the feature groups read by the query, identifying the version of the entry.
+
+        Parameters:
+            fs_query: The query constructed for the Hopsworks Query Service.
+
+        Returns:
+            The tuple `(query_hash, version_hash)`, or `None` if the result of the query can not be cached.
+        """
+        if not fs_query.hqs_payload:
+            return None
+        if fs_query.on_demand_fg_aliases:
+            # External data can change without a commit in Hopsworks.
+            return None
+
+        query_hash = hashlib.sha256(fs_query.hqs_payload.encode("utf-8")).hexdigest()
+
+        versions = []
+        for fg_alias in (
+            fs_query.hudi_cached_feature_groups
+            + fs_query.delta_cached_feature_groups
+            + fs_query.iceberg_cached_feature_groups
+        ):
+            commit_id = self._latest_commit_id(fg_alias.feature_group)
+            if commit_id is None:
+                return None
+            versions.append(
+                [
+                    fg_alias.alias,
+                    fg_alias.feature_group.id,
+                    commit_id,
+                    fg_alias.left_feature_group_start_timestamp,
+                    fg_alias.left_feature_group_end_timestamp,
+                ]
+            )
+        version_hash = hashlib.sha256(
+            json.dumps(sorted(versions, key=str)).encode("utf-8")
+        ).hexdigest()
+        return query_hash, version_hash
+
+    def _latest_commit_id(self, feature_group) -> int | None:
+        try:
+            commits = self._feature_group_api._get_commit_details(
+                feature_group, None, 1
+            )
+        except Exception as e:
+            _logger.debug(
+                "Could not retrieve commits of feature group %s, not caching: %s",
+                feature_group.id,
+                e,
+            )
+            return None
+        if not commits:
+            return None
+        return commits[0].commitid
+
+    def _path(self, query_hash: str, version_hash: str) -> str:
+        return os.path.join(
+            self._cache_dir, f"{query_hash}-{version_hash}{CACHE_FILE_SUFFIX}"
+        )
+
+    def _get(self, query_hash: str, version_hash: str) -> pa.Table | None:
+        """Read a cached table, memory-mapping the file.
+
+        Parameters:
+            query_hash: Hash identifying the query.
+            version_hash: Hash identifying the commit state of the query.
+
+        Returns:
+            The cached table, or `None` on a miss.
+        """
+        path = self._path(query_hash, version_hash)
+        try:
+            table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        except FileNotFoundError:
+            return None
+        except (OSError, pa.ArrowInvalid) as e:
+            _logger.debug("Dropping unreadable cache entry %s: %s", path, e)
+            self._remove(path)
+            return None
+        # The modification time tracks the last use of an entry for eviction.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        _logger.debug("Offline query cache hit: %s", path)
+        return table
+
+    def _put(self, query_hash: str, version_hash: str, table: pa.Table) -> None:
+        """Store a table and drop stale versions of the same query.
+
+        Parameters:
+            query_hash: Hash identifying the query.
+            version_hash: Hash identifying the commit state of the query.
+            table: The query result.
+        """
+        if table.nbytes > self._max_size_bytes:
+            _logger.debug(
+                "Query result of %d bytes exceeds the cache size, not caching.",
+                table.nbytes,
+            )
+            return
+        path = self._path(query_hash, version_hash)
+        tmp_path = os.path.join(self._cache_dir, f".{uuid.uuid4().hex}.tmp")
+        try:
+            with (
+                pa.OSFile(tmp_path, "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _logger.debug("Could not write cache entry %s: %s", path, e)
+            self._remove(tmp_path)
+            return
+
+        with self._lock:
+            for entry in os.scandir(self._cache_dir):
+                if (
+                    entry.name.startswith(query_hash + "-")
+                    and entry.path != path
+                    and entry.name.endswith(CACHE_FILE_SUFFIX)
+                ):
+                    _logger.debug("Invalidating stale cache entry %s", entry.path)
+                    self._remove(entry.path)
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self._cache_dir):
+            if not entry.name.endswith(CACHE_FILE_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size_bytes:
+                break
+            _logger.debug("Evicting cache entry %s", path)
+            self._remove(path)
+            total_size -= size
+
+    def _clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            for entry in os.scandir(self._cache_dir):
+                if entry.name.endswith(CACHE_FILE_SUFFIX):
+                    self._remove(entry.path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+    @property
+    def cache_dir(self) -> str:
+        """Directory holding the cached query results."""
+        return self._cache_dir
+
+    @property
+    def max_size_bytes(self) -> int:
+        """Maximum total size of the cached query results in bytes."""
+        return self._max_size_bytes
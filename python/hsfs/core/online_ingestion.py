@@ -170,6 +170,9 @@ class OnlineIngestion:
     def wait_for_completion(self, options: dict[str, Any] = None):
         """Wait for the online ingestion operation to complete, displaying a progress bar.
 
+        To wait for several ingestions, or for ingestions and job executions together, use
+        [`wait_all`][hopsworks_common.execution_waiter.wait_all] instead.
+
         Parameters:
             options: Options for waiting.
                 - "timeout" (int): Maximum time to wait in seconds (default: 60).
@@ -203,8 +206,7 @@ class OnlineIngestion:
                 progress_bar.n = rows_processed
                 progress_bar.refresh()
 
-                # Check if the online ingestion is complete
-                if self.num_entries and rows_processed >= self.num_entries:
+                if self._is_complete():
                     break
 
                 # Check if the timeout has been reached (if timeout is 0 we will wait indefinitely)
@@ -220,6 +222,16 @@ class OnlineIngestion:
 
                 self.refresh()
 
+    def _is_complete(self) -> bool:
+        """Check whether all the entries of the ingestion have been processed.
+
+        Returns:
+            `True` if the number of entries is known and they have all been processed.
+        """
+        return bool(self.num_entries) and (
+            sum(result.rows for result in self.results) >= self.num_entries
+        )
+
     def _search_logs(
         self, must: list[dict[str, Any]], size: int
     ) -> list[dict[str, Any]]:
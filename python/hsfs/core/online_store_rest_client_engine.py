@@ -18,12 +18,14 @@ from __future__ import annotations
 import base64
 import itertools
 import logging
+import time
 from datetime import datetime
 from typing import Any
 
 from hsfs import training_dataset_feature as td_feature_mod
 from hsfs import util
 from hsfs.core import online_store_rest_client_api
+from hsfs.core.serving_stats import ServingStats
 
 
 _logger = logging.getLogger(__name__)
@@ -44,6 +46,7 @@ class OnlineStoreRestClientEngine:
         feature_view_name: str,
         feature_view_version: int,
         features: list[td_feature_mod.TrainingDatasetFeature],
+        serving_stats: ServingStats | None = None,
     ):
         """Initialize the Online Store Rest Client Engine.
 
@@ -55,6 +58,7 @@ class OnlineStoreRestClientEngine:
             feature_view_version: The version of the feature view from which to retrieve the feature vector.
             features: A list of features to be used for the feature vector conversion. Note that the features
                 must be ordered according to the feature vector schema.
+            serving_stats: Records the duration of the requests and of the decoding of their responses if set.
         """
         if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug(
@@ -67,6 +71,7 @@ class OnlineStoreRestClientEngine:
         self._feature_view_name = feature_view_name
         self._feature_view_version = feature_view_version
         self._features = features
+        self._serving_stats = serving_stats
         self._ordered_feature_names = []
         self._inference_helpers_feature_names = []
         self._no_helpers_feature_names = []
@@ -242,17 +247,25 @@ class OnlineStoreRestClientEngine:
         payload["entries"] = entry
         payload["passedFeatures"] = passed_features
 
+        stats = self._serving_stats
+        if stats is not None:
+            start = time.perf_counter()
         response = self._online_store_rest_client_api._get_single_raw_feature_vector(
             payload=payload
         )
+        if stats is not None:
+            start = stats._lap(ServingStats.REST_REQUEST, start)
         if return_type != self.RETURN_TYPE_RESPONSE_JSON:
-            return self._convert_rdrs_response_to_feature_value_row(
+            row = self._convert_rdrs_response_to_feature_value_row(
                 row_feature_values=response["features"],
                 detailed_status=response.get("detailedStatus", None),
                 drop_missing=drop_missing,
                 inference_helpers_only=inference_helpers_only,
                 return_type=return_type,
             )
+            if stats is not None:
+                stats._lap(ServingStats.REST_DECODE, start)
+            return row
         return response
 
     def _get_batch_feature_vectors(
@@ -319,16 +332,21 @@ class OnlineStoreRestClientEngine:
                 "If some entries do not have passed features, pass an empty dict for those entries."
             )
 
+        stats = self._serving_stats
+        if stats is not None:
+            start = time.perf_counter()
         response = self._online_store_rest_client_api._get_batch_raw_feature_vectors(
             payload=payload
         )
+        if stats is not None:
+            start = stats._lap(ServingStats.REST_REQUEST, start)
 
         if return_type != self.RETURN_TYPE_RESPONSE_JSON:
             if _logger.isEnabledFor(logging.DEBUG):
                 _logger.debug(
                     "Converting batch response to feature value rows for each."
                 )
-            return [
+            rows = [
                 self._convert_rdrs_response_to_feature_value_row(
                     row_feature_values=row,
                     detailed_status=detailed_status,
@@ -340,6 +358,9 @@ class OnlineStoreRestClientEngine:
                     response["features"], response.get("detailedStatus", []) or []
                 )
             ]
+            if stats is not None:
+                stats._lap(ServingStats.REST_DECODE, start)
+            return rows
         return response
 
     def _convert_rdrs_response_to_feature_value_row(
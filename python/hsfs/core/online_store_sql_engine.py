@@ -19,6 +19,7 @@ import asyncio
 import json
 import logging
 import re
+import time
 from typing import TYPE_CHECKING, Any
 
 from hopsworks_common.core import variable_api
@@ -30,6 +31,7 @@ from hsfs.core import (
     training_dataset_api,
 )
 from hsfs.core.constants import HAS_AIOMYSQL, HAS_SQLALCHEMY
+from hsfs.core.serving_stats import ServingStats
 
 
 if TYPE_CHECKING:
@@ -75,6 +77,7 @@ class OnlineStoreSqlClient:
         external: bool,
         serving_keys: set[ServingKey] | None = None,
         connection_options: dict[str, Any] | None = None,
+        serving_stats: ServingStats | None = None,
     ):
         if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug("Initialising Online Store Sql Client")
@@ -101,6 +104,7 @@ class OnlineStoreSqlClient:
         self._connection_options = None
 
         self._async_task_thread = None
+        self._serving_stats = serving_stats
 
     def __del__(self):
         # Safely stop the async task thread.
@@ -454,6 +458,9 @@ class OnlineStoreSqlClient:
             _logger.debug(
                 f"Executing prepared statements for serving vector with entries: {bind_entries}"
             )
+        stats = self._serving_stats
+        if stats is not None:
+            start = time.perf_counter()
         results_dict = self._async_task_thread._submit(
             AsyncTask(
                 task_function=self._execute_prep_statements,
@@ -464,6 +471,8 @@ class OnlineStoreSqlClient:
                 requires_connection_pool=True,
             )
         )
+        if stats is not None:
+            start = stats._lap(ServingStats.SQL_QUERY, start)
         if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug(f"Retrieved feature vectors: {results_dict}")
             _logger.debug("Constructing serving vector from results")
@@ -473,6 +482,8 @@ class OnlineStoreSqlClient:
                     _logger.debug(f"Processing row: {row} for prepared statement {key}")
                 result_dict = dict(row)
                 serving_vector.update(result_dict)
+        if stats is not None:
+            stats._lap(ServingStats.SQL_STITCH, start)
 
         return serving_vector
 
@@ -535,6 +546,9 @@ class OnlineStoreSqlClient:
                 f"Executing prepared statements for batch vector with entries: {entry_values}"
             )
         # run all the prepared statements in parallel using aiomysql engine
+        stats = self._serving_stats
+        if stats is not None:
+            start = time.perf_counter()
         parallel_results = self._async_task_thread._submit(
             AsyncTask(
                 task_function=self._execute_prep_statements,
@@ -542,6 +556,8 @@ class OnlineStoreSqlClient:
                 requires_connection_pool=True,
             )
         )
+        if stats is not None:
+            start = stats._lap(ServingStats.SQL_QUERY, start)
         if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug(
                 f"Retrieved feature vectors: {parallel_results}, stitching them."
@@ -592,6 +608,8 @@ class OnlineStoreSqlClient:
                         self._get_result_key_serving_key(serving_keys, entry), {}
                     )
                 )
+        if stats is not None:
+            stats._lap(ServingStats.SQL_STITCH, start)
         return batch_results, serving_keys_all_fg
 
     def _refresh_mysql_connection(self):
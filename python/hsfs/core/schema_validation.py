@@ -1,7 +1,10 @@
+import dataclasses
 import logging
 import re
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from hopsworks_common.core.constants import HAS_POLARS
 from hopsworks_common.spark_connect_utils import _is_spark_dataframe
 
@@ -9,6 +12,56 @@ from hopsworks_common.spark_connect_utils import _is_spark_dataframe
 logger = logging.getLogger(__name__)
 
 
+@dataclasses.dataclass(frozen=True)
+class ColumnProfile:
+    """Facts about one dataframe column, gathered in a single pass over its Arrow representation.
+
+    `arrow_type` is `None` if the values do not conform to a single Arrow type, e.g. an object column mixing strings and numbers.
+    `max_length` is the longest value in characters for string columns and in bytes for binary columns, and `None` for other columns.
+    """
+
+    arrow_type: pa.DataType | None
+    null_count: int
+    max_length: int | None = None
+
+    @property
+    def is_string(self) -> bool:
+        return self.arrow_type is not None and (
+            pa.types.is_string(self.arrow_type)
+            or pa.types.is_large_string(self.arrow_type)
+            or pa.types.is_string_view(self.arrow_type)
+        )
+
+
+def _max_length(array) -> int | None:
+    if array.null_count == len(array):
+        return None
+    if (
+        pa.types.is_string(array.type)
+        or pa.types.is_large_string(array.type)
+        or pa.types.is_string_view(array.type)
+    ):
+        return pc.max(pc.utf8_length(array)).as_py()
+    if pa.types.is_binary(array.type) or pa.types.is_large_binary(array.type):
+        return pc.max(pc.binary_length(array)).as_py()
+    return None
+
+
+def _profile_arrow_table(table: pa.Table) -> dict[str, ColumnProfile]:
+    """Profile every column of an Arrow table.
+
+    Parameters:
+        table: The table to profile.
+
+    Returns:
+        The profile of each column by column name.
+    """
+    return {
+        name: ColumnProfile(column.type, column.null_count, _max_length(column))
+        for name, column in zip(table.column_names, table.columns, strict=True)
+    }
+
+
 class DataFrameValidator:
     # Base validator class
 
@@ -101,10 +154,57 @@ class DataFrameValidator:
 
         return df_features
 
-    def _validate_df_specifics(self, feature_group, df):
-        """To be implemented by subclasses."""
+    def _profile_columns(self, df):
+        """Profile all columns of the DataFrame in one pass, to be implemented by subclasses.
+
+        Parameters:
+            df: The DataFrame to profile.
+
+        Returns:
+            The `ColumnProfile` of each column by column name.
+        """
         raise NotImplementedError("Subclasses must implement this method")
 
+    def _validate_df_specifics(self, feature_group, df):
+        """Check primary key nulls and online string lengths using the column profiles of the DataFrame.
+
+        Parameters:
+            feature_group: The feature group whose schema is validated against.
+            df: The DataFrame to validate.
+        """
+        profiles = self._profile_columns(df)
+        errors = {}
+        column_lengths = {}
+        is_pk_null = False
+        is_string_length_exceeded = False
+
+        # Check for null values in primary key columns
+        for pk in feature_group.primary_key:
+            if profiles[pk].null_count > 0:
+                errors[pk] = f"Primary key column {pk} contains null values."
+                is_pk_null = True
+
+        # Check string lengths
+        for col, profile in profiles.items():
+            if not profile.is_string or profile.max_length is None:
+                continue
+            col_max_len = (
+                self._get_online_varchar_length(
+                    self._get_feature_from_list(col, feature_group.columns)
+                )
+                if feature_group.columns
+                else 100
+            )
+
+            if col_max_len is not None and profile.max_length > col_max_len:
+                errors[col] = (
+                    f"String length exceeded. Column {col} has string values longer than maximum column limit of {col_max_len} characters."
+                )
+                column_lengths[col] = profile.max_length
+                is_string_length_exceeded = True
+
+        return errors, column_lengths, is_pk_null, is_string_length_exceeded
+
     @staticmethod
     def _get_feature_from_list(feature_name, features):
         for i_feature in features:
@@ -154,96 +254,47 @@ class DataFrameValidator:
 
 
 class PandasValidator(DataFrameValidator):
-    @staticmethod
-    def _get_string_columns(df):
-        if pd.__version__.startswith("2."):
-            # For pandas 2+, use is_string_dtype api
-            return [
-                col
-                for col in df.columns
-                if pd.api.types.is_string_dtype(df[col].dropna())
-            ]
-        # For pandas 1.x,  is_string_dtype api is not compatible, so check each row if its a string
-        string_cols = []
-        for col in df.select_dtypes(include=["object", "string"]).columns:
-            # Skip empty columns
-            if df[col].count() == 0:
+    def _profile_columns(self, df):
+        profiles = {}
+        typed_columns = []
+        for col in df.columns:
+            column = df[col]
+            if column.dtype != object and not isinstance(column.dtype, pd.StringDtype):
+                typed_columns.append(col)
                 continue
-            # Check if ALL non-null values are strings
-            if df[col].dropna().map(lambda x: isinstance(x, str)).all():
-                string_cols.append(col)
-        return string_cols
-
-    # Pandas df specific validator
-    def _validate_df_specifics(self, feature_group, df):
-        errors = {}
-        column_lengths = {}
-        is_pk_null = False
-        is_string_length_exceeded = False
-
-        # Check for null values in primary key columns
-        for pk in feature_group.primary_key:
-            if df[pk].isnull().any():
-                errors[pk] = f"Primary key column {pk} contains null values."
-                is_pk_null = True
-
-        # Check string lengths
-        string_columns = self._get_string_columns(df)
-        for col in string_columns:
-            currentmax = df[col].str.len().max()
-            col_max_len = (
-                self._get_online_varchar_length(
-                    self._get_feature_from_list(col, feature_group.columns)
+            # converting infers the type and counts nulls in the same pass over the values
+            try:
+                array = pa.array(column, from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                profiles[col] = ColumnProfile(None, int(column.isna().sum()))
+            else:
+                profiles[col] = ColumnProfile(
+                    array.type, array.null_count, _max_length(array)
                 )
-                if feature_group.columns
-                else 100
-            )
-
-            if col_max_len is not None and currentmax > col_max_len:
-                errors[col] = (
-                    f"String length exceeded. Column {col} has string values longer than maximum column limit of {col_max_len} characters."
-                )
-                column_lengths[col] = currentmax
-                is_string_length_exceeded = True
 
-        return errors, column_lengths, is_pk_null, is_string_length_exceeded
+        if typed_columns:
+            # the types of numpy and extension dtypes are known without looking at the values
+            typed_df = df[typed_columns]
+            arrow_types = pa.Schema.from_pandas(typed_df, preserve_index=False).types
+            null_counts = typed_df.isna().sum().to_list()
+            for col, arrow_type, null_count in zip(
+                typed_columns, arrow_types, null_counts, strict=True
+            ):
+                profiles[col] = ColumnProfile(arrow_type, int(null_count))
+        return {col: profiles[col] for col in df.columns}
+
+    @classmethod
+    def _get_string_columns(cls, df):
+        return [
+            col
+            for col, profile in cls()._profile_columns(df).items()
+            if profile.is_string
+        ]
 
 
 class PolarsValidator(DataFrameValidator):
-    # Polars df specific validator
-    def _validate_df_specifics(self, feature_group, df):
-        import polars as pl
-
-        errors = {}
-        column_lengths = {}
-        is_pk_null = False
-        is_string_length_exceeded = False
-
-        # Check for null values in primary key columns
-        for pk in feature_group.primary_key:
-            if df[pk].is_null().any():
-                errors[pk] = f"Primary key column {pk} contains null values."
-                is_pk_null = True
-
-        # Check string lengths
-        for col in df.select(pl.col(pl.String)).columns:
-            currentmax = df[col].str.len_chars().max()
-            col_max_len = (
-                self._get_online_varchar_length(
-                    self._get_feature_from_list(col, feature_group.columns)
-                )
-                if feature_group.columns
-                else 100
-            )
-
-            if col_max_len is not None and currentmax > col_max_len:
-                errors[col] = (
-                    f"String length exceeded. Column {col} has string values longer than maximum column limit of {col_max_len} characters."
-                )
-                column_lengths[col] = currentmax
-                is_string_length_exceeded = True
-
-        return errors, column_lengths, is_pk_null, is_string_length_exceeded
+    def _profile_columns(self, df):
+        return _profile_arrow_table(df.to_arrow())
 
 
 class PySparkValidator(DataFrameValidator):
@@ -0,0 +1,263 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Latency of the stages of online feature vector retrieval.
+
+Serving code holds an optional `ServingStats` and times a stage as
+
+```python
+stats = self._serving_stats
+if stats is not None:
+    start = time.perf_counter()
+...  # the stage
+if stats is not None:
+    start = stats._lap(ServingStats.FETCH, start)
+```
+
+so that serving without statistics only pays for the `is not None` checks.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any
+
+from hopsworks_apigen import public
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+_logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets in seconds, four buckets per power of two
+# from 1 microsecond to about 2 minutes, so estimated percentiles are within 19%.
+_BUCKETS_PER_DOUBLING = 4
+_BUCKET_BOUNDS = [
+    1e-6 * 2 ** (i / _BUCKETS_PER_DOUBLING)
+    for i in range(27 * _BUCKETS_PER_DOUBLING + 1)
+]
+_PERCENTILES = {"p50_ms": 0.5, "p90_ms": 0.9, "p99_ms": 0.99}
+
+
+class _StageHistogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        # the last bucket holds durations above the largest bound
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        rank = max(1, math.ceil(fraction * self.count))
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                if bucket == len(_BUCKET_BOUNDS):
+                    return self.max
+                return min(_BUCKET_BOUNDS[bucket], self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        summary = {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000,
+        }
+        for name, fraction in _PERCENTILES.items():
+            summary[name] = self.percentile(fraction) * 1000
+        summary["max_ms"] = self.max * 1000
+        return summary
+
+
+@public
+class ServingStats:
+    """Latency histograms of the stages of online feature vector retrieval.
+
+    Enable them with `init_serving(serving_stats=True)` and read them with
+    [`FeatureView.serving_stats`][hsfs.feature_view.FeatureView.serving_stats].
+    Every timed stage is also passed to the sinks, callables taking the stage name
+    and its duration in seconds, which forward them to a metrics system, see
+    [`prometheus_sink`][hsfs.core.serving_stats.prometheus_sink] and
+    [`opentelemetry_sink`][hsfs.core.serving_stats.opentelemetry_sink].
+
+    The stages are:
+
+    - `validate_entry`: validation of the entries against the serving keys.
+    - `fetch`: retrieval of the feature values from the online store, split into
+      `rest_request` and `rest_decode` for the REST client, and `sql_query` and
+      `sql_stitch` for the SQL client.
+    - `decode_features`: decoding of complex features and timestamps, per vector.
+    - `on_demand_transform` and `model_dependent_transform`: transformation
+      functions, per vector.
+    - `return_type`: conversion of the vectors to the requested return type.
+    - `total`: the whole `get_feature_vector` or `get_feature_vectors` call.
+
+    Parameters:
+        sinks: Callables receiving the stage name and duration in seconds of every timed stage.
+    """
+
+    VALIDATE_ENTRY = "validate_entry"
+    FETCH = "fetch"
+    REST_REQUEST = "rest_request"
+    REST_DECODE = "rest_decode"
+    SQL_QUERY = "sql_query"
+    SQL_STITCH = "sql_stitch"
+    DECODE_FEATURES = "decode_features"
+    ON_DEMAND_TRANSFORM = "on_demand_transform"
+    MODEL_DEPENDENT_TRANSFORM = "model_dependent_transform"
+    RETURN_TYPE = "return_type"
+    TOTAL = "total"
+
+    def __init__(self, sinks: list[Callable[[str, float], None]] | None = None):
+        self._sinks = list(sinks or [])
+        self._lock = threading.Lock()
+        self._histograms: dict[str, _StageHistogram] = {}
+
+    def _record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _StageHistogram()
+            histogram.record(seconds)
+        for sink in self._sinks:
+            try:
+                sink(stage, seconds)
+            except Exception:
+                _logger.warning(
+                    "Serving stats sink %r failed for stage %s.",
+                    sink,
+                    stage,
+                    exc_info=True,
+                )
+
+    def _lap(self, stage: str, start: float) -> float:
+        """Record the time elapsed since `start` for `stage` and return the current time.
+
+        Parameters:
+            stage: Name of the stage.
+            start: `time.perf_counter()` value at the start of the stage.
+
+        Returns:
+            The current `time.perf_counter()` value, the start of the next stage.
+        """
+        now = time.perf_counter()
+        self._record(stage, now - start)
+        return now
+
+    @public
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Summarize the recorded durations per stage.
+
+        Percentiles are estimated from the histogram buckets and are within 19% of the exact value.
+
+        Returns:
+            For each stage with recorded durations, its `count` and its `mean_ms`, `p50_ms`, `p90_ms`, `p99_ms` and `max_ms` in milliseconds.
+        """
+        with self._lock:
+            return {
+                stage: histogram.summary()
+                for stage, histogram in self._histograms.items()
+            }
+
+    @public
+    def reset(self) -> None:
+        """Discard the recorded durations."""
+        with self._lock:
+            self._histograms = {}
+
+
+@public
+def prometheus_sink(
+    histogram: Any, label: str = "stage"
+) -> Callable[[str, float], None]:
+    """Build a serving stats sink observing durations in a Prometheus histogram.
+
+    Example:
+        ```python
+        from prometheus_client import Histogram
+        from hsfs.core.serving_stats import prometheus_sink
+
+        histogram = Histogram(
+            "feature_vector_stage_seconds", "Feature vector retrieval stages", ["stage"]
+        )
+        feature_view.init_serving(serving_stats_sink=prometheus_sink(histogram))
+        ```
+
+    Parameters:
+        histogram: A `prometheus_client.Histogram` with a label for the stage name.
+        label: Name of the stage label.
+
+    Returns:
+        The sink to pass to `init_serving`.
+    """
+    children = {}
+
+    def sink(stage: str, seconds: float) -> None:
+        child = children.get(stage)
+        if child is None:
+            child = children[stage] = histogram.labels(**{label: stage})
+        child.observe(seconds)
+
+    return sink
+
+
+@public
+def opentelemetry_sink(
+    histogram: Any, attribute: str = "stage"
+) -> Callable[[str, float], None]:
+    """Build a serving stats sink recording durations in an OpenTelemetry histogram.
+
+    Example:
+        ```python
+        from opentelemetry import metrics
+        from hsfs.core.serving_stats import opentelemetry_sink
+
+        histogram = metrics.get_meter("serving").create_histogram(
+            "feature_vector_stage_duration", unit="s"
+        )
+        feature_view.init_serving(serving_stats_sink=opentelemetry_sink(histogram))
+        ```
+
+    Parameters:
+        histogram: An OpenTelemetry `Histogram` instrument.
+        attribute: Name of the attribute holding the stage name.
+
+    Returns:
+        The sink to pass to `init_serving`.
+    """
+    attributes = {}
+
+    def sink(stage: str, seconds: float) -> None:
+        stage_attributes = attributes.get(stage)
+        if stage_attributes is None:
+            stage_attributes = attributes[stage] = {attribute: stage}
+        histogram.record(seconds, attributes=stage_attributes)
+
+    return sink
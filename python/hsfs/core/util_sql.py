@@ -105,7 +105,7 @@ async def _create_async_engine(
     # create a aiomysql connection pool
     return await async_create_engine(
         host=hostname,
-        port=3306,
+        port=url.port or 3306,
         user=online_options["user"],
         password=online_options["password"],
         db=url.database,
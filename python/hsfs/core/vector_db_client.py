@@ -18,13 +18,19 @@ from __future__ import annotations
 import base64
 import contextlib
 import json
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+import pyarrow as pa
 from hopsworks_common.client.exceptions import (
     FeatureStoreException,
     VectorDatabaseException,
 )
+from hopsworks_common.core.type_systems import _convert_offline_type_to_pyarrow_type
 from hopsworks_common.util import _convert_event_time_to_timestamp
 from hsfs.constructor.filter import Filter, Logic
 from hsfs.constructor.join import Join
@@ -36,6 +42,18 @@ if TYPE_CHECKING:
     from hsfs.feature import Feature
 
 
+_logger = logging.getLogger(__name__)
+
+# Number of knn queries sent in a single `_msearch` request.
+MSEARCH_BATCH_SIZE = 128
+# Number of `_msearch` requests issued concurrently for large batches.
+MSEARCH_MAX_WORKERS = 4
+# Number of documents per page when scanning an index.
+SCAN_BATCH_SIZE = 1000
+# How long the point in time of a scan is kept alive between two pages.
+SCAN_KEEP_ALIVE = "5m"
+
+
 class VectorDbClient:
     _filter_map = {
         Filter.GT: "gt",
@@ -119,24 +137,154 @@ class VectorDbClient:
         filter: Filter | Logic = None,
         options=None,
     ):
+        embedding_feature = self._get_embedding_feature(feature)
+        self._check_filter(filter, embedding_feature.feature_group)
+        query = self._build_knn_query(embedding, embedding_feature, k, filter)
+        if not index_name:
+            index_name = embedding_feature.embedding_index.index_name
+
+        opensearch_client = OpenSearchClientSingleton(
+            feature_store_id=embedding_feature.feature_group.feature_store_id
+        )
+        results = opensearch_client._search(
+            body=query, index=index_name, options=options
+        )
+
+        # When using project index (`embedding_feature.embedding_index.col_prefix` is not empty), sometimes the total number of result returned is less than k. Possible reason is that when using project index, some embedding columns have null value if the row is from a different feature group. And opensearch filter out the result where embedding is null after retrieving the top k results. So search 3 times more data if it is using project index and size of result is not k.
+        if (
+            embedding_feature.embedding_index.col_prefix
+            and len(results["hits"]["hits"]) != k
+        ):
+            self._expand_knn_query(
+                opensearch_client, query, embedding_feature, index_name, k, options
+            )
+            results = opensearch_client._search(
+                body=query, index=index_name, options=options
+            )
+
+        return self._parse_neighbors(results, embedding_feature)
+
+    def _find_neighbors_batch(
+        self,
+        embeddings,
+        feature: Feature = None,
+        index_name=None,
+        k=10,
+        filter: Filter | Logic = None,
+        options=None,
+        batch_size=MSEARCH_BATCH_SIZE,
+        max_workers=MSEARCH_MAX_WORKERS,
+    ):
+        """Find the nearest neighbours of several embeddings with multi-search requests.
+
+        The knn queries are sent in `_msearch` requests of at most `batch_size` queries each, which are issued in parallel if there is more than one.
+
+        Parameters:
+            embeddings: The target embeddings for which neighbors are to be found.
+            feature: The embedding feature used to compute similarity score, required only if there are multiple embeddings.
+            index_name: Name of the index to search, defaults to the index of the embedding feature.
+            k: The number of nearest neighbors to retrieve per embedding.
+            filter: A filter expression to restrict the search space.
+            options: The options used for the requests to the vector database.
+            batch_size: Maximum number of queries per `_msearch` request.
+            max_workers: Maximum number of `_msearch` requests issued concurrently.
+
+        Returns:
+            A list with one entry per embedding, each in the format returned by `_find_neighbors`.
+        """
+        embedding_feature = self._get_embedding_feature(feature)
+        self._check_filter(filter, embedding_feature.feature_group)
+        if not index_name:
+            index_name = embedding_feature.embedding_index.index_name
+        queries = [
+            self._build_knn_query(embedding, embedding_feature, k, filter)
+            for embedding in embeddings
+        ]
+        if not queries:
+            return []
+
+        opensearch_client = OpenSearchClientSingleton(
+            feature_store_id=embedding_feature.feature_group.feature_store_id
+        )
+        responses = self._msearch(
+            opensearch_client, queries, index_name, options, batch_size, max_workers
+        )
+
+        # See `_find_neighbors` for why queries against a project index are retried with a larger k.
+        if embedding_feature.embedding_index.col_prefix:
+            retry_indices = [
+                i
+                for i, response in enumerate(responses)
+                if len(response["hits"]["hits"]) != k
+            ]
+            if retry_indices:
+                for i in retry_indices:
+                    self._expand_knn_query(
+                        opensearch_client,
+                        queries[i],
+                        embedding_feature,
+                        index_name,
+                        k,
+                        options,
+                    )
+                retried = self._msearch(
+                    opensearch_client,
+                    [queries[i] for i in retry_indices],
+                    index_name,
+                    options,
+                    batch_size,
+                    max_workers,
+                )
+                for i, response in zip(retry_indices, retried, strict=True):
+                    responses[i] = response
+
+        return [
+            self._parse_neighbors(response, embedding_feature) for response in responses
+        ]
+
+    def _msearch(
+        self, opensearch_client, queries, index_name, options, batch_size, max_workers
+    ):
+        batches = [
+            queries[i : i + batch_size] for i in range(0, len(queries), batch_size)
+        ]
+
+        def search_batch(batch):
+            body = []
+            for query in batch:
+                body.append({"index": index_name})
+                body.append(query)
+            return opensearch_client._msearch(body=body, options=options)
+
+        if len(batches) == 1:
+            batch_results = [search_batch(batches[0])]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(batches))
+            ) as executor:
+                batch_results = list(executor.map(search_batch, batches))
+        return [
+            response for result in batch_results for response in result["responses"]
+        ]
+
+    def _get_embedding_feature(self, feature: Feature = None):
         if not feature:
             if not self._embedding_features:
                 raise ValueError("embedding col is not defined.")
             if len(self._embedding_features) > 1:
                 raise ValueError("More than 1 embedding columns but col is not defined")
-            embedding_feature = list(self._embedding_features.values())[0]
-        else:
-            embedding_feature = self._embedding_features.get(feature, None)
-            if embedding_feature is None:
-                raise ValueError(
-                    f"feature: {feature.name} is not an embedding feature."
-                )
-        self._check_filter(filter, embedding_feature.feature_group)
+            return list(self._embedding_features.values())[0]
+        embedding_feature = self._embedding_features.get(feature, None)
+        if embedding_feature is None:
+            raise ValueError(f"feature: {feature.name} is not an embedding feature.")
+        return embedding_feature
+
+    def _build_knn_query(self, embedding, embedding_feature, k, filter):
         col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
         filter_clauses = [
             {"exists": {"field": col_name}},
         ] + self._get_query_filter(filter, embedding_feature.embedding_index.col_prefix)
-        query = {
+        return {
             "size": k,
             "query": {
                 "knn": {
@@ -153,50 +301,34 @@ class VectorDbClient:
                 ).keys()
             ),
         }
-        if not index_name:
-            index_name = embedding_feature.embedding_index.index_name
 
-        opensearch_client = OpenSearchClientSingleton(
-            feature_store_id=embedding_feature.feature_group.feature_store_id
-        )
-        results = opensearch_client._search(
-            body=query, index=index_name, options=options
-        )
-
-        # When using project index (`embedding_feature.embedding_index.col_prefix` is not empty), sometimes the total number of result returned is less than k. Possible reason is that when using project index, some embedding columns have null value if the row is from a different feature group. And opensearch filter out the result where embedding is null after retrieving the top k results. So search 3 times more data if it is using project index and size of result is not k.
-        if (
-            embedding_feature.embedding_index.col_prefix
-            and len(results["hits"]["hits"]) != k
-        ):
-            # Get the max number of results allowed to request if it is not available.
-            # This is expected to be executed once only.
-            if not VectorDbClient._index_result_limit_k.get(index_name):
-                query["query"]["knn"][col_name]["k"] = 2**31 - 1
-                try:
-                    # It is expected that this request ALWAYS fails because requested k is too large.
-                    # The purpose here is to get the max k allowed from the vector database, and cache it.
-                    opensearch_client._search(
-                        body=query, index=index_name, options=options
+    def _expand_knn_query(
+        self, opensearch_client, query, embedding_feature, index_name, k, options
+    ):
+        col_name = embedding_feature.embedding_index.col_prefix + embedding_feature.name
+        # Get the max number of results allowed to request if it is not available.
+        # This is expected to be executed once only.
+        if not VectorDbClient._index_result_limit_k.get(index_name):
+            query["query"]["knn"][col_name]["k"] = 2**31 - 1
+            try:
+                # It is expected that this request ALWAYS fails because requested k is too large.
+                # The purpose here is to get the max k allowed from the vector database, and cache it.
+                opensearch_client._search(body=query, index=index_name, options=options)
+            except VectorDatabaseException as e:
+                if (
+                    e.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
+                    and e.info.get(VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K)
+                ):
+                    VectorDbClient._index_result_limit_k[index_name] = e.info.get(
+                        VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
                     )
-                except VectorDatabaseException as e:
-                    if (
-                        e.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
-                        and e.info.get(
-                            VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
-                        )
-                    ):
-                        VectorDbClient._index_result_limit_k[index_name] = e.info.get(
-                            VectorDatabaseException.REQUESTED_K_TOO_LARGE_INFO_K
-                        )
-                    else:
-                        raise e
-            query["query"]["knn"][col_name]["k"] = min(
-                VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k
-            )
-            results = opensearch_client._search(
-                body=query, index=index_name, options=options
-            )
+                else:
+                    raise e
+        query["query"]["knn"][col_name]["k"] = min(
+            VectorDbClient._index_result_limit_k.get(index_name, k), 3 * k
+        )
 
+    def _parse_neighbors(self, results, embedding_feature):
         # https://opensearch.org/docs/latest/search-plugins/knn/approximate-knn/#spaces
         return [
             (
@@ -472,22 +604,276 @@ class VectorDbClient:
         feature_group: hsfs.feature_group.FeatureGroup,
         n: int = None,
         filter: Filter | Logic = None,
+        read_options: dict | None = None,
     ) -> list:
-        if feature_group.embedding_index:
-            vector_db_client = VectorDbClient(feature_group.select_all())
-            results = vector_db_client._read(
-                feature_group.id,
-                feature_group.columns,
-                pk=feature_group.embedding_index.col_prefix
-                + feature_group.primary_key[0],
-                index_name=feature_group.embedding_index.index_name,
-                n=n,
-                filter=filter,
+        if not feature_group.embedding_index:
+            raise FeatureStoreException("Feature group does not have embedding.")
+        if n is None:
+            # a full read is paginated, so it is not capped by the result window
+            try:
+                return [
+                    list(row.values())
+                    for batch in VectorDbClient._read_feature_group_batches(
+                        feature_group,
+                        filter=filter,
+                        **VectorDbClient._get_scan_options(read_options),
+                    )
+                    for row in batch.to_pylist()
+                ]
+            except VectorDatabaseException as e:
+                if e.reason != VectorDatabaseException.POINT_IN_TIME_UNAVAILABLE:
+                    raise
+        return VectorDbClient._search_feature_group(feature_group, n, filter=filter)
+
+    @staticmethod
+    def _search_feature_group(
+        feature_group: hsfs.feature_group.FeatureGroup,
+        n: int = None,
+        filter: Filter | Logic = None,
+    ) -> list:
+        vector_db_client = VectorDbClient(feature_group.select_all())
+        results = vector_db_client._read(
+            feature_group.id,
+            feature_group.columns,
+            pk=feature_group.embedding_index.col_prefix + feature_group.primary_key[0],
+            index_name=feature_group.embedding_index.index_name,
+            n=n,
+            filter=filter,
+        )
+        return [[result[f.name] for f in feature_group.columns] for result in results]
+
+    def _read_batches(
+        self,
+        fg_id,
+        schema,
+        columns=None,
+        index_name=None,
+        filter: Filter | Logic = None,
+        batch_size=SCAN_BATCH_SIZE,
+        slices=1,
+        keep_alive=SCAN_KEEP_ALIVE,
+        options=None,
+    ):
+        """Stream all documents of a feature group from the vector database as Arrow record batches.
+
+        The index is paginated with a point in time and `search_after`, so the read is neither limited by the `index.max_result_window` of the index nor held in a single response.
+        If the point in time cannot be created, e.g. on OpenSearch older than 2.4, a `VectorDatabaseException` with reason `POINT_IN_TIME_UNAVAILABLE` is raised before anything is read.
+        With `slices` larger than one, the point in time is split into slices which are scanned concurrently over separate connections.
+        At most `2 * slices` pages are buffered, so memory stays bounded however large the index is.
+
+        Parameters:
+            fg_id: Id of the feature group.
+            schema: Features of the feature group.
+            columns: Names of the features to read, defaults to all features in `schema`.
+            index_name: Name of the index, defaults to the index of the feature group.
+            filter: A filter expression to restrict the documents read.
+            batch_size: Number of documents per request and per record batch.
+            slices: Number of slices scanned concurrently.
+            keep_alive: How long the point in time is kept alive between requests.
+            options: The options used for the requests to the vector database.
+
+        Yields:
+            A `pyarrow.RecordBatch` per page of results.
+        """
+        if fg_id not in self._fg_vdb_col_fg_col_map:
+            raise FeatureStoreException("Provided fg does not have embedding.")
+        if not index_name:
+            index_name = self._get_vector_db_index_name(fg_id)
+        embedding_index = self._fg_embedding_map[fg_id]
+        if columns is not None:
+            features_by_name = {f.name: f for f in schema}
+            missing = [c for c in columns if c not in features_by_name]
+            if missing:
+                raise FeatureStoreException(
+                    f"Features {missing} are not part of the feature group."
+                )
+            selected = [features_by_name[c] for c in columns]
+        else:
+            selected = list(schema)
+        arrow_types = [self._get_arrow_type(f) for f in selected]
+
+        pks = self._fg_id_to_vdb_pks[fg_id]
+        filter_query = []
+        if filter:
+            self._check_filter(filter, embedding_index.feature_group)
+            filter_query = self._get_query_filter(filter, embedding_index.col_prefix)
+        query = {
+            "size": batch_size,
+            "query": {"bool": {"must": [{"exists": {"field": pks[0]}}] + filter_query}},
+            "_source": [self._fg_col_vdb_col_map[fg_id][f.name] for f in selected],
+            # _shard_doc is unique within a point in time and, unlike the primary key,
+            # sortable whatever the mapping, so it is a complete tiebreaker.
+            "sort": [{"_shard_doc": "asc"}],
+        }
+
+        opensearch_client = OpenSearchClientSingleton(
+            feature_store_id=embedding_index.feature_group.feature_store_id
+        )
+        try:
+            pit_id = opensearch_client._create_pit(
+                index_name, keep_alive, options=options
             )
-            return [
-                [result[f.name] for f in feature_group.columns] for result in results
-            ]
-        raise FeatureStoreException("Feature group does not have embedding.")
+        except FeatureStoreException:
+            raise
+        except Exception as e:
+            _logger.debug("Creating a point in time on %s failed: %s", index_name, e)
+            raise VectorDatabaseException(
+                VectorDatabaseException.POINT_IN_TIME_UNAVAILABLE,
+                "Scanning the index requires a point in time, which needs OpenSearch 2.4 or newer.",
+                {},
+            ) from e
+        try:
+            if slices <= 1:
+                pages = self._scan_pit(
+                    opensearch_client, query, pit_id, keep_alive, options
+                )
+            else:
+                pages = self._scan_pit_slices(
+                    opensearch_client, query, pit_id, keep_alive, options, slices
+                )
+            for hits in pages:
+                yield self._hits_to_record_batch(hits, fg_id, selected, arrow_types)
+        finally:
+            with contextlib.suppress(Exception):
+                opensearch_client._delete_pit(pit_id)
+
+    @staticmethod
+    def _scan_pit(
+        opensearch_client,
+        query,
+        pit_id,
+        keep_alive,
+        options,
+        slice_id=None,
+        slices=None,
+    ):
+        query = dict(query)
+        if slice_id is not None:
+            query["slice"] = {"id": slice_id, "max": slices}
+        while True:
+            results = opensearch_client._search(
+                body={**query, "pit": {"id": pit_id, "keep_alive": keep_alive}},
+                options=options,
+            )
+            hits = results["hits"]["hits"]
+            if not hits:
+                return
+            yield hits
+            if len(hits) < query["size"]:
+                return
+            pit_id = results.get("pit_id", pit_id)
+            query["search_after"] = hits[-1]["sort"]
+
+    @staticmethod
+    def _scan_pit_slices(opensearch_client, query, pit_id, keep_alive, options, slices):
+        pages = queue.Queue(maxsize=2 * slices)
+        stop = threading.Event()
+        done = object()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def scan(slice_id):
+            try:
+                for hits in VectorDbClient._scan_pit(
+                    opensearch_client,
+                    query,
+                    pit_id,
+                    keep_alive,
+                    options,
+                    slice_id=slice_id,
+                    slices=slices,
+                ):
+                    if stop.is_set():
+                        return
+                    put(hits)
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
+
+        with ThreadPoolExecutor(max_workers=slices) as executor:
+            for slice_id in range(slices):
+                executor.submit(scan, slice_id)
+            try:
+                remaining = slices
+                while remaining:
+                    item = pages.get()
+                    if item is done:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()
+
+    def _hits_to_record_batch(self, hits, fg_id, features, arrow_types):
+        columns = {f.name: [] for f in features}
+        for item in hits:
+            row = self._convert_to_pandas_type(
+                features,
+                self._rewrite_result_key(
+                    item["_source"], self._fg_vdb_col_td_col_map[fg_id]
+                ),
+            )
+            for name, values in columns.items():
+                values.append(row.get(name))
+        return pa.RecordBatch.from_arrays(
+            [
+                pa.array(values, type=arrow_type)
+                for values, arrow_type in zip(
+                    columns.values(), arrow_types, strict=True
+                )
+            ],
+            names=list(columns.keys()),
+        )
+
+    def _get_arrow_type(self, feature):
+        if feature.is_complex() and feature not in self._embedding_features:
+            # complex features are returned as avro encoded bytes
+            return pa.binary()
+        try:
+            return _convert_offline_type_to_pyarrow_type(feature.type)
+        except FeatureStoreException:
+            # let arrow infer types which have no arrow counterpart
+            return None
+
+    @staticmethod
+    def _read_feature_group_batches(
+        feature_group: hsfs.feature_group.FeatureGroup,
+        columns: list[str] | None = None,
+        filter: Filter | Logic = None,
+        batch_size: int = SCAN_BATCH_SIZE,
+        slices: int = 1,
+        options: dict | None = None,
+    ):
+        if not feature_group.embedding_index:
+            raise FeatureStoreException("Feature group does not have embedding.")
+        vector_db_client = VectorDbClient(feature_group.select_all())
+        return vector_db_client._read_batches(
+            feature_group.id,
+            feature_group.columns,
+            columns=columns,
+            index_name=feature_group.embedding_index.index_name,
+            filter=filter,
+            batch_size=batch_size,
+            slices=slices,
+            options=options,
+        )
+
+    @staticmethod
+    def _get_scan_options(read_options: dict | None) -> dict:
+        scan_options = (read_options or {}).get("vector_db_scan", {})
+        return {
+            "batch_size": scan_options.get("batch_size", SCAN_BATCH_SIZE),
+            "slices": scan_options.get("slices", 1),
+        }
 
     def _count(self, fg, options=None):
         query = {
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import itertools
 import logging
+import time
 import warnings
 from base64 import b64decode
 from copy import deepcopy
@@ -41,10 +42,7 @@ from hopsworks_common.core.constants import (
 )
 from hopsworks_common.core.type_systems import _create_extended_type
 from hsfs.client import exceptions, online_store_rest_client
-from hsfs.core import (
-    online_store_rest_client_engine,
-    online_store_sql_engine,
-)
+from hsfs.core import online_store_rest_client_engine
 from hsfs.core import (
     transformation_execution_dag as tf_exec_dag_mod,
 )
@@ -52,6 +50,7 @@ from hsfs.core import (
     transformation_function_engine as tf_engine_mod,
 )
 from hsfs.core.feature_logging import LoggingMetaData
+from hsfs.core.serving_stats import ServingStats
 from hsfs.hopsworks_udf import UDFExecutionMode
 
 
@@ -80,6 +79,7 @@ if TYPE_CHECKING:
         serving_key as sk_mod,
     )
     from hsfs import training_dataset_feature as tdf_mod
+    from hsfs.core import online_store_sql_engine
     from hsfs.feature_group import FeatureGroup
 
 _logger = logging.getLogger(__name__)
@@ -93,6 +93,8 @@ class VectorServer:
     REST_CLIENT_CONFIG_OPTIONS_KEY = "config_online_store_rest_client"
     RESET_REST_CLIENT_OPTIONS_KEY = "reset_online_store_rest_client"
     SQL_TIMESTAMP_STRING_FORMAT = "%Y-%m-%d %H:%M:%S"
+    # Set by `_init_serving` when serving stats are enabled, stages are only timed if not None.
+    _serving_stats: ServingStats | None = None
 
     def __init__(
         self,
@@ -195,8 +197,10 @@ class VectorServer:
         reset_rest_client: bool = False,
         config_rest_client: dict[str, Any] | None = None,
         default_client: Literal["rest", "sql"] | None = None,
+        serving_stats: ServingStats | None = None,
     ):
         self._training_dataset_version = training_dataset_version
+        self._serving_stats = serving_stats
 
         self._parent_feature_groups = entity.get_parent_feature_groups().accessible
 
@@ -344,11 +348,15 @@ class VectorServer:
     ) -> None:
         if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug("Initialising Online Store SQL client")
+        # imported here as it imports sqlalchemy and aiomysql
+        from hsfs.core import online_store_sql_engine
+
         self._sql_client = online_store_sql_engine.OnlineStoreSqlClient(
             feature_store_id=self._feature_store_id,
             skip_fg_ids=self._skip_fg_ids,
             serving_keys=self.serving_keys,
             external=external,
+            serving_stats=self._serving_stats,
         )
         self.sql_client._init_prepared_statements(
             entity,
@@ -373,6 +381,7 @@ class VectorServer:
                 feature_view_name=entity.name,
                 feature_view_version=entity.version,
                 features=entity.features,
+                serving_stats=self._serving_stats,
             )
         )
         # This logic needs to move to the above engine init
@@ -493,6 +502,9 @@ class VectorServer:
         Returns:
             The assembled feature vector in the requested format.
         """
+        stats = self._serving_stats
+        if stats is not None:
+            call_start = time.perf_counter()
         online_client_choice = self._which_client_and_ensure_initialised(
             force_rest_client=force_rest_client, force_sql_client=force_sql_client
         )
@@ -514,12 +526,16 @@ class VectorServer:
             for key, value in entry.items():
                 request_parameters.setdefault(key, value)
 
+        if stats is not None:
+            start = time.perf_counter()
         rondb_entry = self._validate_entry(
             entry=entry,
             allow_missing=allow_missing,
             passed_features=passed_features,
             vector_db_features=vector_db_features,
         )
+        if stats is not None:
+            start = stats._lap(ServingStats.VALIDATE_ENTRY, start)
         if len(rondb_entry) == 0:
             if _logger.isEnabledFor(logging.DEBUG):
                 _logger.debug("Empty entry for rondb, skipping fetching.")
@@ -540,6 +556,8 @@ class VectorServer:
                 logging_data=logging_data,
                 feature_vector_with_inference_helpers=self._fetch_inference_helpers_for_transformations,
             )
+        if stats is not None and len(rondb_entry) != 0:
+            stats._lap(ServingStats.FETCH, start)
 
         self._raise_transformation_warnings(
             transform=transform, on_demand_features=on_demand_features
@@ -575,7 +593,9 @@ class VectorServer:
                 ]
             )
 
-        return self._handle_feature_vector_return_type(
+        if stats is not None:
+            start = time.perf_counter()
+        vector = self._handle_feature_vector_return_type(
             vector,
             batch=False,
             inference_helper=False,
@@ -584,6 +604,10 @@ class VectorServer:
             on_demand_feature=on_demand_features,
             logging_meta_data=logging_meta_data,
         )
+        if stats is not None:
+            end = stats._lap(ServingStats.RETURN_TYPE, start)
+            stats._record(ServingStats.TOTAL, end - call_start)
+        return vector
 
     def _get_feature_vectors(
         self,
@@ -621,6 +645,9 @@ class VectorServer:
         Returns:
             The assembled feature vectors in the requested format.
         """
+        stats = self._serving_stats
+        if stats is not None:
+            call_start = time.perf_counter()
         if passed_features is None:
             passed_features = []
         # Assertions on passed_features and vector_db_features
@@ -687,6 +714,8 @@ class VectorServer:
             transform=transform, on_demand_features=on_demand_features
         )
 
+        if stats is not None:
+            start = time.perf_counter()
         for (idx, entry), passed, vector_features in itertools.zip_longest(
             enumerate(entries),
             passed_features,
@@ -702,6 +731,8 @@ class VectorServer:
                 rondb_entries.append(rondb_entry)
             else:
                 skipped_empty_entries.append(idx)
+        if stats is not None:
+            start = stats._lap(ServingStats.VALIDATE_ENTRY, start)
 
         if online_client_choice == self.DEFAULT_REST_CLIENT and len(rondb_entries) > 0:
             if _logger.isEnabledFor(logging.DEBUG):
@@ -724,6 +755,8 @@ class VectorServer:
             if _logger.isEnabledFor(logging.DEBUG):
                 _logger.debug("Empty entries for rondb, skipping fetching.")
             batch_results = []
+        if stats is not None and len(rondb_entries) > 0:
+            stats._lap(ServingStats.FETCH, start)
 
         if _logger.isEnabledFor(logging.DEBUG):
             _logger.debug("Assembling feature vectors from batch results")
@@ -803,7 +836,9 @@ class VectorServer:
             if vector is not None:
                 vectors.append(vector)
 
-        return self._handle_feature_vector_return_type(
+        if stats is not None:
+            start = time.perf_counter()
+        vectors = self._handle_feature_vector_return_type(
             vectors,
             batch=True,
             inference_helper=False,
@@ -812,6 +847,10 @@ class VectorServer:
             on_demand_feature=transform,
             logging_meta_data=logging_meta_data,
         )
+        if stats is not None:
+            end = stats._lap(ServingStats.RETURN_TYPE, start)
+            stats._record(ServingStats.TOTAL, end - call_start)
+        return vectors
 
     def _assemble_feature_vector(
         self,
@@ -887,7 +926,12 @@ class VectorServer:
                 f"2. Required entries [{', '.join(self.required_serving_keys)}] are not provided."
             )
         if len(self.return_feature_value_handlers) > 0:
+            stats = self._serving_stats
+            if stats is not None:
+                start = time.perf_counter()
             self._apply_return_value_handlers(result_dict, client=client)
+            if stats is not None:
+                stats._lap(ServingStats.DECODE_FEATURES, start)
         feature_dict, encoded_feature_dict = result_dict, result_dict
         if (
             len(self.model_dependent_transformation_functions) > 0
@@ -1530,8 +1574,11 @@ class VectorServer:
         """
         feature_dict = row_dict
         encoded_feature_dict = None
+        stats = self._serving_stats
 
         if transform or on_demand_features or logging_meta_data:
+            if stats is not None:
+                start = time.perf_counter()
             # Check for any missing request parameters
             self._check_missing_request_parameters(
                 features=row_dict, request_parameters=request_parameter
@@ -1547,6 +1594,8 @@ class VectorServer:
                 expected_features=set(self._on_demand_feature_vector_col_name),
                 n_processes=n_processes,
             )
+            if stats is not None:
+                stats._lap(ServingStats.ON_DEMAND_TRANSFORM, start)
             if logging_meta_data:
                 logging_meta_data.untransformed_features.append(
                     [
@@ -1556,6 +1605,8 @@ class VectorServer:
                 )
 
         if transform or logging_meta_data:
+            if stats is not None:
+                start = time.perf_counter()
             # Apply model dependent transformations
             encoded_feature_dict = tf_engine_mod.TransformationFunctionEngine._apply_transformation_functions(
                 execution_graph=self._model_dependent_transformation_functions_execution_graph,
@@ -1565,6 +1616,8 @@ class VectorServer:
                 expected_features=set(self.transformed_feature_vector_col_name),
                 n_processes=n_processes,
             )
+            if stats is not None:
+                stats._lap(ServingStats.MODEL_DEPENDENT_TRANSFORM, start)
             if logging_meta_data:
                 logging_meta_data.transformed_features.append(
                     [
@@ -1930,6 +1983,10 @@ class VectorServer:
     ) -> online_store_rest_client_engine.OnlineStoreRestClientEngine | None:
         return self._rest_client_engine
 
+    @property
+    def serving_stats(self) -> ServingStats | None:
+        return self._serving_stats
+
     @property
     def serving_keys(self) -> list[sk_mod.ServingKey]:
         return self._serving_keys
@@ -15,11 +15,15 @@
 #
 from __future__ import annotations
 
-from typing import TypeVar
+import sys
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import hopsworks_common.connection
 from hsfs.client import exceptions
-from hsfs.engine import spark, spark_no_metastore
+
+
+if TYPE_CHECKING:
+    from hsfs.engine import spark, spark_no_metastore
 
 
 _engine = None
@@ -35,13 +39,18 @@ def _init(engine_type: str) -> None:
         else:
             _stop()
     if not _engine:
+        # engines are imported on first use, as they import pyspark or pandas
         if engine_type == "spark":
+            from hsfs.engine import spark
+
             _engine = spark.Engine()
         elif engine_type == "hive":
             raise ValueError(
                 "Hive engine is not supported in hopsworks client version >= 4.0."
             )
         elif engine_type == "spark-no-metastore" or engine_type == "spark-delta":
+            from hsfs.engine import spark_no_metastore
+
             _engine = spark_no_metastore.Engine()
         elif engine_type in python_types:
             try:
@@ -74,6 +83,19 @@ def _set_instance(
     _engine = engine
 
 
+def _is_spark_engine(instance: Any) -> bool:
+    """Check whether `instance` is a Spark engine without importing pyspark.
+
+    Parameters:
+        instance: The engine instance to check.
+
+    Returns:
+        `True` if `instance` is a Spark engine, including the Spark engine without metastore.
+    """
+    spark_engine = sys.modules.get("hsfs.engine.spark")
+    return spark_engine is not None and isinstance(instance, spark_engine.Engine)
+
+
 def _get_type() -> str:
     if _engine:
         return hopsworks_common.connection._hsfs_engine_type
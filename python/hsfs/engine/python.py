@@ -15,13 +15,13 @@
 #
 from __future__ import annotations
 
+import concurrent.futures
 import itertools
 import json
 import logging
 import math
 import numbers
 import os
-import random
 import re
 import sys
 import uuid
@@ -34,6 +34,7 @@ from typing import (
     Any,
     Literal,
 )
+from urllib.parse import urlparse
 
 from hopsworks_common import constants
 from hsfs.core.type_systems import (
@@ -49,13 +50,15 @@ if TYPE_CHECKING:
     from hsfs.constructor.filter import Filter, Logic
     from hsfs.training_dataset import TrainingDataset
 
-import boto3
 import hsfs
 import pandas as pd
 import pyarrow as pa
-from botocore.response import StreamingBody
+import pyarrow.compute as pc
 from hopsworks_common import client
-from hopsworks_common.client.exceptions import FeatureStoreException
+from hopsworks_common.client.exceptions import (
+    FeatureStoreException,
+    VectorDatabaseException,
+)
 from hopsworks_common.core import inode
 from hopsworks_common.core.constants import HAS_POLARS, polars_not_installed_message
 from hopsworks_common.core.type_systems import _create_extended_type
@@ -89,13 +92,13 @@ from hsfs.core import (
 from hsfs.core.constants import (
     GE_MAJOR,
     HAS_AIOMYSQL,
-    HAS_GREAT_EXPECTATIONS,
     HAS_NUMPY,
     HAS_PANDAS,
     HAS_PYARROW,
     HAS_SQLALCHEMY,
 )
 from hsfs.core.feature_logging import LoggingMetaData
+from hsfs.core.schema_validation import DataFrameValidator
 from hsfs.core.type_systems import PYARROW_HOPSWORKS_DTYPE_MAPPING
 from hsfs.core.vector_db_client import VectorDbClient
 from hsfs.feature_group import ExternalFeatureGroup, FeatureGroup
@@ -103,9 +106,6 @@ from hsfs.hopsworks_udf import HopsworksUdf, UDFExecutionMode
 from hsfs.training_dataset_split import TrainingDatasetSplit
 
 
-if HAS_GREAT_EXPECTATIONS:
-    import great_expectations
-
 if HAS_NUMPY:
     import numpy as np
 
@@ -124,7 +124,18 @@ if HAS_POLARS:
 _logger = logging.getLogger(__name__)
 
 
+def _is_streaming_body(obj: Any) -> bool:
+    # botocore is only imported to read from S3, before which no object can be a
+    # StreamingBody, so the check does not need to import it
+    response = sys.modules.get("botocore.response")
+    return response is not None and isinstance(obj, response.StreamingBody)
+
+
 class Engine:
+    # number of objects read from S3 at once, the size of the connection pool of
+    # a boto3 client
+    S3_READ_CONCURRENCY = 10
+
     def __init__(self) -> None:
         _logger.debug("Initialising Python Engine...")
         self._dataset_api: dataset_api.DatasetApi = dataset_api.DatasetApi()
@@ -157,6 +168,7 @@ class Engine:
                 arrow_flight_config=(
                     read_options.get("arrow_flight_config", {}) if read_options else {}
                 ),
+                local_cache=read_options.get("local_cache") if read_options else None,
             )
         return self._jdbc(sql_query, online_conn, dataframe_type, read_options, schema)
 
@@ -295,18 +307,26 @@ class Engine:
         dataframe_type: str,
         schema: list[feature.Feature] | None = None,
         arrow_flight_config: dict[str, Any] | None = None,
+        local_cache: bool | dict[str, Any] | None = None,
     ) -> pd.DataFrame | pl.DataFrame:
         self._validate_dataframe_type(dataframe_type)
         if isinstance(sql_query, FsQuery):
-            from hsfs.core import arrow_flight_client
+            from hsfs.core import offline_query_cache
 
-            result_df = util._run_with_loading_animation(
-                "Reading data from Hopsworks, using Hopsworks Feature Query Service",
-                arrow_flight_client._get_instance()._read_query,
-                sql_query,
-                arrow_flight_config or {},
-                dataframe_type,
-            )
+            query_cache = offline_query_cache._get_instance(local_cache)
+            cache_key = query_cache._cache_key(sql_query) if query_cache else None
+            if cache_key is None:
+                result_df = self._read_query_service(
+                    sql_query, arrow_flight_config, dataframe_type
+                )
+            else:
+                result_table = query_cache._get(*cache_key)
+                if result_table is None:
+                    result_table = self._read_query_service(
+                        sql_query, arrow_flight_config, "pyarrow"
+                    )
+                    query_cache._put(*cache_key, result_table)
+                result_df = self._arrow_table_to_dataframe(result_table, dataframe_type)
         else:
             raise ValueError(
                 "Reading data with Hive is not supported when using hopsworks client version >= 4.0"
@@ -315,6 +335,70 @@ class Engine:
             result_df = Engine._cast_columns(result_df, schema)
         return self._return_dataframe_type(result_df, dataframe_type)
 
+    def _read_time_travel(
+        self,
+        query_obj: query.Query,
+        dataframe_type: str,
+        schema: list[feature.Feature] | None = None,
+    ) -> pd.DataFrame | pl.DataFrame:
+        """Read the time travel window of a query on a single Delta or Iceberg feature group.
+
+        The table is read directly with delta-rs or PyIceberg: as of the end time if the query has no start time,
+        otherwise only the rows changed after the start time.
+        """
+        self._validate_dataframe_type(dataframe_type)
+        feature_group = query_obj._left_feature_group
+        engine_args = {
+            "feature_store_id": feature_group.feature_store_id,
+            "feature_store_name": feature_group.feature_store_name,
+            "feature_group": feature_group,
+            "spark_session": None,
+            "spark_context": None,
+        }
+        read_args = (
+            query_obj.left_feature_group_start_time,
+            query_obj.left_feature_group_end_time,
+            [feat.name for feat in query_obj._left_features],
+        )
+        if feature_group.time_travel_format == "DELTA":
+            result_table = delta_engine.DeltaEngine(
+                **engine_args
+            )._read_delta_rs_dataset(*read_args)
+        else:
+            result_table = iceberg_engine.IcebergEngine(
+                **engine_args
+            )._read_pyiceberg_dataset(*read_args)
+        result_df = self._arrow_table_to_dataframe(result_table, dataframe_type)
+        if schema:
+            result_df = Engine._cast_columns(result_df, schema)
+        return self._return_dataframe_type(result_df, dataframe_type)
+
+    @staticmethod
+    def _read_query_service(
+        fs_query: FsQuery,
+        arrow_flight_config: dict[str, Any] | None,
+        dataframe_type: str,
+    ) -> pd.DataFrame | pl.DataFrame | pa.Table:
+        from hsfs.core import arrow_flight_client
+
+        return util._run_with_loading_animation(
+            "Reading data from Hopsworks, using Hopsworks Feature Query Service",
+            arrow_flight_client._get_instance()._read_query,
+            fs_query,
+            arrow_flight_config or {},
+            dataframe_type,
+        )
+
+    @staticmethod
+    def _arrow_table_to_dataframe(
+        table: pa.Table, dataframe_type: str
+    ) -> pd.DataFrame | pl.DataFrame:
+        if dataframe_type.lower() == "polars":
+            if not HAS_POLARS:
+                raise ModuleNotFoundError(polars_not_installed_message)
+            return pl.from_arrow(table)
+        return table.to_pandas()
+
     def _jdbc(
         self,
         sql_query: str,
@@ -322,7 +406,7 @@ class Engine:
         dataframe_type: str,
         read_options: dict[str, Any] | None,
         schema: list[feature.Feature] | None = None,
-    ) -> pd.DataFrame | pl.DataFrame:
+    ) -> pd.DataFrame | pl.DataFrame | Iterator[pd.DataFrame | pl.DataFrame]:
         self._validate_dataframe_type(dataframe_type)
         if self._mysql_online_fs_engine is None:
             self._mysql_online_fs_engine = util_sql._create_mysql_engine(
@@ -333,6 +417,10 @@ class Engine:
                     else read_options["external"]
                 ),
             )
+        if read_options and read_options.get("batch_size"):
+            return self._jdbc_batches(
+                sql_query, dataframe_type, int(read_options["batch_size"]), schema
+            )
         with self._mysql_online_fs_engine.connect() as mysql_conn:
             if "sqlalchemy" in str(type(mysql_conn)):
                 sql_query = sql.text(sql_query)
@@ -346,6 +434,40 @@ class Engine:
                 result_df = Engine._cast_columns(result_df, schema, online=True)
         return self._return_dataframe_type(result_df, dataframe_type)
 
+    def _jdbc_batches(
+        self,
+        sql_query: str,
+        dataframe_type: str,
+        batch_size: int,
+        schema: list[feature.Feature] | None = None,
+    ) -> Iterator[pd.DataFrame | pl.DataFrame]:
+        """Yield the result of an online store query in dataframes of `batch_size` rows.
+
+        The rows are fetched through an unbuffered server-side cursor, so neither
+        the client nor the driver hold more than a batch at a time, and the first
+        batch is returned before the query finished scanning. The connection is
+        held until the iterator is exhausted or closed.
+        """
+        if dataframe_type.lower() == "polars" and not HAS_POLARS:
+            raise ModuleNotFoundError(polars_not_installed_message)
+        with self._mysql_online_fs_engine.connect() as mysql_conn:
+            if "sqlalchemy" in str(type(mysql_conn)):
+                # pymysql streams the rows of a server-side cursor
+                mysql_conn = mysql_conn.execution_options(
+                    stream_results=True, max_row_buffer=batch_size
+                )
+                sql_query = sql.text(sql_query)
+            if dataframe_type.lower() == "polars":
+                batches = pl.read_database(
+                    sql_query, mysql_conn, iter_batches=True, batch_size=batch_size
+                )
+            else:
+                batches = pd.read_sql(sql_query, mysql_conn, chunksize=batch_size)
+            for batch_df in batches:
+                if schema:
+                    batch_df = Engine._cast_columns(batch_df, schema, online=True)
+                yield self._return_dataframe_type(batch_df, dataframe_type)
+
     def _read(
         self,
         storage_connector: sc.StorageConnector,
@@ -370,7 +492,7 @@ class Engine:
             # way as for an S3 connector. Reading a Glue-registered table by
             # database/table is a Spark-engine, catalog-mediated path instead.
             df_list = self._read_s3(
-                storage_connector, location, data_format, dataframe_type
+                storage_connector, location, data_format, dataframe_type, read_options
             )
         else:
             raise NotImplementedError(
@@ -397,7 +519,7 @@ class Engine:
             return pd.read_csv(obj)
         if data_format.lower() == "tsv":
             return pd.read_csv(obj, sep="\t")
-        if data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
+        if data_format.lower() == "parquet" and _is_streaming_body(obj):
             return pd.read_parquet(BytesIO(obj.read()))
         if data_format.lower() == "parquet":
             return pd.read_parquet(obj)
@@ -415,7 +537,7 @@ class Engine:
             return pl.read_csv(obj)
         if data_format.lower() == "tsv":
             return pl.read_csv(obj, separator="\t")
-        if data_format.lower() == "parquet" and isinstance(obj, StreamingBody):
+        if data_format.lower() == "parquet" and _is_streaming_body(obj):
             return pl.read_parquet(BytesIO(obj.read()), use_pyarrow=True)
         if data_format.lower() == "parquet":
             return pl.read_parquet(obj, use_pyarrow=True)
@@ -507,6 +629,7 @@ class Engine:
         location: str,
         data_format: str,
         dataframe_type: str = "default",
+        read_options: dict[str, Any] | None = None,
     ) -> list[pd.DataFrame | pl.DataFrame]:
         # get key prefix
         path_parts = location.replace("s3://", "").split("/")
@@ -517,6 +640,8 @@ class Engine:
         # Connectors without a fixed bucket (e.g. Glue) take it from the path.
         bucket = storage_connector.bucket or location_bucket
 
+        import boto3
+
         if storage_connector.session_token is not None:
             # This is only for AWS IAM role passthrough.
             # We don't need to set the endpoint_url and region here.
@@ -535,34 +660,109 @@ class Engine:
                 region_name=storage_connector.region,
             )
 
-        df_list = []
-        object_list = {"is_truncated": True}
-        while object_list.get("is_truncated", False):
-            if "NextContinuationToken" in object_list:
-                object_list = s3.list_objects_v2(
-                    Bucket=bucket,
-                    Prefix=prefix,
-                    MaxKeys=1000,
-                    ContinuationToken=object_list["NextContinuationToken"],
+        keys = []
+        list_kwargs = {"Bucket": bucket, "Prefix": prefix, "MaxKeys": 1000}
+        while True:
+            object_list = s3.list_objects_v2(**list_kwargs)
+            keys.extend(
+                obj["Key"]
+                for obj in object_list.get("Contents", [])
+                if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0
+            )
+            # only truncated listings carry a continuation token
+            if "NextContinuationToken" not in object_list:
+                break
+            list_kwargs["ContinuationToken"] = object_list["NextContinuationToken"]
+        if not keys:
+            return []
+
+        if data_format and data_format.lower() == "parquet":
+            return [
+                self._read_parquet_dataset(
+                    [f"{bucket}/{key}" for key in keys],
+                    self._get_s3_filesystem(storage_connector, bucket),
+                    read_options,
+                    dataframe_type,
                 )
+            ]
+
+        def read_object(key: str) -> pd.DataFrame | pl.DataFrame:
+            body = s3.get_object(Bucket=bucket, Key=key)["Body"]
+            if dataframe_type.lower() == "polars":
+                return self._read_polars(data_format, body)
+            return self._read_pandas(data_format, body)
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.S3_READ_CONCURRENCY
+        ) as pool:
+            return list(pool.map(read_object, keys))
+
+    @staticmethod
+    def _get_s3_filesystem(storage_connector: sc.S3Connector, bucket: str):
+        """Return a pyarrow filesystem with the credentials of the S3 connector."""
+        from pyarrow import fs
+
+        region = storage_connector.region
+        endpoint = storage_connector.arguments.get("fs.s3a.endpoint")
+        if region is None and (
+            storage_connector.session_token is not None or not endpoint
+        ):
+            # unlike boto3, pyarrow does not follow the redirect to the region of
+            # the bucket, so it is looked up upfront
+            region = fs.resolve_s3_region(bucket)
+        if storage_connector.session_token is not None:
+            # This is only for AWS IAM role passthrough.
+            return fs.S3FileSystem(
+                access_key=storage_connector.access_key,
+                secret_key=storage_connector.secret_key,
+                session_token=storage_connector.session_token,
+                region=region,
+            )
+        endpoint_kwargs = {}
+        if endpoint:
+            # pyarrow takes the scheme of the endpoint separately
+            parsed = urlparse(endpoint)
+            if parsed.scheme and parsed.netloc:
+                endpoint_kwargs = {
+                    "endpoint_override": parsed.netloc,
+                    "scheme": parsed.scheme,
+                }
             else:
-                object_list = s3.list_objects_v2(
-                    Bucket=bucket,
-                    Prefix=prefix,
-                    MaxKeys=1000,
-                )
+                endpoint_kwargs = {"endpoint_override": endpoint}
+        return fs.S3FileSystem(
+            access_key=storage_connector.access_key,
+            secret_key=storage_connector.secret_key,
+            region=region,
+            **endpoint_kwargs,
+        )
 
-            for obj in object_list["Contents"]:
-                if not self._is_metadata_file(obj["Key"]) and obj["Size"] > 0:
-                    obj = s3.get_object(
-                        Bucket=bucket,
-                        Key=obj["Key"],
-                    )
-                    if dataframe_type.lower() == "polars":
-                        df_list.append(self._read_polars(data_format, obj["Body"]))
-                    else:
-                        df_list.append(self._read_pandas(data_format, obj["Body"]))
-        return df_list
+    def _read_parquet_dataset(
+        self,
+        paths: list[str],
+        filesystem: Any,
+        read_options: dict[str, Any] | None,
+        dataframe_type: str = "default",
+    ) -> pd.DataFrame | pl.DataFrame:
+        """Read Parquet files as a single pyarrow dataset.
+
+        The files are fetched concurrently, and only the row groups and columns
+        selected by the `filters` and `columns` read options are read.
+        `filters` is a pyarrow expression, or a list of `(column, op, value)`
+        tuples as accepted by `pyarrow.parquet.read_table`.
+        """
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        read_options = read_options or {}
+        filters = read_options.get("filters")
+        if filters is not None and not isinstance(filters, ds.Expression):
+            filters = pq.filters_to_expression(filters)
+        table = ds.dataset(paths, format="parquet", filesystem=filesystem).to_table(
+            columns=read_options.get("columns"),
+            filter=filters,
+            fragment_readahead=self.S3_READ_CONCURRENCY,
+        )
+        return self._arrow_table_to_dataframe(table, dataframe_type)
 
     def _read_options(
         self, data_format: str | None, provided_options: dict[str, Any] | None
@@ -599,12 +799,39 @@ class Engine:
         n: int = None,
         dataframe_type: str = "default",
         filter: Filter | Logic = None,
+        read_options: dict | None = None,
     ) -> pd.DataFrame | pl.DataFrame | np.ndarray | list[list[Any]]:
         dataframe_type = dataframe_type.lower()
         self._validate_dataframe_type(dataframe_type)
 
-        results = VectorDbClient._read_feature_group(feature_group, n, filter=filter)
         feature_names = [f.name for f in feature_group.columns]
+        if n is None:
+            try:
+                batches = list(
+                    VectorDbClient._read_feature_group_batches(
+                        feature_group,
+                        filter=filter,
+                        **VectorDbClient._get_scan_options(read_options),
+                    )
+                )
+            except VectorDatabaseException as e:
+                if e.reason != VectorDatabaseException.POINT_IN_TIME_UNAVAILABLE:
+                    raise
+                # the index cannot be paginated, fall back to a single bounded search
+                results = VectorDbClient._search_feature_group(
+                    feature_group, n, filter=filter
+                )
+            else:
+                if batches:
+                    df = self._arrow_table_to_dataframe(
+                        pa.Table.from_batches(batches), dataframe_type
+                    )
+                    return self._return_dataframe_type(df, dataframe_type)
+                results = []
+        else:
+            results = VectorDbClient._read_feature_group(
+                feature_group, n, filter=filter
+            )
         if dataframe_type == "polars":
             if not HAS_POLARS:
                 raise ModuleNotFoundError(polars_not_installed_message)
@@ -694,21 +921,24 @@ class Engine:
     ) -> str:
         # TODO: add statistics for correlations, histograms and exact_uniqueness
         _logger.info("Computing insert statistics")
-        if HAS_POLARS and (
-            isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
-            arrow_schema = df.to_arrow().schema
-        else:
-            arrow_schema = pa.Schema.from_pandas(df, preserve_index=False)
+        # same single pass the schema validation of inserts uses
+        arrow_types = {
+            name: profile.arrow_type
+            for name, profile in DataFrameValidator._get_validator(df)
+            ._profile_columns(df)
+            .items()
+        }
 
         # parse timestamp columns to string columns
-        for field in arrow_schema:
+        for name, arrow_type in arrow_types.items():
+            if arrow_type is None:
+                continue
             if not (
-                pa.types.is_null(field.type)
-                or pa.types.is_list(field.type)
-                or pa.types.is_large_list(field.type)
-                or pa.types.is_struct(field.type)
-            ) and PYARROW_HOPSWORKS_DTYPE_MAPPING.get(field.type, None) in [
+                pa.types.is_null(arrow_type)
+                or pa.types.is_list(arrow_type)
+                or pa.types.is_large_list(arrow_type)
+                or pa.types.is_struct(arrow_type)
+            ) and PYARROW_HOPSWORKS_DTYPE_MAPPING.get(arrow_type, None) in [
                 "timestamp",
                 "date",
             ]:
@@ -716,25 +946,26 @@ class Engine:
                     isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
                 ):
                     _logger.debug(
-                        f"Casting polars dataframe column {field.name} from {field.type} to string"
+                        f"Casting polars dataframe column {name} from {arrow_type} to string"
                     )
-                    df = df.with_columns(pl.col(field.name).cast(pl.String))
+                    df = df.with_columns(pl.col(name).cast(pl.String))
                 else:
                     _logger.debug(
-                        f"Casting column pandas dataframe column {field.name} from {field.type} to string"
+                        f"Casting column pandas dataframe column {name} from {arrow_type} to string"
                     )
-                    df[field.name] = df[field.name].astype(str)
+                    df[name] = df[name].astype(str)
 
         # complex columns — pandas describe() hangs on unhashable types; identify upfront
         complex_cols = {
-            field.name
-            for field in arrow_schema
-            if (
-                pa.types.is_list(field.type)
-                or pa.types.is_large_list(field.type)
-                or pa.types.is_fixed_size_list(field.type)
-                or pa.types.is_struct(field.type)
-                or pa.types.is_map(field.type)
+            name
+            for name, arrow_type in arrow_types.items()
+            if arrow_type is not None
+            and (
+                pa.types.is_list(arrow_type)
+                or pa.types.is_large_list(arrow_type)
+                or pa.types.is_fixed_size_list(arrow_type)
+                or pa.types.is_struct(arrow_type)
+                or pa.types.is_map(arrow_type)
             )
         }
         if relevant_columns is None or len(relevant_columns) == 0:
@@ -784,9 +1015,10 @@ class Engine:
             ):
                 stats[col] = dict(zip(stats["statistic"], stats[col], strict=False))
             # set data type
-            arrow_type = arrow_schema.field(col).type
+            arrow_type = arrow_types[col]
             if (
-                pa.types.is_null(arrow_type)
+                arrow_type is None
+                or pa.types.is_null(arrow_type)
                 or pa.types.is_list(arrow_type)
                 or pa.types.is_large_list(arrow_type)
                 or pa.types.is_fixed_size_list(arrow_type)
@@ -894,6 +1126,8 @@ class Engine:
             dataframe = dataframe.to_pandas()
         if ge_validate_kwargs is None:
             ge_validate_kwargs = {}
+        import great_expectations
+
         if GE_MAJOR == 1:
             # GE 1.x removed from_pandas; use the get_context + dataframe asset chain.
             context = great_expectations.get_context(mode="ephemeral")
@@ -1428,6 +1662,7 @@ class Engine:
             result_dfs = self._random_split(
                 query_obj.read(read_options=read_option, dataframe_type=dataframe_type),
                 training_dataset_obj,
+                stratify_by=(read_option or {}).get("stratify_by"),
             )
 
         # Statistics are always refit (training_dataset_version not passed): an
@@ -1444,9 +1679,25 @@ class Engine:
         self,
         df: pd.DataFrame | pl.DataFrame,
         training_dataset_obj: TrainingDataset,
+        stratify_by: str | None = None,
     ) -> dict[str, pd.DataFrame | pl.DataFrame]:
-        split_column = f"_SPLIT_INDEX_{uuid.uuid1()}"
-        result_dfs = {}
+        """Randomly split a dataframe into the splits of the training dataset.
+
+        The rows are assigned to the splits by a single permutation drawn from a
+        NumPy generator seeded with the seed of the training dataset, so the same
+        seed always yields the same splits. Each split keeps the original order of
+        its rows.
+
+        Parameters:
+            df: The dataframe to split.
+            training_dataset_obj: The training dataset metadata object.
+            stratify_by:
+                Name of a label column.
+                If set, the rows of each value of the column, nulls included, are spread evenly over the splits, so every split has the same proportion of each value as `df`, up to one row.
+
+        Returns:
+            A dictionary of the split dataframes by split name.
+        """
         splits = training_dataset_obj.splits
         if (
             not math.isclose(
@@ -1459,30 +1710,47 @@ class Engine:
                 "Sum of split ratios should be 1 and each values should be in range (0, 1)"
             )
 
-        df_size = len(df)
-        groups = []
-        for i, split in enumerate(splits):
-            groups += [i] * int(df_size * split.percentage)
-        groups += [len(splits) - 1] * (df_size - len(groups))
         # Honor the user-provided seed so random splits are reproducible across
         # runs, mirroring the Spark engine (randomSplit(..., seed)). A private
-        # generator avoids touching the process-global random module; seed=None
-        # falls back to entropy seeding, preserving the previous behaviour.
-        random.Random(training_dataset_obj.seed).shuffle(groups)
-        if HAS_POLARS and (
-            isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-        ):
-            df = df.with_columns(pl.Series(name=split_column, values=groups))
+        # generator avoids touching the process-global random state; seed=None
+        # falls back to entropy seeding.
+        rng = np.random.default_rng(training_dataset_obj.seed)
+        if stratify_by is None:
+            order = rng.permutation(len(df))
         else:
-            df[split_column] = groups
-        for i, split in enumerate(splits):
-            if HAS_POLARS and (
-                isinstance(df, (pl.DataFrame, pl.dataframe.frame.DataFrame))
-            ):
-                split_df = df.filter(pl.col(split_column) == i).drop(split_column)
-            else:
-                split_df = df[df[split_column] == i].drop(split_column, axis=1)
-            result_dfs[split.name] = split_df
+            # nulls are grouped under the code -1 instead of failing to sort
+            codes, _ = pd.factorize(np.asarray(df[stratify_by].to_numpy()))
+            counts = np.bincount(codes + 1)
+            # group the row positions by label, shuffled within each label
+            grouped = np.lexsort((rng.random(len(df)), codes))
+            grouped_codes = codes[grouped] + 1
+            starts = np.cumsum(counts) - counts
+            ranks = np.arange(len(df)) - starts[grouped_codes]
+            # spread the rows of each label evenly over [0, 1), and cut the rows
+            # ordered by that position at the same boundaries as without labels,
+            # so every label keeps its proportion and the splits their exact sizes
+            spread = (ranks + 0.5) / counts[grouped_codes]
+            order = grouped[np.lexsort((rng.random(len(df)), spread))]
+
+        # every split but the last one gets its share rounded down, the last one
+        # the rest
+        sizes = [int(len(df) * split.percentage) for split in splits]
+        split_positions = np.split(order, np.cumsum(sizes[:-1]))
+
+        is_polars = HAS_POLARS and isinstance(
+            df, (pl.DataFrame, pl.dataframe.frame.DataFrame)
+        )
+        result_dfs = {}
+        for split, positions in zip(splits, split_positions, strict=True):
+            positions = np.sort(positions)
+            result_dfs[split.name] = df[positions] if is_polars else df.iloc[positions]
+        _logger.debug(
+            "Randomly split %d rows into %s.",
+            len(df),
+            ", ".join(
+                f"{name}: {len(split_df)}" for name, split_df in result_dfs.items()
+            ),
+        )
         return result_dfs
 
     def _time_series_split(
@@ -1814,29 +2082,32 @@ class Engine:
         elif HAS_POLARS and (
             isinstance(dataframe, (pl.DataFrame, pl.dataframe.frame.DataFrame))
         ):
-            # Dynamically creating lambda function so that we do not need to loop though to extract features required for the udf.
-            # This is done because polars 'map_rows' provides rows as tuples to the udf.
-            transformation_features = ", ".join(
-                [
-                    f"x[{dataframe.columns.index(feature)}]"
-                    for feature in hopsworks_udf.transformation_features
-                ]
-            )
-            feature_mapping_wrapper = eval(
-                f"lambda x: udf({transformation_features})", locals()
-            )
-            transformed_features = dataframe.map_rows(feature_mapping_wrapper)
-            transformed_data = transformed_data.with_columns(
-                transformed_features.rename(
-                    dict(
-                        zip(
-                            transformed_features.columns,
-                            hopsworks_udf.output_column_names,
+            # Iterate over native Python lists of only the referenced columns,
+            # as for pandas, instead of boxing every row of the frame as a
+            # tuple with `map_rows`.
+            col_lists = [
+                dataframe.get_column(f).to_list()
+                for f in hopsworks_udf.transformation_features
+            ]
+            results = [udf(*vals) for vals in zip(*col_lists, strict=False)]
+
+            if len(hopsworks_udf.return_types) > 1:
+                transformed_data = pl.DataFrame(
+                    results,
+                    schema=hopsworks_udf.output_column_names,
+                    orient="row",
+                    strict=False,
+                )
+            else:
+                transformed_data = pl.DataFrame(
+                    [
+                        pl.Series(
+                            hopsworks_udf.output_column_names[0],
+                            results,
                             strict=False,
                         )
-                    )
+                    ]
                 )
-            )
         return transformed_data
 
     def _apply_pandas_udf(
@@ -1853,22 +2124,17 @@ class Engine:
             dataset: A pandas or polars dataframe.
 
         Returns:
-            A pandas dataframe with the transformed data.
+            A dataframe of the same type as `dataframe` with the transformed data.
 
         Raises:
             hopsworks.client.exceptions.FeatureStoreException: If any of the features mentioned in the transformation function is not present in the Feature View.
         """
-        # Cast to pandas if polars dataframe to avoid errors when applying the pandas UDF.
         if HAS_POLARS and (
             isinstance(dataframe, (pl.DataFrame, pl.dataframe.frame.DataFrame))
         ):
-            # Converting polars dataframe to pandas because currently we support only pandas UDF's as transformation functions.
-            if HAS_PYARROW:
-                dataframe = dataframe.to_pandas(
-                    use_pyarrow_extension_array=True
-                )  # Zero copy if pyarrow extension can be used.
-            else:
-                dataframe = dataframe.to_pandas(use_pyarrow_extension_array=False)
+            return self._apply_pandas_udf_on_polars(
+                hopsworks_udf, dataframe, online=online, engine_type=engine_type
+            )
 
         transformed_data = pd.DataFrame()
 
@@ -1896,6 +2162,42 @@ class Engine:
             )
         return transformed_data
 
+    @_uses_polars
+    def _apply_pandas_udf_on_polars(
+        self,
+        hopsworks_udf: HopsworksUdf,
+        dataframe: pl.DataFrame,
+        online: bool = False,
+        engine_type: str | None = None,
+    ) -> pl.DataFrame:
+        """Apply a pandas udf to a polars dataframe.
+
+        Only the columns the udf reads are converted to pandas, backed by the
+        Arrow buffers of the polars columns, and the outputs are converted back
+        the same way, so the rest of the frame never leaves polars.
+        """
+        udf = hopsworks_udf._get_udf(online=online, engine_type=engine_type)
+        output = udf(
+            *[
+                dataframe.get_column(feature).to_pandas(
+                    use_pyarrow_extension_array=HAS_PYARROW
+                )
+                for feature in hopsworks_udf.transformation_features
+            ]
+        )
+        if isinstance(output, pd.Series):
+            output = output.to_frame()
+        transformed_data = pl.from_pandas(output.reset_index(drop=True))
+        return transformed_data.rename(
+            dict(
+                zip(
+                    transformed_data.columns,
+                    hopsworks_udf.output_column_names,
+                    strict=False,
+                )
+            )
+        )
+
     @staticmethod
     def _get_unique_values(
         feature_dataframe: pd.DataFrame | pl.DataFrame, feature_name: str
@@ -2190,26 +2492,36 @@ class Engine:
                 _logger.info("Materialisation job was not scheduled.")
 
         elif self._start_offline_materialization(offline_write_options):
-            if not offline_write_options.get(
-                "skip_offsets", False
-            ) and self._job_api.last_execution(
-                feature_group.materialization_job
-            ):  # always skip offsets if executing job for the first time
-                # don't provide the current offsets (read from where the job last left off)
-                initial_check_point = ""
-            # provide the initial_check_point as it will reduce the read amplification of materialization job
-            feature_group.materialization_job.run(
-                args=feature_group.materialization_job.config.get("defaultArgs", "")
-                + (
-                    f" -initialCheckPointString {initial_check_point}"
-                    if initial_check_point
-                    else ""
-                ),
-                await_termination=offline_write_options.get("wait_for_job", False),
+            self._start_materialization_job(
+                feature_group, offline_write_options, initial_check_point
             )
 
         return feature_group.materialization_job
 
+    def _start_materialization_job(
+        self,
+        feature_group: FeatureGroup,
+        offline_write_options: dict[str, Any],
+        initial_check_point: str,
+    ) -> None:
+        if not offline_write_options.get(
+            "skip_offsets", False
+        ) and self._job_api.last_execution(
+            feature_group.materialization_job
+        ):  # always skip offsets if executing job for the first time
+            # don't provide the current offsets (read from where the job last left off)
+            initial_check_point = ""
+        # provide the initial_check_point as it will reduce the read amplification of materialization job
+        feature_group.materialization_job.run(
+            args=feature_group.materialization_job.config.get("defaultArgs", "")
+            + (
+                f" -initialCheckPointString {initial_check_point}"
+                if initial_check_point
+                else ""
+            ),
+            await_termination=offline_write_options.get("wait_for_job", False),
+        )
+
     @staticmethod
     def _cast_columns(
         df: pd.DataFrame, schema: list[feature.Feature], online: bool = False
@@ -2348,6 +2660,206 @@ class Engine:
                 metadata[k] = v[0]
         return metadata
 
+    # Arrow types of the columns of lists of rows and of pandas object columns
+    # that convert back to pandas with the same values pandas infers for them.
+    _COLUMNAR_LOGGING_LIST_TYPES = (
+        pa.types.is_integer,
+        pa.types.is_floating,
+        pa.types.is_boolean,
+        pa.types.is_string,
+        pa.types.is_null,
+    )
+    _COLUMNAR_LOGGING_OBJECT_TYPES = (pa.types.is_string, pa.types.is_null)
+
+    @staticmethod
+    def _convert_feature_log_to_arrow(
+        feature_log: list[Any]
+        | list[list[Any]]
+        | np.ndarray
+        | pd.DataFrame
+        | pl.DataFrame,
+        cols: list[str],
+    ) -> pa.Table | None:
+        """Convert a part of a feature log to an Arrow table without going through pandas.
+
+        Polars frames, numeric NumPy arrays in Fortran order and the numeric columns of pandas frames are converted without copying the data.
+        Lists of rows are transposed to columns of numbers, booleans and strings.
+
+        Parameters:
+            feature_log: Part of the feature log provided by the user.
+            cols: List of expected features in the part.
+
+        Returns:
+            The table, or `None` if the part cannot be converted to the values `_convert_feature_log_to_df` converts it to, such as a list of dictionaries.
+        """
+        try:
+            if HAS_POLARS and isinstance(feature_log, pl.DataFrame):
+                if pl.Object in feature_log.dtypes:
+                    return None
+                table = feature_log.to_arrow()
+            elif isinstance(feature_log, pd.DataFrame):
+                table = Engine._convert_pandas_feature_log_to_arrow(feature_log)
+            elif HAS_NUMPY and isinstance(feature_log, np.ndarray):
+                if (
+                    feature_log.size == 0
+                    or feature_log.ndim not in (1, 2)
+                    or feature_log.dtype.kind not in "biuf"
+                ):
+                    return None
+                Engine._validate_logging_list(feature_log, cols)
+                columns = np.asfortranarray(feature_log.reshape(len(feature_log), -1))
+                table = pa.table(
+                    [pa.array(columns[:, i]) for i in range(len(cols))], names=cols
+                )
+            elif isinstance(feature_log, list):
+                if not feature_log or any(
+                    isinstance(row, (dict, tuple)) for row in feature_log
+                ):
+                    return None
+                Engine._validate_logging_list(feature_log, cols)
+                if isinstance(feature_log[0], list) or (
+                    HAS_NUMPY and isinstance(feature_log[0], np.ndarray)
+                ):
+                    if any(
+                        (
+                            not isinstance(row, list)
+                            and not (HAS_NUMPY and isinstance(row, np.ndarray))
+                        )
+                        or len(row) != len(cols)
+                        for row in feature_log
+                    ):
+                        return None
+                    columns = zip(*feature_log, strict=True)
+                else:
+                    columns = [feature_log]
+                table = pa.table([pa.array(column) for column in columns], names=cols)
+                if not all(
+                    any(check(t) for check in Engine._COLUMNAR_LOGGING_LIST_TYPES)
+                    for t in table.schema.types
+                ):
+                    return None
+            else:
+                return None
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None
+        if table is None or len(set(table.column_names)) != table.num_columns:
+            return None
+        return table
+
+    @staticmethod
+    def _convert_pandas_feature_log_to_arrow(
+        feature_log: pd.DataFrame,
+    ) -> pa.Table | None:
+        """Convert a pandas part of a feature log of numbers, booleans, timestamps and strings to an Arrow table.
+
+        Parameters:
+            feature_log: Part of the feature log provided by the user.
+
+        Returns:
+            The table, or `None` if a column has another type or a string column has missing values other than `None`, which Arrow would turn into `None`.
+        """
+        for name, column in feature_log.items():
+            if not isinstance(name, str):
+                return None
+            if isinstance(column.dtype, pd.DatetimeTZDtype) or (
+                isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufM"
+            ):
+                continue
+            if column.dtype != object:
+                return None
+        table = pa.Table.from_pandas(feature_log, preserve_index=False)
+        for (_, column), field in zip(feature_log.items(), table.schema, strict=True):
+            if column.dtype != object:
+                continue
+            if not any(
+                check(field.type) for check in Engine._COLUMNAR_LOGGING_OBJECT_TYPES
+            ):
+                return None
+            if table.column(field.name).null_count and any(
+                value is not None for value in column[column.isna()]
+            ):
+                return None
+        return table
+
+    @staticmethod
+    def _get_feature_logging_table(
+        logging_data: Any,
+        logging_features: list[str],
+        logging_components: list[tuple[Any, list[str], str]],
+        prediction_names: list[str] | None,
+        metadata_columns: dict[str, pa.Scalar],
+    ) -> pa.Table | None:
+        """Assemble the parts of a feature log into a single Arrow table.
+
+        The parts are merged with the same precedence as in `_get_feature_logging_df`: a part with a single row is repeated to the length of the others, and a column of a later part replaces the same column of an earlier part unless it is all missing.
+        The metadata columns are appended as constants, apart from the log id which is unique per row.
+
+        Parameters:
+            logging_data: Feature log provided by the user.
+            logging_features: The names of the logging features.
+            logging_components: Tuples of the data, column names and name of each logging component.
+            prediction_names: Names of the prediction columns, which are prefixed.
+            metadata_columns: The value of each constant metadata column.
+
+        Returns:
+            The table, or `None` if one of the parts cannot be assembled in columns.
+        """
+        parts = [
+            (logging_data, logging_features, constants.FEATURE_LOGGING.LOGGING_DATA)
+        ] + logging_components
+        columns = None
+        num_rows = 0
+        for data, feature_names, log_component_name in parts:
+            if data is None:
+                continue
+            try:
+                table = Engine._convert_feature_log_to_arrow(data, feature_names)
+            except AssertionError as e:
+                raise FeatureStoreException(
+                    f"Error logging data `{log_component_name}` do not have all required features. Please check the `{log_component_name}` to ensure that it has the following features : {feature_names}."
+                ) from e
+            if table is None:
+                return None
+
+            if log_component_name == constants.FEATURE_LOGGING.LOGGING_DATA:
+                columns = dict(zip(table.column_names, table.columns, strict=True))
+                num_rows = table.num_rows
+            elif table.num_rows == 0 or table.num_columns == 0:
+                continue
+            elif not columns or num_rows == 0:
+                columns = dict(zip(table.column_names, table.columns, strict=True))
+                num_rows = table.num_rows
+            elif table.num_rows == 1 and num_rows > 1:
+                for name, column in zip(table.column_names, table.columns, strict=True):
+                    if name not in columns:
+                        columns[name] = pa.repeat(column[0], num_rows)
+            elif table.num_rows != num_rows:
+                raise FeatureStoreException(
+                    f"Length of `{log_component_name}` provided do not match other arguments. Please check the logging data to make sure that all arguments have the same length."
+                )
+            else:
+                for name, column in zip(table.column_names, table.columns, strict=True):
+                    if (
+                        name not in columns
+                        or not pc.all(pc.is_null(column, nan_is_null=True)).as_py()
+                    ):
+                        columns[name] = column
+        if columns is None:
+            return None
+
+        for name in prediction_names or []:
+            if name in columns:
+                columns[constants.FEATURE_LOGGING.PREFIX_PREDICTIONS + name] = (
+                    columns.pop(name)
+                )
+
+        for name, value in metadata_columns.items():
+            columns[name] = pa.repeat(value, num_rows)
+        columns[constants.FEATURE_LOGGING.LOG_ID_COLUMN_NAME] = pa.array(
+            [str(uuid.uuid4()) for _ in range(num_rows)], type=pa.string()
+        )
+        return pa.table(columns)
+
     def _get_feature_logging_df(
         self,
         logging_data: pd.DataFrame
@@ -2481,20 +2993,7 @@ class Engine:
         Returns:
             A tuple of (dataframe, additional_feature_names, missing_feature_names).
         """
-        if logging_data is not None:
-            try:
-                logging_df = Engine._convert_feature_log_to_df(
-                    logging_data, logging_features
-                )
-            except AssertionError as e:
-                raise FeatureStoreException(
-                    f"Error logging data `{constants.FEATURE_LOGGING.LOGGING_DATA}` do not have all required features. Please check the `{constants.FEATURE_LOGGING.LOGGING_DATA}` to ensure that it has the following features : {logging_features}."
-                ) from e
-        else:
-            logging_df = None
-
-        # Iterate through all logging components validate them and collect them into a single dataframe.
-        for data, feature_names, log_component_name in [
+        logging_components = [
             transformed_features,
             untransformed_features,
             predictions,
@@ -2504,54 +3003,90 @@ class Engine:
             request_parameters,
             event_time,
             extra_logging_features,
-        ]:
-            try:
-                df = (
-                    Engine._convert_feature_log_to_df(data, feature_names)
-                    if data is not None or feature_names
-                    else None
-                )
-            except AssertionError as e:
-                raise FeatureStoreException(
-                    f"Error logging data `{log_component_name}` do not have all required features. Please check the `{log_component_name}` to ensure that it has the following features : {feature_names}."
-                ) from e
+        ]
+        _, predictions_feature_names, _ = predictions
 
-            if df is None or df.empty:
-                continue
-            if logging_df is None or logging_df.empty:
-                logging_df = df
-            # If one of the logging components has only one row and the other has multiple rows, we repeat the single row to match the length of the other component.
-            elif len(df) == 1 and len(logging_df) > 1:
-                for col in df.columns:
-                    if col not in logging_df.columns:
-                        logging_df[col] = (
-                            df[col]
-                            .loc[df.index.repeat(len(logging_df))]
-                            .reset_index(drop=True)
-                        )
-            elif len(df) != len(logging_df):
-                raise FeatureStoreException(
-                    f"Length of `{log_component_name}` provided do not match other arguments. Please check the logging data to make sure that all arguments have the same length."
-                )
+        # Assemble the log in Arrow columns when all parts allow it, which avoids
+        # building and aligning a pandas dataframe for each part.
+        logging_table = None
+        if None not in (td_col_name, time_col_name, model_col_name):
+            logging_table = Engine._get_feature_logging_table(
+                logging_data=logging_data,
+                logging_features=logging_features,
+                logging_components=logging_components,
+                prediction_names=predictions_feature_names,
+                metadata_columns={
+                    td_col_name: pa.scalar(training_dataset_version or None),
+                    model_col_name: pa.scalar(model_name, type=pa.string()),
+                    constants.FEATURE_LOGGING.MODEL_VERSION_COLUMN_NAME: pa.scalar(
+                        str(model_version)
+                    ),
+                    time_col_name: pa.scalar(datetime.now(), type=pa.timestamp("ns")),
+                },
+            )
+        if logging_table is not None:
+            logging_df = logging_table.to_pandas(date_as_object=False)
+        else:
+            if logging_data is not None:
+                try:
+                    logging_df = Engine._convert_feature_log_to_df(
+                        logging_data, logging_features
+                    )
+                except AssertionError as e:
+                    raise FeatureStoreException(
+                        f"Error logging data `{constants.FEATURE_LOGGING.LOGGING_DATA}` do not have all required features. Please check the `{constants.FEATURE_LOGGING.LOGGING_DATA}` to ensure that it has the following features : {logging_features}."
+                    ) from e
             else:
-                for col in df.columns:
-                    if col not in logging_df.columns:
-                        logging_df[col] = df[col]
-                    elif not df[col].isna().all():
-                        # If the column already exists in the logging dataframe and the new column has some non-null values, we overwrite the existing column.
-                        # Higher precedence is given if the user explicitly passed the logging component.
-                        logging_df[col] = df[col]
-
-        # Rename prediction columns
-        _, predictions_feature_names, _ = predictions
-        if predictions_feature_names:
-            for feature_name in predictions_feature_names:
-                logging_df = logging_df.rename(
-                    columns={
-                        feature_name: constants.FEATURE_LOGGING.PREFIX_PREDICTIONS
-                        + feature_name
-                    }
-                )
+                logging_df = None
+
+            # Iterate through all logging components validate them and collect them into a single dataframe.
+            for data, feature_names, log_component_name in logging_components:
+                try:
+                    df = (
+                        Engine._convert_feature_log_to_df(data, feature_names)
+                        if data is not None or feature_names
+                        else None
+                    )
+                except AssertionError as e:
+                    raise FeatureStoreException(
+                        f"Error logging data `{log_component_name}` do not have all required features. Please check the `{log_component_name}` to ensure that it has the following features : {feature_names}."
+                    ) from e
+
+                if df is None or df.empty:
+                    continue
+                if logging_df is None or logging_df.empty:
+                    logging_df = df
+                # If one of the logging components has only one row and the other has multiple rows, we repeat the single row to match the length of the other component.
+                elif len(df) == 1 and len(logging_df) > 1:
+                    for col in df.columns:
+                        if col not in logging_df.columns:
+                            logging_df[col] = (
+                                df[col]
+                                .loc[df.index.repeat(len(logging_df))]
+                                .reset_index(drop=True)
+                            )
+                elif len(df) != len(logging_df):
+                    raise FeatureStoreException(
+                        f"Length of `{log_component_name}` provided do not match other arguments. Please check the logging data to make sure that all arguments have the same length."
+                    )
+                else:
+                    for col in df.columns:
+                        if col not in logging_df.columns:
+                            logging_df[col] = df[col]
+                        elif not df[col].isna().all():
+                            # If the column already exists in the logging dataframe and the new column has some non-null values, we overwrite the existing column.
+                            # Higher precedence is given if the user explicitly passed the logging component.
+                            logging_df[col] = df[col]
+
+            # Rename prediction columns
+            if predictions_feature_names:
+                for feature_name in predictions_feature_names:
+                    logging_df = logging_df.rename(
+                        columns={
+                            feature_name: constants.FEATURE_LOGGING.PREFIX_PREDICTIONS
+                            + feature_name
+                        }
+                    )
 
         # Creating a json column for request parameters
         request_parameter_data, request_parameter_columns, _ = request_parameters
@@ -2597,19 +3132,20 @@ class Engine:
                 inplace=True,
             )
 
-        # Add meta data columns
-        logging_metadata = Engine._get_logging_metadata(
-            size=len(logging_df),
-            td_col_name=td_col_name,
-            time_col_name=time_col_name,
-            model_col_name=model_col_name,
-            training_dataset_version=training_dataset_version,
-            model_name=model_name,
-            model_version=model_version,
-        )
+        # Add meta data columns, the columnar path appended them to the table already
+        if logging_table is None:
+            logging_metadata = Engine._get_logging_metadata(
+                size=len(logging_df),
+                td_col_name=td_col_name,
+                time_col_name=time_col_name,
+                model_col_name=model_col_name,
+                training_dataset_version=training_dataset_version,
+                model_name=model_name,
+                model_version=model_version,
+            )
 
-        for k, v in logging_metadata.items():
-            logging_df[k] = pd.Series(v)
+            for k, v in logging_metadata.items():
+                logging_df[k] = pd.Series(v)
 
         # Find any missing columns in the logging dataframe and set them to None
         # Find any additional columns in the logging dataframe that are not in the logging feature group and ignore them.
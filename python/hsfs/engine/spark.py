@@ -138,6 +138,7 @@ _logger = logging.getLogger(__name__)
 class Engine:
     HIVE_FORMAT = "hive"
     KAFKA_FORMAT = "kafka"
+    JDBC_DRIVER_FETCH_SIZE = 10000
 
     APPEND = "append"
     OVERWRITE = "overwrite"
@@ -262,8 +263,11 @@ class Engine:
         n: int = None,
         dataframe_type: str = "default",
         filter: Filter | Logic = None,
+        read_options: dict | None = None,
     ) -> pd.DataFrame | np.ndarray | list[list[Any]] | TypeVar("pyspark.sql.DataFrame"):
-        results = VectorDbClient._read_feature_group(feature_group, n, filter=filter)
+        results = VectorDbClient._read_feature_group(
+            feature_group, n, filter=filter, read_options=read_options
+        )
         feature_names = [f.name for f in feature_group.columns]
         dataframe_type = dataframe_type.lower()
         if dataframe_type in ["default", "spark"]:
@@ -1444,11 +1448,9 @@ class Engine:
 
     def _read_jdbc_on_driver(self, options, dataframe_type):
         # Wallet files exist on the driver only — read via JVM DriverManager
-        # directly on the driver process, collect into pandas, then wrap in a
-        # Spark DataFrame.  Spark always dispatches jdbc tasks to executors
-        # (even with numPartitions=1), so spark.read.jdbc cannot be used here.
-        import pandas as pd
-
+        # directly on the driver process and build the DataFrame from the rows
+        # there.  Spark always dispatches jdbc tasks to executors (even with
+        # numPartitions=1), so spark.read.jdbc cannot be used here.
         jvm = self._jvm
         props = jvm.java.util.Properties()
         for k, v in options.items():
@@ -1458,8 +1460,6 @@ class Engine:
         url = options["url"]
         sql = options.get("query") or f"SELECT * FROM {options['dbtable']}"
 
-        from pyspark.sql.types import StringType, StructField, StructType
-
         driver_class = options.get("driver")
         if driver_class:
             # JDBC driver jars arrive via spark.jars, which live in Spark's
@@ -1472,35 +1472,33 @@ class Engine:
             jvm.org.apache.spark.sql.execution.datasources.jdbc.DriverRegistry.register(
                 driver_class
             )
+        jdbc_utils = jvm.org.apache.spark.sql.execution.datasources.jdbc.JdbcUtils
         conn = jvm.java.sql.DriverManager.getConnection(url, props)
         try:
             stmt = conn.createStatement()
+            # fetch the rows in batches, Oracle drivers fetch 10 rows per round
+            # trip by default
+            stmt.setFetchSize(
+                int(options.get("fetchsize", self.JDBC_DRIVER_FETCH_SIZE))
+            )
             rs = stmt.executeQuery(sql)
-            meta = rs.getMetaData()
-            col_count = meta.getColumnCount()
-            columns = [meta.getColumnLabel(i + 1) for i in range(col_count)]
-            rows = []
-            while rs.next():
-                row = []
-                for i in range(col_count):
-                    val = rs.getObject(i + 1)
-                    row.append(None if val is None else str(val))
-                rows.append(row)
+            # Convert the result set with Spark's own JDBC reader code, so that
+            # the columns are typed as spark.read.jdbc would type them and the
+            # rows never cross Py4J one cell at a time.
+            schema = jdbc_utils.getSchema(
+                rs, jvm.org.apache.spark.sql.jdbc.JdbcDialects.get(url), True, False
+            )
+            rows = jvm.scala.collection.JavaConverters.seqAsJavaList(
+                jdbc_utils.resultSetToRows(rs, schema).toList()
+            )
+            jdf = self._spark_session._jsparkSession.createDataFrame(rows, schema)
             rs.close()
             stmt.close()
         finally:
             conn.close()
 
-        # All values are strings — use an explicit all-string schema so
-        # nullable/all-null columns don't cause inference to fail.
-        # Type coercion happens when Spark executes SQL against the temp view.
-        schema = StructType(
-            [StructField(col, StringType(), nullable=True) for col in columns]
-        )
-
-        pdf = pd.DataFrame(rows, columns=columns)
         return self._return_dataframe_type(
-            self._spark_session.createDataFrame(pdf, schema=schema),
+            DataFrame(jdf, self._spark_session),
             dataframe_type=dataframe_type,
         )
 
@@ -39,18 +39,7 @@ from hsfs.core.variable_api import VariableApi
 
 # if great_expectations is not installed, we will default to using native Hopsworks class as return values
 from hsfs.decorators import _uses_great_expectations
-from hsfs.ge_expectation import GeExpectation
-
-
-if HAS_GREAT_EXPECTATIONS:
-    import great_expectations
-
-    if GE_MAJOR == 1:
-        from great_expectations.expectations.expectation_configuration import (
-            ExpectationConfiguration as _ExpectationConfiguration,
-        )
-    else:
-        _ExpectationConfiguration = great_expectations.core.ExpectationConfiguration
+from hsfs.ge_expectation import GeExpectation, _expectation_configuration_class
 
 
 @public
@@ -248,6 +237,8 @@ class ExpectationSuite:
         Returns:
             The Great Expectations native ExpectationSuite object.
         """
+        import great_expectations
+
         if GE_MAJOR == 1:
             # GE 1.x dropped data_asset_type and ge_cloud_id; renamed expectation_suite_name to name.
             return great_expectations.core.ExpectationSuite(
@@ -329,8 +320,8 @@ class ExpectationSuite:
         Raises:
             TypeError: If the expectation type is not supported.
         """
-        if HAS_GREAT_EXPECTATIONS and isinstance(
-            expectation, _ExpectationConfiguration
+        if util._loaded_great_expectations() is not None and isinstance(
+            expectation, _expectation_configuration_class()
         ):
             json_dict = expectation.to_json_dict()
             # GE 1.x ships type/severity fields; map back to the legacy shape.
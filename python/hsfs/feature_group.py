@@ -72,6 +72,7 @@ from hsfs.core import (
     feature_store_api,
     great_expectation_engine,
     job_api,
+    kafka_engine,
     online_ingestion,
     online_ingestion_api,
     partition_transforms,
@@ -100,24 +101,27 @@ from hsfs.validation_report import ValidationReport
 
 
 if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+
     if HAS_CONFLUENT_KAFKA:
         import confluent_kafka
+    if HAS_GREAT_EXPECTATIONS:
+        import great_expectations
     if HAS_NUMPY:
         import numpy as np
     if HAS_POLARS:
         import polars as pl
     import pandas as pd
+    import pyarrow as pa
     from hopsworks_common.alert import FeatureGroupAlert
     from hsfs.constructor.filter import Filter, Logic
     from hsfs.core.job import Job
+    from hsfs.core.local_vector_index import LocalVectorIndex
     from hsfs.ge_validation_result import ValidationResult
     from hsfs.hopsworks_udf import HopsworksUdf
     from hsfs.statistics import Statistics
 
-
-if HAS_GREAT_EXPECTATIONS:
-    import great_expectations
-
 _logger = logging.getLogger(__name__)
 
 
@@ -1904,9 +1908,8 @@ class FeatureGroupBase:
         Raises:
             hopsworks.client.exceptions.RestAPIError: If the backend encounters an error when handling the request.
         """
-        if HAS_GREAT_EXPECTATIONS and isinstance(
-            expectation_suite, great_expectations.core.ExpectationSuite
-        ):
+        ge = util._loaded_great_expectations()
+        if ge is not None and isinstance(expectation_suite, ge.core.ExpectationSuite):
             tmp_expectation_suite = (
                 hsfs.expectation_suite.ExpectationSuite.from_ge_type(
                     ge_expectation_suite=expectation_suite,
@@ -2081,9 +2084,10 @@ class FeatureGroupBase:
             hopsworks.client.exceptions.FeatureStoreException: If feature group is not registered with Hopsworks.
         """
         if self._id:
-            if HAS_GREAT_EXPECTATIONS and isinstance(
+            ge = util._loaded_great_expectations()
+            if ge is not None and isinstance(
                 validation_report,
-                great_expectations.core.expectation_validation_result.ExpectationSuiteValidationResult,
+                ge.core.expectation_validation_result.ExpectationSuiteValidationResult,
             ):
                 report = ValidationReport(
                     **validation_report.to_json_dict(),
@@ -3017,6 +3021,7 @@ class FeatureGroupBase:
             | None
         ),
     ) -> None:
+        ge = util._loaded_great_expectations()
         if isinstance(expectation_suite, hsfs.expectation_suite.ExpectationSuite):
             tmp_expectation_suite = expectation_suite.to_json_dict(decamelize=True)
             tmp_expectation_suite["feature_group_id"] = self._id
@@ -3024,9 +3029,9 @@ class FeatureGroupBase:
             self._expectation_suite = hsfs.expectation_suite.ExpectationSuite(
                 **tmp_expectation_suite
             )
-        elif HAS_GREAT_EXPECTATIONS and isinstance(
+        elif ge is not None and isinstance(
             expectation_suite,
-            great_expectations.core.expectation_suite.ExpectationSuite,
+            ge.core.expectation_suite.ExpectationSuite,
         ):
             self._expectation_suite = hsfs.expectation_suite.ExpectationSuite(
                 **expectation_suite.to_json_dict(),
@@ -3967,6 +3972,9 @@ class FeatureGroup(FeatureGroupBase):
                 - key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`.
                 - key `"pandas_types"` and value `True` to retrieve columns as [Pandas nullable types](https://pandas.pydata.org/docs/user_guide/integer_na.html) rather than numpy/object(string) types (experimental).
+                - key `"batch_size"` to stream an online read, which then returns an iterator of dataframes of at most `batch_size` rows instead of a single dataframe.
+                  The rows are read through a server-side cursor, so only one batch is held in memory at a time.
+                  For example: `for batch in fg.read(online=True, read_options={"batch_size": 10000}): ...`.
             start_time:
                 Inclusive lower bound on the `event_time` column (`event_time >= start_time`).
                 If not provided and `wallclock_time` is also not set, defaults to the
@@ -4018,7 +4026,11 @@ class FeatureGroup(FeatureGroupBase):
             raise FeatureStoreException(
                 "Time travel format is not set for the feature group, cannot read as of specific point in time."
             )
-        if wallclock_time and engine._get_type() == "python":
+        if (
+            wallclock_time
+            and engine._get_type() == "python"
+            and self._time_travel_format not in ["DELTA", "ICEBERG"]
+        ):
             raise FeatureStoreException(
                 "Python environments does not support incremental queries. "
                 "Read feature group without timestamp to retrieve latest snapshot or switch to "
@@ -4083,9 +4095,8 @@ class FeatureGroup(FeatureGroupBase):
 
         Warning: Pyspark/Spark Only
             Apache HUDI exclusively supports Time Travel and Incremental Query via Spark Context.
-
-        Warning:
-            This function only works for feature groups with time_travel_format='HUDI'.
+            With the Python engine, the changes of `DELTA` and `ICEBERG` feature groups are read directly from the table,
+            from the Delta change data feed or the Iceberg snapshots appended in the time window.
 
         Parameters:
             start_wallclock_time:
@@ -4099,7 +4110,7 @@ class FeatureGroup(FeatureGroupBase):
                 For spark engine, it is a dictionary of read options for Spark.
 
         Returns:
-            The spark dataframe containing the incremental changes of feature data.
+            The dataframe containing the incremental changes of feature data.
 
         Raises:
             hopsworks.client.exceptions.RestAPIError: No data is available for feature group with this commit date.
@@ -4178,6 +4189,162 @@ class FeatureGroup(FeatureGroupBase):
             (result[0], [result[1][f.name] for f in self.columns]) for result in results
         ]
 
+    @public
+    def read_embedding_batches(
+        self,
+        features: list[str] | None = None,
+        filter: Filter | Logic | None = None,
+        batch_size: int = 1000,
+        slices: int = 1,
+        options: dict | None = None,
+    ) -> Iterator[pa.RecordBatch]:
+        """Stream the rows of the feature group from the vector database as Arrow record batches.
+
+        The embedding index is scanned with a point in time and `search_after` pagination, so the read is not limited by the maximum result window of the index, and only a bounded number of batches is held in memory at any time.
+        This requires OpenSearch 2.4 or newer.
+
+        Parameters:
+            features: Names of the features to read, defaults to all features.
+            filter: A filter expression to restrict the rows read.
+            batch_size: Number of rows per request and per record batch.
+            slices: Number of slices of the index scanned concurrently over separate connections.
+            options:
+                The options used for the requests to the vector database.
+                The keys are attribute values of the `hsfs.core.opensearch.OpensearchRequestOption` class.
+
+        Returns:
+            An iterator of `pyarrow.RecordBatch`, ordered by primary key within each slice.
+
+        Raises:
+            hopsworks.client.exceptions.FeatureStoreException: If the feature group does not have an embedding index.
+
+        Example:
+            ```python
+            for batch in fg.read_embedding_batches(
+                features=["id1", "user_vector"], batch_size=5000, slices=4
+            ):
+                process(batch.to_pandas())
+            ```
+        """
+        return VectorDbClient._read_feature_group_batches(
+            self,
+            columns=features,
+            filter=filter,
+            batch_size=batch_size,
+            slices=slices,
+            options=options,
+        )
+
+    @public
+    def read_online_topic(
+        self,
+        partitions: list[int] | None = None,
+        start_offsets: Literal["earliest", "latest"] | dict[int, int] = "earliest",
+        stop_at_end: bool = True,
+        batch_size: int = 10000,
+        max_workers: int | None = None,
+        dataframe_type: Literal["pyarrow", "pandas", "polars"] = "pyarrow",
+        options: dict[str, Any] | None = None,
+    ) -> Iterator[pa.Table | pd.DataFrame | pl.DataFrame]:
+        """Read the rows written to the online topic of the feature group in batches.
+
+        Messages are consumed in batches of up to `batch_size` and their Avro payloads, including complex features, are decoded against the schema of the feature group into one Arrow table per batch.
+        Each batch has a column per feature and the Kafka metadata columns `kafka_partition`, `kafka_offset` and `kafka_timestamp`.
+        Partitions are read by up to `max_workers` consumers in parallel, so batches of different partitions can interleave.
+        Reading the topic does not commit offsets and does not affect ingestion.
+
+        Parameters:
+            partitions: Partitions to read, defaults to all partitions of the topic.
+            start_offsets: `"earliest"`, `"latest"` or a dictionary of start offsets by partition.
+            stop_at_end:
+                Stop at the end of the partitions as of the start of the read.
+                Set to `False` to keep tailing the topic for new messages.
+            batch_size: Maximum number of messages per batch.
+            max_workers: Number of parallel consumers, defaults to one per partition, at most 8.
+            dataframe_type: Type of the returned batches, `"pyarrow"`, `"pandas"` or `"polars"`.
+            options: Additional options, the key `"kafka_producer_config"` overrides the Kafka consumer configuration.
+
+        Returns:
+            An iterator of batches of decoded rows.
+
+        Raises:
+            hopsworks.client.exceptions.FeatureStoreException: If the online topic of the feature group does not exist.
+
+        Example:
+            ```python
+            # measure the ingestion lag of the rows currently in the topic
+            for batch in fg.read_online_topic(dataframe_type="pandas"):
+                print(batch.groupby("kafka_partition")["kafka_offset"].max())
+            ```
+        """
+        return kafka_engine._consume_batches(
+            self,
+            partitions=partitions,
+            start_offsets=start_offsets,
+            stop_at_end=stop_at_end,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            dataframe_type=dataframe_type,
+            options=options,
+        )
+
+    @public
+    def build_local_index(
+        self,
+        col: str | None = None,
+        index_type: Literal["flat", "ivf", "ivf_pq"] = "flat",
+        nlist: int | None = None,
+        nprobe: int = 8,
+        pq_m: int | None = None,
+        data: pd.DataFrame | None = None,
+        read_options: dict | None = None,
+    ) -> LocalVectorIndex:
+        """Build an in-memory nearest neighbor index over the offline data of the feature group.
+
+        The index supports the same similarity search as `find_neighbors`, using the similarity function of the embedding feature, without sending requests to the vector database.
+        Use it for offline evaluation of retrieval models, for example to compute recall@k over many queries.
+
+        Parameters:
+            col:
+                The embedding feature to index.
+                Required only if there are multiple embeddings.
+            index_type:
+                `"flat"` for exact search, `"ivf"` to only search the `nprobe` closest of `nlist` k-means partitions,
+                or `"ivf_pq"` to additionally compress the embeddings with product quantization.
+            nlist: Number of k-means partitions of `"ivf"` and `"ivf_pq"` indexes, defaults to the square root of the number of rows.
+            nprobe: Number of partitions searched per query.
+            pq_m: Number of product quantization codes per embedding, must divide the embedding dimension.
+            data: DataFrame to index instead of reading the offline feature group, for example a filtered read.
+            read_options: Read options passed to `read` when reading the offline feature group.
+
+        Returns:
+            The local vector index.
+
+        Raises:
+            hopsworks.client.exceptions.FeatureStoreException: If the feature group does not have an embedding index.
+
+        Example:
+            ```python
+            index = fg.build_local_index(index_type="ivf", nprobe=16)
+            neighbors = index.find_neighbors_batch(query_embeddings, k=10)
+
+            # raw arrays of scores and row positions, e.g. for recall@k
+            scores, positions = index.search(query_embeddings, k=10)
+            ```
+        """
+        from hsfs.core.local_vector_index import LocalVectorIndex
+
+        return LocalVectorIndex._from_feature_group(
+            self,
+            col=col,
+            data=data,
+            read_options=read_options,
+            index_type=index_type,
+            nlist=nlist,
+            nprobe=nprobe,
+            pq_m=pq_m,
+        )
+
     @public
     def show(self, n: int, online: bool = False) -> list[list[Any]]:
         """Show the first `n` rows of the feature group.
@@ -4406,6 +4573,10 @@ class FeatureGroup(FeatureGroupBase):
             | TypeVar("pyspark.RDD")
             | np.ndarray
             | list[list]
+            | Iterator[pd.DataFrame | pl.DataFrame | pa.RecordBatch | pa.Table]
+            | pa.RecordBatchReader
+            | str
+            | os.PathLike
         ),
         overwrite: bool = False,
         operation: Literal["insert", "upsert"] = "upsert",
@@ -4423,6 +4594,8 @@ class FeatureGroup(FeatureGroupBase):
         By default, the data is inserted into the offline storage as well as the online storage if the feature group is `online_enabled=True`.
 
         The `features` dataframe can be a Spark DataFrame or RDD, a Pandas DataFrame, a Polars DataFrame or a two-dimensional Numpy array or a two-dimensional Python nested list.
+        With the `python` engine, `features` can also be an iterator of Pandas or Polars DataFrames or of Arrow record batches or tables, an Arrow `RecordBatchReader`, or the path of a local Parquet or Arrow IPC dataset.
+        Such data is inserted chunk by chunk, so only a few chunks are held in memory at a time and data larger than memory can be inserted.
         If statistics are enabled, statistics are recomputed for the entire feature group.
         If feature group's time travel format is `HUDI` then `operation` argument can be either `insert` or `upsert`.
 
@@ -4476,6 +4649,17 @@ class FeatureGroup(FeatureGroupBase):
             fg.insert(df_for_fg2)
             ```
 
+        Example: Insert a local Parquet dataset larger than memory
+            ```python
+            fg.insert(
+                "/data/transactions/",
+                write_options={"insert_batch_size": 500_000, "insert_workers": 4},
+            )
+
+            # or any iterator of dataframes
+            fg.insert(pd.read_csv("transactions.csv", chunksize=500_000))
+            ```
+
         Parameters:
             features: Features to be saved.
             overwrite:
@@ -4515,6 +4699,10 @@ class FeatureGroup(FeatureGroupBase):
                   Defaults to `False` and will use external listeners when connecting from outside of Hopsworks.
                 - key `delta.enableChangeDataFeed` set to a *string* value of true or false to enable or disable cdf operations on the feature group delta table.
                   Set to true by default on Feature Group creation.
+                - key `insert_batch_size` and value the maximum number of rows per chunk read from a Parquet or Arrow dataset path, defaults to `100000`.
+                - key `insert_workers` and value the number of threads converting, transforming and validating the next chunks while the current one is written, defaults to `2`.
+                - key `merge_chunk_rows` and value the maximum number of rows merged at once when the python engine upserts into a Delta feature group, unset by default.
+                  Chunking bounds the memory of large upserts, but each chunk is a separate commit, so a failure partway through leaves the upsert partly applied.
 
             validation_options:
                 Additional validation options as key-value pairs.
@@ -4549,7 +4737,7 @@ class FeatureGroup(FeatureGroupBase):
             hopsworks.client.exceptions.DataValidationException:
                 If data validation fails and the expectation suite `validation_ingestion_policy` is set to `STRICT`.
                 Data is NOT ingested.
-            hopsworks.client.exceptions.FeatureStoreException: If `storage` is not one of `"offline"`, `"online"` or unset.
+            hopsworks.client.exceptions.FeatureStoreException: If `storage` is not one of `"offline"`, `"online"` or unset, or if an iterator or dataset path is inserted with the `spark` engine.
         """
         storage_normalized = storage.lower() if storage is not None else None
         if storage_normalized is not None and storage_normalized not in (
@@ -4560,14 +4748,23 @@ class FeatureGroup(FeatureGroupBase):
                 f"Invalid storage: {storage}. Use 'offline', 'online', or leave it unset."
             )
 
-        feature_dataframe = engine._get_instance()._convert_to_default_dataframe(
-            features
-        )
+        batch_source = self._feature_group_engine._is_batch_source(features)
+        if batch_source and engine._get_type() != "python":
+            raise FeatureStoreException(
+                "Inserting an iterator or a dataset path is only supported by the python engine, "
+                "use a Spark DataFrame instead."
+            )
+        if not batch_source:
+            feature_dataframe = engine._get_instance()._convert_to_default_dataframe(
+                features
+            )
 
         if validation_options is None:
             validation_options = {}
-        if write_options is None:
-            write_options = {}
+        # the chunking options only apply to the insert and are not forwarded
+        write_options = dict(write_options or {})
+        insert_batch_size = write_options.pop("insert_batch_size", 100000)
+        insert_workers = write_options.pop("insert_workers", 2)
         if "wait_for_job" not in write_options:
             write_options["wait_for_job"] = wait
         if "wait_for_online_ingestion" not in write_options:
@@ -4584,6 +4781,27 @@ class FeatureGroup(FeatureGroupBase):
             # New delta FG allow for change data capture query
             write_options["delta.enableChangeDataFeed"] = "true"
 
+        if batch_source:
+            job, ge_report = self._feature_group_engine._insert_batches(
+                self,
+                self._feature_group_engine._read_batch_source(
+                    features, insert_batch_size
+                ),
+                overwrite=overwrite,
+                operation=operation,
+                storage=storage_normalized,
+                write_options=write_options,
+                validation_options={"save_report": True, **validation_options},
+                transformation_context=transformation_context,
+                transform=transform,
+                n_processes=n_processes,
+                max_workers=insert_workers,
+            )
+            return (
+                job,
+                ge_report.to_ge_type() if ge_report is not None else None,
+            )
+
         job, ge_report = self._feature_group_engine._insert(
             self,
             feature_dataframe=feature_dataframe,
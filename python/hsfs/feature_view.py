@@ -62,6 +62,7 @@ from hsfs.core import (
 from hsfs.core import feature_monitoring_config as fmc
 from hsfs.core import feature_monitoring_result as fmr
 from hsfs.core.feature_view_api import FeatureViewApi
+from hsfs.core.serving_stats import ServingStats
 from hsfs.core.vector_db_client import VectorDbClient
 from hsfs.decorators import typechecked
 from hsfs.feature import Feature
@@ -406,6 +407,8 @@ class FeatureView:
         default_client: Literal["sql", "rest"] | None = None,
         feature_logger: FeatureLogger | None = None,
         n_processes: int | None = None,
+        serving_stats: bool = False,
+        serving_stats_sink: Callable[[str, float], None] | None = None,
         **kwargs,
     ) -> None:
         """Initialise feature view to retrieve feature vector from online and offline feature store.
@@ -474,6 +477,12 @@ class FeatureView:
             n_processes:
                 Number of worker processes used to apply transformation functions in parallel during serving.
                 When greater than one, the worker pool is pre-spawned here so the first `get_feature_vector(s)` call does not pay the spawn and engine-init latency.
+            serving_stats:
+                If set to `True`, the duration of each stage of `get_feature_vector(s)` is recorded, see [`FeatureView.serving_stats`][hsfs.feature_view.FeatureView.serving_stats].
+                Defaults to `False`, in which case serving does no timing at all.
+            serving_stats_sink:
+                Callable receiving the stage name and duration in seconds of every timed stage, for example to export them to Prometheus or OpenTelemetry with [`prometheus_sink`][hsfs.core.serving_stats.prometheus_sink] or [`opentelemetry_sink`][hsfs.core.serving_stats.opentelemetry_sink].
+                Providing a sink enables the serving stats.
         """
         # initiate batch scoring server
         # `training_dataset_version` should not be set if `None` otherwise backend will look up the td.
@@ -513,6 +522,11 @@ class FeatureView:
             config_rest_client=config_rest_client,
             default_client=default_client,
             training_dataset_version=training_dataset_version,
+            serving_stats=(
+                ServingStats(sinks=[serving_stats_sink] if serving_stats_sink else None)
+                if serving_stats or serving_stats_sink
+                else None
+            ),
         )
 
         self._prefix_serving_key_map = {
@@ -538,6 +552,39 @@ class FeatureView:
         self._transformation_n_processes = n_processes
         self._warmup_transformation_workers(n_processes)
 
+    @public
+    def serving_stats(self, reset: bool = False) -> dict[str, dict[str, float]]:
+        """Get the latency of the stages of feature vector retrieval since serving was initialised.
+
+        Example:
+            ```python
+            feature_view.init_serving(training_dataset_version=1, serving_stats=True)
+            feature_view.get_feature_vector({"id": 1})
+
+            feature_view.serving_stats()["fetch"]["p99_ms"]
+            ```
+
+        The stages are described in [`ServingStats`][hsfs.core.serving_stats.ServingStats].
+
+        Parameters:
+            reset: Whether to discard the recorded durations after summarizing them.
+
+        Returns:
+            For each stage, its `count` and its `mean_ms`, `p50_ms`, `p90_ms`, `p99_ms` and `max_ms` in milliseconds.
+
+        Raises:
+            hopsworks.client.exceptions.FeatureStoreException: If serving was not initialised with `serving_stats=True` or a `serving_stats_sink`.
+        """
+        stats = self._vector_server.serving_stats
+        if stats is None:
+            raise FeatureStoreException(
+                "Serving stats are not enabled. Call `init_serving` with `serving_stats=True` to record them."
+            )
+        summary = stats.summary()
+        if reset:
+            stats.reset()
+        return summary
+
     def _warmup_transformation_workers(self, n_processes: int | None) -> None:
         """Pre-spawn the transformation worker pool when parallel execution is requested.
 
@@ -1297,6 +1344,94 @@ class FeatureView:
             allow_missing=True,
         )
 
+    @public
+    def find_neighbors_batch(
+        self,
+        embeddings: list[list[int | float]],
+        feature: Feature | None = None,
+        k: int | None = 10,
+        filter: Filter | Logic | None = None,
+        external: bool | None = None,
+        return_type: Literal["list", "polars", "pandas"] = "list",
+    ) -> list[list[list[Any]] | pd.DataFrame | pl.DataFrame]:
+        """Finds the nearest neighbors for a batch of embeddings in the vector database.
+
+        The searches for all embeddings are sent to the vector database in as few multi-search requests as possible.
+        The feature vectors of all distinct neighbors are then fetched from the online feature store with a single batch lookup.
+
+        If `filter` is specified, or if embedding feature is stored in default project index, the number of results returned per embedding may be less than k.
+
+        Parameters:
+            embeddings: The target embeddings for which neighbors are to be found.
+            feature:
+                The feature used to compute similarity score.
+                Required only if there are multiple embeddings.
+            k: The number of nearest neighbors to retrieve per embedding.
+            filter: A filter expression to restrict the search space.
+            external:
+                If set to `True`, the connection to the online feature store is established using the same host as for the `host` parameter in the [`hopsworks.login`][hopsworks.login] method.
+                If set to `False`, the online feature store storage connector is used which relies on the private IP.
+                Defaults to `True` if connection to Hopsworks is established from external environment (e.g AWS Sagemaker or Google Colab), otherwise to `False`.
+            return_type: The format in which to return the neighbors of each embedding.
+
+        Returns:
+            One entry per embedding, in the same order, holding the nearest neighbor feature vectors of that embedding in the same format as `find_neighbors`.
+
+        Example:
+            ```python
+            neighbors = fv.find_neighbors_batch(
+                [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+                k=5,
+            )
+            ```
+        """
+        if self._vector_db_client is None:
+            self.init_serving(external=external)
+        batch_results = self._vector_db_client._find_neighbors_batch(
+            embeddings,
+            feature=(feature if feature else None),
+            k=k,
+            filter=filter,
+        )
+
+        # Neighbors shared between embeddings are only looked up once.
+        entries = []
+        vector_db_features = []
+        entry_index = {}
+        result_indices = []
+        for results in batch_results:
+            indices = []
+            for _, result_features in results:
+                primary_key = self._extract_primary_key(result_features)
+                key = tuple(sorted(primary_key.items()))
+                if key not in entry_index:
+                    entry_index[key] = len(entries)
+                    entries.append(primary_key)
+                    vector_db_features.append(result_features)
+                indices.append(entry_index[key])
+            result_indices.append(indices)
+
+        if not entries:
+            return [[] for _ in batch_results]
+
+        feature_vectors = self._vector_server._get_feature_vectors(
+            entries,
+            return_type=return_type,
+            vector_db_features=vector_db_features,
+            allow_missing=True,
+        )
+        neighbors = []
+        for indices in result_indices:
+            if not indices:
+                neighbors.append([])
+            elif return_type == "pandas":
+                neighbors.append(feature_vectors.iloc[indices].reset_index(drop=True))
+            elif return_type == "polars":
+                neighbors.append(feature_vectors[indices])
+            else:
+                neighbors.append([feature_vectors[i] for i in indices])
+        return neighbors
+
     def _extract_primary_key(self, result_key: dict[str, str]) -> dict[str, str]:
         primary_key_map = {}
         for prefix_sk, sk in self._prefix_serving_key_map.items():
@@ -1405,6 +1540,9 @@ class FeatureView:
 
                 - key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`.
+                - key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`.
 
             spine:
                 Spine dataframe with primary key, event time and label column to use for point in time join when fetching features.
@@ -2834,6 +2972,9 @@ class FeatureView:
                 following entries:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`.
+                * key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`.
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration][hsfs.core.job_configuration.JobConfiguration]
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -3021,6 +3162,11 @@ class FeatureView:
                 following entries:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`
+                * key `"stratify_by"` and value the name of a label column to split each of its values separately,
+                  so that every split has the same proportion of each label value. For example: `{"stratify_by": "fraud"}`
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration][hsfs.core.job_configuration.JobConfiguration]
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -3248,6 +3394,11 @@ class FeatureView:
                 following entries:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`
+                * key `"stratify_by"` and value the name of a label column to split each of its values separately,
+                  so that every split has the same proportion of each label value. For example: `{"stratify_by": "fraud"}`
                 * key `spark` and value an object of type
                   [hsfs.core.job_configuration.JobConfiguration][hsfs.core.job_configuration.JobConfiguration]
                   to configure the Hopsworks Job used to compute the training dataset.
@@ -3410,6 +3561,9 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
             event_time: whether to include event time feature or not.  Defaults to `False`, no event time feature.
@@ -3490,6 +3644,9 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
             event_time: whether to include event time feature or not.  Defaults to `False`, no event time feature.
@@ -3572,6 +3729,9 @@ class FeatureView:
                 For python engine:
                 * key `"arrow_flight_config"` to pass a dictionary of arrow flight configurations.
                   For example: `{"arrow_flight_config": {"timeout": 900}}`
+                * key `"local_cache"` to cache the result in a local on-disk cache, which is reused until one of the
+                  read feature groups has a new commit. Either `True` or a dictionary with the keys `"path"` and `"max_size_bytes"`.
+                  For example: `{"local_cache": {"max_size_bytes": 50 * 1024**3}}`
             primary_key: whether to include primary key features or not.  Defaults to `False`, no primary key
                 features.
             event_time: whether to include event time feature or not.  Defaults to `False`, no event time feature.
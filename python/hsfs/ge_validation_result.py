@@ -29,14 +29,9 @@ import dateutil
 import humps
 from hopsworks_apigen import public
 from hsfs import util
-from hsfs.core.constants import HAS_GREAT_EXPECTATIONS
 from hsfs.decorators import _uses_great_expectations
 
 
-if HAS_GREAT_EXPECTATIONS:
-    import great_expectations
-
-
 def _normalize_expectation_config_to_legacy_shape(
     expectation_config: dict[str, Any] | str | None,
 ) -> dict[str, Any] | str | None:
@@ -138,6 +133,8 @@ class ValidationResult:
         Returns:
             The validation result as a Great Expectations object.
         """
+        import great_expectations
+
         return great_expectations.core.ExpectationValidationResult(
             success=self.success,
             exception_info=self.exception_info,
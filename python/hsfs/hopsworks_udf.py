@@ -721,31 +721,46 @@ class HopsworksUdf:
             ind for ind, ele in enumerate(self.return_types) if ele == "timestamp"
         ]
 
-        # Function that converts the timestamp to localized timezone
-        convert_timstamp_function = (
-            "def convert_timezone(date_time_obj : datetime):\n"
-            "   from datetime import datetime, timezone\n"
-            "   import tzlocal\n"
-            "   current_timezone = tzlocal.get_localzone()\n"
-            "   if date_time_obj and isinstance(date_time_obj, datetime):\n"
+        # Function that converts the timestamp to localized timezone. The local
+        # timezone is resolved on the first call of each process rather than when
+        # the wrapper is compiled, as spark runs the wrapper on executors whose
+        # timezone can differ from the driver's.
+        convert_timestamp_function = (
+            "from datetime import datetime as _datetime, timezone as _timezone\n"
+            "import tzlocal as _tzlocal\n"
+            "_local_timezone = None\n"
+            "def _convert_timezone(date_time_obj):\n"
+            "   global _local_timezone\n"
+            "   if _local_timezone is None:\n"
+            "      _local_timezone = _tzlocal.get_localzone()\n"
+            "   if date_time_obj and isinstance(date_time_obj, _datetime):\n"
             "      if date_time_obj.tzinfo is None:\n"
             "      # if timestamp is timezone unaware, make sure it's localized to the system's timezone.\n"
             "      # otherwise, spark will implicitly convert it to the system's timezone.\n"
-            "         return date_time_obj.replace(tzinfo=current_timezone)\n"
+            "         return date_time_obj.replace(tzinfo=_local_timezone)\n"
             "      else:\n"
-            "         return date_time_obj.astimezone(timezone.utc).replace(tzinfo=current_timezone)\n"
+            "         return date_time_obj.astimezone(_timezone.utc).replace(tzinfo=_local_timezone)\n"
             "   else:\n"
             "      return None\n"
         )
 
-        # Start wrapper function generation
+        # Start wrapper function generation. The udf is defined once next to the
+        # wrapper and bound to it as a default argument, so that calling the
+        # wrapper neither redefines the udf nor looks it up by a name the udf
+        # itself could be shadowing.
         code = (
             self._module_imports
             + "\n"
-            + (convert_timstamp_function + "\n" if date_time_output_index else "\n")
-            + "def wrapper(*args):\n"
-            + f"   {self._formatted_function_source}\n"
-            + f"   transformed_features = {self.function_name}(*args)\n"
+            + (convert_timestamp_function + "\n" if date_time_output_index else "\n")
+            + f"{self._formatted_function_source}\n"
+            + f"def wrapper(*args, _udf={self.function_name}"
+            + (
+                ", _convert_timezone=_convert_timezone"
+                if date_time_output_index
+                else ""
+            )
+            + "):\n"
+            + "   transformed_features = _udf(*args)\n"
         )
         if len(self.return_types) > 1:
             # If date time columns are there convert make sure that they are localized.
@@ -753,7 +768,7 @@ class HopsworksUdf:
                 code += (
                     "   transformed_features = list(transformed_features)\n"
                     "   for index in _date_time_output_index:\n"
-                    "      transformed_features[index] = convert_timezone(transformed_features[index])\n"
+                    "      transformed_features[index] = _convert_timezone(transformed_features[index])\n"
                 )
             if rename_outputs:
                 # Use a dictionary to rename output to correct column names. This must be for the udf's to be executable in spark.
@@ -762,9 +777,7 @@ class HopsworksUdf:
                 code += "   return transformed_features"
         else:
             if date_time_output_index:
-                code += (
-                    "   transformed_features = convert_timezone(transformed_features)\n"
-                )
+                code += "   transformed_features = _convert_timezone(transformed_features)\n"
             code += "   return transformed_features"
 
         # Inject required parameter to scope
@@ -791,34 +804,39 @@ class HopsworksUdf:
             if ele == "timestamp"
         ]
 
-        # Function to make transformation function time safe. Defined as a string because it has to be dynamically injected into scope to be executed by spark
-        convert_timstamp_function = """def convert_timezone(date_time_col : pd.Series):
-        import tzlocal
-        current_timezone = tzlocal.get_localzone()
+        # Function to make transformation function time safe. Defined as a string because it has to be dynamically injected into scope to be executed by spark.
+        # The local timezone is resolved on the first call of each process, see _python_udf_wrapper.
+        convert_timstamp_function = """import tzlocal as _tzlocal
+_local_timezone = None
+def _convert_timezone(date_time_col):
+        global _local_timezone
+        if _local_timezone is None:
+            _local_timezone = str(_tzlocal.get_localzone())
         if date_time_col.dt.tz is None:
             # if timestamp is timezone unaware, make sure it's localized to the system's timezone.
             # otherwise, spark will implicitly convert it to the system's timezone.
-            return date_time_col.dt.tz_localize(str(current_timezone))
+            return date_time_col.dt.tz_localize(_local_timezone)
         else:
             # convert to utc, then localize to system's timezone
-            return date_time_col.dt.tz_convert('UTC').dt.tz_localize(None).dt.tz_localize(str(current_timezone))"""
+            return date_time_col.dt.tz_convert('UTC').dt.tz_localize(None).dt.tz_localize(_local_timezone)"""
 
-        # Defining wrapper function that renames the column names to specific names
+        # Defining wrapper function that renames the column names to specific names.
+        # As in _python_udf_wrapper, the udf is defined once and bound to the wrapper.
         if len(self.return_types) > 1:
             code = (
                 self._module_imports
                 + "\n"
                 + f"""import pandas as pd
 {convert_timstamp_function}
-def renaming_wrapper(*args):
-    {self._formatted_function_source}
-    df = {self.function_name}(*args)
+{self._formatted_function_source}
+def renaming_wrapper(*args, _udf={self.function_name}, _convert_timezone=_convert_timezone):
+    df = _udf(*args)
     if isinstance(df, tuple):
         df = pd.concat(df, axis=1)
     df.columns = _output_col_names
     for col in _date_time_output_columns:
         if pd.api.types.is_datetime64_any_dtype(df[col]):
-            df[col] = convert_timezone(df[col])
+            df[col] = _convert_timezone(df[col])
     return df"""
             )
         else:
@@ -827,16 +845,16 @@ def renaming_wrapper(*args):
                 + "\n"
                 + f"""import pandas as pd
 {convert_timstamp_function}
-def renaming_wrapper(*args):
-    {self._formatted_function_source}
-    df = {self.function_name}(*args)
+{self._formatted_function_source}
+def renaming_wrapper(*args, _udf={self.function_name}, _convert_timezone=_convert_timezone):
+    df = _udf(*args)
     # If the output is a dataframe, then it should be a single column dataframe, so we can squeeze it to a series.
     df = df.squeeze(axis=1) if isinstance(df, pd.DataFrame) else df
     df = df.rename(_output_col_names[0])
     if _date_time_output_columns:
         # Set correct type is column is not of datetime type
         if pd.api.types.is_datetime64_any_dtype(df):
-            df = convert_timezone(df)
+            df = _convert_timezone(df)
     return df"""
             )
 
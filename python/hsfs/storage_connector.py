@@ -1168,7 +1168,9 @@ class S3Connector(StorageConnector):
         Parameters:
             query: Not relevant for S3 connectors.
             data_format: The file format of the files to be read, e.g. `csv`, `parquet`.
-            options: Any additional key/value options to be passed to the S3 connector.
+            options:
+                Any additional key/value options to be passed to the S3 connector.
+                When reading `parquet` files with the Python engine, `columns` selects the columns to read and `filters` the rows, as a list of `(column, op, value)` tuples or a pyarrow expression; row groups which cannot match the filters are not downloaded.
             path: Path within the bucket to be read.
             dataframe_type:
                 The type of the returned dataframe.
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import TYPE_CHECKING, Any
 
 from hopsworks_common.util import (
@@ -61,6 +62,8 @@ from hsfs.core import feature_group_api
 
 
 if TYPE_CHECKING:
+    from types import ModuleType
+
     from hsfs.constructor import filter, serving_prepared_statement
 
 
@@ -255,6 +258,19 @@ def _build_serving_keys_from_prepared_statements(
     return serving_keys
 
 
+def _loaded_great_expectations() -> ModuleType | None:
+    """Return the `great_expectations` module if it has already been imported.
+
+    Great Expectations takes seconds to import, so the SDK imports it only where it
+    is needed. Objects of its types cannot exist before it is imported, which lets
+    `isinstance` checks against them skip the import.
+
+    Returns:
+        The `great_expectations` module, or `None` if it has not been imported.
+    """
+    return sys.modules.get("great_expectations")
+
+
 __all__ = [
     "FEATURE_STORE_NAME_SUFFIX",
     "VALID_EMBEDDING_TYPE",
@@ -296,4 +312,5 @@ __all__ = [
     "_parse_features",
     "_build_time_filter",
     "_build_serving_keys_from_prepared_statements",
+    "_loaded_great_expectations",
 ]
@@ -26,7 +26,7 @@ if TYPE_CHECKING:
 
 import humps
 from hsfs import util
-from hsfs.core.constants import GE_MAJOR, HAS_GREAT_EXPECTATIONS
+from hsfs.core.constants import GE_MAJOR
 from hsfs.decorators import _uses_great_expectations
 from hsfs.ge_validation_result import (
     ValidationResult,
@@ -34,10 +34,6 @@ from hsfs.ge_validation_result import (
 )
 
 
-if HAS_GREAT_EXPECTATIONS:
-    import great_expectations
-
-
 @public
 class ValidationReport:
     """Metadata object representing a validation report generated by Great Expectations in the Feature Store."""
@@ -133,6 +129,8 @@ class ValidationReport:
         Returns:
             The validation report in `great_expectations` format.
         """
+        import great_expectations
+
         if GE_MAJOR == 1:
             # GE 1.x renamed evaluation_parameters to suite_parameters and now
             # requires suite_name. The Hopsworks ValidationReport has no suite name,
@@ -188,15 +186,16 @@ class ValidationReport:
             | great_expectations.core.expectation_validation_result.ExpectationValidationResult
         ],
     ) -> None:
+        ge = util._loaded_great_expectations()
         if len(results) == 0:
             self._results = []
         elif isinstance(results[0], ValidationResult):
             self._results = results
         elif isinstance(results[0], dict):
             self._results = [ValidationResult(**result) for result in results]
-        elif isinstance(
+        elif ge is not None and isinstance(
             results[0],
-            great_expectations.core.expectation_validation_result.ExpectationValidationResult,
+            ge.core.expectation_validation_result.ExpectationValidationResult,
         ):
             # GE 1.x produces expectation_config dicts shaped {type, severity, ...};
             # the wire format and the frontend expect the legacy {expectation_type, ...} shape.
@@ -16,7 +16,7 @@
 from __future__ import annotations
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from hopsworks_common import tag
 from hsml import (
@@ -35,6 +35,10 @@ from hsml.client.istio.utils.infer_type import (
 from hsml.constants import INFERENCE_ENDPOINTS as IE
 
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+
 class ServingApi:
     def __init__(self):
         pass
@@ -422,10 +426,52 @@ class ServingApi:
 
     def _create_grpc_channel(self, deployment_instance):
         _client = client.istio._get_instance()
-        path_prefix = (
-            f"/v1/{deployment_instance.project_namespace}/{deployment_instance.name}"
+        return _client._create_grpc_channel(
+            self._get_grpc_path_prefix(deployment_instance)
+        )
+
+    def _get_grpc_path_prefix(self, deployment_instance) -> str:
+        return f"/v1/{deployment_instance.project_namespace}/{deployment_instance.name}"
+
+    async def _send_inference_request_async(
+        self, deployment_instance, data: list[InferInput]
+    ) -> list[InferOutput]:
+        request = InferRequest(
+            infer_inputs=data,
+            model_name=deployment_instance.name,
+        )
+        infer_response = await self._get_async_grpc_client(deployment_instance).infer(
+            infer_request=request
         )
-        return _client._create_grpc_channel(path_prefix)
+        return infer_response.outputs
+
+    async def _stream_inference_requests(
+        self, deployment_instance, payloads: AsyncIterable[list[InferInput]]
+    ) -> AsyncIterator[tuple[int, list[InferOutput]]]:
+        async def requests():
+            index = 0
+            async for data in payloads:
+                yield InferRequest(
+                    infer_inputs=data,
+                    model_name=deployment_instance.name,
+                    request_id=str(index),
+                )
+                index += 1
+
+        async_client = self._get_async_grpc_client(deployment_instance)
+        async for infer_response in async_client.stream_infer(requests()):
+            yield int(infer_response.id), infer_response.outputs
+
+    def _get_async_grpc_client(self, deployment_instance):
+        # Like the gRPC channel, the async client is lazily initialized, reused
+        # in all following calls on the same deployment object and freed when
+        # calling deployment.stop()
+        if deployment_instance._async_grpc_client is None:
+            _client = client.istio._get_instance()
+            deployment_instance._async_grpc_client = _client._create_async_grpc_client(
+                self._get_grpc_path_prefix(deployment_instance)
+            )
+        return deployment_instance._async_grpc_client
 
     def _is_kserve_installed(self) -> bool:
         """Check if kserve is installed.
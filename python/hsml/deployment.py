@@ -26,10 +26,10 @@ from hsml.engine import serving_engine
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 
     from hsfs.core.feature_monitoring_config import FeatureMonitoringConfig
-    from hsml.client.istio.utils.infer_type import InferInput
+    from hsml.client.istio.utils.infer_type import InferInput, InferOutput
     from hsml.deployment_tracing_config import DeploymentTracingConfig
     from hsml.inference_batcher import InferenceBatcher
     from hsml.inference_logger import InferenceLogger
@@ -75,6 +75,7 @@ class Deployment:
         self._serving_engine = serving_engine.ServingEngine()
         self._model_api = model_api.ModelApi()
         self._grpc_channel = None
+        self._async_grpc_client = None
         self._model_registry_id = None
 
     @public
@@ -345,6 +346,86 @@ class Deployment:
         """
         return self._serving_engine._predict(self, data, inputs)
 
+    @public
+    async def predict_async(
+        self,
+        data: list[InferInput] = None,
+        inputs: list | dict = None,
+    ) -> list[InferOutput]:
+        """Send an inference request to the deployment without blocking the event loop.
+
+        Only deployments with gRPC protocol enabled are supported.
+        The requests of a deployment share its connections, so that many of them can be in flight at once.
+
+        One of data or inputs parameters must be set.
+
+        Parameters:
+            data: Model inputs as `InferInput` objects.
+            inputs: Model inputs used in the inference request.
+
+        Returns:
+            Inference outputs.
+
+        Raises:
+            hopsworks.client.exceptions.ModelServingException: If the deployment does not use the gRPC protocol or the payload is invalid.
+            grpc.aio.AioRpcError: If the inference request fails.
+
+        Examples:
+            ```python
+            import asyncio
+
+            my_deployment = ms.get_deployment("my_grpc_deployment")
+
+            async def predict_all(batches):
+                return await asyncio.gather(
+                    *(my_deployment.predict_async(inputs=batch) for batch in batches)
+                )
+
+            predictions = asyncio.run(predict_all(batches))
+            ```
+        """
+        return await self._serving_engine._predict_async(self, data, inputs)
+
+    @public
+    def stream_predict(
+        self,
+        data: Iterable[list[InferInput]] | AsyncIterable[list[InferInput]] = None,
+        inputs: Iterable | AsyncIterable = None,
+    ) -> AsyncIterator[tuple[int, list[InferOutput]]]:
+        """Stream inference requests to the deployment over a single bidirectional gRPC stream.
+
+        Only deployments with gRPC protocol enabled are supported, and the model server has to implement the KServe v2 `ModelStreamInfer` method.
+        Requests are sent as they are produced, without waiting for the responses of the previous ones, and responses are yielded as they complete.
+
+        One of data or inputs parameters must be set.
+
+        Parameters:
+            data: The requests, each of them a list of `InferInput` objects.
+            inputs: The requests, each of them the model inputs of a request.
+
+        Returns:
+            An async iterator of the position of each request in the requests and its inference outputs, in the order the requests complete.
+
+        Raises:
+            hopsworks.client.exceptions.ModelServingException: If the deployment does not use the gRPC protocol or a payload is invalid.
+            hopsworks_common.client.istio.utils.infer_type.InferenceServerException: If the model server fails to process a request.
+            grpc.aio.AioRpcError: If the stream fails.
+
+        Examples:
+            ```python
+            my_deployment = ms.get_deployment("my_grpc_deployment")
+
+            async def predict_all(batches):
+                predictions = [None] * len(batches)
+                async for i, outputs in my_deployment.stream_predict(inputs=batches):
+                    predictions[i] = outputs
+                return predictions
+
+            predictions = asyncio.run(predict_all(batches))
+            ```
+        """
+        return self._serving_engine._stream_predict(self, data, inputs)
+
     @public
     def get_model(self):
         """Retrieve the metadata object for the model being used by this deployment."""
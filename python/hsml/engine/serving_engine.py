@@ -19,8 +19,11 @@ import os
 import tempfile
 import time
 import uuid
+from collections.abc import AsyncIterable
+from typing import TYPE_CHECKING
 
 from hopsworks_common.client.exceptions import ModelServingException, RestAPIError
+from hopsworks_common.client.istio.grpc.inference_client import _aiter
 from hopsworks_common.client.istio.utils.infer_type import InferInput
 from hopsworks_common.constants import (
     DEPLOYMENT,
@@ -37,6 +40,10 @@ from hsml.utils.local_paths import _resolve_serving_file
 from tqdm.auto import tqdm
 
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
 def _render_chunk(chunk) -> str:
     r"""Render a single log chunk's content with a trailing newline.
 
@@ -242,8 +249,9 @@ class ServingEngine:
                 update_progress,
             )
 
-        # free grpc channel
+        # free grpc channels
         deployment_instance._grpc_channel = None
+        deployment_instance._async_grpc_client = None
 
     def _check_status(self, deployment_instance, desired_status):
         state = deployment_instance.get_state()
@@ -883,6 +891,65 @@ class ServingEngine:
             )
             raise re
 
+    async def _predict_async(
+        self,
+        deployment_instance,
+        data: list[InferInput],
+        inputs: dict | list[dict],
+    ):
+        payload = self._build_async_inference_payload(deployment_instance, data, inputs)
+        return await self._serving_api._send_inference_request_async(
+            deployment_instance, payload
+        )
+
+    def _stream_predict(
+        self,
+        deployment_instance,
+        data: Iterable[list[InferInput]] | AsyncIterable[list[InferInput]],
+        inputs: Iterable | AsyncIterable,
+    ):
+        if data is not None and inputs is not None:
+            raise ModelServingException(
+                "Inference data and inputs parameters cannot be provided together."
+            )
+        if data is None and inputs is None:
+            raise ModelServingException(
+                "Either inference data or inputs parameter must be provided."
+            )
+        requests = data if data is not None else inputs
+
+        async def payloads():
+            # payloads are validated as they are produced, so that requests can be
+            # generated while the previous ones are in flight
+            items = (
+                requests if isinstance(requests, AsyncIterable) else _aiter(requests)
+            )
+            async for item in items:
+                yield self._build_async_inference_payload(
+                    deployment_instance,
+                    item if data is not None else None,
+                    item if inputs is not None else None,
+                )
+
+        return self._serving_api._stream_inference_requests(
+            deployment_instance, payloads()
+        )
+
+    def _build_async_inference_payload(
+        self,
+        deployment_instance,
+        data: list[InferInput],
+        inputs: dict | list[dict],
+    ) -> list[InferInput]:
+        if deployment_instance.api_protocol != IE.API_PROTOCOL_GRPC:
+            raise ModelServingException(
+                "Asynchronous inference requests are only supported by deployments with gRPC protocol enabled. Use the `predict` method instead."
+            )
+        self._validate_inference_payload(deployment_instance.api_protocol, data, inputs)
+        return self._build_inference_payload(
+            deployment_instance.api_protocol, data, inputs
+        )
+
     def _validate_inference_payload(
         self,
         api_protocol,
@@ -0,0 +1,174 @@
+# ruff: noqa
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Benchmark of delta-rs upserts into an unpartitioned feature group table.
+
+The script writes a local Delta table of ``--files`` files of ``--file-rows``
+rows each, with increasing integer primary keys, and times:
+
+- an upsert of ``--rows`` rows hitting a single file, merged with the plain
+  primary key predicate and with the key range predicate of
+  ``DeltaEngine._generate_merge_query``, reporting the files each merge scanned;
+- an upsert of ``--rows`` new keys, which ``DeltaEngine._write_delta_rs_dataset``
+  appends after checking the file statistics instead of merging;
+- an upsert of a whole file worth of rows, merged at once and in chunks of
+  ``--chunk-rows`` rows.
+
+Every measurement starts from a fresh copy of the table. Run it as::
+
+    uv run --project python python python/scripts/benchmark_delta_upsert.py --files 20
+
+No Hopsworks cluster is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+import pyarrow as pa
+from deltalake import DeltaTable, write_deltalake
+
+from hsfs.core import partition_transforms
+from hsfs.core.delta_engine import DeltaEngine
+
+
+def _table(start: int, rows: int, value: int) -> pa.Table:
+    return pa.table(
+        {
+            "id": pa.array(range(start, start + rows), pa.int64()),
+            "value": pa.array([value] * rows, pa.int64()),
+        }
+    )
+
+
+def _engine(location: str) -> DeltaEngine:
+    fg = mock.Mock()
+    fg.name, fg.version = "fg", 1
+    fg.primary_key, fg.event_time, fg.partition_key = ["id"], None, []
+    with mock.patch.object(DeltaEngine, "_setup_delta_rs"):
+        engine = DeltaEngine(1, "fs", fg, None, None)
+    engine._get_delta_rs_location = lambda: location
+    engine._get_delta_rs_storage_options = lambda: {}
+    engine._require_spark_for_clustered = lambda *args: None
+    engine._get_last_commit_metadata = lambda *args, **kwargs: None
+    return engine
+
+
+def _merge(location: str, dataset: pa.Table, predicate: str) -> dict:
+    return (
+        DeltaTable(location)
+        .merge(
+            source=dataset,
+            predicate=predicate,
+            source_alias="fg_1_updates",
+            target_alias="fg_1_source",
+        )
+        .when_matched_update_all()
+        .when_not_matched_insert_all()
+        .execute()
+    )
+
+
+def _time(name: str, template: Path, func, *args) -> None:
+    versions = DeltaTable(str(template)).version()
+    with tempfile.TemporaryDirectory() as tmp:
+        location = str(Path(tmp) / "table")
+        shutil.copytree(template, location)
+        start = time.perf_counter()
+        metrics = func(location, *args)
+        seconds = time.perf_counter() - start
+        history = DeltaTable(location).history()
+        operations = [
+            c["operation"] for c in reversed(history[: len(history) - versions - 1])
+        ]
+    files = ""
+    if isinstance(metrics, dict):
+        files = (
+            f"scanned {metrics.get('num_target_files_scanned')}, "
+            f"skipped {metrics.get('num_target_files_skipped_during_scan')}"
+        )
+    print(f"{name:<40} {seconds:>8.3f}s  {','.join(operations):<24} {files}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--file-rows", type=int, default=200_000)
+    parser.add_argument("--rows", type=int, default=1_000)
+    parser.add_argument("--chunk-rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    partition_transforms._require_writable = lambda *args: None
+    total = args.files * args.file_rows
+    with tempfile.TemporaryDirectory() as tmp:
+        template = Path(tmp) / "template"
+        for i in range(args.files):
+            write_deltalake(
+                str(template),
+                _table(i * args.file_rows, args.file_rows, 0),
+                mode="append",
+            )
+
+        engine = _engine(str(template))
+        updates = _table(total // 2, args.rows, 1)
+        plain = engine._generate_merge_query("fg_1_source", "fg_1_updates")
+        ranged = engine._generate_merge_query(
+            "fg_1_source",
+            "fg_1_updates",
+            key_ranges=engine._get_key_ranges(updates, ["id"]),
+        )
+        print(f"{'upsert':<40} {'time':>9}  {'commits':<24} files")
+        _time(
+            f"update {args.rows} rows, key predicate", template, _merge, updates, plain
+        )
+        _time(f"update {args.rows} rows, key range", template, _merge, updates, ranged)
+
+        inserts = _table(total, args.rows, 1)
+        _time(f"insert {args.rows} rows, merge", template, _merge, inserts, plain)
+        _time(
+            f"insert {args.rows} rows, stats append",
+            template,
+            lambda location, dataset: _engine(location)._write_delta_rs_dataset(
+                dataset
+            ),
+            inserts,
+        )
+
+        large = _table(total - args.file_rows // 2, args.file_rows, 1)
+        for name, chunk_rows in [
+            ("single merge", 0),
+            (f"chunks of {args.chunk_rows}", args.chunk_rows),
+        ]:
+            _time(
+                f"upsert {args.file_rows} rows, {name}",
+                template,
+                lambda location, dataset, chunk_rows: _engine(
+                    location
+                )._write_delta_rs_dataset(
+                    dataset, write_options={DeltaEngine.MERGE_CHUNK_ROWS: chunk_rows}
+                ),
+                large,
+                chunk_rows,
+            )
+
+
+if __name__ == "__main__":
+    main()
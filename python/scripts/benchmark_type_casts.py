@@ -0,0 +1,108 @@
+# ruff: noqa
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Per-type benchmark of the offline type casts in ``hopsworks_common.core.type_systems``.
+
+For every offline type that used to be cast element by element, the script builds
+a pandas and a polars column of ``--rows`` rows, in the representation the read
+and write paths receive them, and times the vectorized cast
+(``_cast_*_column_to_offline_type``) against the element-wise cast it falls back
+to (``_cast_*_column_elementwise``). Both results are compared, so a mismatch is
+reported next to the timings.
+
+Run it as::
+
+    uv run --project python python python/scripts/benchmark_type_casts.py --rows 1000000
+
+No Hopsworks cluster is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import hsfs  # noqa: F401, imported first to resolve the import cycle of type_systems
+from hopsworks_common.core import type_systems
+from hopsworks_common.core.constants import HAS_POLARS
+
+
+if HAS_POLARS:
+    import polars as pl
+
+
+def _columns(rows: int) -> dict[str, list]:
+    rng = np.random.default_rng(42)
+    ints = rng.integers(0, 1000, size=(rows, 3))
+    return {
+        "array<int>": [f"[{a}, {b}, {c}]" for a, b, c in ints],
+        "struct<label:string,index:int>": [
+            f'{{"label": "l{a}", "index": {b}}}' for a, b, _ in ints
+        ],
+        "boolean": ["True" if a % 2 else "False" for a in ints[:, 0]],
+        "string": ints[:, 0].tolist(),
+        "decimal(10,2)": [f"{a}.{b % 100:02d}" for a, b, _ in ints],
+    }
+
+
+def _time(func, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def _compare(name: str, vectorized, elementwise, column, offline_type: str) -> None:
+    vectorized_seconds, vectorized_result = _time(vectorized, column, offline_type)
+    elementwise_seconds, elementwise_result = _time(elementwise, column, offline_type)
+    same = vectorized_result.to_list() == elementwise_result.to_list()
+    print(
+        f"{name:<8} {offline_type:<32} {elementwise_seconds:>10.3f} "
+        f"{vectorized_seconds:>10.3f} {elementwise_seconds / vectorized_seconds:>8.1f}x"
+        f"{'' if same else '  (results differ)'}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'frame':<8} {'offline type':<32} {'elementwise':>10} {'vectorized':>10} {'speedup':>9}"
+    )
+    for offline_type, values in _columns(args.rows).items():
+        _compare(
+            "pandas",
+            type_systems._cast_pandas_column_to_offline_type,
+            type_systems._cast_pandas_column_elementwise,
+            pd.Series(values),
+            offline_type,
+        )
+        if HAS_POLARS:
+            _compare(
+                "polars",
+                type_systems._cast_polars_column_to_offline_type,
+                type_systems._cast_polars_column_elementwise,
+                pl.Series(values),
+                offline_type,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# ruff: noqa
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+"""Per-call overhead of the wrappers ``HopsworksUdf._python_udf_wrapper`` generates.
+
+Python UDFs are called once per row by the Python engine and once per request
+by online serving, so the work the generated wrapper does around the UDF is paid
+on every call. For a scalar, a multi-output and a timestamp-returning UDF the
+script times ``--calls`` calls of:
+
+- the UDF itself, as the lower bound;
+- a wrapper generated the way it was before the UDF was compiled once per
+  wrapper, which redefined the UDF and resolved the local timezone on every call;
+- the wrapper ``_python_udf_wrapper`` generates now.
+
+Run it as::
+
+    uv run --project python python python/scripts/benchmark_udf_wrappers.py --calls 200000
+
+No Hopsworks cluster is needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+
+from hsfs.hopsworks_udf import udf
+
+
+@udf(float, mode="python")
+def scale(value):
+    return value * 2.0
+
+
+@udf([float, float], mode="python")
+def split(value):
+    return value - 1.0, value + 1.0
+
+
+@udf(datetime, mode="python")
+def to_timestamp(value):
+    return datetime.fromtimestamp(value)
+
+
+_LEGACY_CONVERT_TIMEZONE = (
+    "def convert_timezone(date_time_obj : datetime):\n"
+    "   from datetime import datetime, timezone\n"
+    "   import tzlocal\n"
+    "   current_timezone = tzlocal.get_localzone()\n"
+    "   if date_time_obj and isinstance(date_time_obj, datetime):\n"
+    "      if date_time_obj.tzinfo is None:\n"
+    "         return date_time_obj.replace(tzinfo=current_timezone)\n"
+    "      else:\n"
+    "         return date_time_obj.astimezone(timezone.utc).replace(tzinfo=current_timezone)\n"
+    "   else:\n"
+    "      return None\n"
+)
+
+
+def _legacy_wrapper(hopsworks_udf):
+    """Generate the wrapper as it was generated before, without renaming outputs."""
+    timestamp = "timestamp" in hopsworks_udf.return_types
+    code = (
+        hopsworks_udf._module_imports
+        + "\n"
+        + (_LEGACY_CONVERT_TIMEZONE + "\n" if timestamp else "\n")
+        + "def wrapper(*args):\n"
+        + f"   {hopsworks_udf._formatted_function_source}\n"
+        + f"   transformed_features = {hopsworks_udf.function_name}(*args)\n"
+    )
+    if timestamp:
+        code += "   transformed_features = convert_timezone(transformed_features)\n"
+    code += "   return transformed_features"
+    scope = hopsworks_udf._prepare_transformation_function_scope()
+    exec(code, scope)
+    return scope["wrapper"]
+
+
+def _bare(hopsworks_udf):
+    """Compile the UDF alone."""
+    scope = hopsworks_udf._prepare_transformation_function_scope()
+    exec(
+        hopsworks_udf._module_imports + "\n" + hopsworks_udf._formatted_function_source,
+        scope,
+    )
+    return scope[hopsworks_udf.function_name]
+
+
+def _per_call(func, calls: int) -> float:
+    start = time.perf_counter()
+    for i in range(calls):
+        func(float(i))
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'udf':<14} {'bare':>9} {'before':>9} {'after':>9} {'speedup':>8}  (ns/call)"
+    )
+    for hopsworks_udf in [scale, split, to_timestamp]:
+        hopsworks_udf.output_column_names = [
+            f"{hopsworks_udf.function_name}_{i}"
+            for i in range(len(hopsworks_udf.return_types))
+        ]
+        wrapper, _ = hopsworks_udf._python_udf_wrapper(rename_outputs=False)
+        bare = _per_call(_bare(hopsworks_udf), args.calls)
+        before = _per_call(_legacy_wrapper(hopsworks_udf), args.calls)
+        after = _per_call(wrapper, args.calls)
+        print(
+            f"{hopsworks_udf.function_name:<14} {bare:>9.0f} {before:>9.0f} "
+            f"{after:>9.0f} {before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
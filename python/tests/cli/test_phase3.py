@@ -108,6 +108,31 @@ def test_job_run_with_wait(mock_project):
     )
 
 
+def test_job_wait_fails_on_failed_execution(mock_project):
+    api = mock.MagicMock()
+    executions = {}
+    for name, success in (("etl", True), ("train", False)):
+        execution = mock.MagicMock()
+        execution.id, execution.job_name, execution.success = 1, name, success
+        executions[name] = execution
+    api.get_job.side_effect = lambda name: mock.MagicMock(
+        get_executions=mock.MagicMock(return_value=[executions[name]])
+    )
+    mock_project.get_job_api.return_value = api
+    with mock.patch(
+        "hopsworks_common.execution_waiter.as_completed",
+        return_value=iter(executions.values()),
+    ) as as_completed:
+        result = CliRunner().invoke(
+            cli, ["job", "wait", "etl", "train", "--timeout", "60"]
+        )
+    assert result.exit_code == 1, result.output
+    assert "1 execution(s) failed" in result.output
+    as_completed.assert_called_once_with(
+        [executions["etl"], executions["train"]], timeout=60.0
+    )
+
+
 def test_job_schedule(mock_project):
     api = mock.MagicMock()
     job = mock.MagicMock()
@@ -0,0 +1,254 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import asyncio
+
+import grpc
+import pytest
+from hopsworks_common.client.istio.grpc.inference_client import (
+    AsyncGRPCInferenceServerClient,
+)
+from hopsworks_common.client.istio.grpc.proto import (
+    grpc_predict_v2_pb2,
+    grpc_predict_v2_pb2_grpc,
+)
+from hopsworks_common.client.istio.utils.infer_type import (
+    InferenceServerException,
+    InferInput,
+    InferRequest,
+)
+
+
+PATH_PREFIX = "/v1/myproject/mymodel"
+API_KEY = "secret"
+
+
+class _Servicer(grpc_predict_v2_pb2_grpc.GRPCInferenceServiceServicer):
+    """Doubles the FP32 input, failing the requests of the model named `fail`."""
+
+    def __init__(self):
+        self.peers = set()
+
+    async def _check_auth(self, context):
+        if ("authorization", "ApiKey " + API_KEY) not in context.invocation_metadata():
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Invalid API key")
+        self.peers.add(context.peer())
+
+    @staticmethod
+    def _response(request):
+        return grpc_predict_v2_pb2.ModelInferResponse(
+            model_name=request.model_name,
+            id=request.id,
+            outputs=[
+                {
+                    "name": "output",
+                    "datatype": "FP32",
+                    "shape": [len(request.inputs[0].contents.fp32_contents)],
+                    "contents": {
+                        "fp32_contents": [
+                            2 * v for v in request.inputs[0].contents.fp32_contents
+                        ]
+                    },
+                }
+            ],
+        )
+
+    async def ModelInfer(self, request, context):
+        await self._check_auth(context)
+        return self._response(request)
+
+    async def ModelStreamInfer(self, request_iterator, context):
+        await self._check_auth(context)
+        requests = [request async for request in request_iterator]
+        # respond in the reverse order, as a server completing them out of order
+        for request in reversed(requests):
+            if request.model_name == "fail":
+                yield grpc_predict_v2_pb2.ModelStreamInferResponse(
+                    error_message=f"request {request.id} failed"
+                )
+            else:
+                yield grpc_predict_v2_pb2.ModelStreamInferResponse(
+                    infer_response=self._response(request)
+                )
+
+
+class _PrefixedHandler(grpc.GenericRpcHandler):
+    """Serve the methods under the path prefix, as the Istio gateway routes them."""
+
+    def __init__(self, handler):
+        self._handler = handler
+
+    def service(self, handler_call_details):
+        if not handler_call_details.method.startswith(PATH_PREFIX):
+            return None
+        return self._handler.service(
+            _HandlerCallDetails(handler_call_details.method[len(PATH_PREFIX) :])
+        )
+
+
+class _HandlerCallDetails(grpc.HandlerCallDetails):
+    def __init__(self, method):
+        self.method = method
+        self.invocation_metadata = ()
+
+
+class _HandlerRecorder:
+    def add_generic_rpc_handlers(self, handlers):
+        self.handlers = handlers
+
+
+def _serve(test, servicer=None, **client_kwargs):
+    """Run `test(client, servicer)` against an in-process inference server."""
+    servicer = servicer or _Servicer()
+
+    async def main():
+        recorder = _HandlerRecorder()
+        grpc_predict_v2_pb2_grpc.add_GRPCInferenceServiceServicer_to_server(
+            servicer, recorder
+        )
+        server = grpc.aio.server()
+        server.add_generic_rpc_handlers(
+            tuple(_PrefixedHandler(h) for h in recorder.handlers)
+        )
+        port = server.add_insecure_port("localhost:0")
+        await server.start()
+        client = AsyncGRPCInferenceServerClient(
+            f"localhost:{port}", API_KEY, path_prefix=PATH_PREFIX, **client_kwargs
+        )
+        try:
+            async with client:
+                return await test(client, servicer)
+        finally:
+            await server.stop(None)
+
+    return asyncio.run(main())
+
+
+def _request(value, model_name="mymodel", request_id=None):
+    return InferRequest(
+        model_name=model_name,
+        request_id=request_id,
+        infer_inputs=[
+            InferInput(name="input", shape=[1], datatype="FP32", data=[value])
+        ],
+    )
+
+
+class TestAsyncGRPCInferenceServerClient:
+    def test_infer(self):
+        # Arrange
+        async def test(client, servicer):
+            return await client.infer(_request(1.5, request_id="a"))
+
+        # Act
+        response = _serve(test)
+
+        # Assert
+        assert response.id == "a"
+        assert response.outputs[0].data == [3.0]
+
+    def test_infer_concurrent_requests_share_the_channels(self):
+        # Arrange
+        async def test(client, servicer):
+            responses = await asyncio.gather(
+                *(client.infer(_request(float(i))) for i in range(20))
+            )
+            return responses, len(servicer.peers)
+
+        # Act
+        responses, num_peers = _serve(test, num_channels=2)
+
+        # Assert
+        assert [r.outputs[0].data for r in responses] == [[2.0 * i] for i in range(20)]
+        assert num_peers == 2
+
+    def test_infer_wrong_api_key(self):
+        # Arrange
+        async def test(client, servicer):
+            client._serving_api_key = "wrong"
+            await client.infer(_request(1.0))
+
+        # Act & Assert
+        with pytest.raises(grpc.aio.AioRpcError) as e:
+            _serve(test)
+        assert e.value.code() == grpc.StatusCode.UNAUTHENTICATED
+
+    def test_stream_infer(self):
+        # Arrange
+        async def test(client, servicer):
+            return [
+                response
+                async for response in client.stream_infer(
+                    _request(float(i)) for i in range(5)
+                )
+            ]
+
+        # Act
+        responses = _serve(test)
+
+        # Assert
+        assert [r.id for r in responses] == ["4", "3", "2", "1", "0"]
+        assert [r.outputs[0].data for r in responses] == [
+            [2.0 * i] for i in reversed(range(5))
+        ]
+
+    def test_stream_infer_async_iterable(self):
+        # Arrange
+        async def requests():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield _request(float(i), request_id=f"r{i}")
+
+        async def test(client, servicer):
+            return [response.id async for response in client.stream_infer(requests())]
+
+        # Act
+        ids = _serve(test)
+
+        # Assert
+        assert sorted(ids) == ["r0", "r1", "r2"]
+
+    def test_stream_infer_error_message(self):
+        # Arrange
+        async def test(client, servicer):
+            async for _ in client.stream_infer([_request(1.0, model_name="fail")]):
+                pass
+
+        # Act & Assert
+        with pytest.raises(InferenceServerException, match="request 0 failed"):
+            _serve(test)
+
+    def test_pool_per_event_loop(self):
+        # Arrange
+        client = AsyncGRPCInferenceServerClient("localhost:1", API_KEY)
+
+        async def get_pool():
+            return client._get_pool(), client._get_pool()
+
+        # Act
+        first, first_again = asyncio.run(get_pool())
+        second, _ = asyncio.run(get_pool())
+
+        # Assert
+        assert first is first_again
+        assert second is not first
+        # the pool of the closed event loop was dropped
+        assert list(client._pools.values()) == [second]
+
+    def test_num_channels_validation(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            AsyncGRPCInferenceServerClient("localhost:1", API_KEY, num_channels=0)
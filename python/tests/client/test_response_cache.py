@@ -0,0 +1,273 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+
+import pytest
+import requests
+from hopsworks_common.client import response_cache
+from hopsworks_common.client.base import Client
+from hopsworks_common.client.exceptions import RestAPIError
+from hopsworks_common.client.response_cache import ResponseCache
+
+
+FG_PATH = ["project", 119, "featurestores", 67, "featuregroups", 13]
+
+
+def _response(status_code, body=None, etag=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"" if body is None else json.dumps(body).encode()
+    if etag is not None:
+        response.headers["ETag"] = etag
+    return response
+
+
+def _client(cache):
+    client = Client()
+    client._connected = True
+    client._base_url = "https://hopsworks.ai:443"
+    client._auth = None
+    client._verify = False
+    client._session = requests.session()
+    client._response_cache = cache
+    return client
+
+
+class TestResponseCache:
+    @pytest.mark.parametrize(
+        ("path", "ttl"),
+        [
+            (FG_PATH[:-1], 60),
+            (FG_PATH, 60),
+            (FG_PATH + ["commits"], None),
+            (FG_PATH + ["statistics"], None),
+            (
+                ["project", 1, "featurestores", 2, "featureview", "fv", "version", 1],
+                60,
+            ),
+            (
+                ["project", 1, "featurestores", 2, "featureview", "fv", "version", 1]
+                + ["preparedstatement"],
+                60,
+            ),
+            (
+                ["project", 1, "featurestores", 2, "featureview", "fv", "version", 1]
+                + ["trainingdatasets", "version", 3],
+                60,
+            ),
+            (
+                ["project", 1, "featurestores", 2, "featureview", "fv", "version", 1]
+                + ["batch"],
+                None,
+            ),
+            (["project", 1, "featurestores", 2, "storageconnectors", "s3"], 30),
+            (
+                [
+                    "project",
+                    1,
+                    "featurestores",
+                    2,
+                    "storageconnectors",
+                    "uc",
+                    "uc_bearer",
+                ],
+                None,
+            ),
+            (["project", 1, "featurestores", 2, "transformationfunctions"], 300),
+            (["project", 1, "jobs", "etl"], None),
+            (["variables", "versions"], None),
+        ],
+    )
+    def test_ttl(self, path, ttl):
+        # Act & Assert
+        assert ResponseCache()._ttl(path) == ttl
+
+    def test_ttl_disabled_type(self):
+        # Arrange
+        cache = ResponseCache(ttls={"featuregroups": 0})
+
+        # Act & Assert
+        assert cache._ttl(FG_PATH) is None
+
+    def test_key_ignores_query_order(self):
+        # Arrange
+        cache = ResponseCache()
+
+        # Act & Assert
+        assert cache._key(FG_PATH, "url", {"a": 1, "b": [2, 3]}, None) == cache._key(
+            FG_PATH, "url", {"b": [2, 3], "a": 1}, None
+        )
+        assert cache._key(FG_PATH, "url", {"a": 1}, None) != cache._key(
+            FG_PATH, "url", {"a": 2}, None
+        )
+
+    def test_put_evicts_least_recently_used(self):
+        # Arrange
+        cache = ResponseCache(max_bytes=10)
+        cache._put(("a",), b"1234", None, 60)
+        cache._put(("b",), b"1234", None, 60)
+        cache._get(("a",))
+
+        # Act
+        cache._put(("c",), b"1234", None, 60)
+        cache._put(("d",), b"12345678901", None, 60)
+
+        # Assert
+        assert list(cache._entries) == [("a",), ("c",)]
+        assert cache._size == 8
+
+    def test_invalidate_resource_type_of_feature_store(self):
+        # Arrange
+        cache = ResponseCache()
+        fv_path = ["project", 119, "featurestores", 67, "featureview", "fv"]
+        other_fs_path = ["project", 119, "featurestores", 68, "featuregroups", 13]
+        for path in [FG_PATH, FG_PATH[:-1], fv_path, other_fs_path]:
+            cache._put(cache._key(path, str(path), None, None), b"{}", None, 60)
+
+        # Act
+        cache.invalidate(FG_PATH + ["clear"])
+
+        # Assert
+        assert [key[1] for key in cache._entries] == [str(fv_path), str(other_fs_path)]
+        cache.invalidate()
+        assert not cache._entries
+        assert cache._size == 0
+
+    @pytest.mark.parametrize(
+        ("value", "enabled"),
+        [
+            (None, False),
+            ("false", False),
+            ("true", True),
+            ('{"max_bytes": 100, "ttls": {"featureview": 5}}', True),
+            ("not json", False),
+        ],
+    )
+    def test_from_environ(self, monkeypatch, value, enabled):
+        # Arrange
+        if value is None:
+            monkeypatch.delenv(response_cache.ENV_VAR, raising=False)
+        else:
+            monkeypatch.setenv(response_cache.ENV_VAR, value)
+
+        # Act
+        cache = response_cache._from_environ()
+
+        # Assert
+        assert (cache is not None) == enabled
+        if value and value.startswith("{"):
+            assert cache._max_bytes == 100
+            assert cache._ttls["featureview"] == 5
+            assert cache._ttls["featuregroups"] == 60
+
+
+class TestSendRequestResponseCache:
+    def test_fresh_response_is_served_from_cache(self, mocker):
+        # Arrange
+        client = _client(ResponseCache())
+        send = mocker.patch(
+            "requests.sessions.Session.send",
+            return_value=_response(200, {"id": 13}, etag='"v1"'),
+        )
+
+        # Act
+        first = client._send_request("GET", FG_PATH)
+        first["id"] = 0
+        second = client._send_request("GET", FG_PATH)
+
+        # Assert
+        assert second == {"id": 13}
+        assert send.call_count == 1
+
+    def test_expired_response_is_revalidated(self, mocker):
+        # Arrange
+        client = _client(ResponseCache(ttls={"featuregroups": 1e-9}))
+        send = mocker.patch(
+            "requests.sessions.Session.send",
+            side_effect=[_response(200, {"id": 13}, etag='"v1"'), _response(304)],
+        )
+
+        # Act
+        client._send_request("GET", FG_PATH)
+        result = client._send_request("GET", FG_PATH)
+
+        # Assert
+        assert result == {"id": 13}
+        assert send.call_count == 2
+        assert "If-None-Match" not in send.call_args_list[0].args[0].headers
+        assert send.call_args_list[1].args[0].headers["If-None-Match"] == '"v1"'
+
+    def test_write_invalidates_cached_responses(self, mocker):
+        # Arrange
+        client = _client(ResponseCache())
+        send = mocker.patch(
+            "requests.sessions.Session.send",
+            side_effect=[
+                _response(200, {"id": 13, "description": "old"}),
+                _response(500, {}),
+                _response(200, {"id": 13, "description": "new"}),
+            ],
+        )
+        client._send_request("GET", FG_PATH)
+
+        # Act
+        with pytest.raises(RestAPIError):
+            client._send_request("PUT", FG_PATH, data="{}")
+        result = client._send_request("GET", FG_PATH)
+
+        # Assert
+        assert result["description"] == "new"
+        assert send.call_count == 3
+
+    def test_errors_and_other_paths_are_not_cached(self, mocker):
+        # Arrange
+        client = _client(ResponseCache())
+        send = mocker.patch(
+            "requests.sessions.Session.send",
+            side_effect=[
+                _response(404, {}),
+                _response(200, {"id": 13}),
+                _response(200, {"items": []}),
+                _response(200, {"items": []}),
+            ],
+        )
+        commits_path = FG_PATH + ["commits"]
+
+        # Act
+        with pytest.raises(RestAPIError):
+            client._send_request("GET", FG_PATH)
+        client._send_request("GET", FG_PATH)
+        client._send_request("GET", commits_path)
+        client._send_request("GET", commits_path)
+
+        # Assert
+        assert send.call_count == 4
+
+    def test_disabled_by_default(self, mocker):
+        # Arrange
+        client = _client(None)
+        del client._response_cache
+        send = mocker.patch(
+            "requests.sessions.Session.send", return_value=_response(200, {"id": 13})
+        )
+
+        # Act
+        client._send_request("GET", FG_PATH)
+        client._send_request("GET", FG_PATH)
+
+        # Assert
+        assert send.call_count == 2
@@ -913,6 +913,69 @@ class TestQueryRead:
             with pytest.raises(FeatureStoreException, match="no event_time column"):
                 filtered_q.read(start_time="2024-01-01")
 
+    def _time_travel_fg(self, time_travel_format="DELTA"):
+        return feature_group.FeatureGroup(
+            name="test_time_travel",
+            version=1,
+            featurestore_id=99,
+            primary_key=["id"],
+            partition_key=[],
+            features=[
+                feature.Feature("id", feature_group_id=13, hudi_precombine_key=True),
+                feature.Feature("value", feature_group_id=13),
+            ],
+            id=13,
+            stream=False,
+            time_travel_format=time_travel_format,
+        )
+
+    def test_read_python_time_travel(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        mock_engine = mocker.patch("hsfs.engine._get_instance").return_value
+        mock_engine._is_flyingduck_query_supported.return_value = False
+        fg = self._time_travel_fg()
+        q = fg.select_all().as_of("2022-01-02", exclude_until="2022-01-01")
+
+        # Act
+        result = q.read(dataframe_type="polars")
+
+        # Assert
+        assert result is mock_engine._read_time_travel.return_value
+        mock_engine._read_time_travel.assert_called_once_with(q, "polars", None)
+        mock_engine._sql.assert_not_called()
+
+    def test_is_python_time_travel_read(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        mock_engine = mocker.patch("hsfs.engine._get_instance").return_value
+        mock_engine._is_flyingduck_query_supported.return_value = False
+        fg = self._time_travel_fg()
+
+        # Act & Assert
+        assert fg.select_all().as_of("2022-01-01")._is_python_time_travel_read({})
+        assert not fg.select_all()._is_python_time_travel_read({})
+        assert (
+            not fg.select_all()
+            .filter(fg.value > 1)
+            .as_of("2022-01-01")
+            ._is_python_time_travel_read({})
+        )
+        assert (
+            not fg.select_all()
+            .join(TestQuery.fg2.select_all())
+            .as_of("2022-01-01")
+            ._is_python_time_travel_read({})
+        )
+        assert (
+            not self._time_travel_fg("HUDI")
+            .select_all()
+            .as_of("2022-01-01")
+            ._is_python_time_travel_read({})
+        )
+        mock_engine._is_flyingduck_query_supported.return_value = True
+        assert not fg.select_all().as_of("2022-01-01")._is_python_time_travel_read({})
+
     def test_build_feature_lookup_left_features_only(self, mocker, backend_fixtures):
         mocker.patch("hsfs.engine._get_type", return_value="python")
 
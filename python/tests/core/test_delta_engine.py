@@ -15,6 +15,7 @@
 #
 import os
 import sys
+import time
 import types
 from datetime import date
 from unittest import mock
@@ -1825,7 +1826,7 @@ class TestDeltaEngine:
             mock_history_data[1], mock_history_data[0]
         )
 
-    def test_get_last_commit_metadata_deltars(self, mocker):
+    def test_get_last_commit_metadata_deltars(self, mocker, monkeypatch):
         # Arrange
         mock_history_data = [
             {"version": 1, "operation": "WRITE", "timestamp": "2024-01-01T00:00:00Z"},
@@ -1839,7 +1840,7 @@ class TestDeltaEngine:
 
         # Fake the deltalake module
         fake_deltalake = types.SimpleNamespace(DeltaTable=mocker.MagicMock())
-        sys.modules["deltalake"] = fake_deltalake
+        monkeypatch.setitem(sys.modules, "deltalake", fake_deltalake)
 
         mock_delta_rs_table = mocker.MagicMock()
         mock_delta_rs_table.history.return_value = mock_history_data
@@ -1860,13 +1861,13 @@ class TestDeltaEngine:
             mock_history_data[1], mock_history_data[0]
         )
 
-    def test_get_last_commit_metadata_empty_history(self, mocker):
+    def test_get_last_commit_metadata_empty_history(self, mocker, monkeypatch):
         # Arrange
         mock_history_data = []
 
         # Fake the deltalake module
         fake_deltalake = types.SimpleNamespace(DeltaTable=mocker.MagicMock())
-        sys.modules["deltalake"] = fake_deltalake
+        monkeypatch.setitem(sys.modules, "deltalake", fake_deltalake)
 
         mock_delta_rs_table = mocker.MagicMock()
         mock_delta_rs_table.history.return_value = mock_history_data
@@ -1884,7 +1885,7 @@ class TestDeltaEngine:
         assert result is None
         mocker_get_delta_feature_group_commit.assert_not_called()
 
-    def test_get_last_commit_metadata_one_history_entry(self, mocker):
+    def test_get_last_commit_metadata_one_history_entry(self, mocker, monkeypatch):
         # Arrange
         mock_history_data = [
             {"version": 1, "operation": "WRITE", "timestamp": "2024-01-01T00:00:00Z"},
@@ -1892,7 +1893,7 @@ class TestDeltaEngine:
 
         # Fake the deltalake module
         fake_deltalake = types.SimpleNamespace(DeltaTable=mocker.MagicMock())
-        sys.modules["deltalake"] = fake_deltalake
+        monkeypatch.setitem(sys.modules, "deltalake", fake_deltalake)
 
         mock_delta_rs_table = mocker.MagicMock()
         mock_delta_rs_table.history.return_value = mock_history_data
@@ -1913,7 +1914,9 @@ class TestDeltaEngine:
             mock_history_data[0], mock_history_data[0]
         )
 
-    def test_get_last_commit_metadata_one_history_entry_optimize(self, mocker):
+    def test_get_last_commit_metadata_one_history_entry_optimize(
+        self, mocker, monkeypatch
+    ):
         # Arrange
         mock_history_data = [
             {
@@ -1925,7 +1928,7 @@ class TestDeltaEngine:
 
         # Fake the deltalake module
         fake_deltalake = types.SimpleNamespace(DeltaTable=mocker.MagicMock())
-        sys.modules["deltalake"] = fake_deltalake
+        monkeypatch.setitem(sys.modules, "deltalake", fake_deltalake)
 
         mock_delta_rs_table = mocker.MagicMock()
         mock_delta_rs_table.history.return_value = mock_history_data
@@ -2441,6 +2444,308 @@ class TestDeltaEngine:
         write_mock.assert_called_once()
         assert write_mock.call_args.kwargs.get("operation") == "insert"
 
+    # ------------------------------------------------------------------
+    # Key range pruning and chunked merges
+    # ------------------------------------------------------------------
+
+    def test_generate_merge_query_with_key_ranges(self, mocker):
+        # Arrange
+        _patch_client(mocker, is_external=False)
+        fg = _make_fg("hopsfs://nn:8020/p")
+        fg.primary_key = ["id", "name"]
+        fg.partition_key = []
+        fg.event_time = None
+        engine = DeltaEngine(1, "fs", fg, None, None)
+
+        # Act
+        q = engine._generate_merge_query(
+            "s", "u", key_ranges={"id": (3, 7), "name": ("a", "o'b")}
+        )
+
+        # Assert
+        assert q == (
+            "s.id == u.id AND s.name == u.name"
+            " AND s.id >= 3 AND s.id <= 7"
+            " AND s.name >= 'a' AND s.name <= 'o''b'"
+        )
+
+    def test_get_key_ranges(self):
+        # Arrange
+        dataset = pa.table(
+            {
+                "id": [5, 2, None, 9],
+                "name": ["b", "a", "c", None],
+                "ts": pd.to_datetime(["2024-01-01"] * 4),
+                "empty": pa.array([None] * 4, pa.int64()),
+            }
+        )
+
+        # Act
+        key_ranges = DeltaEngine._get_key_ranges(
+            dataset, ["id", "name", "ts", "empty", "missing"]
+        )
+
+        # Assert
+        assert key_ranges == {"id": (2, 9), "name": ("a", "c")}
+
+    def test_get_key_ranges_not_arrow_returns_empty(self, mocker):
+        # Act & Assert
+        assert DeltaEngine._get_key_ranges(mocker.Mock(), ["id"]) == {}
+
+    @pytest.mark.parametrize(
+        "mins, maxs, expected",
+        [
+            ([0, 100], [99, 199], True),
+            ([0, 100], [99, 250], False),
+            ([0, None], [99, None], False),
+        ],
+    )
+    def test_can_append_by_key_stats(self, mocker, mins, maxs, expected):
+        # Arrange
+        _patch_client(mocker, is_external=False)
+        fg = _make_fg("hopsfs://nn:8020/p")
+        fg.primary_key = ["id"]
+        engine = DeltaEngine(1, "fs", fg, None, None)
+        fg_source_table = mocker.Mock()
+        fg_source_table.get_add_actions.return_value = pa.record_batch(
+            {
+                "path": ["a.parquet", "b.parquet"],
+                "min.id": pa.array(mins, pa.int64()),
+                "max.id": pa.array(maxs, pa.int64()),
+            }
+        )
+        dataset = pa.table({"id": [200, 300]})
+
+        # Act
+        result = engine._can_append_by_key_stats(fg_source_table, dataset)
+
+        # Assert
+        assert result is expected
+        fg_source_table.get_add_actions.assert_called_once_with(flatten=True)
+
+    def test_can_append_by_key_stats_skips_string_keys(self, mocker):
+        # Arrange
+        _patch_client(mocker, is_external=False)
+        fg = _make_fg("hopsfs://nn:8020/p")
+        fg.primary_key = ["name"]
+        engine = DeltaEngine(1, "fs", fg, None, None)
+        fg_source_table = mocker.Mock()
+
+        # Act
+        result = engine._can_append_by_key_stats(
+            fg_source_table, pa.table({"name": ["x"]})
+        )
+
+        # Assert
+        assert result is False
+        fg_source_table.get_add_actions.assert_not_called()
+
+    def test_can_append_by_key_stats_missing_stats_falls_back_to_false(self, mocker):
+        # Arrange
+        _patch_client(mocker, is_external=False)
+        fg = _make_fg("hopsfs://nn:8020/p")
+        fg.primary_key = ["id"]
+        engine = DeltaEngine(1, "fs", fg, None, None)
+        fg_source_table = mocker.Mock()
+        fg_source_table.get_add_actions.return_value = pa.record_batch(
+            {"path": ["a.parquet"]}
+        )
+
+        # Act
+        result = engine._can_append_by_key_stats(fg_source_table, pa.table({"id": [1]}))
+
+        # Assert
+        assert result is False
+
+    def test_iter_merge_chunks_sorts_by_merge_keys(self):
+        # Arrange
+        dataset = pa.table({"id": [5, 1, 4, 2, 3], "v": ["e", "a", "d", "b", "c"]})
+
+        # Act
+        chunks = list(DeltaEngine._iter_merge_chunks(dataset, ["id"], 2))
+
+        # Assert
+        assert [chunk.column("id").to_pylist() for chunk in chunks] == [
+            [1, 2],
+            [3, 4],
+            [5],
+        ]
+        assert chunks[2].column("v").to_pylist() == ["e"]
+
+    def test_iter_merge_chunks_small_dataset_unchanged(self):
+        # Arrange
+        dataset = pa.table({"id": [2, 1]})
+
+        # Act & Assert
+        assert list(DeltaEngine._iter_merge_chunks(dataset, ["id"], 2)) == [dataset]
+        assert list(DeltaEngine._iter_merge_chunks(dataset, ["id"], 0)) == [dataset]
+
+    def test_write_delta_rs_merges_once_by_default(self, mocker):
+        # Arrange
+        _patch_client(mocker, is_external=False)
+        fg = _make_fg("hopsfs://nn:8020/projects/p1")
+        fg.partition_key = []
+        fg.primary_key = ["id"]
+        fg.event_time = None
+        engine = DeltaEngine(1, "fs", fg, None, None)
+
+        fake_write, fake_delta_table = self._setup_fake_deltalake(mocker)
+        execute = fake_delta_table.merge.return_value.when_matched_update_all.return_value.when_not_matched_insert_all.return_value.execute
+        execute.return_value = {"num_target_rows_inserted": 3}
+        mocker.patch.object(
+            engine, "_get_delta_rs_location", return_value="hdfs://nn/p"
+        )
+        mocker.patch.object(engine, "_can_append_by_key_stats", return_value=False)
+        commit = FeatureGroupCommit(rows_inserted=3, rows_updated=0, rows_deleted=0)
+        mocker.patch.object(engine, "_get_last_commit_metadata", return_value=commit)
+
+        dataset = pa.table({"id": [3, 1, 2]})
+
+        # Act
+        result = engine._write_delta_rs_dataset(dataset, write_options={})
+
+        # Assert
+        # without merge_chunk_rows the upsert is a single, atomic merge
+        fake_delta_table.merge.assert_called_once()
+        assert fake_delta_table.merge.call_args.kwargs["source"].num_rows == 3
+        assert result is commit
+
+    def test_write_delta_rs_merges_in_chunks(self, mocker):
+        # Arrange
+        _patch_client(mocker, is_external=False)
+        fg = _make_fg("hopsfs://nn:8020/projects/p1")
+        fg.partition_key = []
+        fg.primary_key = ["id"]
+        fg.event_time = None
+        engine = DeltaEngine(1, "fs", fg, None, None)
+
+        fake_write, fake_delta_table = self._setup_fake_deltalake(mocker)
+        execute = fake_delta_table.merge.return_value.when_matched_update_all.return_value.when_not_matched_insert_all.return_value.execute
+        execute.side_effect = [
+            {"num_target_rows_inserted": 1, "num_target_rows_updated": 1},
+            {"num_target_rows_inserted": 1, "num_target_rows_updated": 0},
+        ]
+        mocker.patch.object(
+            engine, "_get_delta_rs_location", return_value="hdfs://nn/p"
+        )
+        mocker.patch.object(engine, "_can_append_by_key_stats", return_value=False)
+        commit = FeatureGroupCommit(rows_inserted=1, rows_updated=0, rows_deleted=0)
+        mocker.patch.object(engine, "_get_last_commit_metadata", return_value=commit)
+
+        dataset = pa.table({"id": [3, 1, 2]})
+
+        # Act
+        result = engine._write_delta_rs_dataset(
+            dataset, write_options={DeltaEngine.MERGE_CHUNK_ROWS: 2}
+        )
+
+        # Assert
+        predicates = [
+            c.kwargs["predicate"] for c in fake_delta_table.merge.call_args_list
+        ]
+        assert predicates == [
+            "fg_1_source.id == fg_1_updates.id"
+            " AND fg_1_source.id >= 1 AND fg_1_source.id <= 2",
+            "fg_1_source.id == fg_1_updates.id"
+            " AND fg_1_source.id >= 3 AND fg_1_source.id <= 3",
+        ]
+        assert result is commit
+        assert (commit.rows_inserted, commit.rows_updated, commit.rows_deleted) == (
+            2,
+            1,
+            0,
+        )
+        fake_write.assert_not_called()
+
+    # ------------------------------------------------------------------
+    # Time travel reads with delta-rs
+    # ------------------------------------------------------------------
+
+    def _commit_versions(self, location):
+        deltalake = pytest.importorskip("deltalake")
+        schema = pa.schema([("id", pa.int64()), ("v", pa.int64())])
+        deltalake.write_deltalake(
+            location,
+            pa.table({"id": [1, 2], "v": [0, 0]}, schema=schema),
+            configuration={DeltaEngine.DELTA_ENABLE_CHANGE_DATA_FEED: "true"},
+        )
+        time.sleep(0.01)
+        deltalake.write_deltalake(
+            location, pa.table({"id": [3], "v": [0]}, schema=schema), mode="append"
+        )
+        time.sleep(0.01)
+        deltalake.DeltaTable(location).merge(
+            pa.table({"id": [1, 4], "v": [1, 1]}, schema=schema),
+            "s.id = t.id",
+            source_alias="s",
+            target_alias="t",
+        ).when_matched_update_all().when_not_matched_insert_all().execute()
+        return {
+            commit["version"]: commit["timestamp"]
+            for commit in deltalake.DeltaTable(location).history()
+        }
+
+    def _time_travel_engine(self, mocker, location):
+        _patch_client(mocker, is_external=False)
+        engine = DeltaEngine(1, "fs", _make_fg(location), None, None)
+        mocker.patch.object(engine, "_get_delta_rs_location", return_value=location)
+        mocker.patch.object(engine, "_get_delta_rs_storage_options", return_value={})
+        return engine
+
+    def test_read_delta_rs_dataset_as_of(self, mocker, tmp_path):
+        # Arrange
+        location = str(tmp_path / "fg")
+        commits = self._commit_versions(location)
+        engine = self._time_travel_engine(mocker, location)
+
+        # Act
+        result = engine._read_delta_rs_dataset(None, commits[1], columns=["id"])
+
+        # Assert
+        assert result.column_names == ["id"]
+        assert sorted(result.column("id").to_pylist()) == [1, 2, 3]
+
+    def test_read_delta_rs_dataset_changes(self, mocker, tmp_path):
+        # Arrange
+        location = str(tmp_path / "fg")
+        commits = self._commit_versions(location)
+        engine = self._time_travel_engine(mocker, location)
+
+        # Act
+        result = engine._read_delta_rs_dataset(commits[0], None)
+
+        # Assert
+        assert result.schema == pa.schema([("id", pa.int64()), ("v", pa.int64())])
+        assert sorted(result.to_pylist(), key=lambda row: row["id"]) == [
+            {"id": 1, "v": 1},
+            {"id": 3, "v": 0},
+            {"id": 4, "v": 1},
+        ]
+
+    def test_read_delta_rs_dataset_changes_window(self, mocker, tmp_path):
+        # Arrange
+        location = str(tmp_path / "fg")
+        commits = self._commit_versions(location)
+        engine = self._time_travel_engine(mocker, location)
+
+        # Act
+        window = engine._read_delta_rs_dataset(commits[0], commits[1], columns=["id"])
+        empty = engine._read_delta_rs_dataset(commits[2], None, columns=["id"])
+
+        # Assert
+        assert window.column("id").to_pylist() == [3]
+        assert empty.num_rows == 0
+        assert empty.column_names == ["id"]
+
+    def test_get_delta_version_at(self):
+        # Arrange
+        commits = [(0, 1000), (1, 2000), (2, 3000)]
+
+        # Act & Assert
+        assert DeltaEngine._get_delta_version_at(commits, 500) == 0
+        assert DeltaEngine._get_delta_version_at(commits, 2000) == 1
+        assert DeltaEngine._get_delta_version_at(commits, 9000) == 2
+
 
 class TestDeltaEngineConnectMode:
     """Tests for DeltaEngine initialization in Spark Connect mode."""
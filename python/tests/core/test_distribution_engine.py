@@ -13,9 +13,11 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import base64
 import json
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from hsfs.core.distribution_engine import (
     _WINDOW_DETECTION,
@@ -23,6 +25,7 @@ from hsfs.core.distribution_engine import (
     DistributionEngine,
 )
 from hsfs.core.feature_descriptive_statistics import FeatureDescriptiveStatistics
+from hsfs.core.kll_sketch import KllDoublesSketch
 
 
 # ---------------------------------------------------------------------------
@@ -702,3 +705,61 @@ class TestResolveMergedReference:
         result = engine._resolve_merged_reference(fds_list, histogram_bins=20)
 
         assert result is None
+
+    def test_merges_native_sketches_without_jvm(self):
+        """Decodable sketches are merged in Python and the JVM is not called."""
+        rng = np.random.default_rng(1)
+        values = rng.uniform(0, 10, size=30000)
+        fds_list = []
+        for fid, chunk in enumerate(np.array_split(values, 3)):
+            sketch = KllDoublesSketch(200)
+            sketch.update(chunk)
+            b64 = base64.b64encode(sketch.to_bytes()).decode("ascii")
+            fds_list.append(_make_native_kll_fds(fid, b64_bytes=b64))
+        engine = self._make_engine_with_jvm_mock(None)
+
+        result = engine._resolve_merged_reference(fds_list, histogram_bins=5)
+
+        engine._call_kll_merger.assert_not_called()
+        assert result.count == 30000
+        assert result.min == values.min()
+        assert result.max == values.max()
+        np.testing.assert_allclose(
+            result.percentiles, np.arange(1, 100) / 10, atol=0.25
+        )
+        histogram = result.extended_statistics["histogram"]
+        assert [bucket["value"] for bucket in histogram][0] == (
+            f"{values.min():.2f} to {values.min() + (values.max() - values.min()) / 5:.2f}"
+        )
+        np.testing.assert_allclose(
+            [bucket["ratio"] for bucket in histogram], [0.2] * 5, atol=0.02
+        )
+        merged = KllDoublesSketch.from_bytes(
+            base64.b64decode(result.extended_statistics["kll"]["bytes"])
+        )
+        assert merged.n == 30000
+
+    def test_merges_constant_feature_into_single_bin(self):
+        sketch = KllDoublesSketch(200)
+        sketch.update([5.0, 5.0])
+        b64 = base64.b64encode(sketch.to_bytes()).decode("ascii")
+        engine = DistributionEngine()
+
+        result = engine._resolve_merged_reference(
+            [_make_native_kll_fds(1, b64_bytes=b64)] * 2, histogram_bins=10
+        )
+
+        assert result.extended_statistics["histogram"] == [
+            {"value": "4.95 to 5.05", "count": 4, "ratio": 1.0}
+        ]
+
+    def test_empty_native_sketches_return_none(self):
+        b64 = base64.b64encode(KllDoublesSketch(200).to_bytes()).decode("ascii")
+        engine = self._make_engine_with_jvm_mock(None)
+
+        result = engine._resolve_merged_reference(
+            [_make_native_kll_fds(1, b64_bytes=b64)], histogram_bins=10
+        )
+
+        assert result is None
+        engine._call_kll_merger.assert_not_called()
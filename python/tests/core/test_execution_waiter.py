@@ -0,0 +1,226 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hopsworks_common import execution_waiter
+from hopsworks_common.client.exceptions import RestAPIError
+from hopsworks_common.execution import Execution
+from hopsworks_common.execution_waiter import ExecutionWaiter
+from hsfs.core import online_ingestion, online_ingestion_result
+
+
+@pytest.fixture
+def execution_api(mocker):
+    return mocker.patch("hopsworks_common.core.execution_api.ExecutionApi").return_value
+
+
+def _job(mocker, name):
+    job = mocker.Mock()
+    job.name = name
+    job.job_type = "PYTHON"
+    return job
+
+
+def _execution(job, id, state="RUNNING"):
+    return Execution(id=id, state=state, job=job)
+
+
+def _waiter():
+    return ExecutionWaiter(min_interval=0, max_interval=0)
+
+
+class TestExecutionWaiter:
+    def test_wait_all_polls_until_finished(self, mocker, execution_api):
+        # Arrange
+        job = _job(mocker, "etl")
+        execution_api._get.side_effect = [
+            _execution(job, 1, "RUNNING"),
+            _execution(job, 1, "FINISHED"),
+        ]
+
+        # Act
+        [result] = execution_waiter.wait_all([_execution(job, 1)], waiter=_waiter())
+
+        # Assert
+        assert result.state == "FINISHED"
+        assert result.success is True
+        assert execution_api._get.call_count == 2
+
+    def test_wait_all_returns_failed_executions(self, mocker, execution_api):
+        # Arrange
+        job = _job(mocker, "etl")
+        execution_api._get.return_value = _execution(job, 1, "FAILED")
+
+        # Act
+        [result] = execution_waiter.wait_all([_execution(job, 1)], waiter=_waiter())
+
+        # Assert
+        assert result.success is False
+
+    def test_wait_all_batches_executions_of_a_job(self, mocker, execution_api):
+        # Arrange
+        job = _job(mocker, "backfill")
+        execution_api._get_all.return_value = [
+            _execution(job, 3, "FINISHED"),
+            _execution(job, 2, "FINISHED"),
+            _execution(job, 1, "FINISHED"),
+        ]
+        waiter = _waiter()
+
+        # Act
+        results = execution_waiter.wait_all(
+            [_execution(job, 1), _execution(job, 2)], waiter=waiter
+        )
+
+        # Assert
+        assert [r.id for r in results] == [1, 2]
+        execution_api._get_all.assert_called_once_with(job, limit=4)
+        execution_api._get.assert_not_called()
+
+    def test_wait_all_timeout(self, mocker, execution_api):
+        # Arrange
+        job = _job(mocker, "etl")
+        execution_api._get.return_value = _execution(job, 1, "RUNNING")
+        waiter = ExecutionWaiter(min_interval=60)
+
+        # Act
+        [result] = execution_waiter.wait_all(
+            [_execution(job, 1, "SUBMITTED")], timeout=0.5, waiter=waiter
+        )
+
+        # Assert
+        assert result.state == "RUNNING"
+        assert waiter._tracked == {}
+
+    def test_wait_all_raises_polling_errors(self, mocker, execution_api):
+        # Arrange
+        job = _job(mocker, "etl")
+        response = mocker.Mock()
+        response.status_code = 503
+        response.json.return_value = {}
+        execution_api._get.side_effect = RestAPIError("", response)
+
+        # Act & Assert
+        with pytest.raises(RestAPIError):
+            execution_waiter.wait_all([_execution(job, 1)], waiter=_waiter())
+
+    def test_as_completed(self, mocker, execution_api):
+        # Arrange
+        slow, fast = _job(mocker, "slow"), _job(mocker, "fast")
+        states = {"slow": iter(["RUNNING", "RUNNING", "FINISHED"])}
+
+        def get(job, id):
+            state = next(states[job.name]) if job.name in states else "FINISHED"
+            return _execution(job, id, state)
+
+        execution_api._get.side_effect = get
+
+        # Act
+        results = list(
+            execution_waiter.as_completed(
+                [_execution(slow, 1), _execution(fast, 2)], waiter=_waiter()
+            )
+        )
+
+        # Assert
+        assert [r.job_name for r in results] == ["fast", "slow"]
+
+    def test_as_completed_timeout(self, mocker, execution_api):
+        # Arrange
+        job = _job(mocker, "etl")
+        execution_api._get.return_value = _execution(job, 1, "RUNNING")
+        waiter = ExecutionWaiter(min_interval=60)
+
+        # Act & Assert
+        with pytest.raises(TimeoutError):
+            list(
+                execution_waiter.as_completed(
+                    [_execution(job, 1)], timeout=0.5, waiter=waiter
+                )
+            )
+        assert waiter._tracked == {}
+
+    def test_add_shares_future(self, mocker, execution_api):
+        # Arrange
+        job = _job(mocker, "etl")
+        waiter = ExecutionWaiter(min_interval=60)
+        execution_api._get.return_value = _execution(job, 1, "RUNNING")
+
+        # Act
+        first = waiter.add(_execution(job, 1))
+        second = waiter.add(_execution(job, 1))
+        waiter._discard([first])
+
+        # Assert
+        assert first is second
+        assert not first.cancelled()
+        waiter._discard([second])
+        assert first.cancelled()
+
+    def test_interval(self):
+        # Arrange
+        waiter = ExecutionWaiter(min_interval=1, max_interval=30, backoff=0.1)
+        tracked = execution_waiter._Tracked(("other", 1), None, now=100)
+
+        # Act & Assert
+        assert waiter._interval(tracked, 105) == 1
+        assert waiter._interval(tracked, 200) == 10
+        assert waiter._interval(tracked, 4000) == 30
+
+    def test_online_ingestion(self, mocker):
+        # Arrange
+        ingestion = online_ingestion.OnlineIngestion(id=1, num_entries=10)
+
+        def refresh():
+            ingestion._results.append(
+                online_ingestion_result.OnlineIngestionResult(status="UPDATED", rows=5)
+            )
+
+        mocker.patch.object(ingestion, "refresh", side_effect=refresh)
+
+        # Act
+        [result] = execution_waiter.wait_all([ingestion], waiter=_waiter())
+
+        # Assert
+        assert result is ingestion
+        assert ingestion.refresh.call_count == 2
+
+    def test_wait_until_finished_logs_yarn_state(self, mocker, execution_api, caplog):
+        # Arrange
+        from hopsworks_common.engine import execution_engine
+
+        mocker.patch("hopsworks_common.core.dataset_api.DatasetApi")
+        mocker.patch(
+            "hopsworks_common.execution_waiter._get_default_waiter",
+            return_value=_waiter(),
+        )
+        job = _job(mocker, "etl")
+        job.job_type = "SPARK"
+        execution_api._get.return_value = Execution(
+            id=1, state="FINISHED", final_status="SUCCEEDED", job=job
+        )
+        engine = execution_engine.ExecutionEngine()
+
+        # Act
+        with caplog.at_level("INFO", logger=execution_engine.__name__):
+            result = engine._wait_until_finished(job, _execution(job, 1))
+
+        # Assert
+        assert result.success is True
+        assert (
+            "Waiting for execution to finish. Current state: FINISHED. "
+            "Final status: SUCCEEDED" in caplog.messages
+        )
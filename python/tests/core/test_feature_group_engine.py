@@ -14,6 +14,9 @@
 #   limitations under the License.
 #
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from hopsworks_common.core import sink_job_configuration
 from hsfs import feature, feature_group, feature_group_commit, validation_report
@@ -1252,6 +1255,170 @@ class TestFeatureGroupEngine:
         assert mock_fg_api.return_value._delete_content.call_count == 1
         assert mock_engine_get_instance.return_value._save_dataframe.call_count == 1
 
+    def test_insert_batches(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mock_engine_get_instance.return_value._convert_to_default_dataframe.side_effect = (
+            lambda df: df
+        )
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._save_feature_group_metadata"
+        )
+        mock_verify_schema = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._verify_schema_compatibility"
+        )
+        mock_ge_engine = mocker.patch(
+            "hsfs.core.great_expectation_engine.GreatExpectationEngine"
+        )
+        mock_fg_api = mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+        mocker.patch("hsfs.core.schema_validation.DataFrameValidator._validate_schema")
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        chunks = [pd.DataFrame({"a": [i, i + 1]}) for i in range(0, 10, 2)]
+
+        # Act
+        fg_engine._insert_batches(
+            feature_group=fg,
+            batches=iter(chunks),
+            overwrite=True,
+            operation="upsert",
+            storage=None,
+            write_options={},
+            validation_options={"save_report": True},
+        )
+
+        # Assert
+        save_calls = (
+            mock_engine_get_instance.return_value._save_dataframe.call_args_list
+        )
+        assert [c.args[1]["a"].tolist() for c in save_calls] == [
+            chunk["a"].tolist() for chunk in chunks
+        ]
+        assert [c.args[2] for c in save_calls] == ["bulk_insert"] + ["upsert"] * 4
+        assert mock_fg_api.return_value._delete_content.call_count == 1
+        assert mock_verify_schema.call_count == 5
+        validate_calls = mock_ge_engine.return_value._validate.call_args_list
+        assert (
+            "fetch_expectation_suite"
+            not in validate_calls[0].kwargs["validation_options"]
+        )
+        assert all(
+            c.kwargs["validation_options"]["fetch_expectation_suite"] is False
+            for c in validate_calls[1:]
+        )
+        assert fg._multi_part_insert is False
+
+    def test_insert_batches_stream(self, mocker):
+        # Arrange
+        feature_store_id = 99
+
+        mocker.patch("hsfs.engine._get_type")
+        mock_engine_get_instance = mocker.patch("hsfs.engine._get_instance")
+        mock_engine_get_instance.return_value._convert_to_default_dataframe.side_effect = (
+            lambda df: df
+        )
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._save_feature_group_metadata"
+        )
+        mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._verify_schema_compatibility"
+        )
+        mocker.patch("hsfs.core.great_expectation_engine.GreatExpectationEngine")
+        mocker.patch("hsfs.core.feature_group_api.FeatureGroupApi")
+        mocker.patch("hsfs.core.schema_validation.DataFrameValidator._validate_schema")
+        mocker.patch(
+            "hsfs.core.kafka_engine._kafka_get_offsets", return_value="checkpoint"
+        )
+
+        fg_engine = feature_group_engine.FeatureGroupEngine(
+            feature_store_id=feature_store_id
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test",
+            version=1,
+            featurestore_id=feature_store_id,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+            stream=True,
+        )
+        fg._materialization_job = mocker.Mock()
+        write_options = {"wait_for_job": False}
+
+        # Act
+        job, _ = fg_engine._insert_batches(
+            feature_group=fg,
+            batches=iter([pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [2]})]),
+            overwrite=False,
+            operation="upsert",
+            storage=None,
+            write_options=write_options,
+            validation_options={},
+        )
+
+        # Assert
+        mock_engine = mock_engine_get_instance.return_value
+        assert all(
+            c.args[5]["start_offline_materialization"] is False
+            for c in mock_engine._save_dataframe.call_args_list
+        )
+        mock_engine._start_materialization_job.assert_called_once_with(
+            fg, write_options, "checkpoint"
+        )
+        assert job is fg.materialization_job
+
+    def test_insert_batches_empty(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine._get_type")
+        fg_engine = feature_group_engine.FeatureGroupEngine(feature_store_id=99)
+
+        # Act & Assert
+        with pytest.raises(exceptions.FeatureStoreException):
+            fg_engine._insert_batches(
+                feature_group=None,
+                batches=iter([]),
+                overwrite=False,
+                operation="upsert",
+                storage=None,
+                write_options={},
+                validation_options={},
+            )
+
+    def test_read_batch_source_parquet(self, tmp_path):
+        # Arrange
+        pq.write_table(pa.table({"a": list(range(5))}), tmp_path / "part-0.parquet")
+
+        # Act
+        batches = list(
+            feature_group_engine.FeatureGroupEngine._read_batch_source(
+                str(tmp_path), batch_size=2
+            )
+        )
+
+        # Assert
+        assert [batch.num_rows for batch in batches] == [2, 2, 1]
+        assert feature_group_engine.FeatureGroupEngine._is_batch_source(str(tmp_path))
+        assert not feature_group_engine.FeatureGroupEngine._is_batch_source(
+            pd.DataFrame()
+        )
+
     def test_delete(self, mocker):
         # Arrange
         feature_store_id = 99
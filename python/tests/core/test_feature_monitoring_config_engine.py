@@ -18,7 +18,7 @@ from datetime import datetime
 from unittest.mock import MagicMock
 
 import pytest
-from hopsworks_common.client.exceptions import RestAPIError
+from hopsworks_common.client.exceptions import FeatureStoreException, RestAPIError
 from hsfs import util
 from hsfs.core import feature_monitoring_config as fmc
 from hsfs.core import feature_monitoring_config_engine
@@ -710,6 +710,161 @@ class TestFeatureMonitoringConfigEngine:
                 "profile_flags must be None for scalar-only config"
             )
 
+    def test_run_feature_monitoring_computes_windows_together(self, mocker):
+        # Arrange
+        config_engine = feature_monitoring_config_engine.FeatureMonitoringConfigEngine(
+            feature_store_id=DEFAULT_FEATURE_STORE_ID,
+            feature_group_id=DEFAULT_FEATURE_GROUP_ID,
+        )
+        config = self._build_mock_fm_config(["amount", "age"])
+        config.model_name = config.model_version = None
+        config.detection_window_config = mwc.MonitoringWindowConfig(
+            time_offset="1d", row_percentage=1.0
+        )
+        config.reference_window_config = mwc.MonitoringWindowConfig(
+            time_offset="1w", window_length="1d", row_percentage=1.0
+        )
+        mocker.patch.object(
+            config_engine._feature_monitoring_config_api,
+            "_get_by_name",
+            return_value=config,
+        )
+        run_windows_mock = mocker.patch.object(
+            config_engine._monitoring_window_config_engine,
+            "_run_windows_monitoring",
+            side_effect=lambda entity, requests, return_exceptions=False: [
+                [
+                    FeatureDescriptiveStatistics(feature_name=f, count=i)
+                    for f in request.feature_names
+                ]
+                for i, request in enumerate(requests)
+            ],
+        )
+        compare_mock = mocker.patch.object(
+            config_engine._result_engine,
+            "_run_and_save_statistics_comparison",
+            side_effect=lambda **kwargs: kwargs["fm_config"],
+        )
+
+        # Act
+        result = config_engine._run_feature_monitoring(
+            entity=MagicMock(), config_name="a"
+        )
+
+        # Assert
+        assert result is config
+        run_windows_mock.assert_called_once()
+        requests = run_windows_mock.call_args.kwargs["requests"]
+        assert [request.monitoring_window_config for request in requests] == [
+            config.detection_window_config,
+            config.reference_window_config,
+        ]
+        kwargs = compare_mock.call_args.kwargs
+        assert [fds.count for fds in kwargs["detection_statistics"]] == [0, 0]
+        assert [fds.count for fds in kwargs["reference_statistics"]] == [1, 1]
+
+    def test_run_feature_monitoring_configs_computes_shared_windows_once(self, mocker):
+        # Arrange
+        config_engine = feature_monitoring_config_engine.FeatureMonitoringConfigEngine(
+            feature_store_id=DEFAULT_FEATURE_STORE_ID,
+            feature_group_id=DEFAULT_FEATURE_GROUP_ID,
+        )
+        configs = {}
+        for name, feature_names in [("a", ["amount"]), ("b", ["amount", "age"])]:
+            config = self._build_mock_fm_config(feature_names)
+            config.model_name = config.model_version = None
+            config.detection_window_config = mwc.MonitoringWindowConfig(
+                time_offset="1d", row_percentage=1.0
+            )
+            config.reference_window_config = mwc.MonitoringWindowConfig(
+                time_offset="1w", window_length="1d", row_percentage=1.0
+            )
+            configs[name] = config
+        mocker.patch.object(
+            config_engine._feature_monitoring_config_api,
+            "_get_by_name",
+            side_effect=configs.get,
+        )
+        run_single_mock = mocker.patch.object(
+            config_engine._monitoring_window_config_engine,
+            "_run_single_window_monitoring",
+            side_effect=lambda **kwargs: [
+                FeatureDescriptiveStatistics(feature_name=f, count=100)
+                for f in kwargs["feature_names"]
+            ],
+        )
+        compare_mock = mocker.patch.object(
+            config_engine._result_engine,
+            "_run_and_save_statistics_comparison",
+            side_effect=lambda **kwargs: kwargs["fm_config"],
+        )
+
+        # Act
+        results = config_engine._run_feature_monitoring_configs(
+            entity=MagicMock(), config_names=["a", "b"]
+        )
+
+        # Assert
+        assert results == [configs["a"], configs["b"]]
+        assert run_single_mock.call_count == 2
+        for call in run_single_mock.call_args_list:
+            assert call.kwargs["feature_names"] == ["amount", "age"]
+        for call, feature_names in zip(
+            compare_mock.call_args_list, [["amount"], ["amount", "age"]], strict=True
+        ):
+            for statistics in ("detection_statistics", "reference_statistics"):
+                assert [
+                    fds.feature_name for fds in call.kwargs[statistics]
+                ] == feature_names
+
+    def test_run_feature_monitoring_configs_isolates_failures(self, mocker):
+        # Arrange
+        config_engine = feature_monitoring_config_engine.FeatureMonitoringConfigEngine(
+            feature_store_id=DEFAULT_FEATURE_STORE_ID,
+            feature_group_id=DEFAULT_FEATURE_GROUP_ID,
+        )
+        config = self._build_mock_fm_config(["amount"])
+        config.model_name = config.model_version = None
+        config.detection_window_config = mwc.MonitoringWindowConfig(
+            time_offset="1d", row_percentage=1.0
+        )
+        config.reference_window_config = None
+        error = FeatureStoreException("config not found")
+
+        def get_by_name(name):
+            if name != "a":
+                raise error
+            return config
+
+        mocker.patch.object(
+            config_engine._feature_monitoring_config_api,
+            "_get_by_name",
+            side_effect=get_by_name,
+        )
+        mocker.patch.object(
+            config_engine._monitoring_window_config_engine,
+            "_run_single_window_monitoring",
+            side_effect=lambda **kwargs: [
+                FeatureDescriptiveStatistics(feature_name=f, count=100)
+                for f in kwargs["feature_names"]
+            ],
+        )
+        mocker.patch.object(
+            config_engine._result_engine,
+            "_run_and_save_statistics_comparison",
+            side_effect=lambda **kwargs: kwargs["fm_config"],
+        )
+
+        # Act
+        results = config_engine._run_feature_monitoring_configs(
+            entity=MagicMock(), config_names=["a", "b"]
+        )
+
+        # Assert
+        assert results == [config, error]
+        with pytest.raises(FeatureStoreException):
+            config_engine._run_feature_monitoring(entity=MagicMock(), config_name="b")
+
     def test_distribution_child_rejects_specific_value(self):
         """validate_statistics_comparison_config raises when distribution child has specific_value."""
         config_engine = feature_monitoring_config_engine.FeatureMonitoringConfigEngine(
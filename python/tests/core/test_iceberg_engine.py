@@ -2118,3 +2118,47 @@ class TestPyIcebergEngine:
         assert version == 3
         rows = table.scan().to_arrow().sort_by("id").to_pydict()
         assert rows["id"] == [2, 3]
+
+    @pytest.mark.skipif(not HAS_PYICEBERG, reason="pyiceberg not installed")
+    @pytest.mark.skipif(
+        sys.platform == "win32",
+        reason="pyiceberg's PyArrowFileIO mishandles local Windows paths",
+    )
+    def test_read_pyiceberg_dataset(self, mocker, tmp_path):
+        # Arrange
+        import pyarrow as pa
+
+        fg = _make_fg(primary_key=["id"])
+        fg.location = (tmp_path / "fg_1").as_uri()
+        fg._is_hopsfs_storage.return_value = False
+        fg.storage_connector = None
+        iceberg_engine = self._pyiceberg_engine(mocker, fg=fg)
+        iceberg_engine._write_pyiceberg_dataset(
+            pa.table({"id": [1, 2], "value": ["a", "b"]}), operation="insert"
+        )
+        inserted_at = (
+            iceberg_engine._load_pyiceberg_current_table("read it")
+            .current_snapshot()
+            .timestamp_ms
+        )
+        iceberg_engine._write_pyiceberg_dataset(
+            pa.table({"id": [2, 3], "value": ["B", "c"]}), operation="upsert"
+        )
+        upserted_at = (
+            iceberg_engine._load_pyiceberg_current_table("read it")
+            .current_snapshot()
+            .timestamp_ms
+        )
+
+        # Act
+        as_of = iceberg_engine._read_pyiceberg_dataset(None, inserted_at)
+        changes = iceberg_engine._read_pyiceberg_dataset(inserted_at, None)
+        no_changes = iceberg_engine._read_pyiceberg_dataset(
+            upserted_at, None, columns=["id"]
+        )
+
+        # Assert
+        assert as_of.sort_by("id").to_pydict() == {"id": [1, 2], "value": ["a", "b"]}
+        assert changes.sort_by("id").to_pydict() == {"id": [2, 3], "value": ["B", "c"]}
+        assert no_changes.num_rows == 0
+        assert no_changes.column_names == ["id"]
@@ -14,11 +14,14 @@
 #   limitations under the License.
 #
 import importlib
+import json
+import threading
+from datetime import datetime, timezone
 
 import pytest
 from hopsworks_common.client.exceptions import FeatureStoreException
 from hopsworks_common.core import constants
-from hsfs import feature_group, storage_connector
+from hsfs import feature, feature_group, storage_connector
 from hsfs.core import kafka_engine, online_ingestion
 
 
@@ -27,6 +30,90 @@ if constants.HAS_CONFLUENT_KAFKA:
     from confluent_kafka.admin import PartitionMetadata, TopicMetadata
 
 
+def _topic_feature_group(mocker):
+    mocker.patch("hopsworks_common.client._get_instance")
+    fg = feature_group.FeatureGroup(
+        id=111, name="test", version=1, featurestore_id=99, primary_key=["id"]
+    )
+    fg.columns = [
+        feature.Feature("id", type="bigint"),
+        feature.Feature("ts", type="timestamp"),
+        feature.Feature("tags", type="array<string>"),
+    ]
+    fg._subject = {
+        "id": 823,
+        "schema": json.dumps(
+            {
+                "type": "record",
+                "name": "test_1",
+                "namespace": "test_featurestore.db",
+                "fields": [
+                    {"name": "id", "type": ["null", "long"]},
+                    {
+                        "name": "ts",
+                        "type": [
+                            "null",
+                            {"type": "long", "logicalType": "timestamp-micros"},
+                        ],
+                    },
+                    {
+                        "name": "tags",
+                        "type": [
+                            "null",
+                            {"type": "array", "items": ["null", "string"]},
+                        ],
+                    },
+                ],
+            }
+        ),
+    }
+    fg._online_topic_name = "test_topic"
+    return fg
+
+
+def _topic_message(mocker, fg, row, partition=0, offset=0, feature_group_id=b"111"):
+    feature_writers, writer = kafka_engine._get_writer_function(fg)
+    message = mocker.Mock()
+    message.value.return_value = kafka_engine._encode_row(
+        feature_writers, writer, dict(row)
+    )
+    message.error.return_value = None
+    message.partition.return_value = partition
+    message.offset.return_value = offset
+    message.timestamp.return_value = (1, 1700000000000)
+    message.headers.return_value = [("featureGroupId", feature_group_id)]
+    return message
+
+
+class FakeConsumer:
+    """Consumer returning the messages of its assigned partitions in a single batch."""
+
+    def __init__(self, messages, end_offsets):
+        self._messages = messages
+        self._end_offsets = end_offsets
+        self._assigned = None
+        self.closed = False
+
+    def list_topics(self, topic, timeout=None):
+        topic_metadata = TopicMetadata()
+        topic_metadata.partitions = {p: PartitionMetadata() for p in self._end_offsets}
+        return type("Metadata", (), {"topics": {topic: topic_metadata}})()
+
+    def get_watermark_offsets(self, partition):
+        return 0, self._end_offsets[partition.partition]
+
+    def assign(self, assignment):
+        self._assigned = {tp.partition for tp in assignment}
+
+    def consume(self, num_messages, timeout):
+        messages = [m for m in self._messages if m.partition() in self._assigned]
+        self._messages = [m for m in self._messages if m not in messages]
+        return messages
+
+    def close(self):
+        self.closed = True
+
+
 class TestKafkaEngine:
     def test_kafka_produce(self, mocker):
         # Arrange
@@ -812,3 +899,127 @@ class TestKafkaEngine:
 
         # Assert
         assert progress_bar.n == 1
+
+    @pytest.mark.skipif(
+        not constants.HAS_CONFLUENT_KAFKA, reason="confluent-kafka not installed"
+    )
+    def test_decode_messages(self, mocker):
+        # Arrange
+        fg = _topic_feature_group(mocker)
+        ts = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        messages = [
+            _topic_message(mocker, fg, {"id": 1, "ts": ts, "tags": ["a", "b"]}),
+            _topic_message(
+                mocker, fg, {"id": 2, "ts": None, "tags": None}, partition=1, offset=7
+            ),
+        ]
+        feature_readers, reader = kafka_engine._get_reader_function(fg)
+
+        # Act
+        table = kafka_engine._decode_messages(
+            messages, feature_readers, reader, kafka_engine._get_arrow_types(fg)
+        )
+
+        # Assert
+        assert table.column_names == [
+            "id",
+            "ts",
+            "tags",
+            "kafka_partition",
+            "kafka_offset",
+            "kafka_timestamp",
+        ]
+        assert table.column("id").to_pylist() == [1, 2]
+        assert table.column("tags").to_pylist() == [["a", "b"], None]
+        assert table.column("ts").to_pylist()[0] == ts.replace(tzinfo=None)
+        assert table.column("kafka_partition").to_pylist() == [0, 1]
+        assert table.column("kafka_offset").to_pylist() == [0, 7]
+
+    @pytest.mark.skipif(
+        not constants.HAS_CONFLUENT_KAFKA, reason="confluent-kafka not installed"
+    )
+    def test_consume_batches_stops_at_end(self, mocker):
+        # Arrange
+        fg = _topic_feature_group(mocker)
+        messages = [
+            _topic_message(mocker, fg, {"id": i, "ts": None, "tags": None}, offset=i)
+            for i in range(3)
+        ]
+        # rows of other feature groups sharing the topic are skipped
+        messages[1].headers.return_value = [("featureGroupId", b"112")]
+        consumer = FakeConsumer(messages, end_offsets={0: 3})
+        mocker.patch(
+            "hsfs.core.kafka_engine._init_kafka_consumer", return_value=consumer
+        )
+
+        # Act
+        batches = list(fg.read_online_topic(dataframe_type="pandas"))
+
+        # Assert
+        assert len(batches) == 1
+        assert batches[0]["id"].tolist() == [0, 2]
+        assert consumer.closed
+
+    @pytest.mark.skipif(
+        not constants.HAS_CONFLUENT_KAFKA, reason="confluent-kafka not installed"
+    )
+    def test_consume_batches_parallel_partitions(self, mocker):
+        # Arrange
+        fg = _topic_feature_group(mocker)
+        messages = [
+            _topic_message(mocker, fg, {"id": p, "ts": None, "tags": None}, partition=p)
+            for p in range(3)
+        ]
+        consumers = []
+
+        def init_consumer(feature_store_id, options):
+            assert options["kafka_producer_config"]["enable.auto.commit"] is False
+            consumers.append(FakeConsumer(messages, end_offsets={0: 1, 1: 1, 2: 1}))
+            return consumers[-1]
+
+        mocker.patch(
+            "hsfs.core.kafka_engine._init_kafka_consumer", side_effect=init_consumer
+        )
+
+        # Act
+        batches = list(kafka_engine._consume_batches(fg, max_workers=3))
+
+        # Assert
+        assert sorted(
+            row for batch in batches for row in batch.column("id").to_pylist()
+        ) == [0, 1, 2]
+        # one consumer for the metadata and one per worker
+        assert len(consumers) == 4
+        assert all(consumer.closed for consumer in consumers)
+
+    @pytest.mark.skipif(
+        not constants.HAS_CONFLUENT_KAFKA, reason="confluent-kafka not installed"
+    )
+    def test_consume_batches_close_with_idle_partition(self, mocker):
+        # Arrange
+        fg = _topic_feature_group(mocker)
+        # partition 1 never receives a message
+        messages = [_topic_message(mocker, fg, {"id": 0, "ts": None, "tags": None})]
+        consumers = []
+
+        def init_consumer(feature_store_id, options):
+            consumers.append(FakeConsumer(messages, end_offsets={0: 1, 1: 0}))
+            return consumers[-1]
+
+        mocker.patch(
+            "hsfs.core.kafka_engine._init_kafka_consumer", side_effect=init_consumer
+        )
+        batches = kafka_engine._consume_batches(
+            fg, stop_at_end=False, timeout=0.01, max_workers=2
+        )
+
+        # Act
+        first = next(batches)
+        closing = threading.Thread(target=batches.close)
+        closing.start()
+        closing.join(timeout=5)
+
+        # Assert
+        assert first.column("id").to_pylist() == [0]
+        assert not closing.is_alive()
+        assert all(consumer.closed for consumer in consumers)
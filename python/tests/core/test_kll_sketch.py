@@ -0,0 +1,146 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import struct
+
+import numpy as np
+import pytest
+from hsfs.core.kll_sketch import KllDoublesSketch, _total_capacity
+
+
+class TestKllDoublesSketch:
+    def test_level_capacities(self):
+        # Assert
+        assert _total_capacity(200, 8, 1) == 200
+        assert _total_capacity(200, 8, 2) == 200 + 133
+        assert _total_capacity(8, 8, 3) == 24
+
+    def test_deserialize_empty(self):
+        # Arrange
+        data = struct.pack("<BBBBHBx", 2, 1, 15, 1, 200, 8)
+
+        # Act
+        sketch = KllDoublesSketch.from_bytes(data)
+
+        # Assert
+        assert sketch.is_empty
+        assert sketch.k == 200
+        assert sketch.to_bytes() == struct.pack("<BBBBHBx", 2, 1, 15, 3, 200, 8)
+
+    def test_deserialize_single_item(self):
+        # Arrange
+        data = struct.pack("<BBBBHBxd", 2, 2, 15, 4, 200, 8, 4.5)
+
+        # Act
+        sketch = KllDoublesSketch.from_bytes(data)
+
+        # Assert
+        assert sketch.n == 1
+        assert sketch.min_item == sketch.max_item == 4.5
+        assert sketch.get_quantiles([0.5]).tolist() == [4.5]
+
+    def test_deserialize_full(self):
+        # Arrange: k=8 and 2 levels give 8 + 8 slots; 3 items of weight 1 and
+        # 2 items of weight 2 are retained.
+        data = (
+            struct.pack("<BBBBHBxqHBx", 5, 1, 15, 0, 8, 8, 7, 8, 2)
+            + struct.pack("<2i", 11, 14)
+            + struct.pack("<dd", 1.0, 9.0)
+            + struct.pack("<5d", 3.0, 1.0, 2.0, 5.0, 9.0)
+        )
+
+        # Act
+        sketch = KllDoublesSketch.from_bytes(data)
+
+        # Assert
+        assert sketch.n == 7
+        assert sketch.num_retained == 5
+        assert sketch.get_quantiles([0.1, 0.5, 0.6, 1.0]).tolist() == [
+            1.0,
+            5.0,
+            5.0,
+            9.0,
+        ]
+        np.testing.assert_allclose(sketch.get_cdf([2.0, 5.0]), [2 / 7, 5 / 7, 1.0])
+        assert sketch.to_bytes() == data
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"bytes1",
+            struct.pack("<BBBBHBx", 2, 1, 7, 0, 200, 8),
+            struct.pack("<BBBBHBx", 5, 3, 15, 0, 200, 8),
+            # weights add up to 5, not the 7 of the preamble
+            struct.pack("<BBBBHBxqHBx", 5, 1, 15, 0, 8, 8, 7, 8, 1)
+            + struct.pack("<i", 3)
+            + struct.pack("<dd", 1.0, 5.0)
+            + struct.pack("<5d", 1.0, 2.0, 3.0, 4.0, 5.0),
+        ],
+    )
+    def test_deserialize_invalid(self, data):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            KllDoublesSketch.from_bytes(data)
+
+    def test_update_and_round_trip(self):
+        # Arrange
+        values = np.random.default_rng(0).normal(size=50000)
+        sketch = KllDoublesSketch(200)
+
+        # Act
+        sketch.update(values)
+        restored = KllDoublesSketch.from_bytes(sketch.to_bytes())
+
+        # Assert
+        assert restored.n == 50000
+        assert restored.num_retained < 1000
+        assert restored.min_item == values.min()
+        assert restored.max_item == values.max()
+        fractions = np.arange(1, 100) / 100
+        np.testing.assert_array_equal(
+            restored.get_quantiles(fractions), sketch.get_quantiles(fractions)
+        )
+
+    def test_merge(self):
+        # Arrange
+        rng = np.random.default_rng(0)
+        values = rng.uniform(size=100000)
+        merged = KllDoublesSketch(200)
+        other_k = KllDoublesSketch(100)
+        other_k.update(values[:10])
+
+        # Act
+        for chunk in np.array_split(values[10:], 10):
+            sketch = KllDoublesSketch(200)
+            sketch.update(chunk)
+            merged.merge(sketch)
+        merged.merge(other_k)
+
+        # Assert
+        assert merged.n == 100000
+        assert merged.k == 200
+        assert KllDoublesSketch.from_bytes(merged.to_bytes()).n == 100000
+        fractions = np.arange(1, 100) / 100
+        np.testing.assert_allclose(
+            merged.get_quantiles(fractions), fractions, atol=0.02
+        )
+        np.testing.assert_allclose(
+            merged.get_cdf([0.25, 0.5, 0.75]), [0.25, 0.5, 0.75, 1.0], atol=0.02
+        )
+
+    def test_empty_quantiles_raise(self):
+        # Act & Assert
+        with pytest.raises(ValueError):
+            KllDoublesSketch(200).get_quantiles([0.5])
@@ -0,0 +1,162 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from hsfs.client.exceptions import FeatureStoreException
+from hsfs.core.local_vector_index import LocalVectorIndex
+from hsfs.embedding import EmbeddingIndex, SimilarityFunctionType
+from hsfs.feature import Feature
+from hsfs.feature_group import FeatureGroup
+
+
+def _data(n=200, dimension=8, seed=1):
+    rng = np.random.default_rng(seed)
+    embeddings = rng.normal(size=(n, dimension)).astype(np.float32)
+    rows = pd.DataFrame({"id": np.arange(n), "vector": list(embeddings)})
+    return embeddings, rows
+
+
+class TestLocalVectorIndex:
+    def test_flat_l2_scores(self):
+        # Arrange
+        embeddings, rows = _data()
+        index = LocalVectorIndex(embeddings, rows)
+        query = embeddings[5] + 0.01
+
+        # Act
+        scores, indices = index.search([query], k=3)
+
+        # Assert
+        distances = ((embeddings - query) ** 2).sum(axis=1)
+        np.testing.assert_array_equal(indices[0], np.argsort(distances)[:3])
+        np.testing.assert_allclose(scores[0], np.sort(distances)[:3], atol=1e-5)
+
+    def test_flat_cosine_scores(self):
+        # Arrange
+        embeddings, rows = _data()
+        index = LocalVectorIndex(embeddings, rows, SimilarityFunctionType.COSINE)
+        query = embeddings[7] * 3
+
+        # Act
+        scores, indices = index.search([query], k=1)
+
+        # Assert
+        assert indices[0, 0] == 7
+        assert scores[0, 0] == pytest.approx(0, abs=1e-5)
+
+    def test_flat_dot_product_scores(self):
+        # Arrange
+        embeddings = np.array([[1.0, 0.0], [2.0, 0.0], [-1.0, 0.0]])
+        rows = pd.DataFrame({"id": [0, 1, 2]})
+        index = LocalVectorIndex(embeddings, rows, SimilarityFunctionType.DOT_PRODUCT)
+
+        # Act
+        scores, indices = index.search([[1.0, 0.0]], k=3)
+
+        # Assert
+        np.testing.assert_array_equal(indices[0], [1, 0, 2])
+        # transformed like the scores of the OpenSearch innerproduct space
+        np.testing.assert_allclose(scores[0], [1 / 3 - 1, 1 / 2 - 1, 1])
+
+    def test_find_neighbors_batch_format(self):
+        # Arrange
+        embeddings, rows = _data(n=5, dimension=2)
+        index = LocalVectorIndex(embeddings, rows)
+
+        # Act
+        results = index.find_neighbors_batch(embeddings[:2], k=10)
+
+        # Assert
+        assert len(results) == 2
+        assert len(results[0]) == 5
+        score, row = results[0][0]
+        assert score == pytest.approx(0, abs=1e-6)
+        assert row[0] == 0
+        assert row[1] == pytest.approx(embeddings[0].tolist())
+        assert isinstance(row[1], list)
+
+    def test_ivf_probing_all_lists_is_exact(self):
+        # Arrange
+        embeddings, rows = _data(n=500)
+        flat = LocalVectorIndex(embeddings, rows)
+        ivf = LocalVectorIndex(embeddings, rows, index_type="ivf", nlist=10, nprobe=10)
+
+        # Act
+        _, flat_indices = flat.search(embeddings[:20], k=5)
+        _, ivf_indices = ivf.search(embeddings[:20], k=5)
+
+        # Assert
+        np.testing.assert_array_equal(ivf_indices, flat_indices)
+
+    def test_ivf_pq_recall(self):
+        # Arrange
+        embeddings, rows = _data(n=1000, dimension=16)
+        flat = LocalVectorIndex(embeddings, rows)
+        ivf_pq = LocalVectorIndex(
+            embeddings, rows, index_type="ivf_pq", nlist=4, nprobe=4, pq_m=8
+        )
+
+        # Act
+        _, flat_indices = flat.search(embeddings[:50], k=1)
+        _, pq_indices = ivf_pq.search(embeddings[:50], k=1)
+
+        # Assert
+        assert (flat_indices == pq_indices).mean() > 0.8
+
+    def test_invalid_index_type(self):
+        # Arrange
+        embeddings, rows = _data(n=5)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            LocalVectorIndex(embeddings, rows, index_type="hnsw")
+
+    def test_from_feature_group(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        embedding_index = EmbeddingIndex()
+        embedding_index.add_embedding(
+            "vector", 8, similarity_function_type=SimilarityFunctionType.COSINE
+        )
+        with mock.patch("hopsworks_common.client._get_instance"):
+            fg = FeatureGroup("test_fg", 1, 99, id=1, embedding_index=embedding_index)
+        fg.features = [
+            Feature("id", type="bigint"),
+            Feature("vector", type="array<float>"),
+        ]
+        embeddings, rows = _data()
+
+        # Act
+        index = fg.build_local_index(data=rows, index_type="ivf")
+
+        # Assert
+        assert index.similarity_function_type == SimilarityFunctionType.COSINE
+        assert index.index_type == "ivf"
+        assert len(index) == 200
+        assert index.find_neighbors(embeddings[3], k=1)[0][1][0] == 3
+
+    def test_from_feature_group_without_embedding(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        with mock.patch("hopsworks_common.client._get_instance"):
+            fg = FeatureGroup("test_fg", 1, 99, id=1)
+
+        # Act & Assert
+        with pytest.raises(FeatureStoreException):
+            fg.build_local_index(data=_data()[1])
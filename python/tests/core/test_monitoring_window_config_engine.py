@@ -13,10 +13,12 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 #
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, call
 
 import pytest
+from hopsworks_common.client.exceptions import RestAPIError
 from hsfs import feature_group, feature_view, util
 from hsfs.constructor import filter as filter_module
 from hsfs.constructor import query
@@ -928,3 +930,160 @@ class TestMergeDispatch:
         assert not resolve_mock.called, (
             "cap reached — must fall back before even invoking the merger"
         )
+
+
+class TestRunWindowsMonitoring:
+    """Scheduling of the windows of several monitoring configs of an entity."""
+
+    @staticmethod
+    def _stats(feature_names, count=100):
+        return [
+            FeatureDescriptiveStatistics(feature_name=f, count=count)
+            for f in feature_names
+        ]
+
+    def test_identical_windows_are_computed_once(self, mocker):
+        # Arrange
+        engine = mwce.MonitoringWindowConfigEngine()
+        run_single = mocker.patch.object(
+            engine,
+            "_run_single_window_monitoring",
+            side_effect=lambda **kwargs: self._stats(kwargs["feature_names"]),
+        )
+        requests = [
+            mwce.WindowStatisticsRequest(
+                monitoring_window_config=mwc.MonitoringWindowConfig(
+                    time_offset="1d", row_percentage=1.0
+                ),
+                feature_names=feature_names,
+            )
+            for feature_names in (["amount", "age"], ["age", "city"])
+        ] + [
+            mwce.WindowStatisticsRequest(
+                monitoring_window_config=mwc.MonitoringWindowConfig(
+                    time_offset="1w", row_percentage=1.0
+                ),
+                feature_names=["amount"],
+            )
+        ]
+
+        # Act
+        results = engine._run_windows_monitoring(entity=MagicMock(), requests=requests)
+
+        # Assert
+        assert run_single.call_count == 2
+        assert sorted(
+            single_call.kwargs["feature_names"]
+            for single_call in run_single.call_args_list
+        ) == [["amount"], ["amount", "age", "city"]]
+        assert [[fds.feature_name for fds in stats] for stats in results] == [
+            ["amount", "age"],
+            ["age", "city"],
+            ["amount"],
+        ]
+
+    def test_failed_window_returns_exception(self, mocker):
+        # Arrange
+        engine = mwce.MonitoringWindowConfigEngine()
+        error = RuntimeError("read failed")
+
+        def run_single(**kwargs):
+            if kwargs["monitoring_window_config"].time_offset == "1w":
+                raise error
+            return self._stats(kwargs["feature_names"])
+
+        mocker.patch.object(
+            engine, "_run_single_window_monitoring", side_effect=run_single
+        )
+        requests = [
+            mwce.WindowStatisticsRequest(
+                mwc.MonitoringWindowConfig(time_offset=time_offset), ["amount"]
+            )
+            for time_offset in ("1d", "1w")
+        ]
+
+        # Act
+        results = engine._run_windows_monitoring(
+            entity=MagicMock(), requests=requests, return_exceptions=True
+        )
+
+        # Assert
+        assert [fds.feature_name for fds in results[0]] == ["amount"]
+        assert results[1] is error
+        with pytest.raises(RuntimeError):
+            engine._run_windows_monitoring(entity=MagicMock(), requests=requests)
+
+    def test_windows_differing_in_profile_flags_are_not_merged(self, mocker):
+        # Arrange
+        engine = mwce.MonitoringWindowConfigEngine()
+        run_single = mocker.patch.object(
+            engine,
+            "_run_single_window_monitoring",
+            side_effect=lambda **kwargs: self._stats(kwargs["feature_names"]),
+        )
+        window_config = mwc.MonitoringWindowConfig(time_offset="1d")
+        requests = [
+            mwce.WindowStatisticsRequest(window_config, ["amount"]),
+            mwce.WindowStatisticsRequest(window_config, ["amount"], {"kll": True}),
+        ]
+
+        # Act
+        engine._run_windows_monitoring(entity=MagicMock(), requests=requests)
+
+        # Assert
+        assert run_single.call_count == 2
+
+    def test_distinct_windows_run_concurrently(self, mocker):
+        # Arrange
+        engine = mwce.MonitoringWindowConfigEngine()
+        barrier = threading.Barrier(2, timeout=10)
+
+        def run_single(**kwargs):
+            # both windows must be in flight at the same time to pass the barrier
+            barrier.wait()
+            return self._stats(kwargs["feature_names"])
+
+        mocker.patch.object(
+            engine, "_run_single_window_monitoring", side_effect=run_single
+        )
+        requests = [
+            mwce.WindowStatisticsRequest(
+                mwc.MonitoringWindowConfig(time_offset=offset), ["amount"]
+            )
+            for offset in ("1d", "1w")
+        ]
+
+        # Act
+        results = engine._run_windows_monitoring(entity=MagicMock(), requests=requests)
+
+        # Assert
+        assert [len(stats) for stats in results] == [1, 1]
+
+    def test_statistics_not_found_is_an_empty_window(self, mocker):
+        # Arrange
+        engine = mwce.MonitoringWindowConfigEngine()
+        not_found_response = MagicMock()
+        not_found_response.json.return_value = {
+            "errorCode": RestAPIError.FeatureStoreErrorCode.STATISTICS_NOT_FOUND
+        }
+        not_found_response.status_code = 404
+        mocker.patch.object(
+            engine,
+            "_run_single_window_monitoring",
+            side_effect=RestAPIError("url", not_found_response),
+        )
+        requests = [
+            mwce.WindowStatisticsRequest(
+                mwc.MonitoringWindowConfig(training_dataset_version=1),
+                ["amount", "age"],
+            )
+        ]
+
+        # Act
+        results = engine._run_windows_monitoring(entity=MagicMock(), requests=requests)
+
+        # Assert
+        assert [(fds.feature_name, fds.count) for fds in results[0]] == [
+            ("amount", 0),
+            ("age", 0),
+        ]
@@ -0,0 +1,233 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+import os
+
+import pandas as pd
+import pyarrow as pa
+from hsfs import feature_group_commit
+from hsfs.constructor import fs_query
+from hsfs.core import offline_query_cache
+from hsfs.engine import python
+
+
+def _fs_query(hqs_payload="{}", on_demand_feature_groups=None):
+    return fs_query.FsQuery(
+        query="test_query",
+        on_demand_feature_groups=on_demand_feature_groups or [],
+        hudi_cached_feature_groups=[
+            {
+                "feature_group": {
+                    "type": "cachedFeaturegroupDTO",
+                    "id": 15,
+                    "name": "test_name",
+                    "version": 1,
+                    "featurestore_id": 67,
+                },
+                "alias": "fg0",
+                "left_feature_group_start_timestamp": None,
+                "left_feature_group_end_timestamp": 1000,
+            }
+        ],
+        hqs_payload=hqs_payload,
+    )
+
+
+def _mock_commits(mocker, commit_id):
+    return mocker.patch(
+        "hsfs.core.feature_group_api.FeatureGroupApi._get_commit_details",
+        return_value=[feature_group_commit.FeatureGroupCommit(commitid=commit_id)],
+    )
+
+
+class TestOfflineQueryCache:
+    def test_get_instance_disabled(self):
+        # Act & Assert
+        assert offline_query_cache._get_instance(None) is None
+        assert offline_query_cache._get_instance(False) is None
+
+    def test_get_instance_config(self, tmp_path):
+        # Act
+        cache = offline_query_cache._get_instance(
+            {"path": str(tmp_path), "max_size_bytes": 1024}
+        )
+
+        # Assert
+        assert cache.cache_dir == str(tmp_path)
+        assert cache.max_size_bytes == 1024
+        assert cache is offline_query_cache._get_instance(
+            {"path": str(tmp_path), "max_size_bytes": 1024}
+        )
+
+    def test_cache_key_changes_with_commit(self, mocker, tmp_path):
+        # Arrange
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path))
+        query = _fs_query()
+
+        # Act
+        _mock_commits(mocker, 1)
+        key_1 = cache._cache_key(query)
+        _mock_commits(mocker, 2)
+        key_2 = cache._cache_key(query)
+
+        # Assert
+        assert key_1[0] == key_2[0]
+        assert key_1[1] != key_2[1]
+
+    def test_cache_key_external_feature_group(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        _mock_commits(mocker, 1)
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path))
+        query = _fs_query(
+            on_demand_feature_groups=[
+                {
+                    "on_demand_feature_group": {
+                        "type": "onDemandFeaturegroupDTO",
+                        "id": 16,
+                        "spine": False,
+                    },
+                    "alias": "fg1",
+                }
+            ]
+        )
+
+        # Act & Assert
+        assert cache._cache_key(query) is None
+
+    def test_cache_key_no_commits(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.feature_group_api.FeatureGroupApi._get_commit_details",
+            return_value=[],
+        )
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path))
+
+        # Act & Assert
+        assert cache._cache_key(_fs_query()) is None
+
+    def test_put_get(self, tmp_path):
+        # Arrange
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path))
+        table = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+        # Act
+        miss = cache._get("q", "v1")
+        cache._put("q", "v1", table)
+        hit = cache._get("q", "v1")
+
+        # Assert
+        assert miss is None
+        assert hit.equals(table)
+
+    def test_put_invalidates_stale_versions(self, tmp_path):
+        # Arrange
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path))
+        table = pa.table({"a": [1]})
+        cache._put("q", "v1", table)
+        cache._put("other", "v1", table)
+
+        # Act
+        cache._put("q", "v2", table)
+
+        # Assert
+        assert cache._get("q", "v1") is None
+        assert cache._get("q", "v2") is not None
+        assert cache._get("other", "v1") is not None
+
+    def test_evict_least_recently_used(self, tmp_path):
+        # Arrange
+        table = pa.table({"a": list(range(1000))})
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path))
+        cache._put("q1", "v", table)
+        cache._put("q2", "v", table)
+        entry_size = os.path.getsize(cache._path("q1", "v"))
+        os.utime(cache._path("q1", "v"), (1, 1))
+        os.utime(cache._path("q2", "v"), (2, 2))
+        cache._get("q1", "v")
+        cache._max_size_bytes = 2 * entry_size
+
+        # Act
+        cache._put("q3", "v", table)
+
+        # Assert
+        assert cache._get("q1", "v") is not None
+        assert cache._get("q2", "v") is None
+        assert cache._get("q3", "v") is not None
+
+    def test_put_larger_than_cache(self, tmp_path):
+        # Arrange
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path), max_size_bytes=1)
+
+        # Act
+        cache._put("q", "v", pa.table({"a": list(range(100))}))
+
+        # Assert
+        assert cache._get("q", "v") is None
+
+    def test_get_corrupt_entry(self, tmp_path):
+        # Arrange
+        cache = offline_query_cache.OfflineQueryCache(str(tmp_path))
+        with open(cache._path("q", "v"), "wb") as f:
+            f.write(b"not arrow")
+
+        # Act & Assert
+        assert cache._get("q", "v") is None
+        assert not os.path.exists(cache._path("q", "v"))
+
+    def test_sql_offline_local_cache(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        _mock_commits(mocker, 1)
+        mock_read_query = mocker.patch(
+            "hsfs.engine.python.Engine._read_query_service",
+            return_value=pa.table({"a": [1, 2]}),
+        )
+        python_engine = python.Engine()
+        local_cache = {"path": str(tmp_path)}
+
+        # Act
+        first = python_engine._sql_offline(
+            _fs_query(), "pandas", local_cache=local_cache
+        )
+        second = python_engine._sql_offline(
+            _fs_query(), "pandas", local_cache=local_cache
+        )
+
+        # Assert
+        assert mock_read_query.call_count == 1
+        assert mock_read_query.call_args[0][2] == "pyarrow"
+        pd.testing.assert_frame_equal(first, pd.DataFrame({"a": [1, 2]}))
+        pd.testing.assert_frame_equal(second, first)
+
+    def test_sql_offline_local_cache_new_commit(self, mocker, tmp_path):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        mock_read_query = mocker.patch(
+            "hsfs.engine.python.Engine._read_query_service",
+            return_value=pa.table({"a": [1, 2]}),
+        )
+        python_engine = python.Engine()
+        local_cache = {"path": str(tmp_path)}
+
+        # Act
+        _mock_commits(mocker, 1)
+        python_engine._sql_offline(_fs_query(), "pandas", local_cache=local_cache)
+        _mock_commits(mocker, 2)
+        python_engine._sql_offline(_fs_query(), "pandas", local_cache=local_cache)
+
+        # Assert
+        assert mock_read_query.call_count == 2
+        assert len(os.listdir(tmp_path)) == 1
@@ -17,6 +17,7 @@
 import pytest
 from hsfs import training_dataset_feature
 from hsfs.core import online_store_rest_client_engine
+from hsfs.core.serving_stats import ServingStats
 
 
 ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS = "hsfs.core.online_store_rest_client_api.OnlineStoreRestClientApi._get_batch_raw_feature_vectors"
@@ -291,6 +292,38 @@ class TestOnlineRestClientEngine:
             ]
         )
 
+    def test_get_batch_feature_vectors_records_serving_stats(
+        self, mocker, backend_fixtures, training_dataset_features_ticker
+    ):
+        # Arrange
+        stats = ServingStats()
+        engine = online_store_rest_client_engine.OnlineStoreRestClientEngine(
+            feature_store_name="test_store_featurestore",
+            feature_view_name="test_feature_view",
+            feature_view_version=2,
+            features=training_dataset_features_ticker,
+            serving_stats=stats,
+        )
+        mocker.patch(
+            ONLINE_STORE_REST_CLIENT_API_GET_BATCH_RAW_FEATURE_VECTORS,
+            return_value=backend_fixtures["rondb_server"][
+                "get_batch_vector_response_json_complete"
+            ],
+        )
+
+        # Act
+        engine._get_batch_feature_vectors(
+            entries=backend_fixtures["rondb_server"]["get_batch_vector_payload"][
+                "entries"
+            ],
+            drop_missing=False,
+        )
+
+        # Assert
+        summary = stats.summary()
+        assert set(summary) == {ServingStats.REST_REQUEST, ServingStats.REST_DECODE}
+        assert summary[ServingStats.REST_REQUEST]["count"] == 1
+
     @pytest.mark.parametrize(
         "fixture_key",
         [
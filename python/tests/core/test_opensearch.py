@@ -83,6 +83,81 @@ class TestOpenSearchClientSingleton:
         assert exception.reason == expected_reason
         assert exception.info == expected_info
 
+    def test_msearch(self):
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.msearch.return_value = {
+            "responses": [{"hits": {"hits": []}}, {"hits": {"hits": []}}]
+        }
+        target = ProjectOpenSearchClient(
+            opensearch_client=mock_client, is_cluster_client=False
+        )
+        body = [{"index": "idx"}, {"size": 1}, {"index": "idx"}, {"size": 2}]
+
+        # Act
+        result = target._msearch(body=body)
+
+        # Assert
+        assert len(result["responses"]) == 2
+        assert mock_client.msearch.call_args.kwargs["body"] == body
+
+    def test_msearch_item_error(self):
+        # Arrange
+        mock_client = MagicMock()
+        mock_client.msearch.return_value = {
+            "responses": [
+                {"hits": {"hits": []}},
+                {
+                    "error": {
+                        "type": "search_phase_execution_exception",
+                        "caused_by": {
+                            "type": "illegal_argument_exception",
+                            "reason": "[knn] requires k <= 5",
+                        },
+                    },
+                    "status": 400,
+                },
+            ]
+        }
+        target = ProjectOpenSearchClient(
+            opensearch_client=mock_client, is_cluster_client=False
+        )
+
+        # Act
+        with pytest.raises(VectorDatabaseException) as e:
+            target._msearch(body=[{"index": "idx"}, {"size": 1}])
+
+        # Assert
+        assert e.value.reason == VectorDatabaseException.REQUESTED_K_TOO_LARGE
+
+    def test_create_and_delete_pit(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hopsworks_common.core.opensearch.OpensearchRequestOption.get_version",
+            return_value=(2, 11),
+        )
+        mock_client = MagicMock()
+        mock_client.create_point_in_time.return_value = {"pit_id": "pit"}
+        target = ProjectOpenSearchClient(
+            opensearch_client=mock_client, is_cluster_client=False
+        )
+
+        # Act
+        pit_id = target._create_pit("idx", "5m")
+        target._delete_pit(pit_id)
+
+        # Assert
+        assert pit_id == "pit"
+        assert mock_client.create_point_in_time.call_args.kwargs["index"] == "idx"
+        assert (
+            mock_client.create_point_in_time.call_args.kwargs["params"]["keep_alive"]
+            == "5m"
+        )
+        assert "keep_alive" not in OpensearchRequestOption.DEFAULT_OPTION_MAP_V2_3
+        mock_client.delete_point_in_time.assert_called_once_with(
+            body={"pit_id": ["pit"]}
+        )
+
     @pytest.fixture(autouse=True)
     def reset_singleton(self):
         """Ensure clean singleton state for each test.
@@ -395,6 +395,29 @@ class TestPandasDataframe(BaseDataFrameTest):
         # validate that only 'val' is detected as a string column
         assert string_cols == ["string1", "string2"]
 
+    def test_profile_columns(self):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "pk": [1.0, None, 3.0],
+                "name": ["a", "ünï", None],
+                "payload": [b"ab", b"abcd", None],
+                "mixed": ["hello", 2.0, None],
+            }
+        )
+
+        # Act
+        profiles = PandasValidator()._profile_columns(df)
+
+        # Assert
+        assert profiles["pk"].null_count == 1
+        assert profiles["pk"].max_length is None
+        assert profiles["name"].is_string
+        assert profiles["name"].max_length == 3
+        assert profiles["payload"].max_length == 4
+        assert profiles["mixed"].arrow_type is None
+        assert profiles["mixed"].null_count == 1
+
 
 @pytest.mark.skipif(not HAS_POLARS, reason="polars not installed")
 class TestPolarsDataframe(BaseDataFrameTest):
@@ -428,6 +451,19 @@ class TestPolarsDataframe(BaseDataFrameTest):
         # Assert
         assert isinstance(validator, PolarsValidator)
 
+    def test_profile_columns(self):
+        # Arrange
+        df = pl.DataFrame({"pk": [1, None, 3], "name": ["a", "ünï", None]})
+
+        # Act
+        profiles = PolarsValidator()._profile_columns(df)
+
+        # Assert
+        assert profiles["pk"].null_count == 1
+        assert profiles["name"].is_string
+        assert profiles["name"].max_length == 3
+        assert profiles["name"].null_count == 1
+
 
 class TestSparkDataframe(BaseDataFrameTest):
     @pytest.fixture
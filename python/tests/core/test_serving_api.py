@@ -14,10 +14,11 @@
 #   limitations under the License.
 #
 
+import asyncio
 import json
 import re
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from hopsworks_common.client.exceptions import RestAPIError
@@ -89,6 +90,7 @@ def _inference_deployment(
         project_namespace=project_namespace,
         api_protocol=api_protocol,
         _grpc_channel=None,
+        _async_grpc_client=None,
     )
 
 
@@ -352,6 +354,80 @@ class TestServingApi:
             deployment._grpc_channel is istio_client._create_grpc_channel.return_value
         )
 
+    @pytest.mark.parametrize(("project_name", "project_namespace"), NAMESPACE_CASES)
+    def test_async_grpc_inference_request_addresses_the_namespace(
+        self, mocker, project_name, project_namespace
+    ):
+        # Arrange
+        api = ServingApi()
+        istio_client = MagicMock()
+        async_client = istio_client._create_async_grpc_client.return_value
+        async_client.infer = AsyncMock(return_value=SimpleNamespace(outputs=["out"]))
+        mocker.patch(
+            "hsml.core.serving_api.client.istio._get_instance",
+            return_value=istio_client,
+        )
+        deployment = _inference_deployment(
+            project_name, project_namespace, api_protocol=IE.API_PROTOCOL_GRPC
+        )
+        infer_input = InferInput(name="input", shape=[1], datatype="FP32", data=[1.0])
+
+        async def predict_twice():
+            return [
+                await api._send_inference_request_async(deployment, [infer_input])
+                for _ in range(2)
+            ]
+
+        # Act
+        outputs = asyncio.run(predict_twice())
+
+        # Assert
+        assert outputs == [["out"], ["out"]]
+        istio_client._create_async_grpc_client.assert_called_once_with(
+            f"/v1/{project_namespace}/skdepl"
+        )
+        assert deployment._async_grpc_client is async_client
+
+    def test_stream_inference_requests_returns_request_positions(self, mocker):
+        # Arrange
+        api = ServingApi()
+        istio_client = MagicMock()
+        sent = []
+
+        async def stream_infer(requests):
+            async for request in requests:
+                sent.append(request)
+            for request in reversed(sent):
+                yield SimpleNamespace(id=request.id, outputs=request.inputs)
+
+        istio_client._create_async_grpc_client.return_value.stream_infer = stream_infer
+        mocker.patch(
+            "hsml.core.serving_api.client.istio._get_instance",
+            return_value=istio_client,
+        )
+        deployment = _inference_deployment(
+            "myproject", "myproject", api_protocol=IE.API_PROTOCOL_GRPC
+        )
+
+        async def payloads():
+            for i in range(3):
+                yield [f"input{i}"]
+
+        async def stream():
+            return [
+                response
+                async for response in api._stream_inference_requests(
+                    deployment, payloads()
+                )
+            ]
+
+        # Act
+        responses = asyncio.run(stream())
+
+        # Assert
+        assert responses == [(2, ["input2"]), (1, ["input1"]), (0, ["input0"])]
+        assert {request.model_name for request in sent} == {"skdepl"}
+
     def test_rest_inference_request_through_hopsworks_addresses_neither(self, mocker):
         # Arrange
         api = ServingApi()
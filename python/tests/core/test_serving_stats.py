@@ -0,0 +1,122 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hsfs.core.serving_stats import (
+    ServingStats,
+    opentelemetry_sink,
+    prometheus_sink,
+)
+
+
+class TestServingStats:
+    def test_summary(self):
+        # Arrange
+        stats = ServingStats()
+
+        # Act
+        for i in range(1, 101):
+            stats._record(ServingStats.FETCH, i / 1000)
+        stats._record(ServingStats.TOTAL, 0.5)
+        summary = stats.summary()
+
+        # Assert
+        assert set(summary) == {ServingStats.FETCH, ServingStats.TOTAL}
+        fetch = summary[ServingStats.FETCH]
+        assert fetch["count"] == 100
+        assert fetch["mean_ms"] == pytest.approx(50.5)
+        assert fetch["max_ms"] == pytest.approx(100)
+        # percentiles are bucket upper bounds, at most 19% above the exact value
+        assert 50 <= fetch["p50_ms"] <= 50 * 1.19
+        assert 90 <= fetch["p90_ms"] <= 90 * 1.19
+        assert 99 <= fetch["p99_ms"] <= 100
+        assert summary[ServingStats.TOTAL]["p99_ms"] == pytest.approx(500)
+
+    def test_summary_above_largest_bucket(self):
+        # Arrange
+        stats = ServingStats()
+
+        # Act
+        stats._record(ServingStats.TOTAL, 1000.0)
+
+        # Assert
+        assert stats.summary()[ServingStats.TOTAL]["p50_ms"] == pytest.approx(1e6)
+
+    def test_reset(self):
+        # Arrange
+        stats = ServingStats()
+        stats._record(ServingStats.FETCH, 0.01)
+
+        # Act
+        stats.reset()
+
+        # Assert
+        assert stats.summary() == {}
+
+    def test_lap(self, mocker):
+        # Arrange
+        mocker.patch("hsfs.core.serving_stats.time.perf_counter", return_value=12.5)
+        stats = ServingStats()
+
+        # Act
+        end = stats._lap(ServingStats.VALIDATE_ENTRY, 12.0)
+
+        # Assert
+        assert end == 12.5
+        assert stats.summary()[ServingStats.VALIDATE_ENTRY]["max_ms"] == 500
+
+    def test_sinks(self, mocker):
+        # Arrange
+        sink = mocker.Mock()
+        failing_sink = mocker.Mock(side_effect=RuntimeError("unreachable"))
+        stats = ServingStats(sinks=[failing_sink, sink])
+
+        # Act
+        stats._record(ServingStats.REST_REQUEST, 0.002)
+
+        # Assert
+        failing_sink.assert_called_once_with(ServingStats.REST_REQUEST, 0.002)
+        sink.assert_called_once_with(ServingStats.REST_REQUEST, 0.002)
+        assert stats.summary()[ServingStats.REST_REQUEST]["count"] == 1
+
+    def test_prometheus_sink(self, mocker):
+        # Arrange
+        histogram = mocker.Mock()
+        sink = prometheus_sink(histogram)
+
+        # Act
+        sink(ServingStats.FETCH, 0.1)
+        sink(ServingStats.FETCH, 0.2)
+
+        # Assert
+        histogram.labels.assert_called_once_with(stage=ServingStats.FETCH)
+        assert histogram.labels.return_value.observe.call_args_list == [
+            mocker.call(0.1),
+            mocker.call(0.2),
+        ]
+
+    def test_opentelemetry_sink(self, mocker):
+        # Arrange
+        histogram = mocker.Mock()
+        sink = opentelemetry_sink(histogram, attribute="hopsworks.stage")
+
+        # Act
+        sink(ServingStats.SQL_QUERY, 0.1)
+
+        # Assert
+        histogram.record.assert_called_once_with(
+            0.1, attributes={"hopsworks.stage": ServingStats.SQL_QUERY}
+        )
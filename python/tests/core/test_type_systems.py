@@ -884,6 +884,64 @@ class TestTypeSystems:
         assert str(e_info.value) == "Not supported type wrong."
 
 
+@pytest.mark.skipif(not HAS_PANDAS, reason="Pandas is not installed.")
+class TestCastPandasColumnToOfflineType:
+    def test_array_parses_json_strings(self):
+        # Arrange
+        series = pd.Series(["[1, 2, 3]", "", None, np.nan, "[4]"])
+
+        # Act
+        result = type_systems._cast_pandas_column_to_offline_type(series, "array<int>")
+
+        # Assert
+        assert result.tolist() == [[1, 2, 3], None, None, None, [4]]
+        assert result.dtype == object
+
+    def test_struct_parses_json_strings(self):
+        # Arrange
+        series = pd.Series(['{"label": "blue", "index": 45}', None])
+
+        # Act
+        result = type_systems._cast_pandas_column_to_offline_type(
+            series, "struct<label:string,index:int>"
+        )
+
+        # Assert
+        assert result.tolist() == [{"label": "blue", "index": 45}, None]
+
+    def test_struct_falls_back_to_python_literals(self):
+        # Arrange - single quotes are not JSON, so the column is parsed element by element
+        series = pd.Series(["{'label': 'blue', 'index': 45}"])
+
+        # Act
+        result = type_systems._cast_pandas_column_to_offline_type(
+            series, "struct<label:string,index:int>"
+        )
+
+        # Assert
+        assert result.tolist() == [{"label": "blue", "index": 45}]
+
+    def test_boolean_parses_string_literals(self):
+        # Arrange
+        series = pd.Series(["True", "False", "", None])
+
+        # Act
+        result = type_systems._cast_pandas_column_to_offline_type(series, "boolean")
+
+        # Assert
+        assert result.tolist() == [True, False, None, None]
+
+    def test_string_keeps_nan_behaviour(self):
+        # Arrange
+        series = pd.Series(["a", None, np.nan])
+
+        # Act
+        result = type_systems._cast_pandas_column_to_offline_type(series, "string")
+
+        # Assert
+        assert result.tolist() == ["a", None, "nan"]
+
+
 @pytest.mark.skipif(not HAS_POLARS, reason="Polars is not installed.")
 class TestCastPolarsColumnToOfflineType:
     """Direct unit tests for the per-branch cast logic shared across polars versions."""
@@ -1013,3 +1071,29 @@ class TestCastPolarsColumnToOfflineType:
 
         # Assert
         assert result is series
+
+    def test_array_parses_json_with_offline_element_type(self):
+        # Arrange
+        series = pl.Series("a", ["[1, 2]", "", None], dtype=pl.String)
+
+        # Act
+        result = type_systems._cast_polars_column_to_offline_type(
+            series, "array<double>"
+        )
+
+        # Assert
+        assert result.dtype == pl.List(pl.Float64)
+        assert result.name == "a"
+        assert result.to_list() == [[1.0, 2.0], None, None]
+
+    def test_decimal_does_not_round(self):
+        # Arrange
+        series = pl.Series("d", ["1.555"], dtype=pl.String)
+
+        # Act
+        result = type_systems._cast_polars_column_to_offline_type(
+            series, "decimal(10,2)"
+        )
+
+        # Assert
+        assert result.to_list() == [decimal.Decimal("1.555")]
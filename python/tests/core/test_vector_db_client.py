@@ -19,7 +19,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from hopsworks_common.util import _convert_event_time_to_timestamp
-from hsfs.client.exceptions import FeatureStoreException
+from hsfs.client.exceptions import FeatureStoreException, VectorDatabaseException
 from hsfs.core import vector_db_client
 from hsfs.embedding import EmbeddingIndex
 from hsfs.feature import Feature
@@ -38,6 +38,7 @@ class TestVectorDbClient:
         f_bool = Feature("f_bool", feature_group=fg, type="boolean")
         f_ts = Feature("f_ts", feature_group=fg, type="timestamp")
         fg.columns = [f1, f2, f3, f_bool, f_ts]
+        fg.primary_key = ["f1", "f2"]
         fg2 = FeatureGroup("test_fg", 1, 99, id=2)
         fg2.columns = [f1, f2]
 
@@ -518,6 +519,65 @@ class TestVectorDbClient:
             }
         }
 
+    def test_find_neighbors_batch_single_msearch(self):
+        # Arrange
+        hit = {"_score": 0.5, "_source": {"f1": 4, "f2": [9, 4, 4]}}
+        self.mock_os_wrapper._msearch.return_value = {
+            "responses": [{"hits": {"hits": [hit]}}, {"hits": {"hits": []}}]
+        }
+
+        # Act
+        results = self.target._find_neighbors_batch(
+            [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], feature=self.f2, k=5
+        )
+
+        # Assert
+        assert self.mock_os_wrapper._msearch.call_count == 1
+        assert self.mock_os_wrapper._search.call_count == 0
+        body = self.mock_os_wrapper._msearch.call_args.kwargs["body"]
+        assert body[0] == {"index": "2249__embedding_default_embedding"}
+        assert body[1]["query"]["knn"]["f2"]["vector"] == [1.0, 2.0, 3.0]
+        assert body[3]["query"]["knn"]["f2"]["vector"] == [4.0, 5.0, 6.0]
+        assert results == [[(1.0, {"f1": 4, "f2": [9, 4, 4]})], []]
+
+    def test_find_neighbors_batch_parallel_batches(self):
+        # Arrange
+        def msearch(body, options=None):
+            return {
+                "responses": [
+                    {
+                        "hits": {
+                            "hits": [
+                                {
+                                    "_score": 1.0,
+                                    "_source": {
+                                        "f1": query["query"]["knn"]["f2"]["vector"][0]
+                                    },
+                                }
+                            ]
+                        }
+                    }
+                    for query in body[1::2]
+                ]
+            }
+
+        self.mock_os_wrapper._msearch.side_effect = msearch
+        embeddings = [[float(i), 0.0, 0.0] for i in range(5)]
+
+        # Act
+        results = self.target._find_neighbors_batch(
+            embeddings, feature=self.f2, k=1, batch_size=2
+        )
+
+        # Assert
+        assert self.mock_os_wrapper._msearch.call_count == 3
+        assert [result[0][1]["f1"] for result in results] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_find_neighbors_batch_empty(self):
+        # Act & Assert
+        assert self.target._find_neighbors_batch([], feature=self.f2) == []
+        assert self.mock_os_wrapper._msearch.call_count == 0
+
     def test_convert_to_pandas_type_timestamp_keeps_milliseconds(self):
         # OpenSearch stores timestamps as epoch ms; sub-second precision must
         # survive the conversion, e.g. for timestamp(3) online types (FSTORE-2061)
@@ -536,3 +596,110 @@ class TestVectorDbClient:
         )
 
         assert result["f_ts"] == datetime(1970, 1, 1)
+
+    def test_read_batches_paginates_with_search_after(self):
+        # Arrange
+        def hit(i):
+            return {"_source": {"f1": i, "f3": i * 10}, "sort": [i, i]}
+
+        self.mock_os_wrapper._create_pit.return_value = "pit"
+        self.mock_os_wrapper._search.side_effect = [
+            {"pit_id": "pit", "hits": {"hits": [hit(1), hit(2)]}},
+            {"pit_id": "pit", "hits": {"hits": [hit(3)]}},
+        ]
+
+        # Act
+        batches = list(
+            self.target._read_batches(
+                self.fg.id, self.fg.columns, columns=["f1", "f3"], batch_size=2
+            )
+        )
+
+        # Assert
+        assert [batch.num_rows for batch in batches] == [2, 1]
+        assert batches[0].schema.names == ["f1", "f3"]
+        assert batches[1].to_pylist() == [{"f1": 3, "f3": 30}]
+        self.mock_os_wrapper._create_pit.assert_called_once_with(
+            "2249__embedding_default_embedding", "5m", options=None
+        )
+        first, second = (
+            c.kwargs["body"] for c in self.mock_os_wrapper._search.call_args_list
+        )
+        assert first["sort"] == [{"_shard_doc": "asc"}]
+        assert first["_source"] == ["f1", "f3"]
+        assert first["pit"] == {"id": "pit", "keep_alive": "5m"}
+        assert "search_after" not in first
+        assert second["search_after"] == [2, 2]
+        self.mock_os_wrapper._delete_pit.assert_called_once_with("pit")
+
+    def test_read_batches_slices(self):
+        # Arrange
+        def search(body, options=None):
+            slice_id = body["slice"]["id"]
+            return {
+                "hits": {"hits": [{"_source": {"f1": slice_id}, "sort": [slice_id]}]}
+            }
+
+        self.mock_os_wrapper._search.side_effect = search
+
+        # Act
+        batches = list(
+            self.target._read_batches(
+                self.fg.id, self.fg.columns, columns=["f1"], slices=3
+            )
+        )
+
+        # Assert
+        assert sorted(row["f1"] for b in batches for row in b.to_pylist()) == [0, 1, 2]
+        assert {
+            c.kwargs["body"]["slice"]["max"]
+            for c in self.mock_os_wrapper._search.call_args_list
+        } == {3}
+        self.mock_os_wrapper._delete_pit.assert_called_once()
+
+    def test_read_batches_slice_error_deletes_pit(self):
+        # Arrange
+        self.mock_os_wrapper._search.side_effect = FeatureStoreException("failed")
+
+        # Act & Assert
+        with pytest.raises(FeatureStoreException):
+            list(self.target._read_batches(self.fg.id, self.fg.columns, slices=2))
+        self.mock_os_wrapper._delete_pit.assert_called_once()
+
+    def test_read_batches_point_in_time_unavailable(self):
+        # Arrange
+        self.mock_os_wrapper._create_pit.side_effect = VectorDatabaseException(
+            VectorDatabaseException.OTHERS, "no such endpoint", {}
+        )
+
+        # Act & Assert
+        with pytest.raises(VectorDatabaseException) as e_info:
+            list(self.target._read_batches(self.fg.id, self.fg.columns))
+        assert e_info.value.reason == VectorDatabaseException.POINT_IN_TIME_UNAVAILABLE
+        self.mock_os_wrapper._search.assert_not_called()
+
+    def test_read_feature_group_falls_back_without_point_in_time(self, mocker):
+        # Arrange
+        mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient._read_feature_group_batches",
+            side_effect=VectorDatabaseException(
+                VectorDatabaseException.POINT_IN_TIME_UNAVAILABLE, "no pit", {}
+            ),
+        )
+        mock_search = mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient._search_feature_group",
+            return_value=[[1, 2]],
+        )
+        fg = mocker.MagicMock()
+
+        # Act
+        result = vector_db_client.VectorDbClient._read_feature_group(fg)
+
+        # Assert
+        assert result == [[1, 2]]
+        mock_search.assert_called_once_with(fg, None, filter=None)
+
+    def test_read_batches_unknown_feature(self):
+        # Act & Assert
+        with pytest.raises(FeatureStoreException):
+            list(self.target._read_batches(self.fg.id, self.fg.columns, columns=["x"]))
@@ -19,6 +19,7 @@ from unittest.mock import PropertyMock
 
 import pytest
 from hopsworks_common.core.constants import HAS_POLARS
+from hsfs.core.serving_stats import ServingStats
 from hsfs.core.vector_server import VectorServer
 
 
@@ -141,3 +142,85 @@ class TestVectorServer:
         server = VectorServer.__new__(VectorServer)
 
         assert server._handle_timestamp_based_on_dtype(timestamp_value) == expected
+
+    def _serving_server(self, mocker, serving_stats):
+        server = VectorServer(feature_store_id=99)
+        server._serving_stats = serving_stats
+        server._rest_client_engine = mocker.Mock()
+        server._rest_client_engine._get_single_feature_vector.return_value = {"id": 1}
+        server._rest_client_engine._get_batch_feature_vectors.return_value = [
+            {"id": 1},
+            {"id": 2},
+        ]
+        mocker.patch.object(
+            server, "_which_client_and_ensure_initialised", return_value="rest"
+        )
+        mocker.patch.object(
+            server, "_validate_entry", side_effect=lambda entry, **kwargs: entry
+        )
+        mocker.patch.object(server, "_assemble_feature_vector", return_value=[1])
+        mocker.patch.object(
+            server,
+            "_handle_feature_vector_return_type",
+            side_effect=lambda vector, **kwargs: vector,
+        )
+        return server
+
+    def test_get_feature_vector_records_serving_stats(self, mocker):
+        # Arrange
+        stats = ServingStats()
+        server = self._serving_server(mocker, stats)
+
+        # Act
+        vector = server._get_feature_vector({"id": 1}, return_type="list")
+
+        # Assert
+        assert vector == [1]
+        summary = stats.summary()
+        assert set(summary) == {
+            ServingStats.VALIDATE_ENTRY,
+            ServingStats.FETCH,
+            ServingStats.RETURN_TYPE,
+            ServingStats.TOTAL,
+        }
+        assert all(stage["count"] == 1 for stage in summary.values())
+        assert (
+            summary[ServingStats.TOTAL]["max_ms"]
+            >= summary[ServingStats.FETCH]["max_ms"]
+        )
+
+    def test_get_feature_vectors_records_serving_stats(self, mocker):
+        # Arrange
+        stats = ServingStats()
+        server = self._serving_server(mocker, stats)
+
+        # Act
+        vectors = server._get_feature_vectors(
+            [{"id": 1}, {"id": 2}], return_type="list", vector_db_features=[]
+        )
+
+        # Assert
+        assert vectors == [[1], [1]]
+        summary = stats.summary()
+        assert set(summary) == {
+            ServingStats.VALIDATE_ENTRY,
+            ServingStats.FETCH,
+            ServingStats.RETURN_TYPE,
+            ServingStats.TOTAL,
+        }
+        # the stages of a batch are recorded once per call
+        assert all(stage["count"] == 1 for stage in summary.values())
+
+    def test_get_feature_vector_without_serving_stats(self, mocker):
+        # Arrange
+        server = self._serving_server(mocker, None)
+        perf_counter = mocker.patch("hsfs.core.vector_server.time.perf_counter")
+
+        # Act
+        server._get_feature_vector({"id": 1}, return_type="list")
+        server._get_feature_vectors(
+            [{"id": 1}, {"id": 2}], return_type="list", vector_db_features=[]
+        )
+
+        # Assert
+        perf_counter.assert_not_called()
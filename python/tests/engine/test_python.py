@@ -350,6 +350,44 @@ class TestPython:
         assert mock_python_engine_sql_offline.call_count == 0
         assert mock_python_engine_jdbc.call_count == 1
 
+    @pytest.mark.parametrize(
+        "time_travel_format, engine_class, read_method",
+        [
+            ("DELTA", "hsfs.core.delta_engine.DeltaEngine", "_read_delta_rs_dataset"),
+            (
+                "ICEBERG",
+                "hsfs.core.iceberg_engine.IcebergEngine",
+                "_read_pyiceberg_dataset",
+            ),
+        ],
+    )
+    def test_read_time_travel(
+        self, mocker, time_travel_format, engine_class, read_method
+    ):
+        # Arrange
+        mock_engine = mocker.patch(engine_class)
+        getattr(mock_engine.return_value, read_method).return_value = pa.table(
+            {"id": [1, 2]}
+        )
+        python_engine = python.Engine()
+        query_obj = mocker.Mock()
+        query_obj._left_feature_group.time_travel_format = time_travel_format
+        query_obj.left_feature_group_start_time = 1000
+        query_obj.left_feature_group_end_time = None
+        id_feature = mocker.Mock()
+        id_feature.name = "id"
+        query_obj._left_features = [id_feature]
+
+        # Act
+        result = python_engine._read_time_travel(query_obj, "pandas")
+
+        # Assert
+        assert result["id"].tolist() == [1, 2]
+        getattr(mock_engine.return_value, read_method).assert_called_once_with(
+            1000, None, ["id"]
+        )
+        assert mock_engine.call_args.kwargs["spark_session"] is None
+
     def test_jdbc(self, mocker):
         # Arrange
         mock_util_create_mysql_engine = mocker.patch(
@@ -418,6 +456,51 @@ class TestPython:
         assert mock_util_create_mysql_engine.call_count == 1
         assert mock_python_engine_return_dataframe_type.call_count == 1
 
+    @pytest.mark.parametrize("dataframe_type", ["pandas", "polars"])
+    def test_jdbc_batch_size_streams_batches(self, mocker, dataframe_type):
+        # Arrange
+        if dataframe_type == "polars" and not HAS_POLARS:
+            pytest.skip("polars is not installed")
+        from sqlalchemy import create_engine, text
+
+        mysql_engine = create_engine("sqlite://")
+        with mysql_engine.begin() as conn:
+            conn.execute(text("CREATE TABLE fg (id INTEGER, amount REAL)"))
+            conn.execute(
+                text(
+                    "INSERT INTO fg VALUES (1, 1.5), (2, 2.5), (3, 3.5), (4, 4.5), (5, 5.5)"
+                )
+            )
+        mocker.patch(
+            "hsfs.core.util_sql._create_mysql_engine", return_value=mysql_engine
+        )
+        mocker.patch("hopsworks_common.client._is_external", return_value=False)
+        schema = [
+            feature.Feature(name="id", type="bigint", online_type="bigint"),
+            feature.Feature(name="amount", type="double", online_type="double"),
+        ]
+
+        python_engine = python.Engine()
+
+        # Act
+        batches = python_engine._jdbc(
+            sql_query="SELECT id, amount FROM fg ORDER BY id",
+            connector=None,
+            dataframe_type=dataframe_type,
+            read_options={"batch_size": 2},
+            # pandas_types casts only apply to pandas
+            schema=schema if dataframe_type == "pandas" else None,
+        )
+
+        # Assert
+        batches = list(batches)
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert [batch["id"].to_list() for batch in batches] == [[1, 2], [3, 4], [5]]
+        if dataframe_type == "polars":
+            assert all(isinstance(batch, pl.DataFrame) for batch in batches)
+        else:
+            assert all(str(batch["id"].dtype) == "Int64" for batch in batches)
+
     def test_read_none_data_format(self, mocker):
         # Arrange
         mocker.patch("pandas.concat")
@@ -928,6 +1011,115 @@ class TestPython:
         assert mock_boto3_client.call_count == 1
         assert mock_python_engine_read_pandas.call_count == 4
 
+    def test_read_s3_parquet_reads_dataset(self, mocker):
+        # Arrange
+        mock_boto3_client = mocker.patch("boto3.client")
+        mock_s3_filesystem = mocker.patch("pyarrow.fs.S3FileSystem")
+        mock_read_parquet_dataset = mocker.patch(
+            "hsfs.engine.python.Engine._read_parquet_dataset"
+        )
+
+        python_engine = python.Engine()
+
+        connector = storage_connector.S3Connector(
+            id=1,
+            name="test_connector",
+            featurestore_id=1,
+            arguments=[{"name": "fs.s3a.endpoint", "value": "http://localhost:9000"}],
+            access_key="test_access_key",
+            secret_key="test_secret_key",
+        )
+
+        mock_boto3_client.return_value.list_objects_v2.return_value = {
+            "Contents": [
+                {"Key": "td/_SUCCESS", "Size": 1},
+                {"Key": "td/part-0.parquet", "Size": 1},
+                {"Key": "td/part-1.parquet", "Size": 0},
+                {"Key": "td/part-2.parquet", "Size": 1},
+            ],
+        }
+        read_options = {"columns": ["a"]}
+
+        # Act
+        result = python_engine._read_s3(
+            storage_connector=connector,
+            location="s3://bucket/td",
+            data_format="parquet",
+            read_options=read_options,
+        )
+
+        # Assert
+        assert result == [mock_read_parquet_dataset.return_value]
+        mock_read_parquet_dataset.assert_called_once_with(
+            ["bucket/td/part-0.parquet", "bucket/td/part-2.parquet"],
+            mock_s3_filesystem.return_value,
+            read_options,
+            "default",
+        )
+        mock_s3_filesystem.assert_called_once_with(
+            access_key="test_access_key",
+            secret_key="test_secret_key",
+            region=None,
+            endpoint_override="localhost:9000",
+            scheme="http",
+        )
+        mock_boto3_client.return_value.get_object.assert_not_called()
+
+    @pytest.mark.parametrize("session_token", [None, "test_session_token"])
+    def test_get_s3_filesystem_resolves_bucket_region(self, mocker, session_token):
+        # Arrange
+        mock_resolve_region = mocker.patch(
+            "pyarrow.fs.resolve_s3_region", return_value="eu-north-1"
+        )
+        mock_s3_filesystem = mocker.patch("pyarrow.fs.S3FileSystem")
+
+        connector = storage_connector.S3Connector(
+            id=1,
+            name="test_connector",
+            featurestore_id=1,
+            access_key="test_access_key",
+            secret_key="test_secret_key",
+            session_token=session_token,
+        )
+
+        # Act
+        python.Engine._get_s3_filesystem(connector, "bucket")
+
+        # Assert
+        mock_resolve_region.assert_called_once_with("bucket")
+        assert mock_s3_filesystem.call_args.kwargs["region"] == "eu-north-1"
+
+    @pytest.mark.parametrize("dataframe_type", ["default", "polars"])
+    def test_read_parquet_dataset(self, tmp_path, dataframe_type):
+        # Arrange
+        if dataframe_type == "polars" and not HAS_POLARS:
+            pytest.skip("polars is not installed")
+        from pyarrow import fs
+        from pyarrow import parquet as pq
+
+        python_engine = python.Engine()
+        for i in range(3):
+            pq.write_table(
+                pa.table({"id": [2 * i, 2 * i + 1], "label": ["x", "y"]}),
+                tmp_path / f"part-{i}.parquet",
+            )
+        paths = [str(tmp_path / f"part-{i}.parquet") for i in range(3)]
+
+        # Act
+        result = python_engine._read_parquet_dataset(
+            paths,
+            fs.LocalFileSystem(),
+            {"columns": ["id"], "filters": [("label", "=", "y")]},
+            dataframe_type,
+        )
+
+        # Assert
+        if dataframe_type == "polars":
+            assert isinstance(result, pl.DataFrame)
+            result = result.to_pandas()
+        assert list(result.columns) == ["id"]
+        assert sorted(result["id"].tolist()) == [1, 3, 5]
+
     def test_read_options(self):
         # Arrange
         python_engine = python.Engine()
@@ -1033,6 +1225,72 @@ class TestPython:
         for col in cast_df.columns:
             assert cast_df[col].dtype == expected[col]
 
+    def test_read_vector_db_scans_index(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        mock_read_batches = mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient._read_feature_group_batches",
+            return_value=iter(
+                [
+                    pa.record_batch({"id": [1, 2], "name": ["a", "b"]}),
+                    pa.record_batch({"id": [3], "name": ["c"]}),
+                ]
+            ),
+        )
+        fg = feature_group.FeatureGroup(
+            name="test", version=1, featurestore_id=99, primary_key=[], id=10
+        )
+        fg.features = [
+            feature.Feature(name="id", type="bigint"),
+            feature.Feature(name="name", type="string"),
+        ]
+        python_engine = python.Engine()
+
+        # Act
+        result = python_engine._read_vector_db(
+            fg,
+            dataframe_type="pandas",
+            read_options={"vector_db_scan": {"batch_size": 2, "slices": 4}},
+        )
+
+        # Assert
+        pd.testing.assert_frame_equal(
+            result, pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+        )
+        assert mock_read_batches.call_args.kwargs["batch_size"] == 2
+        assert mock_read_batches.call_args.kwargs["slices"] == 4
+
+    def test_read_vector_db_falls_back_without_point_in_time(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient._read_feature_group_batches",
+            side_effect=exceptions.VectorDatabaseException(
+                exceptions.VectorDatabaseException.POINT_IN_TIME_UNAVAILABLE,
+                "no pit",
+                {},
+            ),
+        )
+        mock_search = mocker.patch(
+            "hsfs.core.vector_db_client.VectorDbClient._search_feature_group",
+            return_value=[[1, "a"]],
+        )
+        fg = feature_group.FeatureGroup(
+            name="test", version=1, featurestore_id=99, primary_key=[], id=10
+        )
+        fg.features = [
+            feature.Feature(name="id", type="bigint"),
+            feature.Feature(name="name", type="string"),
+        ]
+        python_engine = python.Engine()
+
+        # Act
+        result = python_engine._read_vector_db(fg, dataframe_type="pandas")
+
+        # Assert
+        pd.testing.assert_frame_equal(result, pd.DataFrame({"id": [1], "name": ["a"]}))
+        mock_search.assert_called_once_with(fg, None, filter=None)
+
     def test_register_external_temporary_table(self):
         # Arrange
         python_engine = python.Engine()
@@ -2545,6 +2803,146 @@ class TestPython:
         # Act / Assert
         assert train_rows(1) != train_rows(2)
 
+    def _split_td(self, splits, seed=123):
+        return training_dataset.TrainingDataset(
+            name="test",
+            version=1,
+            data_format="CSV",
+            featurestore_id=99,
+            splits=splits,
+            train_split="train",
+            seed=seed,
+            id=10,
+        )
+
+    def test_random_split_sizes(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        python_engine = python.Engine()
+        df = pd.DataFrame({"col": range(1001)})
+        td = self._split_td({"train": 0.7, "validation": 0.2, "test": 0.1})
+
+        # Act
+        result = python_engine._random_split(df, td)
+
+        # Assert
+        assert {name: len(split) for name, split in result.items()} == {
+            "train": 700,
+            "validation": 200,
+            "test": 101,
+        }
+        rows = sorted(sum((split["col"].tolist() for split in result.values()), []))
+        assert rows == list(range(1001))
+        for split in result.values():
+            assert list(split.columns) == ["col"]
+            assert split["col"].is_monotonic_increasing
+
+    @pytest.mark.skipif(
+        not HAS_POLARS,
+        reason="Polars is not installed.",
+    )
+    def test_random_split_polars_matches_pandas(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        python_engine = python.Engine()
+        df = pd.DataFrame({"col": range(100)})
+        td = self._split_td({"train": 0.8, "test": 0.2})
+
+        # Act
+        expected = python_engine._random_split(df, td)
+        result = python_engine._random_split(pl.from_pandas(df), td)
+
+        # Assert
+        for name in ("train", "test"):
+            assert isinstance(result[name], pl.DataFrame)
+            assert result[name].columns == ["col"]
+            assert result[name]["col"].to_list() == expected[name]["col"].tolist()
+
+    def test_random_split_stratify_by(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        python_engine = python.Engine()
+        df = pd.DataFrame({"col": range(1000), "label": [0] * 900 + [1] * 100})
+        td = self._split_td({"train": 0.8, "test": 0.2})
+
+        # Act
+        first = python_engine._random_split(df, td, stratify_by="label")
+        second = python_engine._random_split(df, td, stratify_by="label")
+
+        # Assert
+        assert first["train"]["label"].value_counts().to_dict() == {0: 720, 1: 80}
+        assert first["test"]["label"].value_counts().to_dict() == {0: 180, 1: 20}
+        for name in ("train", "test"):
+            assert first[name]["col"].tolist() == second[name]["col"].tolist()
+
+    def test_random_split_stratify_by_small_strata(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        python_engine = python.Engine()
+        df = pd.DataFrame({"col": range(3000), "label": np.repeat(range(1000), 3)})
+        td = self._split_td({"train": 0.8, "test": 0.2})
+
+        # Act
+        result = python_engine._random_split(df, td, stratify_by="label")
+
+        # Assert
+        assert len(result["train"]) == 2400
+        assert len(result["test"]) == 600
+        assert set(result["train"]["label"].value_counts()) == {2, 3}
+
+    @pytest.mark.parametrize("dataframe_type", ["pandas", "polars"])
+    def test_random_split_stratify_by_null_labels(self, mocker, dataframe_type):
+        # Arrange
+        if dataframe_type == "polars" and not HAS_POLARS:
+            pytest.skip("polars is not installed")
+        mocker.patch("hopsworks_common.client._get_instance")
+        python_engine = python.Engine()
+        df = pd.DataFrame({"col": range(10), "label": ["a", None] * 5})
+        if dataframe_type == "polars":
+            df = pl.from_pandas(df)
+        td = self._split_td({"train": 0.8, "test": 0.2})
+
+        # Act
+        result = python_engine._random_split(df, td, stratify_by="label")
+
+        # Assert
+        for name, expected in (("train", 4), ("test", 1)):
+            labels = list(result[name]["label"])
+            assert labels.count("a") == expected
+            assert labels.count(None) == expected
+
+    def test_prepare_transform_split_df_random_split_stratify_by(self, mocker):
+        # Arrange
+        mocker.patch("hopsworks_common.client._get_instance")
+        mock_random_split = mocker.patch("hsfs.engine.python.Engine._random_split")
+        mock_tf_engine = mocker.patch(
+            "hsfs.core.transformation_function_engine.TransformationFunctionEngine"
+        )
+        mock_tf_engine._fit_and_transform.side_effect = (
+            lambda training_dataset, feature_view_obj, dataset, **kwargs: dataset
+        )
+        python_engine = python.Engine()
+        query_obj = mocker.Mock()
+        td = self._split_td({"train": 0.8, "test": 0.2})
+        mock_random_split.return_value = {
+            "train": pd.DataFrame(),
+            "test": pd.DataFrame(),
+        }
+        fv = mocker.Mock()
+        fv.transformation_functions = []
+
+        # Act
+        python_engine._prepare_transform_split_df(
+            query_obj=query_obj,
+            training_dataset_obj=td,
+            feature_view_obj=fv,
+            read_option={"stratify_by": "label"},
+            dataframe_type="default",
+        )
+
+        # Assert
+        assert mock_random_split.call_args.kwargs["stratify_by"] == "label"
+
     def test_split_labels(self):
         # Arrange
         python_engine = python.Engine()
@@ -3137,8 +3535,7 @@ class TestPython:
         reason="Polars is not installed.",
     )
     def test_random_split_polars(self, mocker):
-        # Arrange - exercises the polars `with_columns(pl.Series(...))` and
-        # `filter(pl.col(...) == i).drop(...)` branch of _random_split.
+        # Arrange - exercises the polars row selection of _random_split.
         mocker.patch("hopsworks_common.client._get_instance")
 
         python_engine = python.Engine()
@@ -3802,6 +4199,69 @@ class TestPython:
         # Assert
         assert result == file
 
+    @pytest.mark.skipif(
+        not HAS_POLARS,
+        reason="Polars is not installed.",
+    )
+    @pytest.mark.parametrize("execution_mode", ["python", "pandas"])
+    def test_apply_udf_on_polars_dataframe_multiple_outputs(
+        self, mocker, execution_mode
+    ):
+        # Arrange
+        from hsfs.hopsworks_udf import udf
+
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        python_engine = python.Engine()
+
+        @udf([int, float], mode=execution_mode)
+        def plus_and_half(col1, col2):
+            if isinstance(col1, pd.Series):
+                return pd.DataFrame({"a": col1 + 1, "b": col2 / 2})
+            return col1 + 1, None if col2 is None else col2 / 2
+
+        tf = plus_and_half("a", "b")
+        tf.output_column_names = ["out_0", "out_1"]
+        df = pl.DataFrame({"a": [1, 2, 3], "b": [2.0, 4.0, None], "c": ["x", "y", "z"]})
+        mock_to_pandas = mocker.patch.object(pl.DataFrame, "to_pandas")
+
+        # Act
+        result = python_engine._apply_udf_on_dataframe(tf, df)
+
+        # Assert
+        assert isinstance(result, pl.DataFrame)
+        assert result.columns == ["out_0", "out_1"]
+        assert result["out_0"].to_list() == [2, 3, 4]
+        assert result["out_1"].to_list() == [1.0, 2.0, None]
+        mock_to_pandas.assert_not_called()
+
+    @pytest.mark.skipif(
+        not HAS_POLARS,
+        reason="Polars is not installed.",
+    )
+    @pytest.mark.parametrize("execution_mode", ["python", "pandas"])
+    def test_apply_udf_on_polars_dataframe_single_output(self, mocker, execution_mode):
+        # Arrange
+        from hsfs.hopsworks_udf import udf
+
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        python_engine = python.Engine()
+
+        @udf(str, mode=execution_mode)
+        def upper(col1):
+            return col1.str.upper() if isinstance(col1, pd.Series) else col1.upper()
+
+        tf = upper("c")
+        tf.output_column_names = ["upper_c_"]
+        df = pl.DataFrame({"a": [1, 2], "c": ["x", "y"]})
+
+        # Act
+        result = python_engine._apply_udf_on_dataframe(tf, df)
+
+        # Assert
+        assert isinstance(result, pl.DataFrame)
+        assert result.columns == ["upper_c_"]
+        assert result["upper_c_"].to_list() == ["X", "Y"]
+
     def test_get_unique_values(self):
         # Arrange
         python_engine = python.Engine()
@@ -7987,6 +8447,94 @@ class TestPython:
             == expected_log_data[logging_feature_names].values.tolist()
         )
 
+    def test_get_feature_logging_df_columnar_matches_dataframe_path(
+        self, mocker, logging_features, logging_test_dataframe
+    ):
+        # Prepare
+        mocker.patch("hopsworks_common.client._get_instance")
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        python_engine = python.Engine()
+
+        logging_features, meta_data_logging_columns, column_names = logging_features
+        logging_feature_group_features = meta_data_logging_columns + logging_features
+        serving_keys = logging_test_dataframe[["primary_key"]]
+        args = TestPython.get_logging_arguments(
+            untransformed_features=logging_test_dataframe[
+                column_names["untransformed_features"]
+            ].to_numpy(dtype=float),
+            predictions=logging_test_dataframe["label"].tolist(),
+            serving_keys=pl.from_pandas(serving_keys) if HAS_POLARS else serving_keys,
+            helper_columns=logging_test_dataframe[["inference_helper_1"]],
+            request_parameters=logging_test_dataframe[["rp_1", "rp_2"]],
+            event_time=logging_test_dataframe[["event_time"]].head(1),
+            request_id=logging_test_dataframe["request_id"].tolist(),
+            logging_feature_group_features=logging_feature_group_features,
+            column_names=column_names,
+        )
+        table_spy = mocker.spy(python.Engine, "_get_feature_logging_table")
+
+        # Act
+        columnar_df, columnar_additional, columnar_missing = (
+            python_engine._get_feature_logging_df(**args)
+        )
+        mocker.patch.object(
+            python.Engine, "_get_feature_logging_table", return_value=None
+        )
+        logging_df, additional, missing = python_engine._get_feature_logging_df(**args)
+
+        # Assert
+        assert table_spy.spy_return is not None
+        columns = [
+            name
+            for name in logging_df.columns
+            if name
+            not in (
+                constants.FEATURE_LOGGING.LOG_ID_COLUMN_NAME,
+                constants.FEATURE_LOGGING.LOG_TIME_COLUMN_NAME,
+            )
+        ]
+        assert list(columnar_df.columns) == list(logging_df.columns)
+        assert (columnar_df.dtypes == logging_df.dtypes).all()
+        assert (
+            columnar_df[columns].astype(object).values.tolist()
+            == logging_df[columns].astype(object).values.tolist()
+        )
+        assert columnar_df[constants.FEATURE_LOGGING.LOG_ID_COLUMN_NAME].is_unique
+        assert (columnar_additional, columnar_missing) == (additional, missing)
+
+    def test_convert_feature_log_to_arrow_numpy_without_copy(self):
+        # Arrange
+        feature_log = np.asfortranarray(np.arange(6, dtype=float).reshape(3, 2))
+
+        # Act
+        table = python.Engine._convert_feature_log_to_arrow(
+            feature_log, ["feature_1", "feature_2"]
+        )
+
+        # Assert
+        assert table.column("feature_2").to_pylist() == [1.0, 3.0, 5.0]
+        assert (
+            table.column("feature_2").chunk(0).buffers()[1].address
+            == feature_log[:, 1].ctypes.data
+        )
+
+    @pytest.mark.parametrize(
+        "feature_log",
+        [
+            [{"feature_1": 1}, {"feature_1": 2}],
+            [[1], ["a"]],
+            np.array([["a"], ["b"]], dtype=object),
+            pd.DataFrame({"feature_1": ["a", np.nan]}),
+            pd.DataFrame({"feature_1": pd.Categorical(["a", "b"])}),
+        ],
+    )
+    def test_convert_feature_log_to_arrow_falls_back_to_dataframe(self, feature_log):
+        # Act & Assert
+        assert (
+            python.Engine._convert_feature_log_to_arrow(feature_log, ["feature_1"])
+            is None
+        )
+
     def test_get_feature_logging_list_logging_data_dataframe(
         self, mocker, logging_features, logging_test_dataframe
     ):
@@ -11424,3 +11424,81 @@ class TestSparkConnectMode:
         args = mock_profile.call_args.args
         assert args[-2] is True  # kll
         assert args[-1] == 12  # histogram_bins
+
+
+class TestReadJdbcOnDriver:
+    @staticmethod
+    def _make_engine():
+        engine = spark.Engine.__new__(spark.Engine)
+        engine._spark_session = MagicMock()
+        engine._jvm = MagicMock()
+        engine._is_connect = False
+        return engine
+
+    def test_read_jdbc_on_driver(self, mocker):
+        # Arrange
+        engine = self._make_engine()
+        mock_dataframe = mocker.patch("hsfs.engine.spark.DataFrame")
+        mock_return_dataframe_type = mocker.patch(
+            "hsfs.engine.spark.Engine._return_dataframe_type"
+        )
+        jvm = engine._jvm
+        conn = jvm.java.sql.DriverManager.getConnection.return_value
+        stmt = conn.createStatement.return_value
+        rs = stmt.executeQuery.return_value
+        jdbc_utils = jvm.org.apache.spark.sql.execution.datasources.jdbc.JdbcUtils
+        schema = jdbc_utils.getSchema.return_value
+        rows = jvm.scala.collection.JavaConverters.seqAsJavaList.return_value
+        options = {
+            "url": "jdbc:oracle:thin:@db",
+            "dbtable": "sales",
+            "user": "hopsworks",
+        }
+
+        # Act
+        engine._read_jdbc_on_driver(options, "default")
+
+        # Assert
+        stmt.executeQuery.assert_called_once_with("SELECT * FROM sales")
+        stmt.setFetchSize.assert_called_once_with(spark.Engine.JDBC_DRIVER_FETCH_SIZE)
+        jvm.java.util.Properties.return_value.setProperty.assert_called_once_with(
+            "user", "hopsworks"
+        )
+        # the rows are converted in the JVM, not read cell by cell through Py4J
+        rs.next.assert_not_called()
+        rs.getObject.assert_not_called()
+        jdbc_utils.getSchema.assert_called_once_with(
+            rs,
+            jvm.org.apache.spark.sql.jdbc.JdbcDialects.get.return_value,
+            True,
+            False,
+        )
+        jdbc_utils.resultSetToRows.assert_called_once_with(rs, schema)
+        engine._spark_session._jsparkSession.createDataFrame.assert_called_once_with(
+            rows, schema
+        )
+        conn.close.assert_called_once()
+        mock_dataframe.assert_called_once_with(
+            engine._spark_session._jsparkSession.createDataFrame.return_value,
+            engine._spark_session,
+        )
+        mock_return_dataframe_type.assert_called_once_with(
+            mock_dataframe.return_value, dataframe_type="default"
+        )
+
+    def test_read_jdbc_on_driver_fetch_size_option(self, mocker):
+        # Arrange
+        engine = self._make_engine()
+        mocker.patch("hsfs.engine.spark.DataFrame")
+        mocker.patch("hsfs.engine.spark.Engine._return_dataframe_type")
+        stmt = engine._jvm.java.sql.DriverManager.getConnection.return_value.createStatement.return_value
+
+        # Act
+        engine._read_jdbc_on_driver(
+            {"url": "jdbc:oracle:thin:@db", "query": "SELECT 1", "fetchsize": "500"},
+            "default",
+        )
+
+        # Assert
+        stmt.setFetchSize.assert_called_once_with(500)
+        stmt.executeQuery.assert_called_once_with("SELECT 1")
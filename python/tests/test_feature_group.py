@@ -770,6 +770,63 @@ class TestFeatureGroup:
 
         assert mock_insert.call_args[1]["storage"] == "online"
 
+    def test_insert_iterator_uses_batches(self, mocker):
+        import pandas as pd
+
+        mocker.patch("hsfs.engine._get_type", return_value="python")
+        mock_insert = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._insert"
+        )
+        mock_insert_batches = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._insert_batches",
+            return_value=(None, None),
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+        chunks = iter([pd.DataFrame({"id": [1]}), pd.DataFrame({"id": [2]})])
+
+        write_options = {"insert_workers": 4, "insert_batch_size": 10}
+
+        fg.insert(chunks, write_options=write_options)
+
+        mock_insert.assert_not_called()
+        assert mock_insert_batches.call_args[0][1] is chunks
+        assert mock_insert_batches.call_args[1]["max_workers"] == 4
+        # the chunking options are not forwarded to the writers and the job
+        forwarded = mock_insert_batches.call_args[1]["write_options"]
+        assert "insert_workers" not in forwarded
+        assert "insert_batch_size" not in forwarded
+        assert write_options == {"insert_workers": 4, "insert_batch_size": 10}
+
+    def test_insert_dataset_path_spark_engine(self, mocker):
+        mocker.patch("hsfs.engine._get_type", return_value="spark")
+        mock_insert_batches = mocker.patch(
+            "hsfs.core.feature_group_engine.FeatureGroupEngine._insert_batches"
+        )
+
+        fg = feature_group.FeatureGroup(
+            name="test_fg",
+            version=2,
+            featurestore_id=99,
+            primary_key=[],
+            foreign_key=[],
+            partition_key=[],
+            id=10,
+        )
+
+        with pytest.raises(FeatureStoreException, match="python engine"):
+            fg.insert("/data/transactions/")
+
+        mock_insert_batches.assert_not_called()
+
     def test_save_feature_list(self, mocker):
         mock_save_metadata = mocker.patch(
             "hsfs.core.feature_group_engine.FeatureGroupEngine._save_feature_group_metadata",
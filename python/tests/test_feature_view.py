@@ -831,6 +831,52 @@ class TestFeatureView:
         server._init_serving.assert_called_once()
         assert server._init_serving.call_args.kwargs["entity"] is fv
 
+    def test_init_serving_serving_stats(self, mocker):
+        # Arrange
+        from hsfs.core.serving_stats import ServingStats
+
+        fv, server = self._fv_with_spec_server(mocker)
+        mocker.patch.object(fv, "_get_embedding_fgs", return_value=[])
+        sink = mocker.Mock()
+
+        # Act
+        fv.init_serving(training_dataset_version=1)
+        disabled = server._init_serving.call_args.kwargs["serving_stats"]
+        fv.init_serving(training_dataset_version=1, serving_stats_sink=sink)
+        enabled = server._init_serving.call_args.kwargs["serving_stats"]
+
+        # Assert
+        assert disabled is None
+        assert isinstance(enabled, ServingStats)
+        enabled._record(ServingStats.FETCH, 0.01)
+        sink.assert_called_once_with(ServingStats.FETCH, 0.01)
+
+    def test_serving_stats(self, mocker):
+        # Arrange
+        from hsfs.core.serving_stats import ServingStats
+
+        fv, server = self._fv_with_spec_server(mocker)
+        server.serving_stats = ServingStats()
+        server.serving_stats._record(ServingStats.FETCH, 0.01)
+
+        # Act
+        summary = fv.serving_stats(reset=True)
+
+        # Assert
+        assert summary[ServingStats.FETCH]["count"] == 1
+        assert fv.serving_stats() == {}
+
+    def test_serving_stats_not_enabled(self, mocker):
+        # Arrange
+        fv, server = self._fv_with_spec_server(mocker)
+        server.serving_stats = None
+
+        # Act / Assert
+        with pytest.raises(
+            FeatureStoreException, match="Serving stats are not enabled"
+        ):
+            fv.serving_stats()
+
     def test_get_feature_vector_delegates_to_server(self, mocker):
         # Regression guard for the renamed VectorServer._get_feature_vector.
         fv, server = self._fv_with_spec_server(mocker)
@@ -867,6 +913,54 @@ class TestFeatureView:
         server._get_inference_helpers.assert_called_once()
         assert result is server._get_inference_helpers.return_value
 
+    def test_find_neighbors_batch_deduplicates_lookups(self, mocker):
+        fv, server = self._fv_with_spec_server(mocker)
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client._find_neighbors_batch.return_value = [
+            [(0.1, {"primary_key": 1}), (0.2, {"primary_key": 2})],
+            [(0.1, {"primary_key": 2})],
+            [],
+        ]
+        mocker.patch.object(
+            fv,
+            "_extract_primary_key",
+            side_effect=lambda result: {"primary_key": result["primary_key"]},
+        )
+        server._get_feature_vectors.return_value = [[1, "a"], [2, "b"]]
+
+        result = fv.find_neighbors_batch([[0.1], [0.2], [0.3]], k=2)
+
+        server._get_feature_vectors.assert_called_once()
+        assert server._get_feature_vectors.call_args.args[0] == [
+            {"primary_key": 1},
+            {"primary_key": 2},
+        ]
+        assert result == [[[1, "a"], [2, "b"]], [[2, "b"]], []]
+
+    def test_find_neighbors_batch_pandas(self, mocker):
+        import pandas as pd
+
+        fv, server = self._fv_with_spec_server(mocker)
+        fv._vector_db_client = mocker.MagicMock()
+        fv._vector_db_client._find_neighbors_batch.return_value = [
+            [(0.1, {"primary_key": 2})],
+            [(0.1, {"primary_key": 1}), (0.2, {"primary_key": 2})],
+        ]
+        mocker.patch.object(
+            fv,
+            "_extract_primary_key",
+            side_effect=lambda result: {"primary_key": result["primary_key"]},
+        )
+        server._get_feature_vectors.return_value = pd.DataFrame(
+            {"primary_key": [2, 1], "f": ["b", "a"]}
+        )
+
+        result = fv.find_neighbors_batch([[0.1], [0.2]], return_type="pandas")
+
+        assert result[0]["primary_key"].tolist() == [2]
+        assert result[1]["primary_key"].tolist() == [1, 2]
+        assert result[1].index.tolist() == [0, 1]
+
     def test_transformed_feature_name(self, mocker):
         # Arrange
         mocker.patch("hopsworks_common.client._get_instance")
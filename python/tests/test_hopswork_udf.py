@@ -14,7 +14,7 @@
 #   limitations under the License.
 #
 
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timezone
 
 import pandas as pd
 import pytest
@@ -951,6 +951,53 @@ def test_function():
         assert all(result.columns == ["test_func_col1_col2_0", "test_func_col1_col2_1"])
         assert result.values.tolist() == [[2, 12], [3, 22], [4, 32], [5, 42]]
 
+    def test_python_udf_wrapper_named_like_wrapper(self):
+        @udf(int, mode="python")
+        def wrapper(col1):
+            return col1 + 1
+
+        wrapper.output_column_names = ["wrapper_col1_"]
+        wrapper_function, _ = wrapper._python_udf_wrapper(rename_outputs=False)
+
+        assert [wrapper_function(i) for i in range(3)] == [1, 2, 3]
+
+    def test_python_udf_wrapper_timestamp_resolves_timezone_once(self, mocker):
+        mock_get_localzone = mocker.patch(
+            "tzlocal.get_localzone", return_value=timezone.utc
+        )
+
+        @udf([datetime, int], mode="python")
+        def test_func(col1):
+            return datetime(2024, 1, col1), col1
+
+        test_func.output_column_names = ["test_func_col1_0", "test_func_col1_1"]
+        wrapper_function, _ = test_func._python_udf_wrapper(rename_outputs=False)
+
+        result = [wrapper_function(i) for i in range(1, 4)]
+
+        assert result == [
+            [datetime(2024, 1, i, tzinfo=timezone.utc), i] for i in range(1, 4)
+        ]
+        mock_get_localzone.assert_called_once()
+
+    def test_pandas_udf_wrapper_timestamp_resolves_timezone_once(self, mocker):
+        mock_get_localzone = mocker.patch(
+            "tzlocal.get_localzone", return_value=timezone.utc
+        )
+
+        @udf(datetime)
+        def test_func(col1):
+            return pd.to_datetime(col1, unit="D")
+
+        test_func.output_column_names = ["test_func_col1_"]
+        wrapper_function, _ = test_func._pandas_udf_wrapper()
+
+        for _ in range(3):
+            result = wrapper_function(pd.Series([0, 1]))
+
+        assert str(result.dt.tz) == "UTC"
+        mock_get_localzone.assert_called_once()
+
     def test_get_udf_spark_engine_default_mode_training(self, mocker):
         mocker.patch("hsfs.engine._get_type", return_value="spark")
 
@@ -0,0 +1,111 @@
+#
+#   Copyright 2026 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Import-time regression tests.
+
+Each import runs in a fresh interpreter under ``python -X importtime``. The
+tests assert which modules get imported, not how long that takes, so they stay
+deterministic on slow CI machines. The slowest imports are in the failure
+message to help find the module that started pulling in a heavy dependency.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+# Optional dependencies taking from tens of milliseconds (botocore, grpc) to
+# seconds (great_expectations) to import, which only some code paths need.
+HEAVY_MODULES = [
+    "boto3",
+    "botocore",
+    "great_expectations",
+    "grpc",
+    "pyspark",
+]
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Import cumulative time in microseconds of every module imported by ``statement``."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+    )
+    assert proc.returncode == 0, proc.stderr
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def _assert_not_imported(statement: str, modules: list[str]) -> None:
+    times = _import_times(statement)
+    imported = sorted(
+        module
+        for module in times
+        if any(module == m or module.startswith(f"{m}.") for m in modules)
+    )
+    slowest = sorted(times.items(), key=lambda item: item[1], reverse=True)[:10]
+    assert not imported, f"{statement!r} imported {imported}, slowest: {slowest}"
+
+
+def test_import_hopsworks_is_lightweight():
+    """``import hopsworks`` must not import dataframe libraries or ``hsfs``."""
+    _assert_not_imported(
+        "import hopsworks",
+        [
+            *HEAVY_MODULES,
+            "hsfs",
+            "numpy",
+            "opensearchpy",
+            "pandas",
+            "polars",
+            "pyarrow",
+            "sqlalchemy",
+        ],
+    )
+
+
+def test_import_hsfs_defers_optional_dependencies():
+    """``import hsfs`` must not import the engines or optional dependencies."""
+    _assert_not_imported(
+        "import hsfs",
+        [
+            *HEAVY_MODULES,
+            "aiomysql",
+            "sqlalchemy",
+            "hsfs.engine.python",
+            "hsfs.engine.spark",
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        # online feature vector retrieval
+        "hsfs.core.vector_server",
+        "hsfs.engine.python",
+        "hsfs.feature_view",
+    ],
+)
+def test_import_serving_path_defers_optional_dependencies(module):
+    """The Python engine and online serving only import what they need to serve."""
+    _assert_not_imported(f"import {module}", [*HEAVY_MODULES, "hsfs.engine.spark"])
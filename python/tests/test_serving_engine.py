@@ -14,6 +14,13 @@
 #   limitations under the License.
 #
 
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from hopsworks_common.client.exceptions import ModelServingException
+from hsml.client.istio.utils.infer_type import InferInput
+from hsml.constants import INFERENCE_ENDPOINTS as IE
 from hsml.engine import serving_engine
 
 
@@ -231,3 +238,79 @@ class TestSave:
         mock_upload.assert_called_once_with(deployment)
         eng._update.assert_called_once_with(deployment, 0)
         eng._create.assert_not_called()
+
+
+class TestAsyncPredict:
+    def _engine(self, mocker):
+        eng = serving_engine.ServingEngine.__new__(serving_engine.ServingEngine)
+        eng._serving_api = mocker.Mock()
+        return eng
+
+    def test_predict_async_requires_grpc(self, mocker):
+        # Arrange
+        eng = self._engine(mocker)
+        deployment = SimpleNamespace(api_protocol=IE.API_PROTOCOL_REST)
+
+        # Act & Assert
+        with pytest.raises(ModelServingException, match="gRPC protocol"):
+            asyncio.run(eng._predict_async(deployment, None, {"instances": [[1]]}))
+        eng._serving_api._send_inference_request_async.assert_not_called()
+
+    def test_predict_async_builds_payload(self, mocker):
+        # Arrange
+        eng = self._engine(mocker)
+        eng._serving_api._send_inference_request_async = mocker.AsyncMock(
+            return_value=["out"]
+        )
+        deployment = SimpleNamespace(api_protocol=IE.API_PROTOCOL_GRPC)
+        inputs = {"name": "x", "shape": [1], "datatype": "FP32", "data": [1.0]}
+
+        # Act
+        outputs = asyncio.run(eng._predict_async(deployment, None, inputs))
+
+        # Assert
+        assert outputs == ["out"]
+        _, payload = eng._serving_api._send_inference_request_async.call_args.args
+        assert [i.name for i in payload] == ["x"]
+        assert isinstance(payload[0], InferInput)
+
+    def test_stream_predict_validates_each_request(self, mocker):
+        # Arrange
+        eng = self._engine(mocker)
+
+        async def stream_inference_requests(deployment, payloads):
+            async for payload in payloads:
+                yield payload
+
+        eng._serving_api._stream_inference_requests = stream_inference_requests
+        deployment = SimpleNamespace(api_protocol=IE.API_PROTOCOL_GRPC)
+        inputs = {"name": "x", "shape": [1], "datatype": "FP32", "data": [1.0]}
+
+        async def consume(stream):
+            return [payload async for payload in stream]
+
+        # Act
+        payloads = asyncio.run(
+            consume(eng._stream_predict(deployment, None, [inputs, dict(inputs)]))
+        )
+
+        # Assert
+        assert [[i.name for i in payload] for payload in payloads] == [["x"], ["x"]]
+        with pytest.raises(ModelServingException, match="cannot be a dictionary"):
+            asyncio.run(
+                consume(eng._stream_predict(deployment, [{"instances": [[1]]}], None))
+            )
+
+    def test_stream_predict_data_and_inputs(self, mocker):
+        # Act & Assert
+        with pytest.raises(ModelServingException, match="cannot be provided together"):
+            self._engine(mocker)._stream_predict(
+                SimpleNamespace(api_protocol=IE.API_PROTOCOL_GRPC), [], []
+            )
+
+    def test_stream_predict_without_data_or_inputs(self, mocker):
+        # Act & Assert
+        with pytest.raises(ModelServingException, match="must be provided"):
+            self._engine(mocker)._stream_predict(
+                SimpleNamespace(api_protocol=IE.API_PROTOCOL_GRPC), None, None
+            )
@@ -971,3 +971,38 @@ class TestUtil:
                 match="Event loop is not running. Please invoke this co-routine from a running loop or provide an event loop.",
             ):
                 asyncio.run(util_sql._create_async_engine(online_connector, True, 1))
+
+    @pytest.mark.skipif(
+        not HAS_SQLALCHEMY or not HAS_AIOMYSQL,
+        reason="SQLAlchemy or aiomysql is not installed",
+    )
+    @pytest.mark.parametrize(
+        "url, expected_port",
+        [
+            ("jdbc:mysql://10.0.0.1:13306/test_fs", 13306),
+            ("jdbc:mysql://10.0.0.1/test_fs", 3306),
+        ],
+    )
+    def test_create_async_engine_port(self, mocker, url, expected_port):
+        # Arrange
+        online_connector = mocker.Mock()
+        online_connector.spark_options.return_value = {
+            "url": url,
+            "user": "user",
+            "password": "password",
+        }
+        mock_create_engine = mocker.patch(
+            "hsfs.core.util_sql.async_create_engine", new=mocker.AsyncMock()
+        )
+
+        # Act
+        async def create():
+            return await util_sql._create_async_engine(online_connector, False, 1)
+
+        asyncio.run(create())
+
+        # Assert
+        kwargs = mock_create_engine.call_args.kwargs
+        assert kwargs["host"] == "10.0.0.1"
+        assert kwargs["port"] == expected_port
+        assert kwargs["db"] == "test_fs"
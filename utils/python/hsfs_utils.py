@@ -223,7 +223,12 @@ def run_feature_monitoring(
 ) -> None:
     """
     Run feature monitoring for a given entity (feature_group or feature_view)
-    based on a feature monitoring configuration.
+    based on one or several feature monitoring configurations.
+
+    `config_name` is the name of a config or a list of names. The configs of a list
+    are run in one monitoring cycle, which reads a window shared by several configs
+    once. A config which fails does not stop the others, the job fails after all
+    of them ran.
     """
     feature_store = job_conf.pop("feature_store")
     fs = get_feature_store_handle(feature_store)
@@ -251,21 +256,28 @@ def run_feature_monitoring(
         )
     )
 
-    try:
-        monitoring_config_engine._run_feature_monitoring(
-            entity=entity,
-            config_name=job_conf["config_name"],
-            end_commit_time=end_commit_time,
-        )
-    except Exception as e:
+    config_names = job_conf["config_name"]
+    if isinstance(config_names, str):
+        config_names = [config_names]
+    results = monitoring_config_engine._run_feature_monitoring_configs(
+        entity=entity,
+        config_names=config_names,
+        end_commit_time=end_commit_time,
+    )
+    errors = []
+    for config_name, result in zip(config_names, results, strict=True):
+        if not isinstance(result, Exception):
+            continue
+        errors.append(result)
         config = monitoring_config_engine._get_feature_monitoring_configs(
-            name=job_conf["config_name"]
+            name=config_name
         )
         monitoring_config_engine._result_engine._save_with_exception(
             feature_monitoring_config_id=config.id,
             job_name=config.job_name,
         )
-        raise e
+    if errors:
+        raise errors[0]
 
 
 def delta_vacuum_fg(spark: SparkSession, job_conf: dict[Any, Any]) -> None: